@@ -1,14 +1,16 @@
 # evaluation_library.py
 
 import json
-import re
 import logging
 from typing import Dict, Any, List, Set, Optional, Tuple
 from dataclasses import dataclass, field
+from functools import lru_cache
 from enum import Enum
 
 import jellyfish  # Provides jaro_winkler, damerau_levenshtein_distance, nysiis
 
+from exam_patterns import VALID_EXAM_PATTERNS, get_passed_exams
+
 class AlertSeverity(Enum):
     LOW = "Low"
     MEDIUM = "Medium"
@@ -39,13 +41,6 @@ class Alert:
 # Below here, your existing logic remains mostly unchanged
 ############################################################
 
-VALID_EXAM_PATTERNS = [
-    'Series 86/87', 'Series 9/10', 'Series 7TO', 'Series 99', 'Series 57',
-    'Series 66', 'Series 65', 'Series 63', 'Series 82', 'Series 52', 'Series 53',
-    'Series 51', 'Series 31', 'Series 28', 'Series 27', 'Series 26', 'Series 24',
-    'Series 22', 'Series 50', 'Series 4', 'Series 3', 'Series 7', 'Series 6', 'SIE'
-]
-VALID_EXAM_PATTERNS.sort(key=len, reverse=True)
 
 nickname_dict = {
     "john": {"jon", "johnny", "jack"},
@@ -57,41 +52,60 @@ for formal_name, nicknames in nickname_dict.items():
     for nickname in nicknames:
         reverse_nickname_dict.setdefault(nickname, set()).add(formal_name)
 
-def parse_name(name_input: Any) -> Dict[str, Optional[str]]:
-    """Convert a name input (string or dict) into a standardized dict with keys: 'first', 'middle', 'last'."""
-    if isinstance(name_input, dict):
-        return {
-            "first": name_input.get("first"),
-            "middle": name_input.get("middle"),
-            "last": name_input.get("last"),
-        }
+@lru_cache(maxsize=65536)
+def phonetic_key(part_lower: str) -> str:
+    """NYSIIS code of a lower-cased name part, or "" if it cannot be encoded (memoized)."""
+    try:
+        return jellyfish.nysiis(part_lower)
+    except Exception:
+        return ""
 
+class ParsedName:
+    """
+    Parsed 'first', 'middle', 'last' name parts plus their stripped lower-case forms
+    and the NYSIIS key of the middle name, as used by match_name_part.
+
+    String inputs are parsed once and the same instance is returned for every later
+    call, so instances are read-only.
+    """
+    __slots__ = ("first", "middle", "last", "first_lower", "middle_lower", "last_lower", "middle_key")
+
+    def __init__(self, first: Optional[str] = None, middle: Optional[str] = None, last: Optional[str] = None):
+        self.first = first
+        self.middle = middle
+        self.last = last
+        self.first_lower = first.strip().lower() if first else None
+        self.middle_lower = middle.strip().lower() if middle else None
+        self.last_lower = last.strip().lower() if last else None
+        self.middle_key = phonetic_key(self.middle_lower) if self.middle_lower else ""
+
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        return {"first": self.first, "middle": self.middle, "last": self.last}
+
+EMPTY_NAME = ParsedName()
+
+@lru_cache(maxsize=65536)
+def _parse_name_str(name: str) -> ParsedName:
+    parts = name.strip().split()
+    if len(parts) == 0:
+        return EMPTY_NAME
+    elif len(parts) == 1:
+        return ParsedName(parts[0])
+    elif len(parts) == 2:
+        return ParsedName(parts[0], None, parts[1])
+    return ParsedName(parts[0], " ".join(parts[1:-1]), parts[-1])
+
+def parse_name_cached(name_input: Any) -> ParsedName:
+    """Parse a name input (string or dict) into a ParsedName; strings are memoized."""
     if isinstance(name_input, str):
-        parts = name_input.strip().split()
-        if len(parts) == 0:
-            return {"first": None, "middle": None, "last": None}
-        elif len(parts) == 1:
-            return {"first": parts[0], "middle": None, "last": None}
-        elif len(parts) == 2:
-            return {"first": parts[0], "middle": None, "last": parts[1]}
-        else:
-            return {
-                "first": parts[0],
-                "middle": " ".join(parts[1:-1]),
-                "last": parts[-1],
-            }
-
-    return {"first": None, "middle": None, "last": None}
-
-def get_passed_exams(exams: List[Dict[str, Any]]) -> Set[str]:
-    passed_exams = set()
-    for exam in exams:
-        exam_category = exam.get('examCategory', '')
-        for pattern in VALID_EXAM_PATTERNS:
-            if re.search(pattern, exam_category, re.IGNORECASE):
-                passed_exams.add(pattern)
-                break
-    return passed_exams
+        return _parse_name_str(name_input)
+    if isinstance(name_input, dict):
+        return ParsedName(name_input.get("first"), name_input.get("middle"), name_input.get("last"))
+    return EMPTY_NAME
+
+def parse_name(name_input: Any) -> Dict[str, Optional[str]]:
+    """Convert a name input (string or dict) into a standardized dict with keys: 'first', 'middle', 'last'."""
+    return parse_name_cached(name_input).to_dict()
 
 def get_name_variants(name: str) -> set:
     variants = {name}
@@ -119,9 +133,33 @@ def match_name_part(
         else:
             return 0.0
 
-    claim_part = claim_part.strip().lower()
-    corroborating_part = corroborating_part.strip().lower()
+    return _match_lowered_part(claim_part.strip().lower(), corroborating_part.strip().lower(), name_type)
 
+def match_parsed_part(claim_name: ParsedName, corroborating_name: ParsedName, name_type: str) -> float:
+    """match_name_part for ParsedName inputs, reusing their lower-cased parts and NYSIIS keys."""
+    claim_part = getattr(claim_name, name_type)
+    corroborating_part = getattr(corroborating_name, name_type)
+    if not claim_part and not corroborating_part:
+        return 1.0
+    if not claim_part or not corroborating_part:
+        if name_type == "middle":
+            return 0.5
+        else:
+            return 0.0
+
+    if name_type == "middle":
+        return _match_lowered_part(claim_name.middle_lower, corroborating_name.middle_lower, name_type,
+                                   claim_name.middle_key, corroborating_name.middle_key)
+    return _match_lowered_part(getattr(claim_name, f"{name_type}_lower"),
+                               getattr(corroborating_name, f"{name_type}_lower"), name_type)
+
+def _match_lowered_part(
+    claim_part: str,
+    corroborating_part: str,
+    name_type: str,
+    claim_key: Optional[str] = None,
+    corroborating_key: Optional[str] = None
+) -> float:
     if claim_part == corroborating_part:
         return 1.0
 
@@ -145,11 +183,8 @@ def match_name_part(
         similarity = 1.0 - distance
         return similarity if similarity >= 0.85 else 0.0
     else:
-        try:
-            code1 = jellyfish.nysiis(claim_part)
-            code2 = jellyfish.nysiis(corroborating_part)
-        except Exception:
-            code1 = code2 = ""
+        code1 = claim_key if claim_key is not None else phonetic_key(claim_part)
+        code2 = corroborating_key if corroborating_key is not None else phonetic_key(corroborating_part)
         if code1 == code2 and code1 != "":
             return 0.8
         return 0.0
@@ -160,20 +195,21 @@ def evaluate_name(
     other_names: List[Any],
     score_threshold: float = 80.0
 ) -> Tuple[Dict[str, Any], Optional[Alert]]:
-    claim_name = parse_name(expected_name)
+    claim_parsed = parse_name_cached(expected_name)
+    claim_name = claim_parsed.to_dict()
 
-    def score_single_name(claim_dict, fetched_input) -> Dict[str, Any]:
-        corr_name = parse_name(fetched_input)
+    def score_single_name(claim_parsed, fetched_input) -> Dict[str, Any]:
+        corr_parsed = parse_name_cached(fetched_input)
         
         weights = {"last": 50, "first": 40, "middle": 10}
-        if not claim_dict["middle"] and not corr_name["middle"]:
+        if not claim_parsed.middle and not corr_parsed.middle:
             weights["middle"] = 0
 
-        last_score = match_name_part(claim_dict["last"], corr_name["last"], "last")
-        first_score = match_name_part(claim_dict["first"], corr_name["first"], "first")
+        last_score = match_parsed_part(claim_parsed, corr_parsed, "last")
+        first_score = match_parsed_part(claim_parsed, corr_parsed, "first")
         middle_score = 0.0
         if weights["middle"] != 0:
-            middle_score = match_name_part(claim_dict["middle"], corr_name["middle"], "middle")
+            middle_score = match_parsed_part(claim_parsed, corr_parsed, "middle")
 
         total_score = (last_score * weights["last"]) \
                       + (first_score * weights["first"]) \
@@ -184,7 +220,7 @@ def evaluate_name(
             normalized_score = (total_score / total_possible_weight) * 100.0
 
         return {
-            "fetched_name": corr_name,
+            "fetched_name": corr_parsed.to_dict(),
             "score": round(normalized_score, 2),
             "first_score": round(first_score, 2),
             "middle_score": round(middle_score, 2),
@@ -192,11 +228,11 @@ def evaluate_name(
         }
 
     all_matches = []
-    main_result = score_single_name(claim_name, fetched_name)
+    main_result = score_single_name(claim_parsed, fetched_name)
     all_matches.append({"name_source": "main_fetched_name", **main_result})
 
     for idx, alt_name in enumerate(other_names):
-        alt_result = score_single_name(claim_name, alt_name)
+        alt_result = score_single_name(claim_parsed, alt_name)
         all_matches.append({"name_source": f"other_names[{idx}]", **alt_result})
 
     best_match = max(all_matches, key=lambda x: x["score"])
@@ -1,11 +1,12 @@
 import requests
 import csv
 import json
-import re
 from dataclasses import dataclass, asdict
 from enum import Enum
 from typing import Dict, Any, List, Set, Optional, Tuple
 
+from exam_patterns import VALID_EXAM_PATTERNS, get_passed_exams, is_valid_exam_category
+
 class AlertSeverity(Enum):
     LOW = "Low"
     MEDIUM = "Medium"
@@ -29,49 +30,6 @@ class Alert:
             "description": self.description
         }
 
-VALID_EXAM_PATTERNS = [
-    'Series 86/87',
-    'Series 9/10',
-    'Series 7TO',
-    'Series 99',
-    'Series 57',
-    'Series 66',
-    'Series 65',
-    'Series 63',
-    'Series 82',
-    'Series 52',
-    'Series 53',
-    'Series 51',
-    'Series 31',
-    'Series 28',
-    'Series 27',
-    'Series 26',
-    'Series 24',
-    'Series 22',
-    'Series 50',
-    'Series 4',
-    'Series 3',
-    'Series 7',
-    'Series 6',
-    'SIE',
-]
-
-# Sort patterns by length in descending order
-VALID_EXAM_PATTERNS.sort(key=len, reverse=True)
-
-def get_passed_exams(exams: List[Dict[str, Any]]) -> Set[str]:
-    """
-    Accumulate a set of passed exams.
-    """
-    passed_exams = set()
-    for exam in exams:
-        exam_category = exam.get('examCategory', '')
-        for pattern in VALID_EXAM_PATTERNS:
-            if re.search(pattern, exam_category, re.IGNORECASE):
-                passed_exams.add(pattern)
-                break
-    return passed_exams
-
 def ia_exam_requirement(passed_exams: Set[str]) -> bool:
     return 'Series 65' in passed_exams or 'Series 66' in passed_exams
 
@@ -89,9 +47,6 @@ def check_exam_requirements(passed_exams: Set[str]) -> Dict[str, bool]:
     """
     return {role: requirement(passed_exams) for role, requirement in EXAM_REQUIREMENTS.items()}
 
-def is_valid_exam_category(category: str) -> bool:
-    return any(re.search(pattern, category, re.IGNORECASE) for pattern in VALID_EXAM_PATTERNS)
-
 def validate_exams(exams: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     invalid_exams = []
     for exam in exams:
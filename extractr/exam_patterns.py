@@ -0,0 +1,113 @@
+"""
+exam_patterns.py
+
+Single-pass classification of exam categories (e.g. "Series 65", "SIE") into the exam
+names used by the license and exam evaluations.
+
+VALID_EXAM_PATTERNS is matched as one precompiled, case-insensitive alternation with a
+named group per pattern, and results are memoized per category string, so the handful of
+distinct categories seen in BrokerCheck/IAPD data are classified once per process. The
+result is the same as trying each pattern in turn (longest first) with re.search.
+
+The same module ships with v2 and extractr; keep the copies identical.
+
+Run `python exam_patterns.py` for a micro-benchmark against the per-pattern loop.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+VALID_EXAM_PATTERNS = [
+    'Series 86/87', 'Series 9/10', 'Series 7TO', 'Series 99', 'Series 57',
+    'Series 66', 'Series 65', 'Series 63', 'Series 82', 'Series 52', 'Series 53',
+    'Series 51', 'Series 31', 'Series 28', 'Series 27', 'Series 26', 'Series 24',
+    'Series 22', 'Series 50', 'Series 4', 'Series 3', 'Series 7', 'Series 6', 'SIE'
+]
+# Longest first, so "Series 7TO" wins over "Series 7"
+VALID_EXAM_PATTERNS.sort(key=len, reverse=True)
+
+EXAM_PATTERN_RE = re.compile(
+    "|".join(f"(?P<exam{rank}>{re.escape(pattern)})" for rank, pattern in enumerate(VALID_EXAM_PATTERNS)),
+    re.IGNORECASE
+)
+_GROUP_RANK = {f"exam{rank}": rank for rank in range(len(VALID_EXAM_PATTERNS))}
+
+
+@lru_cache(maxsize=4096)
+def classify_exam(category: str) -> Optional[str]:
+    """
+    Return the exam pattern matched by an exam category, or None if it matches none.
+
+    When a category contains several patterns the one listed first in VALID_EXAM_PATTERNS
+    wins, regardless of where it appears in the string.
+    """
+    best = None
+    for match in EXAM_PATTERN_RE.finditer(category):
+        rank = _GROUP_RANK[match.lastgroup]
+        if best is None or rank < best:
+            best = rank
+            if best == 0:
+                break
+    return VALID_EXAM_PATTERNS[best] if best is not None else None
+
+
+def is_valid_exam_category(category: str) -> bool:
+    """Return True if the category matches any known exam pattern."""
+    return classify_exam(category or '') is not None
+
+
+def get_passed_exams(exams: Iterable[Dict[str, Any]]) -> Set[str]:
+    """Accumulate the set of exam patterns matched by a list of exam records."""
+    passed_exams = set()
+    for exam in exams:
+        matched = classify_exam(exam.get('examCategory', '') or '')
+        if matched:
+            passed_exams.add(matched)
+    return passed_exams
+
+
+def _classify_exam_loop(category: str) -> Optional[str]:
+    """Reference implementation: try each pattern with re.search (used by the benchmark)."""
+    for pattern in VALID_EXAM_PATTERNS:
+        if re.search(pattern, category, re.IGNORECASE):
+            return pattern
+    return None
+
+
+# Categories seen in BrokerCheck/IAPD payloads plus every pattern, for the benchmark
+EXAM_TAXONOMY: List[str] = VALID_EXAM_PATTERNS + [
+    'Series 9', 'Series 10', 'Series 79TO', 'Series 8', 'Series 99TO', 'Series 55', 'Series 87',
+    'Series 5', 'Series 2', 'Series 6TO', 'Series 52TO', 'Series 57TO', 'Series 34', 'Series 1',
+    'F04', 'Series 86', 'Series 40', 'Series 30', 'Series 25', 'Series 21', 'Series 14', ''
+]
+
+
+if __name__ == "__main__":
+    import timeit
+
+    mismatches = [c for c in EXAM_TAXONOMY if classify_exam(c) != _classify_exam_loop(c)]
+    if mismatches:
+        raise SystemExit(f"Classification differs for: {mismatches}")
+
+    exams = [{'examCategory': category} for category in EXAM_TAXONOMY] * 20
+    number = 200
+
+    def loop_passed_exams():
+        passed = set()
+        for exam in exams:
+            matched = _classify_exam_loop(exam.get('examCategory', ''))
+            if matched:
+                passed.add(matched)
+        return passed
+
+    assert loop_passed_exams() == get_passed_exams(exams)
+    loop_time = min(timeit.repeat(loop_passed_exams, number=number, repeat=5))
+    compiled_time = min(timeit.repeat(lambda: get_passed_exams(exams), number=number, repeat=5))
+    classify_exam.cache_clear()
+    cold_time = min(timeit.repeat(lambda: [classify_exam.__wrapped__(c) for c in EXAM_TAXONOMY], number=number, repeat=5))
+    per_call = number * len(exams)
+    print(f"{len(EXAM_TAXONOMY)} categories, {len(exams)} exams per call, {number} calls")
+    print(f"per-pattern re.search loop: {loop_time / per_call * 1e6:.3f} us/exam")
+    print(f"compiled + memoized:        {compiled_time / per_call * 1e6:.3f} us/exam ({loop_time / compiled_time:.1f}x)")
+    print(f"compiled, uncached:         {cold_time / (number * len(EXAM_TAXONOMY)) * 1e6:.3f} us/category")
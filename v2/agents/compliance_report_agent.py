@@ -7,10 +7,11 @@ import json
 import logging
 from logging import Logger
 from datetime import datetime
-from evaluation_processor import Alert
 import os
 from storage_providers import StorageProviderFactory
 from main_config import get_storage_config
+from cache_manager.report_index import index_compliance_report
+from report_serializer import AlertEncoder, dumps_bytes, json_dumps_with_alerts, to_serializable
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +24,7 @@ def get_storage_provider():
     if _storage_provider is None:
         try:
             storage_config = get_storage_config()
-            _storage_provider = StorageProviderFactory.create_provider(storage_config)
+            _storage_provider = StorageProviderFactory.create_provider(storage_config, instrument=True)
         except Exception as e:
             logger.error(f"Failed to initialize storage provider: {str(e)}")
             _storage_provider = None
@@ -43,31 +44,7 @@ def convert_to_serializable(obj: Any) -> Any:
         JSON-serializable version of the object
     """
     try:
-        if isinstance(obj, Alert):
-            logger.debug(f"Converting Alert object to dict using to_dict()")
-            return obj.to_dict()
-        elif isinstance(obj, (str, int, float, bool, type(None))):
-            return obj
-        elif isinstance(obj, dict):
-            return {key: convert_to_serializable(value) for key, value in obj.items()}
-        elif isinstance(obj, list):
-            return [convert_to_serializable(item) for item in obj]
-        elif hasattr(obj, '__dict__'):
-            logger.debug(f"Converting object of type {type(obj)} to dict")
-            result = {}
-            for key, value in obj.__dict__.items():
-                try:
-                    result[key] = convert_to_serializable(value)
-                except Exception as e:
-                    logger.warning(f"Failed to convert attribute {key} of {type(obj)}: {str(e)}")
-                    result[key] = str(value)
-            return result
-        elif hasattr(obj, '__slots__'):
-            logger.debug(f"Converting object with slots of type {type(obj)} to dict")
-            return {slot: convert_to_serializable(getattr(obj, slot)) for slot in obj.__slots__}
-        else:
-            logger.warning(f"Converting unknown type {type(obj)} to string representation")
-            return str(obj)
+        return to_serializable(obj)
     except Exception as e:
         logger.error(f"Error converting object of type {type(obj)}: {str(e)}", exc_info=True)
         return str(obj)
@@ -90,6 +67,30 @@ def log_alert_structure(alert: Any, index: int):
     else:
         logger.debug(f"  String representation: {str(alert)}")
 
+# Fields compared between report versions: final_evaluation keys, or (section, key) pairs
+COMPLIANCE_FIELDS = [
+    "overall_compliance",
+    ("search_evaluation", "compliance"),
+    ("status_evaluation", "compliance"),
+    ("name_evaluation", "compliance"),
+    ("license_evaluation", "compliance"),
+    ("exam_evaluation", "compliance"),
+    ("disclosure_review", "compliance"),
+    ("disciplinary_evaluation", "compliance"),
+    ("arbitration_review", "compliance"),
+    ("regulatory_evaluation", "compliance")
+]
+
+def _compliance_value(report: Dict[str, Any], field) -> Any:
+    """Return the value of one COMPLIANCE_FIELDS entry from a report."""
+    if isinstance(field, tuple):
+        return report.get(field[0], {}).get(field[1], None)
+    return report.get("final_evaluation", {}).get(field, None)
+
+def _alert_count(report: Dict[str, Any]) -> int:
+    """Return the number of alerts in a report's final evaluation."""
+    return len(report.get("final_evaluation", {}).get("alerts", []))
+
 def has_significant_changes(new_report: Dict[str, Any], old_report: Dict[str, Any]) -> bool:
     """
     Compare two compliance reports to determine if significant changes warrant a new version.
@@ -104,34 +105,16 @@ def has_significant_changes(new_report: Dict[str, Any], old_report: Dict[str, An
     logger.debug(f"Comparing reports for changes. New report keys: {list(new_report.keys())}")
     logger.debug(f"Old report keys: {list(old_report.keys())}")
 
-    compliance_fields = [
-        "overall_compliance",
-        ("search_evaluation", "compliance"),
-        ("status_evaluation", "compliance"),
-        ("name_evaluation", "compliance"),
-        ("license_evaluation", "compliance"),
-        ("exam_evaluation", "compliance"),
-        ("disclosure_review", "compliance"),
-        ("disciplinary_evaluation", "compliance"),
-        ("arbitration_review", "compliance"),
-        ("regulatory_evaluation", "compliance")
-    ]
-
-    for field in compliance_fields:
-        if isinstance(field, tuple):
-            new_value = new_report.get(field[0], {}).get(field[1], None)
-            old_value = old_report.get(field[0], {}).get(field[1], None)
-            logger.debug(f"Checking nested field {field[0]}.{field[1]}: new={new_value}, old={old_value}")
-        else:
-            new_value = new_report.get("final_evaluation", {}).get(field, None)
-            old_value = old_report.get("final_evaluation", {}).get(field, None)
-            logger.debug(f"Checking field {field}: new={new_value}, old={old_value}")
+    for field in COMPLIANCE_FIELDS:
+        new_value = _compliance_value(new_report, field)
+        old_value = _compliance_value(old_report, field)
+        logger.debug(f"Checking field {field}: new={new_value}, old={old_value}")
         if new_value != old_value:
             logger.info(f"Change detected in {field}: {old_value} -> {new_value}")
             return True
 
-    new_alerts = len(new_report.get("final_evaluation", {}).get("alerts", []))
-    old_alerts = len(old_report.get("final_evaluation", {}).get("alerts", []))
+    new_alerts = _alert_count(new_report)
+    old_alerts = _alert_count(old_report)
     logger.debug(f"Comparing alert counts: new={new_alerts}, old={old_alerts}")
     if new_alerts != old_alerts:
         logger.info(f"Change detected in alert count: {old_alerts} -> {new_alerts}")
@@ -139,16 +122,81 @@ def has_significant_changes(new_report: Dict[str, Any], old_report: Dict[str, An
 
     return False
 
-class AlertEncoder(json.JSONEncoder):
-    """Custom JSON encoder to handle Alert objects."""
-    def default(self, obj):
-        if isinstance(obj, Alert):
-            return obj.to_dict()
-        return super().default(obj)
+def report_fingerprint(report: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Extract the values has_significant_changes compares, as a JSON-compatible dict.
+
+    Two reports have significant changes exactly when their fingerprints differ.
+    Returns None if the report is not shaped for comparison (e.g. a section is not a dict).
+    """
+    try:
+        fingerprint = {
+            ".".join(field) if isinstance(field, tuple) else field: _compliance_value(report, field)
+            for field in COMPLIANCE_FIELDS
+        }
+        fingerprint["alert_count"] = _alert_count(report)
+        return to_serializable(fingerprint)
+    except Exception:
+        return None
+
+def digest_path(cache_path: str, reference_id: str) -> str:
+    """
+    Path of the sidecar digest for a reference_id.
+
+    The digest records the latest saved version for the current date and its fingerprint,
+    so unchanged re-runs are detected without listing the folder or reading the full report.
+    Its name does not match the ComplianceReportAgent_*.json report globs.
+    """
+    return f"{cache_path}/ComplianceReportDigest_{reference_id}.json"
 
-def json_dumps_with_alerts(obj: Any, **kwargs) -> str:
-    """Helper function to serialize objects that may contain Alert instances."""
-    return json.dumps(obj, cls=AlertEncoder, **kwargs)
+def read_report_digest(storage_provider, cache_path: str, reference_id: str, date: str) -> Optional[Dict[str, Any]]:
+    """Return the digest for reference_id if it exists and was written for date, else None."""
+    path = digest_path(cache_path, reference_id)
+    try:
+        # A missing digest is the normal first-save case; reading it would log and count an error
+        if not storage_provider.file_exists(path):
+            return None
+        content = storage_provider.read_file(path)
+        digest = content if isinstance(content, dict) else json.loads(content)
+    except Exception:
+        return None
+    if not isinstance(digest, dict) or digest.get("reference_id") != reference_id or digest.get("date") != date:
+        return None
+    if not isinstance(digest.get("latest_version"), int) or not isinstance(digest.get("fingerprint"), dict):
+        return None
+    return digest
+
+def write_report_digest(storage_provider, cache_path: str, reference_id: str, date: str,
+                        latest_version: int, fingerprint: Optional[Dict[str, Any]]) -> None:
+    """Record the latest version and its fingerprint; failures only cost the fast path."""
+    if fingerprint is None:
+        return
+    digest = {
+        "reference_id": reference_id,
+        "date": date,
+        "latest_version": latest_version,
+        "fingerprint": fingerprint
+    }
+    try:
+        storage_provider.write_file(digest_path(cache_path, reference_id), dumps_bytes(digest))
+    except Exception as e:
+        logger.warning(f"Failed to write report digest: {str(e)}")
+
+def update_report_index(storage_provider, employee_number: str, file_name: str, report: Dict[str, Any]) -> bool:
+    """
+    Records a saved compliance report in the cache_manager report index.
+
+    The index lives next to the employee folders on local disk, so it is only
+    maintained when the storage provider is backed by the local filesystem.
+
+    Returns:
+        bool: True if the index was updated, False otherwise.
+    """
+    base_path = getattr(storage_provider, 'base_path', None)
+    if not isinstance(base_path, Path):
+        logger.debug("Storage provider is not local; skipping compliance report index update")
+        return False
+    return index_compliance_report(base_path / "cache", employee_number, file_name, report)
 
 def save_compliance_report(report: Dict[str, Any], employee_number: Optional[str] = None, logger: Logger = logger) -> bool:
     """
@@ -191,48 +239,69 @@ def save_compliance_report(report: Dict[str, Any], employee_number: Optional[str
         date = datetime.now().strftime(DATE_FORMAT)
         logger.debug(f"Using date: {date}")
 
-        # Find existing files for this reference_id and date
-        pattern = f"ComplianceReportAgent_{reference_id}_v*_{date}.json"
-        logger.debug(f"Looking for existing files with pattern: {pattern}")
-        try:
-            existing_files = storage_provider.list_files(cache_path, pattern)
-            logger.debug(f"Found existing files: {existing_files}")
+        # Fast path: the sidecar digest answers "changed?" without listing or reading reports
+        fingerprint = report_fingerprint(report)
+        digest = read_report_digest(storage_provider, cache_path, reference_id, date) if fingerprint is not None else None
+        version = None
+        latest_version = None
+        if digest is not None:
+            if digest["fingerprint"] == fingerprint:
+                latest_path = f"{cache_path}/ComplianceReportAgent_{reference_id}_v{digest['latest_version']}_{date}.json"
+                if storage_provider.file_exists(latest_path):
+                    logger.info("No significant changes detected (report digest); no new version saved",
+                                extra={"reference_id": reference_id, "employee_number": employee_number})
+                    return True
+                logger.debug(f"Report digest names missing report {latest_path}; checking existing files")
+            else:
+                candidate = digest["latest_version"] + 1
+                if not storage_provider.file_exists(f"{cache_path}/ComplianceReportAgent_{reference_id}_v{candidate}_{date}.json"):
+                    version = candidate
+                    logger.debug(f"Version decision from report digest: version={version}")
+
+        if version is None:
+            # Find existing files for this reference_id and date
+            pattern = f"ComplianceReportAgent_{reference_id}_v*_{date}.json"
+            logger.debug(f"Looking for existing files with pattern: {pattern}")
+            try:
+                existing_files = storage_provider.list_files(cache_path, pattern)
+                logger.debug(f"Found existing files: {existing_files}")
             
-            # Sort files by version number
-            existing_files = sorted(
-                existing_files,
-                key=lambda x: int(Path(x).stem.split('_v')[1].split('_')[0])
-            )
-            latest_file = existing_files[-1] if existing_files else None
+                # Sort files by version number
+                existing_files = sorted(
+                    existing_files,
+                    key=lambda x: int(Path(x).stem.split('_v')[1].split('_')[0])
+                )
+                latest_file = existing_files[-1] if existing_files else None
             
-            # Load latest file for comparison, if it exists
-            if latest_file:
-                logger.debug(f"Loading latest file for comparison: {latest_file}")
-                try:
-                    # Extract just the filename from the full path
-                    file_name = Path(latest_file).name
-                    file_content = storage_provider.read_file(f"{cache_path}/{file_name}")
-                    if isinstance(file_content, dict):
-                        old_report = file_content
-                    else:
-                        if isinstance(file_content, bytes):
-                            file_content = file_content.decode('utf-8')
-                        old_report = json.loads(file_content)
-                    logger.debug(f"Successfully loaded old report with keys: {list(old_report.keys())}")
-                    needs_new_version = has_significant_changes(report, old_report)
-                    version = len(existing_files) + 1 if needs_new_version else None
-                    logger.debug(f"Version decision: needs_new_version={needs_new_version}, version={version}")
-                except Exception as e:
-                    logger.warning(f"Failed to load or parse existing report: {str(e)}", exc_info=True)
-                    version = len(existing_files) + 1  # Create new version if old file is inaccessible
-                    logger.debug(f"Creating new version {version} due to error loading existing report")
-            else:
-                version = 1  # First version if no prior file
-                logger.debug("No existing files found, creating version 1")
-        except Exception as e:
-            logger.warning(f"Error listing existing files: {str(e)}", exc_info=True)
-            version = 1  # Default to version 1 if we can't list files
-            logger.debug("Defaulting to version 1 due to error listing files")
+                # Load latest file for comparison, if it exists
+                if latest_file:
+                    logger.debug(f"Loading latest file for comparison: {latest_file}")
+                    try:
+                        # Extract just the filename from the full path
+                        file_name = Path(latest_file).name
+                        file_content = storage_provider.read_file(f"{cache_path}/{file_name}")
+                        if isinstance(file_content, dict):
+                            old_report = file_content
+                        else:
+                            if isinstance(file_content, bytes):
+                                file_content = file_content.decode('utf-8')
+                            old_report = json.loads(file_content)
+                        logger.debug(f"Successfully loaded old report with keys: {list(old_report.keys())}")
+                        needs_new_version = has_significant_changes(report, old_report)
+                        version = len(existing_files) + 1 if needs_new_version else None
+                        latest_version = len(existing_files)
+                        logger.debug(f"Version decision: needs_new_version={needs_new_version}, version={version}")
+                    except Exception as e:
+                        logger.warning(f"Failed to load or parse existing report: {str(e)}", exc_info=True)
+                        version = len(existing_files) + 1  # Create new version if old file is inaccessible
+                        logger.debug(f"Creating new version {version} due to error loading existing report")
+                else:
+                    version = 1  # First version if no prior file
+                    logger.debug("No existing files found, creating version 1")
+            except Exception as e:
+                logger.warning(f"Error listing existing files: {str(e)}", exc_info=True)
+                version = 1  # Default to version 1 if we can't list files
+                logger.debug("Defaulting to version 1 due to error listing files")
 
         if version:
             file_name = f"ComplianceReportAgent_{reference_id}_v{version}_{date}.json"
@@ -246,22 +315,18 @@ def save_compliance_report(report: Dict[str, Any], employee_number: Optional[str
             logger.debug(f"Number of alerts: {len(alerts)}")
             
             # Log detailed structure of each alert
-            for i, alert in enumerate(alerts):
-                log_alert_structure(alert, i)
+            if logger.isEnabledFor(logging.DEBUG):
+                for i, alert in enumerate(alerts):
+                    log_alert_structure(alert, i)
             
             try:
-                # Convert the report to a serializable format
-                logger.debug("Starting conversion to serializable format...")
-                serializable_report = convert_to_serializable(report)
-                logger.debug("Successfully converted report to serializable format")
-                
-                # Test serialization before writing to file
-                logger.debug("Testing JSON serialization...")
-                json_str = json_dumps_with_alerts(serializable_report, indent=2)
-                logger.debug("JSON serialization test successful")
+                # Serialize once; Alert objects are converted by the shared serializer
+                report_bytes = dumps_bytes(report, indent=2)
                 
                 # Write file using storage provider
-                storage_provider.write_file(file_path, json_str)
+                if storage_provider.write_file(file_path, report_bytes):
+                    update_report_index(storage_provider, employee_number, file_name, report)
+                    write_report_digest(storage_provider, cache_path, reference_id, date, version, fingerprint)
                 logger.info("New version of compliance report saved", 
                             extra={"reference_id": reference_id, "employee_number": employee_number, 
                                    "file_path": file_path})
@@ -272,6 +337,8 @@ def save_compliance_report(report: Dict[str, Any], employee_number: Optional[str
         else:
             logger.info("No significant changes detected; no new version saved", 
                         extra={"reference_id": reference_id, "employee_number": employee_number})
+            if latest_version:
+                write_report_digest(storage_provider, cache_path, reference_id, date, latest_version, fingerprint)
 
         return True
 
@@ -23,10 +23,11 @@ from prometheus_client import Counter, Histogram, Gauge, Summary, start_http_ser
 import threading
 import functools
 
-from logger_config import setup_logging  # Import centralized logging config
+from logger_config import setup_logging, set_log_level  # Import centralized logging config
 from marshaller import Marshaller
 from services import FinancialServicesFacade
 from business import process_claim
+from report_serializer import dumps_bytes
 from cache_manager.cache_operations import CacheManager
 from cache_manager.compliance_handler import ComplianceHandler
 from cache_manager.summary_generator import SummaryGenerator
@@ -34,9 +35,10 @@ from cache_manager.file_handler import FileHandler
 from main_config import get_storage_config, load_config
 from storage_manager import StorageManager
 from storage_providers.factory import StorageProviderFactory
+from storage_providers.instrumentation import correlation_context
 
 # Setup logging
-loggers = setup_logging(debug=True)
+loggers = setup_logging()  # Level from LOG_LEVEL (default INFO); toggle at runtime via PUT /settings
 logger = loggers["api"]
 
 # Initialize Redis clients for different purposes
@@ -157,7 +159,7 @@ celery_app.conf.update(
 # Settings, ClaimRequest, and TaskStatusResponse models
 class Settings(BaseModel):
     headless: bool = True
-    debug: bool = False
+    debug: bool = os.getenv("LOG_LEVEL", "INFO").upper() == "DEBUG"
 
 class TaskStatusResponse(BaseModel):
     task_id: str
@@ -193,6 +195,15 @@ app = FastAPI(
     version="1.0.0"
 )
 
+@app.middleware("http")
+async def correlation_id_middleware(request, call_next):
+    """Tag storage calls made while serving a request with its X-Request-ID (or a generated one)."""
+    request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex
+    with correlation_context(request_id):
+        response = await call_next(request)
+    response.headers["X-Request-ID"] = request_id
+    return response
+
 # Global instances
 settings = Settings()
 facade = None
@@ -761,10 +772,12 @@ def send_webhook_notification(self, webhook_url: str, payload: Dict[str, Any], r
             "X-Idempotency-Key": webhook_id
         }
         
+        # Serialize once: the signed bytes are exactly the bytes sent
+        payload_bytes = dumps_bytes(payload)
+
         # Add HMAC signature if secret is set
         hmac_secret = os.environ.get("WEBHOOK_HMAC_SECRET")
         if hmac_secret:
-            payload_bytes = json.dumps(payload).encode('utf-8')
             signature = hmac.new(
                 hmac_secret.encode('utf-8'),
                 payload_bytes,
@@ -775,7 +788,7 @@ def send_webhook_notification(self, webhook_url: str, payload: Dict[str, Any], r
         # Use synchronous requests instead of asyncio (better for Celery workers)
         response = requests.post(
             webhook_url,
-            json=payload,
+            data=payload_bytes,
             timeout=30,  # 30 second timeout
             headers=headers
         )
@@ -1048,7 +1061,7 @@ def initialize_services():
         storage_config = get_storage_config(config)
         logger.debug(f"Storage config retrieved: {json.dumps(storage_config, indent=2)}")
         storage_manager = StorageManager(storage_config)
-        compliance_report_storage = StorageProviderFactory.create_provider(storage_config)
+        compliance_report_storage = StorageProviderFactory.create_provider(storage_config, instrument=True)
         logger.debug(f"Successfully initialized compliance_report_agent storage provider with base_path: {compliance_report_storage.base_path}")
         
         logger.info("Configuring compliance report agent...")
@@ -1082,7 +1095,7 @@ def initialize_services():
         # Initialize cache and compliance services
         logger.info("Initializing cache and compliance services...")
         try:
-            cache_manager = CacheManager()
+            cache_manager = CacheManager(storage_provider=storage_manager.provider)
             file_handler = FileHandler(cache_manager.cache_folder)
             compliance_handler = ComplianceHandler(file_handler.base_path)
             summary_generator = SummaryGenerator(file_handler=file_handler, compliance_handler=compliance_handler)
@@ -1108,7 +1121,7 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up resources on shutdown."""
-    global facade, marshaller
+    global facade, marshaller, storage_manager
     logger.info("Shutting down API server")
     try:
         if facade:
@@ -1117,6 +1130,9 @@ async def shutdown_event():
         if marshaller:
             marshaller.cleanup()
             logger.debug("Successfully cleaned up Marshaller")
+        if storage_manager:
+            await storage_manager.aclose()
+            logger.debug("Successfully closed async storage")
     except Exception as e:
         logger.error(f"Error cleaning up: {str(e)}")
 
@@ -1199,14 +1215,15 @@ def process_compliance_claim(self, request_dict: Dict[str, Any], mode: str):
             logger.debug(f"Set individual_name to '{claim['individual_name']}'")
 
         # Process the claim
-        report = process_claim(
-            claim=claim,
-            facade=facade,  # Use global facade
-            employee_number=employee_number,
-            skip_disciplinary=mode_settings["skip_disciplinary"],
-            skip_arbitration=mode_settings["skip_arbitration"],
-            skip_regulatory=mode_settings["skip_regulatory"]
-        )
+        with correlation_context(request.reference_id):
+            report = process_claim(
+                claim=claim,
+                facade=facade,  # Use global facade
+                employee_number=employee_number,
+                skip_disciplinary=mode_settings["skip_disciplinary"],
+                skip_arbitration=mode_settings["skip_arbitration"],
+                skip_regulatory=mode_settings["skip_regulatory"]
+            )
         
         if report is None:
             logger.error(f"Failed to process claim for reference_id={request.reference_id}: process_claim returned None")
@@ -1313,14 +1330,15 @@ async def process_claim_helper(request: ClaimRequest, mode: str, send_webhook: b
         logger.debug(f"Set individual_name to '{claim['individual_name']}' from first_name and last_name")
 
     try:
-        report = process_claim(
-            claim=claim,
-            facade=facade,  # Use global facade
-            employee_number=employee_number,
-            skip_disciplinary=skip_disciplinary,
-            skip_arbitration=skip_arbitration,
-            skip_regulatory=skip_regulatory
-        )
+        with correlation_context(request.reference_id):
+            report = process_claim(
+                claim=claim,
+                facade=facade,  # Use global facade
+                employee_number=employee_number,
+                skip_disciplinary=skip_disciplinary,
+                skip_arbitration=skip_arbitration,
+                skip_regulatory=skip_regulatory
+            )
         
         if report is None:
             logger.error(f"Failed to process claim for reference_id={request.reference_id}: process_claim returned None")
@@ -1344,8 +1362,13 @@ async def update_settings(new_settings: Settings):
     """Update API settings and reinitialize services if needed."""
     global settings, facade
     old_headless = settings.headless
+    old_debug = settings.debug
     settings = new_settings
     
+    if old_debug != settings.debug:
+        set_log_level("DEBUG" if settings.debug else "INFO")
+        logger.info(f"Log level set to {'DEBUG' if settings.debug else 'INFO'}")
+    
     if old_headless != settings.headless:
         if facade:
             facade.cleanup()
@@ -1498,11 +1521,12 @@ async def clear_cache(employee_number: str):
     return json.loads(result)
 
 @app.post("/cache/clear-all")
-async def clear_all_cache():
+async def clear_all_cache(dry_run: bool = False):
     """
     Clear all cache (except ComplianceReportAgent) across all employees.
+    Runs in the background; poll /cache/maintenance/{job_id} for progress and the summary.
     """
-    result = cache_manager.clear_all_cache()
+    result = cache_manager.start_maintenance("clear_all", dry_run=dry_run)
     return json.loads(result)
 
 @app.post("/cache/clear-agent/{employee_number}/{agent_name}")
@@ -1522,29 +1546,40 @@ async def list_cache(employee_number: Optional[str] = None, page: int = 1, page_
     return json.loads(result)
 
 @app.post("/cache/cleanup-stale")
-async def cleanup_stale_cache():
+async def cleanup_stale_cache(dry_run: bool = False):
     """
     Delete stale cache older than 90 days (except ComplianceReportAgent).
+    Runs in the background; poll /cache/maintenance/{job_id} for progress and the summary.
+    """
+    result = cache_manager.start_maintenance("cleanup_stale", dry_run=dry_run)
+    return json.loads(result)
+
+@app.get("/cache/maintenance/{job_id}")
+async def get_cache_maintenance_status(job_id: str):
+    """
+    Get progress or the final summary of a background cache maintenance job.
     """
-    result = cache_manager.cleanup_stale_cache()
+    result = cache_manager.get_maintenance_status(job_id)
     return json.loads(result)
 
 # Compliance analytics endpoints
 @app.get("/compliance/summary/{employee_number}")
-async def get_compliance_summary(employee_number: str, page: int = 1, page_size: int = 10):
+async def get_compliance_summary(employee_number: str, page: int = 1, page_size: int = 10, cursor: Optional[str] = None):
     """
     Get a compliance summary for a specific employee with pagination.
+    Pass the `next_cursor` of a previous response as `cursor` to fetch the following page.
     """
     emp_path = cache_manager.cache_folder / employee_number
-    result = summary_generator.generate_compliance_summary(emp_path, employee_number, page, page_size)
+    result = summary_generator.generate_compliance_summary(emp_path, employee_number, page, page_size, cursor)
     return json.loads(result)
 
 @app.get("/compliance/all-summaries")
-async def get_all_compliance_summaries(page: int = 1, page_size: int = 10):
+async def get_all_compliance_summaries(page: int = 1, page_size: int = 10, cursor: Optional[str] = None):
     """
     Get a compliance summary for all employees with pagination.
+    Pass the `next_cursor` of a previous response as `cursor` to fetch the following page.
     """
-    result = summary_generator.generate_all_compliance_summaries(cache_manager.cache_folder, page, page_size)
+    result = summary_generator.generate_all_compliance_summaries(cache_manager.cache_folder, page, page_size, cursor)
     return json.loads(result)
 
 @app.get("/compliance/taxonomy")
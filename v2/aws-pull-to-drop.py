@@ -1,9 +1,26 @@
-import boto3
+"""
+Download the CSV files of the S3 drop prefix to the local input folder.
+
+Files are listed with every page of list_objects_v2 and downloaded concurrently; files the
+local folder already holds (same size and version, see storage_sync) are not downloaded
+again. Each pulled file is then moved to the S3 archive prefix under <MM-DD-YYYY>/. The sync
+manifest (cache/sync/pull-drop.json) lets an interrupted pull resume where it stopped.
+
+S3_INPUT_BUCKET, S3_INPUT_FOLDER, S3_INPUT_ARCHIVE_FOLDER and LOCAL_INPUT_FOLDER override
+the storage configuration in config.json.
+"""
+
+import argparse
+import copy
+import logging
 import os
-from datetime import datetime
-from botocore.exceptions import NoCredentialsError, PartialCredentialsError
+
 from dotenv import load_dotenv
 
+from main_config import DEFAULT_SYNC_WORKERS, get_storage_config
+from storage_manager import StorageManager
+from storage_sync import pull_drop
+
 load_dotenv()
 
 S3_INPUT_BUCKET = os.environ.get('S3_INPUT_BUCKET')
@@ -12,109 +29,35 @@ LOCAL_INPUT_FOLDER = os.environ.get('LOCAL_INPUT_FOLDER')
 S3_INPUT_ARCHIVE_FOLDER = os.environ.get('S3_INPUT_ARCHIVE_FOLDER')
 
 
-def download_and_archive_csv_files(bucket_name, prefix, local_dir, archive_subfolder):
-    """
-    1) Clear out CSV files in local_dir.
-    2) Download all CSV files from S3 prefix -> local_dir.
-    3) Move each file in S3 to an archive subfolder named by today's date.
-    4) Create a manifest with counts. Upload manifest to S3 and also place in local_dir.
-    """
-    try:
-        # Create an S3 client
-        s3 = boto3.client('s3', region_name='us-east-1')
-
-        # 1) Clear out CSV files in the local_dir, count how many were removed
-        removed_count = 0
-        if os.path.isdir(local_dir):
-            for f in os.listdir(local_dir):
-                if f.lower().endswith('.csv'):
-                    os.remove(os.path.join(local_dir, f))
-                    removed_count += 1
-        else:
-            # If the directory doesn't exist, create it
-            os.makedirs(local_dir)
-
-        # 2) Download CSV files from S3
-        response = s3.list_objects_v2(Bucket=bucket_name, Prefix=prefix)
-
-        if 'Contents' not in response:
-            print("No files found in the specified prefix.")
-            downloaded_count = 0
-        else:
-            downloaded_count = 0
-
-            for obj in response['Contents']:
-                file_key = obj['Key']
-                file_name = os.path.basename(file_key)
-
-                # Skip directories and non-CSV files
-                if not file_name.endswith('.csv'):
-                    continue
-
-                local_file_path = os.path.join(local_dir, file_name)
-                print(f"Downloading {file_key} -> {local_file_path}")
-
-                # Download the file to local_dir
-                s3.download_file(bucket_name, file_key, local_file_path)
-                downloaded_count += 1
-
-                # 3) Move (archive) each downloaded file in S3
-                #    to a date-stamped subfolder in archive_subfolder
-                today_str = datetime.now().strftime("%m-%d-%Y")
-                archive_key = f"{archive_subfolder.strip('/')}/{today_str}/{file_name}"
-
-                print(f"Archiving {file_key} -> {archive_key}")
-
-                # Copy the file to the new archive location
-                s3.copy_object(
-                    Bucket=bucket_name,
-                    CopySource={'Bucket': bucket_name, 'Key': file_key},
-                    Key=archive_key
-                )
-
-                # Delete the original file from the source prefix
-                print(f"Deleting source file {file_key}")
-                s3.delete_object(Bucket=bucket_name, Key=file_key)
-
-        # 4) Create a manifest.txt with the required info
-        manifest_filename = "manifest.txt"
-        manifest_filepath = os.path.join(local_dir, manifest_filename)
-
-        # Build the manifest content
-        today_str = datetime.now().strftime("%m-%d-%Y")
-        manifest_lines = [
-            f"Date: {today_str}",
-            f"Removed local CSV files: {removed_count}",
-            f"Downloaded CSV files from S3: {downloaded_count}",
-            ""
-        ]
-        manifest_content = "\n".join(manifest_lines)
-
-        # Write the manifest locally
-        with open(manifest_filepath, 'w') as mf:
-            mf.write(manifest_content)
-
-        # 5) Upload the manifest to the correct archive folder in S3
-        archive_manifest_key = f"{archive_subfolder.strip('/')}/{today_str}/{manifest_filename}"
-        print(f"Uploading manifest to S3: {archive_manifest_key}")
-        s3.upload_file(manifest_filepath, bucket_name, archive_manifest_key)
-
-        print("---- JOB COMPLETE ----")
-        print(manifest_content)
-
-    except NoCredentialsError:
-        print("No AWS credentials were found. Please configure them.")
-    except PartialCredentialsError:
-        print("Incomplete AWS credentials configuration.")
-    except Exception as e:
-        print(f"An error occurred: {e}")
+def build_storage_managers():
+    """Return (s3, local) storage managers for the drop, with the environment overrides applied."""
+    storage_config = get_storage_config()
+    s3_config = copy.deepcopy(storage_config)
+    s3_config['mode'] = 's3'
+    s3 = s3_config['s3']
+    if S3_INPUT_BUCKET:
+        for key in ('bucket_name', 'input_bucket', 'archive_bucket'):
+            s3[key] = S3_INPUT_BUCKET
+        for key in ('output_bucket', 'cache_bucket'):
+            s3[key] = s3.get(key) or S3_INPUT_BUCKET
+    if S3_INPUT_FOLDER:
+        s3['input_prefix'] = S3_INPUT_FOLDER
+    if S3_INPUT_ARCHIVE_FOLDER:
+        s3['archive_prefix'] = S3_INPUT_ARCHIVE_FOLDER
+
+    local_config = copy.deepcopy(storage_config)
+    local_config['mode'] = 'local'
+    if LOCAL_INPUT_FOLDER:
+        local_config['local']['input_folder'] = LOCAL_INPUT_FOLDER
+    return StorageManager(s3_config), StorageManager(local_config)
 
 
 if __name__ == "__main__":
-    # Update these variables as needed
-    #bucket_name = "cenxtgen-dev-brokersearch"
-    #prefix = "fmrdb/input/"
-    #local_dir = "./drop"
-    #archive_subfolder = "fmrdb/input_archive"  # Updated to correct archive location
-
-    download_and_archive_csv_files(S3_INPUT_BUCKET, S3_INPUT_FOLDER, LOCAL_INPUT_FOLDER, S3_INPUT_ARCHIVE_FOLDER)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Pull CSV files from the S3 drop prefix")
+    parser.add_argument('--workers', type=int, default=DEFAULT_SYNC_WORKERS, help=f"Concurrent downloads (default: {DEFAULT_SYNC_WORKERS})")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    s3_storage, local_storage = build_storage_managers()
+    summary = pull_drop(s3_storage, local_storage, workers=args.workers)
+    logging.info(f"---- JOB COMPLETE ----\n{summary.to_dict()}")
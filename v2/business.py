@@ -1,25 +1,14 @@
-import json
 from typing import Dict, Any, Callable
 import logging
-from services import FinancialServicesFacade
+from services import FinancialServicesFacade, claim_request_context
 from evaluation_report_builder import EvaluationReportBuilder
 from evaluation_report_director import EvaluationReportDirector
-from evaluation_processor import Alert
+from logger_config import LazyJson, LazyFormat
+from report_serializer import AlertEncoder, json_dumps_with_alerts
 
 # Configure logging with detailed format
 logger = logging.getLogger("business")
 
-class AlertEncoder(json.JSONEncoder):
-    """Custom JSON encoder to handle Alert objects."""
-    def default(self, obj):
-        if isinstance(obj, Alert):
-            return obj.to_dict()
-        return super().default(obj)
-
-def json_dumps_with_alerts(obj: Any, **kwargs) -> str:
-    """Helper function to serialize objects that may contain Alert instances."""
-    return json.dumps(obj, cls=AlertEncoder, **kwargs)
-
 def determine_search_strategy(claim: Dict[str, Any]) -> Callable[[Dict[str, Any], FinancialServicesFacade, str], Dict[str, Any]]:
     """Determine the appropriate search strategy based on claim data.
     
@@ -83,43 +72,43 @@ def determine_search_strategy(claim: Dict[str, Any]) -> Callable[[Dict[str, Any]
         organization_name = ""
     organization_name = organization_name.strip()
 
-    claim_summary = f"claim={json_dumps_with_alerts(claim)}"
-    logger.debug(f"Determining search strategy for {claim_summary}")
+    claim_summary = LazyFormat("claim=%s", LazyJson(claim, dumps=json_dumps_with_alerts))
+    logger.debug("Determining search strategy for %s", claim_summary)
 
     # Strategy selection (corrected to prioritize UC1 when crd_number is present)
     if crd_number:  # UC1: Use crd_number only, ignore other inputs
-        logger.info(f"Selected search_with_crd_only for {claim_summary}")
+        logger.info("Selected search_with_crd_only for %s", claim_summary)
         return search_with_crd_only
     elif individual_name and organization_crd:  # UC2: Name + Org CRD
-        logger.info(f"Selected search_with_correlated for {claim_summary}")
+        logger.info("Selected search_with_correlated for %s", claim_summary)
         return search_with_correlated
     elif individual_name and organization_name:  # UC3: Name + Org Name
-        logger.info(f"Selected search_with_correlated for {claim_summary}")
+        logger.info("Selected search_with_correlated for %s", claim_summary)
         return search_with_correlated
     elif organization_crd and not individual_name:  # Entity-only search
-        logger.info(f"Selected search_with_entity for {claim_summary}")
+        logger.info("Selected search_with_entity for %s", claim_summary)
         return search_with_entity
     elif organization_name and not individual_name and not organization_crd:  # Org name only
-        logger.info(f"Selected search_with_org_name_only for {claim_summary}")
+        logger.info("Selected search_with_org_name_only for %s", claim_summary)
         return search_with_org_name_only
     else:  # Fallback for insufficient data
-        logger.info(f"Selected search_default for {claim_summary}")
+        logger.info("Selected search_default for %s", claim_summary)
         return search_default
 
 def search_with_both_crds(claim: Dict[str, Any], facade: FinancialServicesFacade, employee_number: str) -> Dict[str, Any]:
     """Search using both individual and organization CRDs."""
     crd_number = claim.get("crd_number", "") or ""
     package_name = claim.get("packageName", "FULL").upper()
-    claim_summary = f"claim={json_dumps_with_alerts(claim)}, employee_number={employee_number}"
-    logger.info(f"Executing search_with_both_crds for {claim_summary} with crd_number='{crd_number}', package_name='{package_name}'")
+    claim_summary = LazyFormat("claim=%s, employee_number=%s", LazyJson(claim, dumps=json_dumps_with_alerts), employee_number)
+    logger.info("Executing search_with_both_crds for %s with crd_number='%s', package_name='%s'", claim_summary, crd_number, package_name)
 
     try:
         basic_result = facade.search_sec_iapd_individual(crd_number, employee_number)
-        logger.debug(f"SEC IAPD basic_result: {json_dumps_with_alerts(basic_result)}")
+        logger.debug("SEC IAPD basic_result: %s", LazyJson(basic_result, dumps=json_dumps_with_alerts))
         if basic_result and (basic_result.get("fetched_name", "").strip() or basic_result.get("crd_number")):
-            detailed_result = facade.search_sec_iapd_detailed(crd_number, employee_number)
-            logger.debug(f"SEC IAPD detailed_result: {json_dumps_with_alerts(detailed_result)}")
-            logger.info(f"SEC IAPD returned valid data for {claim_summary}")
+            # search_sec_iapd_individual already merges the detailed fetch
+            detailed_result = basic_result
+            logger.info("SEC IAPD returned valid data for %s", claim_summary)
             return {
                 "source": "IAPD",
                 "basic_result": basic_result,
@@ -130,7 +119,7 @@ def search_with_both_crds(claim: Dict[str, Any], facade: FinancialServicesFacade
                 "compliance_explanation": "Search completed successfully with SEC IAPD data, individual found."
             }
         else:
-            logger.warning(f"SEC IAPD search returned no meaningful data for {claim_summary}")
+            logger.warning("SEC IAPD search returned no meaningful data for %s", claim_summary)
             return {
                 "source": "IAPD",
                 "basic_result": basic_result or {},
@@ -141,7 +130,7 @@ def search_with_both_crds(claim: Dict[str, Any], facade: FinancialServicesFacade
                 "compliance_explanation": "Search completed but no individual found in SEC IAPD data."
             }
     except Exception as e:
-        logger.error(f"Failed to search SEC IAPD for {claim_summary}: {str(e)}", exc_info=True)
+        logger.error("Failed to search SEC IAPD for %s: %s", claim_summary, e, exc_info=True)
         return {
             "source": "IAPD",
             "basic_result": None,
@@ -158,16 +147,16 @@ def search_with_crd_and_org_name(claim: Dict[str, Any], facade: FinancialService
     crd_number = claim.get("crd_number", "") or ""
     org_name = claim.get("organization_name", "") or ""
     package_name = claim.get("packageName", "FULL").upper()
-    claim_summary = f"claim={json_dumps_with_alerts(claim)}, employee_number={employee_number}"
-    logger.info(f"Executing search_with_crd_and_org_name for {claim_summary} with crd_number='{crd_number}', org_name='{org_name}', package_name='{package_name}'")
+    claim_summary = LazyFormat("claim=%s, employee_number=%s", LazyJson(claim, dumps=json_dumps_with_alerts), employee_number)
+    logger.info("Executing search_with_crd_and_org_name for %s with crd_number='%s', org_name='%s', package_name='%s'", claim_summary, crd_number, org_name, package_name)
 
     if package_name == "BROKERCHECK":
-        logger.info(f"Prioritizing FINRA BrokerCheck due to packageName='BROKERCHECK' for {claim_summary}")
+        logger.info("Prioritizing FINRA BrokerCheck due to packageName='BROKERCHECK' for %s", claim_summary)
         try:
             broker_result = facade.search_finra_brokercheck_individual(crd_number, employee_number)
-            logger.debug(f"FINRA BrokerCheck result: {json_dumps_with_alerts(broker_result)}")
+            logger.debug("FINRA BrokerCheck result: %s", LazyJson(broker_result, dumps=json_dumps_with_alerts))
             if broker_result and broker_result.get("fetched_name", "").strip():
-                logger.info(f"FINRA BrokerCheck returned valid data for {claim_summary}")
+                logger.info("FINRA BrokerCheck returned valid data for %s", claim_summary)
                 return {
                     "source": "FINRA_BrokerCheck",
                     "basic_result": broker_result,
@@ -178,17 +167,17 @@ def search_with_crd_and_org_name(claim: Dict[str, Any], facade: FinancialService
                     "compliance_explanation": "Search completed successfully with FINRA BrokerCheck data, individual found."
                 }
         except Exception as e:
-            logger.error(f"FINRA BrokerCheck search failed for {claim_summary}: {str(e)}", exc_info=True)
+            logger.error("FINRA BrokerCheck search failed for %s: %s", claim_summary, e, exc_info=True)
 
         # Fallback to IAPD
-        logger.info(f"No valid BrokerCheck hits, falling back to SEC IAPD for {claim_summary}")
+        logger.info("No valid BrokerCheck hits, falling back to SEC IAPD for %s", claim_summary)
         try:
             basic_result = facade.search_sec_iapd_individual(crd_number, employee_number)
-            logger.debug(f"SEC IAPD basic_result: {json_dumps_with_alerts(basic_result)}")
+            logger.debug("SEC IAPD basic_result: %s", LazyJson(basic_result, dumps=json_dumps_with_alerts))
             if basic_result and (basic_result.get("fetched_name", "").strip() or basic_result.get("crd_number")):
-                detailed_result = facade.search_sec_iapd_detailed(crd_number, employee_number)
-                logger.debug(f"SEC IAPD detailed_result: {json_dumps_with_alerts(detailed_result)}")
-                logger.info(f"SEC IAPD returned valid data for {claim_summary}")
+                # search_sec_iapd_individual already merges the detailed fetch
+                detailed_result = basic_result
+                logger.info("SEC IAPD returned valid data for %s", claim_summary)
                 return {
                     "source": "IAPD",
                     "basic_result": basic_result,
@@ -199,7 +188,7 @@ def search_with_crd_and_org_name(claim: Dict[str, Any], facade: FinancialService
                     "compliance_explanation": "Search completed successfully with SEC IAPD data, individual found."
                 }
             else:
-                logger.warning(f"SEC IAPD search returned no meaningful data for {claim_summary}")
+                logger.warning("SEC IAPD search returned no meaningful data for %s", claim_summary)
                 return {
                     "source": "IAPD",
                     "basic_result": basic_result or {},
@@ -210,7 +199,7 @@ def search_with_crd_and_org_name(claim: Dict[str, Any], facade: FinancialService
                     "compliance_explanation": "Search completed but no individual found in SEC IAPD data."
                 }
         except Exception as e:
-            logger.error(f"SEC IAPD search failed for {claim_summary}: {str(e)}", exc_info=True)
+            logger.error("SEC IAPD search failed for %s: %s", claim_summary, e, exc_info=True)
             return {
                 "source": "IAPD",
                 "basic_result": None,
@@ -224,9 +213,9 @@ def search_with_crd_and_org_name(claim: Dict[str, Any], facade: FinancialService
     else:
         try:
             broker_result = facade.search_finra_brokercheck_individual(crd_number, employee_number)
-            logger.debug(f"FINRA BrokerCheck result: {json_dumps_with_alerts(broker_result)}")
+            logger.debug("FINRA BrokerCheck result: %s", LazyJson(broker_result, dumps=json_dumps_with_alerts))
             if broker_result and broker_result.get("fetched_name", "").strip():
-                logger.info(f"FINRA BrokerCheck returned valid data for {claim_summary}")
+                logger.info("FINRA BrokerCheck returned valid data for %s", claim_summary)
                 return {
                     "source": "FINRA_BrokerCheck",
                     "basic_result": broker_result,
@@ -237,13 +226,13 @@ def search_with_crd_and_org_name(claim: Dict[str, Any], facade: FinancialService
                     "compliance_explanation": "Search completed successfully with FINRA BrokerCheck data, individual found."
                 }
         except Exception as e:
-            logger.error(f"FINRA BrokerCheck search failed for {claim_summary}: {str(e)}", exc_info=True)
+            logger.error("FINRA BrokerCheck search failed for %s: %s", claim_summary, e, exc_info=True)
 
         if org_name.strip():
             try:
                 org_crd_number = facade.get_organization_crd(org_name)
                 if not org_crd_number or org_crd_number == "NOT_FOUND":
-                    logger.warning(f"Unknown organization '{org_name}' for {claim_summary}")
+                    logger.warning("Unknown organization '%s' for %s", org_name, claim_summary)
                     return {
                         "source": "Entity_Search",
                         "basic_result": None,
@@ -255,7 +244,7 @@ def search_with_crd_and_org_name(claim: Dict[str, Any], facade: FinancialService
                         "skip_reasons": [f"Unable to resolve organization CRD from name '{org_name}'"]
                     }
             except Exception as e:
-                logger.error(f"Failed to resolve org CRD for '{org_name}' in {claim_summary}: {str(e)}", exc_info=True)
+                logger.error("Failed to resolve org CRD for '%s' in %s: %s", org_name, claim_summary, e, exc_info=True)
                 return {
                     "source": "Entity_Search",
                     "basic_result": None,
@@ -267,14 +256,14 @@ def search_with_crd_and_org_name(claim: Dict[str, Any], facade: FinancialService
                     "error": str(e)
                 }
 
-        logger.info(f"No valid BrokerCheck hits, falling back to SEC IAPD for {claim_summary}")
+        logger.info("No valid BrokerCheck hits, falling back to SEC IAPD for %s", claim_summary)
         try:
             basic_result = facade.search_sec_iapd_individual(crd_number, employee_number)
-            logger.debug(f"SEC IAPD basic_result: {json_dumps_with_alerts(basic_result)}")
+            logger.debug("SEC IAPD basic_result: %s", LazyJson(basic_result, dumps=json_dumps_with_alerts))
             if basic_result and (basic_result.get("fetched_name", "").strip() or basic_result.get("crd_number")):
-                detailed_result = facade.search_sec_iapd_detailed(crd_number, employee_number)
-                logger.debug(f"SEC IAPD detailed_result: {json_dumps_with_alerts(detailed_result)}")
-                logger.info(f"SEC IAPD returned valid data for {claim_summary}")
+                # search_sec_iapd_individual already merges the detailed fetch
+                detailed_result = basic_result
+                logger.info("SEC IAPD returned valid data for %s", claim_summary)
                 return {
                     "source": "IAPD",
                     "basic_result": basic_result,
@@ -285,7 +274,7 @@ def search_with_crd_and_org_name(claim: Dict[str, Any], facade: FinancialService
                     "compliance_explanation": "Search completed successfully with SEC IAPD data, individual found."
                 }
             else:
-                logger.warning(f"SEC IAPD search returned no meaningful data for {claim_summary}")
+                logger.warning("SEC IAPD search returned no meaningful data for %s", claim_summary)
                 return {
                     "source": "IAPD",
                     "basic_result": basic_result or {},
@@ -296,7 +285,7 @@ def search_with_crd_and_org_name(claim: Dict[str, Any], facade: FinancialService
                     "compliance_explanation": "Search completed but no individual found in SEC IAPD data."
                 }
         except Exception as e:
-            logger.error(f"SEC IAPD search failed for {claim_summary}: {str(e)}", exc_info=True)
+            logger.error("SEC IAPD search failed for %s: %s", claim_summary, e, exc_info=True)
             return {
                 "source": "IAPD",
                 "basic_result": None,
@@ -314,19 +303,19 @@ def search_with_crd_and_org_crd(claim: Dict[str, Any], facade: FinancialServices
     individual_name = claim.get("individual_name", "") or ""
     organization_crd_number = claim.get("organization_crd_number", "") or claim.get("organization_crd", "") or ""
     package_name = claim.get("packageName", "FULL").upper()
-    claim_summary = f"claim={json_dumps_with_alerts(claim)}, employee_number={employee_number}"
-    logger.info(f"Executing search_with_crd_and_org_crd for {claim_summary} with cr ascendancy: crd_number='{crd_number}', individual_name='{individual_name}', organization_crd_number='{organization_crd_number}', employee_number='{employee_number}', package_name='{package_name}'")
+    claim_summary = LazyFormat("claim=%s, employee_number=%s", LazyJson(claim, dumps=json_dumps_with_alerts), employee_number)
+    logger.info("Executing search_with_crd_and_org_crd for %s with cr ascendancy: crd_number='%s', individual_name='%s', organization_crd_number='%s', employee_number='%s', package_name='%s'", claim_summary, crd_number, individual_name, organization_crd_number, employee_number, package_name)
 
     broker_result = None
     sec_result = None
 
     if package_name == "BROKERCHECK":
-        logger.info(f"Prioritizing FINRA BrokerCheck due to packageName='BROKERCHECK' for {claim_summary}")
+        logger.info("Prioritizing FINRA BrokerCheck due to packageName='BROKERCHECK' for %s", claim_summary)
         try:
             broker_result = facade.search_finra_correlated(individual_name or crd_number, organization_crd_number, employee_number)
-            logger.debug(f"FINRA BrokerCheck correlated result: {json_dumps_with_alerts(broker_result)}")
+            logger.debug("FINRA BrokerCheck correlated result: %s", LazyJson(broker_result, dumps=json_dumps_with_alerts))
             if broker_result and broker_result.get("fetched_name", "").strip():
-                logger.info(f"FINRA BrokerCheck returned valid data for {claim_summary}")
+                logger.info("FINRA BrokerCheck returned valid data for %s", claim_summary)
                 return {
                     "source": "FINRA_BrokerCheck",
                     "basic_result": broker_result,
@@ -337,15 +326,15 @@ def search_with_crd_and_org_crd(claim: Dict[str, Any], facade: FinancialServices
                     "compliance_explanation": "Search completed successfully with FINRA BrokerCheck data, individual found."
                 }
         except Exception as e:
-            logger.error(f"FINRA BrokerCheck search failed for {claim_summary}: {str(e)}", exc_info=True)
+            logger.error("FINRA BrokerCheck search failed for %s: %s", claim_summary, e, exc_info=True)
 
         # Fallback to IAPD
-        logger.info(f"No valid BrokerCheck hits, falling back to SEC IAPD for {claim_summary}")
+        logger.info("No valid BrokerCheck hits, falling back to SEC IAPD for %s", claim_summary)
         try:
             sec_result = facade.search_sec_iapd_correlated(individual_name or crd_number, organization_crd_number, employee_number)
-            logger.debug(f"SEC IAPD correlated result: {json_dumps_with_alerts(sec_result)}")
+            logger.debug("SEC IAPD correlated result: %s", LazyJson(sec_result, dumps=json_dumps_with_alerts))
             if sec_result and sec_result.get("fetched_name", "").strip():
-                logger.info(f"SEC IAPD returned valid data for {claim_summary}")
+                logger.info("SEC IAPD returned valid data for %s", claim_summary)
                 return {
                     "source": "IAPD",
                     "basic_result": sec_result,
@@ -356,22 +345,22 @@ def search_with_crd_and_org_crd(claim: Dict[str, Any], facade: FinancialServices
                     "compliance_explanation": "Search completed successfully with SEC IAPD data, individual found."
                 }
         except Exception as e:
-            logger.error(f"SEC IAPD search failed for {claim_summary}: {str(e)}", exc_info=True)
+            logger.error("SEC IAPD search failed for %s: %s", claim_summary, e, exc_info=True)
     else:
         try:
             broker_result = facade.search_finra_correlated(individual_name or crd_number, organization_crd_number, employee_number)
-            logger.debug(f"FINRA BrokerCheck correlated result: {json_dumps_with_alerts(broker_result)}")
+            logger.debug("FINRA BrokerCheck correlated result: %s", LazyJson(broker_result, dumps=json_dumps_with_alerts))
         except Exception as e:
-            logger.error(f"FINRA BrokerCheck search failed for {claim_summary}: {str(e)}", exc_info=True)
+            logger.error("FINRA BrokerCheck search failed for %s: %s", claim_summary, e, exc_info=True)
 
         try:
             sec_result = facade.search_sec_iapd_correlated(individual_name or crd_number, organization_crd_number, employee_number)
-            logger.debug(f"SEC IAPD correlated result: {json_dumps_with_alerts(sec_result)}")
+            logger.debug("SEC IAPD correlated result: %s", LazyJson(sec_result, dumps=json_dumps_with_alerts))
         except Exception as e:
-            logger.error(f"SEC IAPD search failed for {claim_summary}: {str(e)}", exc_info=True)
+            logger.error("SEC IAPD search failed for %s: %s", claim_summary, e, exc_info=True)
 
         if sec_result and sec_result.get("fetched_name", "").strip():
-            logger.info(f"SEC IAPD returned valid data for {claim_summary}")
+            logger.info("SEC IAPD returned valid data for %s", claim_summary)
             return {
                 "source": "IAPD",
                 "basic_result": sec_result,
@@ -382,7 +371,7 @@ def search_with_crd_and_org_crd(claim: Dict[str, Any], facade: FinancialServices
                 "compliance_explanation": "Search completed successfully with SEC IAPD data, individual found."
             }
         elif broker_result and broker_result.get("fetched_name", "").strip():
-            logger.info(f"FINRA BrokerCheck returned valid data for {claim_summary}")
+            logger.info("FINRA BrokerCheck returned valid data for %s", claim_summary)
             return {
                 "source": "FINRA_BrokerCheck",
                 "basic_result": broker_result,
@@ -394,7 +383,7 @@ def search_with_crd_and_org_crd(claim: Dict[str, Any], facade: FinancialServices
             }
 
     # No valid results
-    logger.warning(f"No valid results found for {claim_summary} from FINRA BrokerCheck or SEC IAPD")
+    logger.warning("No valid results found for %s from FINRA BrokerCheck or SEC IAPD", claim_summary)
     return {
         "source": None,
         "basic_result": None,
@@ -409,8 +398,8 @@ def search_with_crd_only(claim: Dict[str, Any], facade: FinancialServicesFacade,
     """Search using only CRD number, respecting packageName and ensuring compliance reflects data retrieval."""
     crd_number = claim.get("crd_number", "") or ""
     package_name = claim.get("packageName", "FULL").upper()
-    claim_summary = f"claim={json_dumps_with_alerts(claim)}, employee_number={employee_number}"
-    logger.info(f"Executing search_with_crd_only for {claim_summary} with crd_number='{crd_number}', package_name='{package_name}'")
+    claim_summary = LazyFormat("claim=%s, employee_number=%s", LazyJson(claim, dumps=json_dumps_with_alerts), employee_number)
+    logger.info("Executing search_with_crd_only for %s with crd_number='%s', package_name='%s'", claim_summary, crd_number, package_name)
 
     broker_result = None
     sec_result = None
@@ -420,26 +409,24 @@ def search_with_crd_only(claim: Dict[str, Any], facade: FinancialServicesFacade,
     # Check FINRA BrokerCheck
     try:
         broker_result = facade.search_finra_brokercheck_individual(crd_number, employee_number)
-        logger.debug(f"FINRA BrokerCheck result: {json_dumps_with_alerts(broker_result)}")
+        logger.debug("FINRA BrokerCheck result: %s", LazyJson(broker_result, dumps=json_dumps_with_alerts))
         
-        # Get detailed result if basic search returned something
+        # The individual search already merges the detailed fetch; reuse it rather than searching again
         if broker_result and broker_result.get("fetched_name", "").strip():
-            broker_detailed_result = facade.search_finra_brokercheck_detailed(crd_number, employee_number)
-            logger.debug(f"FINRA BrokerCheck detailed_result: {json_dumps_with_alerts(broker_detailed_result)}")
+            broker_detailed_result = broker_result
     except Exception as e:
-        logger.error(f"FINRA BrokerCheck search failed for {claim_summary}: {str(e)}", exc_info=True)
+        logger.error("FINRA BrokerCheck search failed for %s: %s", claim_summary, e, exc_info=True)
 
     # Check SEC IAPD
     try:
         sec_result = facade.search_sec_iapd_individual(crd_number, employee_number)
-        logger.debug(f"SEC IAPD result: {json_dumps_with_alerts(sec_result)}")
+        logger.debug("SEC IAPD result: %s", LazyJson(sec_result, dumps=json_dumps_with_alerts))
         
-        # Get detailed result if basic search returned something
+        # The individual search already merges the detailed fetch; reuse it rather than searching again
         if sec_result and sec_result.get("fetched_name", "").strip():
-            sec_detailed_result = facade.search_sec_iapd_detailed(crd_number, employee_number)
-            logger.debug(f"SEC IAPD detailed_result: {json_dumps_with_alerts(sec_detailed_result)}")
+            sec_detailed_result = sec_result
     except Exception as e:
-        logger.error(f"SEC IAPD search failed for {claim_summary}: {str(e)}", exc_info=True)
+        logger.error("SEC IAPD search failed for %s: %s", claim_summary, e, exc_info=True)
 
     # Check for invalid CRD number
     is_invalid_crd = False
@@ -463,7 +450,7 @@ def search_with_crd_only(claim: Dict[str, Any], facade: FinancialServicesFacade,
     
     # Return invalid CRD result if detected
     if is_invalid_crd:
-        logger.warning(f"Invalid CRD detected for {claim_summary}: {invalid_crd_reason}")
+        logger.warning("Invalid CRD detected for %s: %s", claim_summary, invalid_crd_reason)
         return {
             "source": "CRD_Validation",
             "basic_result": broker_result or sec_result,
@@ -478,7 +465,7 @@ def search_with_crd_only(claim: Dict[str, Any], facade: FinancialServicesFacade,
     # Process results based on package_name preference
     if package_name == "BROKERCHECK":
         if broker_result and broker_result.get("fetched_name", "").strip():
-            logger.info(f"FINRA BrokerCheck returned valid data for {claim_summary}")
+            logger.info("FINRA BrokerCheck returned valid data for %s", claim_summary)
             return {
                 "source": "FINRA_BrokerCheck",
                 "basic_result": broker_result,
@@ -489,7 +476,7 @@ def search_with_crd_only(claim: Dict[str, Any], facade: FinancialServicesFacade,
                 "compliance_explanation": "Search completed successfully with FINRA BrokerCheck data, individual found."
             }
         elif sec_result and sec_result.get("fetched_name", "").strip():
-            logger.info(f"SEC IAPD returned valid data for {claim_summary}")
+            logger.info("SEC IAPD returned valid data for %s", claim_summary)
             return {
                 "source": "IAPD",
                 "basic_result": sec_result,
@@ -501,7 +488,7 @@ def search_with_crd_only(claim: Dict[str, Any], facade: FinancialServicesFacade,
             }
     else:
         if sec_result and sec_result.get("fetched_name", "").strip():
-            logger.info(f"SEC IAPD returned valid data for {claim_summary}")
+            logger.info("SEC IAPD returned valid data for %s", claim_summary)
             return {
                 "source": "IAPD",
                 "basic_result": sec_result,
@@ -512,7 +499,7 @@ def search_with_crd_only(claim: Dict[str, Any], facade: FinancialServicesFacade,
                 "compliance_explanation": "Search completed successfully with SEC IAPD data, individual found."
             }
         elif broker_result and broker_result.get("fetched_name", "").strip():
-            logger.info(f"FINRA BrokerCheck returned valid data for {claim_summary}")
+            logger.info("FINRA BrokerCheck returned valid data for %s", claim_summary)
             return {
                 "source": "FINRA_BrokerCheck",
                 "basic_result": broker_result,
@@ -524,7 +511,7 @@ def search_with_crd_only(claim: Dict[str, Any], facade: FinancialServicesFacade,
             }
 
     # No valid results
-    logger.warning(f"No valid results found for {claim_summary} from FINRA BrokerCheck or SEC IAPD")
+    logger.warning("No valid results found for %s from FINRA BrokerCheck or SEC IAPD", claim_summary)
     return {
         "source": None,
         "basic_result": None,
@@ -538,9 +525,9 @@ def search_with_crd_only(claim: Dict[str, Any], facade: FinancialServicesFacade,
 def search_with_entity(claim: Dict[str, Any], facade: FinancialServicesFacade, employee_number: str) -> Dict[str, Any]:
     """Search using only organization CRD number."""
     organization_crd_number = claim.get("organization_crd_number", claim.get("organization_crd", "")) or ""
-    claim_summary = f"claim={json_dumps_with_alerts(claim)}, employee_number={employee_number}"
-    logger.info(f"Executing search_with_entity for {claim_summary} with organization_crd_number='{organization_crd_number}'")
-    logger.warning(f"Entity search not supported for {claim_summary}")
+    claim_summary = LazyFormat("claim=%s, employee_number=%s", LazyJson(claim, dumps=json_dumps_with_alerts), employee_number)
+    logger.info("Executing search_with_entity for %s with organization_crd_number='%s'", claim_summary, organization_crd_number)
+    logger.warning("Entity search not supported for %s", claim_summary)
     return {
         "source": "Entity_Search",
         "basic_result": None,
@@ -554,9 +541,9 @@ def search_with_entity(claim: Dict[str, Any], facade: FinancialServicesFacade, e
 def search_with_org_name_only(claim: Dict[str, Any], facade: FinancialServicesFacade, employee_number: str) -> Dict[str, Any]:
     """Search using only organization name."""
     organization_name = claim.get("organization_name", "") or ""
-    claim_summary = f"claim={json_dumps_with_alerts(claim)}, employee_number={employee_number}"
-    logger.info(f"Executing search_with_org_name_only for {claim_summary} with organization_name='{organization_name}'")
-    logger.warning(f"Entity search not supported for {claim_summary}")
+    claim_summary = LazyFormat("claim=%s, employee_number=%s", LazyJson(claim, dumps=json_dumps_with_alerts), employee_number)
+    logger.info("Executing search_with_org_name_only for %s with organization_name='%s'", claim_summary, organization_name)
+    logger.warning("Entity search not supported for %s", claim_summary)
     return {
         "source": "Entity_Search",
         "basic_result": None,
@@ -569,9 +556,9 @@ def search_with_org_name_only(claim: Dict[str, Any], facade: FinancialServicesFa
 
 def search_default(claim: Dict[str, Any], facade: FinancialServicesFacade, employee_number: str) -> Dict[str, Any]:
     """Default search when no usable fields are provided."""
-    claim_summary = f"claim={json_dumps_with_alerts(claim)}, employee_number={employee_number}"
-    logger.info(f"Executing search_default for {claim_summary}")
-    logger.warning(f"Insufficient identifiers to perform search for {claim_summary}")
+    claim_summary = LazyFormat("claim=%s, employee_number=%s", LazyJson(claim, dumps=json_dumps_with_alerts), employee_number)
+    logger.info("Executing search_default for %s", claim_summary)
+    logger.warning("Insufficient identifiers to perform search for %s", claim_summary)
     return {
         "source": "Default",
         "basic_result": None,
@@ -588,19 +575,20 @@ def search_with_correlated(claim: Dict[str, Any], facade: FinancialServicesFacad
     organization_name = claim.get("organization_name", "") or ""
     organization_crd_number = claim.get("organization_crd_number", claim.get("organization_crd", "")) or ""
     package_name = claim.get("packageName", "FULL").upper()
-    claim_summary = f"claim={json_dumps_with_alerts(claim)}, employee_number={employee_number}"
-    logger.info(f"Executing search_with_correlated for {claim_summary} with individual_name='{individual_name}', "
-                f"organization_name='{organization_name}', organization_crd_number='{organization_crd_number}', package_name='{package_name}'")
+    claim_summary = LazyFormat("claim=%s, employee_number=%s", LazyJson(claim, dumps=json_dumps_with_alerts), employee_number)
+    logger.info("Executing search_with_correlated for %s with individual_name='%s', "
+                "organization_name='%s', organization_crd_number='%s', package_name='%s'",
+                claim_summary, individual_name, organization_name, organization_crd_number, package_name)
 
     resolved_crd_number = None
     if organization_crd_number.strip():
         resolved_crd_number = organization_crd_number
-        logger.debug(f"Using provided organization_crd_number='{resolved_crd_number}' for {claim_summary}")
+        logger.debug("Using provided organization_crd_number='%s' for %s", resolved_crd_number, claim_summary)
     elif organization_name.strip():
         try:
             resolved_crd_number = facade.get_organization_crd(organization_name)
             if not resolved_crd_number or resolved_crd_number == "NOT_FOUND":
-                logger.info(f"Skipping record - unable to resolve CRD for organization_name='{organization_name}' in {claim_summary}")
+                logger.info("Skipping record - unable to resolve CRD for organization_name='%s' in %s", organization_name, claim_summary)
                 return {
                     "source": "IAPD",
                     "basic_result": None,
@@ -611,9 +599,9 @@ def search_with_correlated(claim: Dict[str, Any], facade: FinancialServicesFacad
                     "compliance_explanation": f"Unable to resolve organization CRD from name '{organization_name}'",
                     "skip_reasons": [f"Unable to resolve organization CRD from name '{organization_name}'"]
                 }
-            logger.debug(f"Resolved CRD '{resolved_crd_number}' from organization_name='{organization_name}' for {claim_summary}")
+            logger.debug("Resolved CRD '%s' from organization_name='%s' for %s", resolved_crd_number, organization_name, claim_summary)
         except Exception as e:
-            logger.error(f"Error resolving CRD for organization_name='{organization_name}' in {claim_summary}: {str(e)}", exc_info=True)
+            logger.error("Error resolving CRD for organization_name='%s' in %s: %s", organization_name, claim_summary, e, exc_info=True)
             return {
                 "source": "IAPD",
                 "basic_result": None,
@@ -625,7 +613,7 @@ def search_with_correlated(claim: Dict[str, Any], facade: FinancialServicesFacad
                 "skip_reasons": [f"Organization CRD resolution failed for '{organization_name}'"]
             }
     else:
-        logger.info(f"Skipping record - no organization_name or organization_crd_number provided for {claim_summary}")
+        logger.info("Skipping record - no organization_name or organization_crd_number provided for %s", claim_summary)
         return {
             "source": "IAPD",
             "basic_result": None,
@@ -641,17 +629,17 @@ def search_with_correlated(claim: Dict[str, Any], facade: FinancialServicesFacad
     search_claim = claim.copy()
     search_claim["organization_crd"] = resolved_crd_number
     
-    logger.info(f"Searching with individual name '{individual_name}' and organization CRD '{resolved_crd_number}' for {claim_summary}")
+    logger.info("Searching with individual name '%s' and organization CRD '%s' for %s", individual_name, resolved_crd_number, claim_summary)
     if package_name == "BROKERCHECK":
-        logger.info(f"Prioritizing FINRA BrokerCheck due to packageName='BROKERCHECK' for {claim_summary}")
+        logger.info("Prioritizing FINRA BrokerCheck due to packageName='BROKERCHECK' for %s", claim_summary)
         try:
             basic_result = facade.search_finra_correlated(individual_name, resolved_crd_number, employee_number)
-            logger.debug(f"FINRA BrokerCheck basic_result: {json_dumps_with_alerts(basic_result)}")
+            logger.debug("FINRA BrokerCheck basic_result: %s", LazyJson(basic_result, dumps=json_dumps_with_alerts))
             if basic_result and (basic_result.get("fetched_name", "").strip() or basic_result.get("crd_number")):
                 crd_number = basic_result.get("crd_number")
                 detailed_result = facade.search_finra_brokercheck_detailed(crd_number, employee_number) if crd_number else None
-                logger.debug(f"FINRA BrokerCheck detailed_result: {json_dumps_with_alerts(detailed_result)}")
-                logger.info(f"FINRA BrokerCheck returned valid data for {claim_summary}")
+                logger.debug("FINRA BrokerCheck detailed_result: %s", LazyJson(detailed_result, dumps=json_dumps_with_alerts))
+                logger.info("FINRA BrokerCheck returned valid data for %s", claim_summary)
                 return {
                     "source": "FINRA_BrokerCheck",
                     "basic_result": basic_result,
@@ -662,18 +650,18 @@ def search_with_correlated(claim: Dict[str, Any], facade: FinancialServicesFacad
                     "compliance_explanation": "Search completed successfully with FINRA BrokerCheck data using individual name and organization CRD."
                 }
         except Exception as e:
-            logger.error(f"FINRA BrokerCheck search failed for {claim_summary}: {str(e)}", exc_info=True)
+            logger.error("FINRA BrokerCheck search failed for %s: %s", claim_summary, e, exc_info=True)
 
         # Fallback to IAPD
-        logger.info(f"No valid BrokerCheck hits, falling back to SEC IAPD for {claim_summary}")
+        logger.info("No valid BrokerCheck hits, falling back to SEC IAPD for %s", claim_summary)
         try:
             basic_result = facade.search_sec_iapd_correlated(individual_name, resolved_crd_number, employee_number)
-            logger.debug(f"SEC IAPD basic_result: {json_dumps_with_alerts(basic_result)}")
+            logger.debug("SEC IAPD basic_result: %s", LazyJson(basic_result, dumps=json_dumps_with_alerts))
             if basic_result and (basic_result.get("fetched_name", "").strip() or basic_result.get("crd_number")):
                 crd_number = basic_result.get("crd_number")
                 detailed_result = facade.search_sec_iapd_detailed(crd_number, employee_number) if crd_number else None
-                logger.debug(f"SEC IAPD detailed_result: {json_dumps_with_alerts(detailed_result)}")
-                logger.info(f"SEC IAPD returned valid data for {claim_summary}")
+                logger.debug("SEC IAPD detailed_result: %s", LazyJson(detailed_result, dumps=json_dumps_with_alerts))
+                logger.info("SEC IAPD returned valid data for %s", claim_summary)
                 return {
                     "source": "IAPD",
                     "basic_result": basic_result,
@@ -684,16 +672,16 @@ def search_with_correlated(claim: Dict[str, Any], facade: FinancialServicesFacad
                     "compliance_explanation": "Search completed successfully with SEC IAPD data using individual name and organization CRD."
                 }
         except Exception as e:
-            logger.error(f"SEC IAPD search failed for {claim_summary}: {str(e)}", exc_info=True)
+            logger.error("SEC IAPD search failed for %s: %s", claim_summary, e, exc_info=True)
     else:
         try:
             basic_result = facade.search_sec_iapd_correlated(individual_name, resolved_crd_number, employee_number)
-            logger.debug(f"SEC IAPD basic_result: {json_dumps_with_alerts(basic_result)}")
+            logger.debug("SEC IAPD basic_result: %s", LazyJson(basic_result, dumps=json_dumps_with_alerts))
             if basic_result and (basic_result.get("fetched_name", "").strip() or basic_result.get("crd_number")):
                 crd_number = basic_result.get("crd_number")
                 detailed_result = facade.search_sec_iapd_detailed(crd_number, employee_number) if crd_number else None
-                logger.debug(f"SEC IAPD detailed_result: {json_dumps_with_alerts(detailed_result)}")
-                logger.info(f"SEC IAPD returned valid data for {claim_summary}")
+                logger.debug("SEC IAPD detailed_result: %s", LazyJson(detailed_result, dumps=json_dumps_with_alerts))
+                logger.info("SEC IAPD returned valid data for %s", claim_summary)
                 return {
                     "source": "IAPD",
                     "basic_result": basic_result,
@@ -704,17 +692,17 @@ def search_with_correlated(claim: Dict[str, Any], facade: FinancialServicesFacad
                     "compliance_explanation": "Search completed successfully with SEC IAPD data using individual name and organization CRD."
                 }
         except Exception as e:
-            logger.error(f"SEC IAPD search failed for {claim_summary}: {str(e)}", exc_info=True)
+            logger.error("SEC IAPD search failed for %s: %s", claim_summary, e, exc_info=True)
 
-        logger.info(f"No valid IAPD hits, falling back to FINRA BrokerCheck for {claim_summary}")
+        logger.info("No valid IAPD hits, falling back to FINRA BrokerCheck for %s", claim_summary)
         try:
             basic_result = facade.search_finra_correlated(individual_name, resolved_crd_number, employee_number)
-            logger.debug(f"FINRA BrokerCheck basic_result: {json_dumps_with_alerts(basic_result)}")
+            logger.debug("FINRA BrokerCheck basic_result: %s", LazyJson(basic_result, dumps=json_dumps_with_alerts))
             if basic_result and (basic_result.get("fetched_name", "").strip() or basic_result.get("crd_number")):
                 crd_number = basic_result.get("crd_number")
                 detailed_result = facade.search_finra_brokercheck_detailed(crd_number, employee_number) if crd_number else None
-                logger.debug(f"FINRA BrokerCheck detailed_result.Setting extracted employments: {json_dumps_with_alerts(detailed_result)}")
-                logger.info(f"FINRA BrokerCheck returned valid data for {claim_summary}")
+                logger.debug("FINRA BrokerCheck detailed_result.Setting extracted employments: %s", LazyJson(detailed_result, dumps=json_dumps_with_alerts))
+                logger.info("FINRA BrokerCheck returned valid data for %s", claim_summary)
                 return {
                     "source": "FINRA_BrokerCheck",
                     "basic_result": basic_result,
@@ -725,9 +713,9 @@ def search_with_correlated(claim: Dict[str, Any], facade: FinancialServicesFacad
                     "compliance_explanation": "Search completed successfully with FINRA BrokerCheck data using individual name and organization CRD."
                 }
         except Exception as e:
-            logger.error(f"FINRA BrokerCheck search failed for {claim_summary}: {str(e)}", exc_info=True)
+            logger.error("FINRA BrokerCheck search failed for %s: %s", claim_summary, e, exc_info=True)
 
-    logger.warning(f"No valid results found for {claim_summary} from FINRA BrokerCheck or SEC IAPD")
+    logger.warning("No valid results found for %s from FINRA BrokerCheck or SEC IAPD", claim_summary)
     return {
         "source": None,
         "basic_result": None,
@@ -746,19 +734,36 @@ def process_claim(
     skip_arbitration: bool = False,
     skip_regulatory: bool = False
 ) -> Dict[str, Any]:
-    """Process a claim with enhanced error handling and logging."""
-    claim_summary = f"claim={json_dumps_with_alerts(claim)}"
+    """Process a claim with enhanced error handling and logging.
+
+    Facade searches are memoized for the duration of the claim, so strategies and their
+    fallbacks never fetch the same (source, CRD) pair twice.
+    """
+    with claim_request_context():
+        return _process_claim(claim, facade, employee_number, skip_disciplinary, skip_arbitration, skip_regulatory)
+
+def _process_claim(
+    claim: Dict[str, Any],
+    facade: FinancialServicesFacade,
+    employee_number: str,
+    skip_disciplinary: bool,
+    skip_arbitration: bool,
+    skip_regulatory: bool
+) -> Dict[str, Any]:
+    """Run the search strategy and reviews for a claim inside its request context."""
+    claim_summary = LazyFormat("claim=%s", LazyJson(claim, dumps=json_dumps_with_alerts))
     employee_number = claim.get("employee_number", employee_number or "EMP_DEFAULT")
-    logger.info(f"Starting claim processing for {claim_summary}, employee_number={employee_number}, "
-                f"skip_disciplinary={skip_disciplinary}, skip_arbitration={skip_arbitration}, skip_regulatory={skip_regulatory}")
+    logger.info("Starting claim processing for %s, employee_number=%s, "
+                "skip_disciplinary=%s, skip_arbitration=%s, skip_regulatory=%s",
+                claim_summary, employee_number, skip_disciplinary, skip_arbitration, skip_regulatory)
 
     strategy_func = determine_search_strategy(claim)
-    logger.debug(f"Selected strategy: {strategy_func.__name__} for {claim_summary}")
+    logger.debug("Selected strategy: %s for %s", strategy_func.__name__, claim_summary)
 
     try:
         search_evaluation = strategy_func(claim, facade, employee_number)
     except Exception as e:
-        logger.error(f"Search strategy {strategy_func.__name__} failed for {claim_summary}: {str(e)}", exc_info=True)
+        logger.error("Search strategy %s failed for %s: %s", strategy_func.__name__, claim_summary, e, exc_info=True)
         search_evaluation = {
             "source": "Unknown",
             "search_strategy": strategy_func.__name__,
@@ -795,7 +800,7 @@ def process_claim(
             last_name = " ".join(last_name_parts) if last_name_parts else ""
 
         if skip_disciplinary:
-            logger.info(f"Skipping disciplinary review for {claim_summary}")
+            logger.info("Skipping disciplinary review for %s", claim_summary)
             extracted_info["disciplinary_evaluation"] = {"actions": [], "due_diligence": {"status": "Skipped per configuration"}}
         else:
             try:
@@ -803,11 +808,11 @@ def process_claim(
                     "actions": [], "due_diligence": {"status": "No name provided"}
                 }
             except Exception as e:
-                logger.error(f"Disciplinary review failed for {claim_summary}: {str(e)}", exc_info=True)
+                logger.error("Disciplinary review failed for %s: %s", claim_summary, e, exc_info=True)
                 extracted_info["disciplinary_evaluation"] = {"actions": [], "due_diligence": {"status": f"Failed: {str(e)}"}}
 
         if skip_arbitration:
-            logger.info(f"Skipping arbitration review for {claim_summary}")
+            logger.info("Skipping arbitration review for %s", claim_summary)
             extracted_info["arbitration_evaluation"] = {"actions": [], "due_diligence": {"status": "Skipped per configuration"}}
         else:
             try:
@@ -815,11 +820,11 @@ def process_claim(
                     "actions": [], "due_diligence": {"status": "No name provided"}
                 }
             except Exception as e:
-                logger.error(f"Arbitration review failed for {claim_summary}: {str(e)}", exc_info=True)
+                logger.error("Arbitration review failed for %s: %s", claim_summary, e, exc_info=True)
                 extracted_info["arbitration_evaluation"] = {"actions": [], "due_diligence": {"status": f"Failed: {str(e)}"}}
 
         if skip_regulatory:
-            logger.info(f"Skipping regulatory review for {claim_summary}")
+            logger.info("Skipping regulatory review for %s", claim_summary)
             extracted_info["regulatory_evaluation"] = {"actions": [], "due_diligence": {"status": "Skipped per configuration"}}
         else:
             try:
@@ -827,7 +832,7 @@ def process_claim(
                     "actions": [], "due_diligence": {"status": "No name provided"}
                 }
             except Exception as e:
-                logger.error(f"Regulatory review failed for {claim_summary}: {str(e)}", exc_info=True)
+                logger.error("Regulatory review failed for %s: %s", claim_summary, e, exc_info=True)
                 extracted_info["regulatory_evaluation"] = {"actions": [], "due_diligence": {"status": f"Failed: {str(e)}"}}
 
         detailed_result = search_evaluation.get("detailed_result", {})
@@ -851,13 +856,13 @@ def process_claim(
 
     try:
         if facade.save_compliance_report(report, employee_number):
-            logger.info(f"Compliance report saved for {claim_summary}, reference_id={report['reference_id']}")
+            logger.info("Compliance report saved for %s, reference_id=%s", claim_summary, report['reference_id'])
         else:
-            logger.error(f"Failed to save compliance report for {claim_summary}, reference_id={report['reference_id']}")
+            logger.error("Failed to save compliance report for %s, reference_id=%s", claim_summary, report['reference_id'])
     except Exception as e:
-        logger.error(f"Exception while saving compliance report for {claim_summary}, reference_id={report['reference_id']}: {str(e)}", exc_info=True)
+        logger.error("Exception while saving compliance report for %s, reference_id=%s: %s", claim_summary, report['reference_id'], e, exc_info=True)
 
-    logger.info(f"Claim processing completed for {claim_summary}")
+    logger.info("Claim processing completed for %s", claim_summary)
     return report
 
 if __name__ == "__main__":
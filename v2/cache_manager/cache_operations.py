@@ -7,16 +7,18 @@
 This module provides the `CacheManager` class for general cache operations related to regulatory
 and compliance data. It handles clearing, listing, and cleaning up stale cache, excluding
 compliance-specific logic, which is delegated to `compliance_handler.py`.
+Bulk operations (clear-all and stale cleanup) run through the parallel engine in `maintenance.py`
+and return summaries only.
 """
 
 import json
-from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
 from .config import DEFAULT_CACHE_FOLDER, CACHE_TTL_DAYS
 from .agents import AgentName
 from .file_handler import FileHandler
+from .maintenance import CacheMaintenanceEngine
 import logging
 logger = logging.getLogger("CacheOperations")
 
@@ -28,12 +30,14 @@ class CacheManager:
         cache_folder (Path): Directory where cache data is stored (default: `cache/`).
         ttl_days (int): Time-to-live for cache files in days (default: 90).
         file_handler (FileHandler): Helper class for filesystem operations.
+        maintenance (CacheMaintenanceEngine): Parallel engine for bulk clear and cleanup operations.
     """
 
-    def __init__(self, cache_folder: Path = DEFAULT_CACHE_FOLDER, ttl_days: int = CACHE_TTL_DAYS):
+    def __init__(self, cache_folder: Path = DEFAULT_CACHE_FOLDER, ttl_days: int = CACHE_TTL_DAYS, storage_provider=None):
         self.cache_folder = cache_folder
         self.ttl_days = ttl_days
         self.file_handler = FileHandler(cache_folder)
+        self.maintenance = CacheMaintenanceEngine.from_storage_provider(storage_provider, cache_folder, ttl_days)
         if not self.cache_folder.exists():
             logger.warning(f"Cache folder does not exist: {self.cache_folder}")
 
@@ -62,40 +66,22 @@ class CacheManager:
         logger.info(result["message"])
         return json.dumps(result, indent=2)
 
-    def clear_all_cache(self) -> str:
+    def clear_all_cache(self, dry_run: bool = False) -> str:
         """
         Clear all cache except ComplianceReportAgent files across all employees.
 
+        Args:
+            dry_run (bool): Report what would be cleared without deleting anything.
+
         Returns:
-            str: JSON-formatted result of the operation.
+            str: JSON-formatted summary of the operation.
         """
-        result = {"cleared_employees": [], "total_cleared_agents": 0, "status": "success", "message": ""}
-        if not self.cache_folder.exists():
-            result["status"] = "warning"
-            result["message"] = f"No employee cache folders found at {self.cache_folder}"
+        if self.maintenance.s3_client is None and not self.cache_folder.exists():
+            result = {"status": "warning", "message": f"No employee cache folders found at {self.cache_folder}"}
             logger.warning(result["message"])
             return json.dumps(result, indent=2)
-
-        emp_dirs = self.file_handler.list_files(self.cache_folder, "*")
-        for emp_path in emp_dirs:
-            if emp_path.is_dir():
-                emp_num = emp_path.name
-                cleared_agents = []
-                for agent_folder in self.file_handler.list_files(emp_path, "*"):
-                    if agent_folder.is_dir() and agent_folder.name != AgentName.COMPLIANCE_REPORT:
-                        self.file_handler.delete_path(agent_folder)
-                        cleared_agents.append(agent_folder.name)
-                if cleared_agents:
-                    result["cleared_employees"].append({"employee_number": emp_num, "cleared_agents": cleared_agents})
-                    result["total_cleared_agents"] += len(cleared_agents)
-
-        if not result["cleared_employees"]:
-            result["status"] = "warning"
-            result["message"] = f"No cache found to clear in {self.cache_folder}"
-        else:
-            result["message"] = f"Cleared cache for {len(result['cleared_employees'])} employees, {result['total_cleared_agents']} agents total"
-        logger.info(result["message"])
-        return json.dumps(result, indent=2)
+        job = self.maintenance.run("clear_all", dry_run=dry_run)
+        return json.dumps(self._maintenance_result(job), indent=2)
 
     def clear_agent_cache(self, employee_number: str, agent_name: str) -> str:
         """
@@ -245,34 +231,56 @@ class CacheManager:
         result["message"] = f"Cache contents for {employee_number} (page {result['pagination']['current_page']} of {result['pagination']['total_pages']})"
         return json.dumps(result, indent=2)
 
-    def cleanup_stale_cache(self) -> str:
+    def cleanup_stale_cache(self, dry_run: bool = False) -> str:
         """
         Delete cache files older than ttl_days, excluding ComplianceReportAgent.
 
+        Args:
+            dry_run (bool): Count stale files without deleting them.
+
         Returns:
-            str: JSON-formatted result of the cleanup operation.
+            str: JSON-formatted summary of the cleanup operation.
         """
-        cutoff_date = datetime.now() - timedelta(days=self.ttl_days)
-        result = {"status": "success", "message": "", "deleted_files": []}
-        if not self.cache_folder.exists():
-            result["status"] = "warning"
-            result["message"] = f"Cache folder not found at {self.cache_folder}"
+        if self.maintenance.s3_client is None and not self.cache_folder.exists():
+            result = {"status": "warning", "message": f"Cache folder not found at {self.cache_folder}"}
             logger.warning(result["message"])
             return json.dumps(result, indent=2)
+        job = self.maintenance.run("cleanup_stale", dry_run=dry_run)
+        return json.dumps(self._maintenance_result(job), indent=2)
+
+    def start_maintenance(self, operation: str, dry_run: bool = False) -> str:
+        """
+        Start "cleanup_stale" or "clear_all" in the background.
+
+        Returns:
+            str: JSON-formatted job status including the job_id to poll with `get_maintenance_status`.
+        """
         try:
-            for emp_path in self.file_handler.list_files(self.cache_folder, "*"):
-                if emp_path.is_dir():
-                    for agent_folder in self.file_handler.list_files(emp_path, "*"):
-                        if agent_folder.name == AgentName.COMPLIANCE_REPORT:
-                            continue
-                        for file in self.file_handler.list_files(agent_folder, "*.json"):
-                            if datetime.fromtimestamp(file.stat().st_mtime) < cutoff_date:
-                                self.file_handler.delete_path(file)
-                                result["deleted_files"].append(str(file))
-        except Exception as e:
+            job = self.maintenance.start(operation, dry_run=dry_run)
+        except ValueError as e:
+            return json.dumps({"status": "error", "message": str(e)}, indent=2)
+        return json.dumps(job.to_dict(), indent=2)
+
+    def get_maintenance_status(self, job_id: str) -> str:
+        """
+        Report progress or the final summary of a background maintenance job.
+
+        Returns:
+            str: JSON-formatted job status.
+        """
+        job = self.maintenance.get_job(job_id)
+        if job is None:
+            return json.dumps({"job_id": job_id, "status": "warning", "message": f"No maintenance job found with id {job_id}"}, indent=2)
+        return json.dumps(job.to_dict(), indent=2)
+
+    def _maintenance_result(self, job) -> dict:
+        """Map a finished maintenance job to the status/message result format."""
+        result = job.to_dict()
+        if job.status == "failed":
             result["status"] = "error"
-            result["message"] = f"Failed to cleanup stale cache: {str(e)}"
-            logger.error(result["message"])
-        result["message"] = f"Deleted {len(result['deleted_files'])} stale cache files"
-        logger.info(result["message"])
-        return json.dumps(result, indent=2)
\ No newline at end of file
+        elif job.operation == "clear_all" and job.cleared_agents == 0:
+            result["status"] = "warning"
+            result["message"] = f"No cache found to clear in {self.cache_folder}"
+        else:
+            result["status"] = "success"
+        return result
@@ -16,6 +16,7 @@ def main():
     parser.add_argument("--clear-agent", nargs=2, metavar=("EMPLOYEE_NUMBER", "AGENT_NAME"), help="Clear cache for a specific agent")
     parser.add_argument("--list-cache", nargs="?", const="ALL", help="List all cached files (or specify an employee)")
     parser.add_argument("--cleanup-stale", action="store_true", help="Delete stale cache older than 90 days")
+    parser.add_argument("--dry-run", action="store_true", help="With --clear-cache ALL or --cleanup-stale, report what would be deleted without deleting")
     parser.add_argument("--get-latest-compliance", help="Get the latest compliance report for an employee")
     parser.add_argument("--get-compliance-by-ref", nargs=2, metavar=("EMPLOYEE_NUMBER", "REFERENCE_ID"), help="Get compliance report by reference ID")
     parser.add_argument("--list-compliance-reports", nargs="?", const=None, help="List all compliance reports with latest revision (or specify an employee)")
@@ -24,8 +25,10 @@ def main():
     parser.add_argument("--generate-compliance-taxonomy", action="store_true", help="Generate a taxonomy tree from the latest ComplianceReportAgent JSON files")
     parser.add_argument("--generate-risk-dashboard", action="store_true", help="Generate a compliance risk dashboard from the latest reports")
     parser.add_argument("--generate-data-quality", action="store_true", help="Generate a data quality report from the latest reports")
+    parser.add_argument("--rebuild-index", action="store_true", help="Rebuild the compliance report index from the cache folder")
     parser.add_argument("--page", type=int, default=1, help="Page number for paginated results (default: 1)")
     parser.add_argument("--page-size", type=int, default=10, help="Number of items per page (default: 10)")
+    parser.add_argument("--cursor", help="Cursor token from a previous summary's next_cursor (overrides --page)")
 
     args = parser.parse_args()
     cache_folder = Path(args.cache_folder) if args.cache_folder else None
@@ -35,7 +38,7 @@ def main():
 
     if args.clear_cache:
         if args.clear_cache == "ALL":
-            print(cache_manager.clear_all_cache())
+            print(cache_manager.clear_all_cache(dry_run=args.dry_run))
         else:
             print(cache_manager.clear_cache(args.clear_cache))
     elif args.clear_agent:
@@ -44,7 +47,9 @@ def main():
     elif args.list_cache is not None:
         print(cache_manager.list_cache(args.list_cache, args.page, args.page_size))
     elif args.cleanup_stale:
-        print(cache_manager.cleanup_stale_cache())
+        print(cache_manager.cleanup_stale_cache(dry_run=args.dry_run))
+    elif args.rebuild_index:
+        print(f"Indexed {compliance_handler.index.rebuild()} compliance reports")
     elif args.get_latest_compliance:
         print(compliance_handler.get_latest_compliance_report(args.get_latest_compliance))
     elif args.get_compliance_by_ref:
@@ -54,9 +59,9 @@ def main():
         print(compliance_handler.list_compliance_reports(args.list_compliance_reports, args.page, args.page_size))
     elif args.generate_compliance_summary:
         emp_path = cache_manager.cache_folder / args.generate_compliance_summary
-        print(summary_generator.generate_compliance_summary(emp_path, args.generate_compliance_summary, args.page, args.page_size))
+        print(summary_generator.generate_compliance_summary(emp_path, args.generate_compliance_summary, args.page, args.page_size, args.cursor))
     elif args.generate_all_summaries:
-        print(summary_generator.generate_all_compliance_summaries(cache_manager.cache_folder, args.page, args.page_size))
+        print(summary_generator.generate_all_compliance_summaries(cache_manager.cache_folder, args.page, args.page_size, args.cursor))
     elif args.generate_compliance_taxonomy:
         print(summary_generator.generate_taxonomy_from_latest_reports())
     elif args.generate_risk_dashboard:
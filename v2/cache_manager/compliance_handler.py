@@ -19,6 +19,7 @@ Initialize and use for compliance operations:
 ✔️ Retrieve compliance report by reference ID
 ✔️ List all compliance reports with only the latest revision per reference ID
 ✔️ Pagination support for listing reports
+✔️ Lookups answered from the compliance report index (`report_index.py`) instead of folder scans
 ✔️ All results returned as JSON strings
 
 🗂 CACHE FOLDER STRUCTURE
@@ -42,6 +43,7 @@ from typing import Optional, Dict, Any
 
 from .config import DEFAULT_CACHE_FOLDER
 from .file_handler import FileHandler
+from .report_index import ComplianceReportIndex
 import logging
 logger = logging.getLogger("ComplianceHandler")
 
@@ -55,6 +57,7 @@ class ComplianceHandler:
     Attributes:
         cache_folder (Path): Directory where cache data is stored (default: `cache/`).
         file_handler (FileHandler): Helper class for filesystem operations.
+        index (ComplianceReportIndex): Index of saved compliance reports under the cache folder.
 
     Methods:
         get_latest_compliance_report: Retrieves the latest compliance report with versioning.
@@ -71,6 +74,7 @@ class ComplianceHandler:
         """
         self.cache_folder = cache_folder
         self.file_handler = FileHandler(cache_folder)
+        self.index = ComplianceReportIndex(cache_folder)
         if not self.cache_folder.exists():
             logger.warning(f"Cache folder does not exist: {self.cache_folder}")
 
@@ -104,6 +108,14 @@ class ComplianceHandler:
             logger.warning(result["message"])
             return json.dumps(result, indent=2)
         
+        entry = self.index.latest_report(employee_number)
+        if entry:
+            report = self.file_handler.read_json(emp_path / entry["file_name"])
+            if report is not None:
+                result["report"] = report
+                result["message"] = f"Retrieved latest compliance report: {entry['file_name']}"
+                return json.dumps(result, indent=2)
+
         report_files = self.file_handler.list_files(emp_path, "ComplianceReportAgent_*_v*.json")
         if not report_files:
             result["status"] = "warning"
@@ -157,6 +169,14 @@ class ComplianceHandler:
             logger.warning(result["message"])
             return json.dumps(result, indent=2)
         
+        entry = self.index.latest_report(employee_number, reference_id)
+        if entry:
+            report = self.file_handler.read_json(emp_path / entry["file_name"])
+            if report is not None:
+                result["report"] = report
+                result["message"] = f"Retrieved compliance report: {entry['file_name']}"
+                return json.dumps(result, indent=2)
+
         report_files = self.file_handler.list_files(emp_path, f"ComplianceReportAgent_{reference_id}_v*.json")
         if not report_files:
             result["status"] = "warning"
@@ -252,43 +272,20 @@ class ComplianceHandler:
                 logger.warning(result["message"])
                 return json.dumps(result, indent=2)
             
-            emp_dirs = self.file_handler.list_files(self.cache_folder, "*")
-            if not emp_dirs:
+            full_reports: Dict[str, list] = {}
+            for emp_num in self.index.employees():
+                latest_reports = self.index.latest_reports(emp_num)
+                if latest_reports:
+                    full_reports[emp_num] = [
+                        {"reference_id": entry["reference_id"], "file_name": entry["file_name"], "last_modified": entry["last_modified"]}
+                        for entry in latest_reports
+                    ]
+            if not full_reports:
                 result["status"] = "warning"
-                result["message"] = "No directories found in cache folder"
+                result["message"] = "No compliance reports found in cache folder"
                 logger.warning(result["message"])
                 return json.dumps(result, indent=2)
 
-            full_reports: Dict[str, list] = {}
-            for emp_path in sorted(emp_dirs):
-                if emp_path.is_dir():
-                    report_files = self.file_handler.list_files(emp_path, "ComplianceReportAgent_*.json")
-                    if report_files:
-                        latest_reports: Dict[str, Dict[str, Any]] = {}
-                        for file in report_files:
-                            try:
-                                parts = file.name.split("_")
-                                if len(parts) < 4:
-                                    continue
-                                reference_id = parts[1]
-                                version = int(parts[2].split("v")[1].split("_")[0])
-                                last_modified = self.file_handler.get_last_modified(file)
-                                
-                                if reference_id not in latest_reports or version > latest_reports[reference_id]["version"]:
-                                    latest_reports[reference_id] = {
-                                        "reference_id": reference_id,
-                                        "version": version,
-                                        "file_name": file.name,
-                                        "last_modified": last_modified
-                                    }
-                            except (IndexError, ValueError) as e:
-                                logger.warning(f"Failed to parse file {file.name}: {str(e)}")
-                                continue
-                        full_reports[emp_path.name] = [
-                            {"reference_id": data["reference_id"], "file_name": data["file_name"], "last_modified": data["last_modified"]}
-                            for data in latest_reports.values()
-                        ]
-
             total_items = len(full_reports)
             page_size = max(1, page_size)
             total_pages = (total_items + page_size - 1) // page_size
@@ -316,8 +313,16 @@ class ComplianceHandler:
             logger.warning(result["message"])
             return json.dumps(result, indent=2)
 
-        full_reports = []
-        report_files = self.file_handler.list_files(emp_path, "ComplianceReportAgent_*.json")
+        full_reports = [
+            {
+                "reference_id": entry["reference_id"],
+                "version": entry["version"],
+                "file_name": entry["file_name"],
+                "last_modified": entry["last_modified"]
+            }
+            for entry in self.index.all_reports(employee_number)
+        ]
+        report_files = [] if full_reports else self.file_handler.list_files(emp_path, "ComplianceReportAgent_*.json")
         for file in report_files:
             try:
                 parts = file.name.split("_")
@@ -24,6 +24,7 @@ DEFAULT_CACHE_FOLDER = Path(__file__).parent.parent / "cache"  # Default cache d
 CACHE_TTL_DAYS = 90  # Cache expiration in days; files older than this are considered stale
 DATE_FORMAT = "%Y%m%d"  # Standardized date format for filenames (e.g., 20250308)
 MANIFEST_FILE = "manifest.txt"  # File to track last cache update per agent (not yet implemented)
+COMPLIANCE_INDEX_FILE = "compliance_index.jsonl"  # JSONL index of compliance reports, kept at the cache root
 
 # Logging Configuration
 LOG_LEVEL = "WARNING"  # Logging level; set to WARNING to suppress info logs
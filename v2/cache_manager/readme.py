@@ -210,7 +210,10 @@
 # - clear_cache(employee_number): Clears all agent caches except compliance reports.
 # - clear_agent_cache(employee_number, agent_name): Clears a specific agent’s cache.
 # - list_cache(employee_number=None): Lists cache for all or one employee.
-# - cleanup_stale_cache(): Removes files older than 90 days (excluding compliance reports).
+# - cleanup_stale_cache(dry_run=False): Removes files older than 90 days (excluding compliance reports).
+# - clear_all_cache(dry_run=False): Clears all agent caches for every employee.
+# - start_maintenance(operation, dry_run=False): Runs "cleanup_stale" or "clear_all" in the background.
+# - get_maintenance_status(job_id): Progress and summary counts of a background maintenance job.
 #
 # 📋 Compliance Handling (compliance_handler.ComplianceHandler)
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -0,0 +1,343 @@
+"""
+==============================================
+📌 COMPLIANCE REPORT INDEX MODULE OVERVIEW
+==============================================
+
+🗂 PURPOSE
+This module provides the `ComplianceReportIndex` class, a persistent JSONL manifest of every
+ComplianceReportAgent file in the cache. Each line holds the fields the compliance endpoints
+need (reference ID, employee, version, date, compliance flag, risk level, alert counts), so
+listings, summaries and the risk dashboard are answered without globbing employee folders or
+loading report JSON.
+
+🗂 USAGE
+The index is appended to whenever a compliance report is saved:
+    from cache_manager.report_index import index_compliance_report
+    index_compliance_report(Path("cache"), "EMP001", "ComplianceReportAgent_EN-53_v1_20250308.json", report)
+
+And queried by the handlers:
+    index = ComplianceReportIndex(Path("cache"))
+    index.latest_reports("EMP001")
+
+🗂 FEATURES
+✔️ Append-only JSONL file (`compliance_index.jsonl`) at the cache root, one line per report version
+✔️ Incremental refresh: only lines appended since the last read are parsed
+✔️ Automatic rebuild from the cache folder when the index file is missing
+✔️ Lock file (`compliance_index.jsonl.lock`) serializing rebuilds against appends across processes
+✔️ Latest revision per reference ID resolved by (date, version)
+
+🗂 TROUBLESHOOTING
+- If a listing misses reports copied into the cache by hand, run `rebuild()`
+  (or `python -m cache_manager.cli --rebuild-index`).
+- Entries whose report file was deleted are skipped when the report body is requested.
+==============================================
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: rebuilds are then only serialized within this process
+    fcntl = None
+
+from .config import COMPLIANCE_INDEX_FILE
+
+logger = logging.getLogger("ComplianceReportIndex")
+
+REPORT_FILE_PATTERN = re.compile(r"^ComplianceReportAgent_(?P<reference_id>.+)_v(?P<version>\d+)_(?P<date>\d{8})\.json$")
+
+# Subsections captured for non-compliant reports, in report order
+SUBSECTIONS = [
+    "search_evaluation",
+    "status_evaluation",
+    "name_evaluation",
+    "license_evaluation",
+    "exam_evaluation",
+    "disclosure_review",
+    "disciplinary_evaluation",
+    "arbitration_review",
+    "regulatory_evaluation"
+]
+
+SEVERITY_ORDER = {"Low": 0, "Medium": 1, "High": 2}
+
+_fallback_lock = threading.RLock()
+
+
+def parse_report_file_name(file_name: str) -> Optional[Tuple[str, int, str]]:
+    """
+    Parses a compliance report file name.
+
+    Args:
+        file_name (str): File name such as "ComplianceReportAgent_EN-53_v1_20250308.json".
+
+    Returns:
+        Optional[Tuple[str, int, str]]: (reference_id, version, date) or None if the name does not match.
+    """
+    match = REPORT_FILE_PATTERN.match(file_name)
+    if not match:
+        return None
+    return match.group("reference_id"), int(match.group("version")), match.group("date")
+
+
+def build_index_entry(report: Dict[str, Any], employee_number: str, file_name: str,
+                      last_modified: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Builds the index line for a compliance report.
+
+    Args:
+        report (Dict[str, Any]): Serialized compliance report.
+        employee_number (str): Employee folder the report is stored under.
+        file_name (str): Report file name, used for reference ID, version and date.
+        last_modified (Optional[str]): Timestamp string; defaults to now.
+
+    Returns:
+        Optional[Dict[str, Any]]: Index entry, or None if the file name is not a compliance report.
+    """
+    parsed = parse_report_file_name(file_name)
+    if not parsed:
+        return None
+    reference_id, version, date = parsed
+    final_eval = report.get("final_evaluation", {}) or {}
+    # Reports are indexed before serialization, so alerts may still be Alert objects
+    alerts = [alert.to_dict() if hasattr(alert, "to_dict") else alert for alert in final_eval.get("alerts") or []]
+    overall_compliance = final_eval.get("overall_compliance", False)
+
+    severity = None
+    if alerts:
+        severity = max((alert.get("severity", "Low") for alert in alerts), key=lambda s: SEVERITY_ORDER.get(s, 0))
+
+    subsections = []
+    if not overall_compliance or alerts:
+        for section_name in SUBSECTIONS:
+            section_data = report.get(section_name, {}) or {}
+            section_alerts = section_data.get("alerts")
+            subsections.append({
+                "subsection": section_name,
+                "compliance": section_data.get("compliance", True),
+                "alert_count": len(section_alerts) if section_alerts is not None else 0,
+                "explanation": section_data.get("compliance_explanation", "N/A")
+            })
+
+    return {
+        "employee_number": employee_number,
+        "claim_employee_number": report.get("claim", {}).get("employee_number", employee_number),
+        "reference_id": reference_id,
+        "version": version,
+        "date": date,
+        "file_name": file_name,
+        "last_modified": last_modified or datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "overall_compliance": overall_compliance,
+        "risk_level": final_eval.get("risk_level"),
+        "alert_count": len(alerts),
+        "max_severity": severity,
+        "alert_descriptions": [alert.get("description", "Unnamed alert") for alert in alerts],
+        "subsections": subsections
+    }
+
+
+class ComplianceReportIndex:
+    """
+    Persistent, append-only index of compliance reports stored in the cache folder.
+
+    The file is shared between processes: writers append one JSON line per saved report and
+    readers pick up new lines on their next query by reading from the last known offset.
+    Appends hold a shared lock on the lock file and rebuilds an exclusive one, so a report
+    appended or saved while another writer rebuilds is not lost when the rebuild replaces the file.
+
+    Attributes:
+        cache_folder (Path): Root cache folder containing employee subdirectories.
+        index_path (Path): Location of the JSONL index file.
+    """
+
+    def __init__(self, cache_folder: Path):
+        """Initialize the index for a cache folder; nothing is read until the first query."""
+        self.cache_folder = Path(cache_folder)
+        self.index_path = self.cache_folder / COMPLIANCE_INDEX_FILE
+        self.lock_path = self.cache_folder / f"{COMPLIANCE_INDEX_FILE}.lock"
+        self._lock = threading.Lock()
+        self._reports: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._offset = 0
+        self._inode = None
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool) -> Iterator[None]:
+        """Holds the index lock file: shared for appends, exclusive for creating or replacing the index."""
+        if fcntl is None:
+            with _fallback_lock:
+                yield
+            return
+        self.cache_folder.mkdir(parents=True, exist_ok=True)
+        with self.lock_path.open("a") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _create_if_missing(self) -> bool:
+        """Rebuilds the index unless another writer created it first; True if this call built it."""
+        with self._file_lock(exclusive=True):
+            if self.index_path.exists():
+                return False
+            self._rebuild_locked()
+            return True
+
+    def record(self, entry: Dict[str, Any]) -> None:
+        """
+        Appends an entry to the index file.
+
+        Each entry is written with a single append so concurrent writers do not interleave lines.
+        If the index does not exist yet it is rebuilt instead, which also picks up the report
+        just written along with any reports saved before the index was introduced.
+        """
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        while True:
+            with self._file_lock(exclusive=False):
+                if self.index_path.exists():
+                    with self.index_path.open("a", encoding="utf-8") as f:
+                        f.write(line)
+                    return
+            if self._create_if_missing():
+                return
+
+    def rebuild(self) -> int:
+        """
+        Rebuilds the index by scanning the cache folder and reading each report once.
+
+        Returns:
+            int: Number of reports indexed.
+        """
+        with self._file_lock(exclusive=True):
+            return self._rebuild_locked()
+
+    def _rebuild_locked(self) -> int:
+        entries = []
+        if self.cache_folder.exists():
+            for emp_path in sorted(self.cache_folder.iterdir()):
+                if not emp_path.is_dir():
+                    continue
+                for file in sorted(emp_path.glob("ComplianceReportAgent_*.json")):
+                    try:
+                        with file.open("r") as f:
+                            report = json.load(f)
+                        last_modified = datetime.fromtimestamp(file.stat().st_mtime).strftime("%Y-%m-%d %H:%M:%S")
+                        entry = build_index_entry(report, emp_path.name, file.name, last_modified)
+                    except Exception as e:
+                        logger.warning(f"Skipping {file} while rebuilding index: {str(e)}")
+                        continue
+                    if entry:
+                        entries.append(entry)
+
+        self.cache_folder.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        os.replace(tmp_path, self.index_path)
+
+        with self._lock:
+            self._reports = {}
+            self._offset = 0
+            self._inode = None
+        logger.info(f"Rebuilt compliance report index with {len(entries)} reports")
+        return len(entries)
+
+    def _refresh(self) -> None:
+        """Loads lines appended since the last read, reloading fully if the file was replaced."""
+        if not self.index_path.exists():
+            if not self.cache_folder.exists():
+                return
+            self._create_if_missing()
+
+        with self._lock:
+            stat = self.index_path.stat()
+            if stat.st_ino != self._inode or stat.st_size < self._offset:
+                self._reports = {}
+                self._offset = 0
+                self._inode = stat.st_ino
+            if stat.st_size == self._offset:
+                return
+            with self.index_path.open("rb") as f:
+                f.seek(self._offset)
+                data = f.read()
+            # Leave a partially written trailing line for the next refresh
+            end = data.rfind(b"\n") + 1
+            for raw in data[:end].splitlines():
+                try:
+                    entry = json.loads(raw)
+                except ValueError:
+                    logger.warning("Skipping malformed compliance index line")
+                    continue
+                self._reports.setdefault(entry["employee_number"], {})[entry["file_name"]] = entry
+            self._offset += end
+
+    def count(self) -> int:
+        """Returns the number of indexed report versions."""
+        self._refresh()
+        with self._lock:
+            return sum(len(reports) for reports in self._reports.values())
+
+    def employees(self) -> List[str]:
+        """Returns the sorted employee numbers that have indexed reports."""
+        self._refresh()
+        with self._lock:
+            return sorted(self._reports)
+
+    def all_reports(self, employee_number: str) -> List[Dict[str, Any]]:
+        """Returns every indexed report version for an employee, sorted by file name."""
+        self._refresh()
+        with self._lock:
+            reports = self._reports.get(employee_number, {})
+            return [reports[name] for name in sorted(reports)]
+
+    def latest_reports(self, employee_number: str) -> List[Dict[str, Any]]:
+        """Returns the latest revision per reference ID for an employee, sorted by file name."""
+        latest: Dict[str, Dict[str, Any]] = {}
+        for entry in self.all_reports(employee_number):
+            current = latest.get(entry["reference_id"])
+            if current is None or (entry["date"], entry["version"]) > (current["date"], current["version"]):
+                latest[entry["reference_id"]] = entry
+        return sorted(latest.values(), key=lambda e: e["file_name"])
+
+    def latest_report(self, employee_number: str, reference_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Returns the newest report for an employee, optionally restricted to one reference ID."""
+        candidates = [
+            entry for entry in self.latest_reports(employee_number)
+            if reference_id is None or entry["reference_id"] == reference_id
+        ]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda e: (e["date"], e["version"]))
+
+
+def index_compliance_report(cache_folder: Path, employee_number: str, file_name: str, report: Dict[str, Any]) -> bool:
+    """
+    Records a freshly saved compliance report in the index of its cache folder.
+
+    Args:
+        cache_folder (Path): Root cache folder the report was written under.
+        employee_number (str): Employee folder name.
+        file_name (str): Report file name.
+        report (Dict[str, Any]): Serialized report contents.
+
+    Returns:
+        bool: True if the entry was appended, False otherwise.
+    """
+    try:
+        entry = build_index_entry(report, employee_number, file_name)
+        if entry is None:
+            return False
+        ComplianceReportIndex(cache_folder).record(entry)
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to update compliance report index for {file_name}: {str(e)}")
+        return False
@@ -17,14 +17,20 @@ then call methods like `generate_compliance_summary`, `generate_taxonomy_from_la
 - Relies on `file_handler.py` for filesystem operations and `compliance_handler.py` for report filtering.
 - Outputs are either JSON strings (for summaries) or human-readable text (for taxonomy, dashboard, and quality reports).
 - Designed to work with `ComplianceReportAgent_*.json` files in the cache structure.
+- Cross-employee summaries and the risk dashboard are answered from the compliance report index
+  (`report_index.py`); only the taxonomy and data quality reports read report bodies.
 """
 
+import base64
+from bisect import bisect_right
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Iterator, Tuple, Optional
 from collections import defaultdict
 
 from .file_handler import FileHandler
 from .compliance_handler import ComplianceHandler
+from .report_index import ComplianceReportIndex
 import json
 import logging
 logger = logging.getLogger("SummaryGenerator")
@@ -104,15 +110,68 @@ class SummaryGenerator:
                     subsection_data.append(subsection_entry)
         return report_data, subsection_data
 
-    def generate_compliance_summary(self, emp_path: Path, employee_number: str, page: int = 1, page_size: int = 10) -> str:
+    def _encode_cursor(self, position: Dict[str, Any]) -> str:
+        """Encode a pagination position as an opaque cursor token."""
+        return base64.urlsafe_b64encode(json.dumps(position, separators=(",", ":")).encode("utf-8")).decode("ascii")
+
+    def _decode_cursor(self, cursor: str, after_type: type) -> Dict[str, Any]:
+        """
+        Decode a cursor token produced by `_encode_cursor`.
+
+        Args:
+            cursor (str): Cursor token.
+            after_type (type): Type of the position the endpoint expects: str for a file name,
+                list for an [employee_number, file_name] pair.
+
+        Raises:
+            ValueError: If the token is malformed or was issued by another endpoint.
+        """
+        try:
+            position = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        except Exception as e:
+            raise ValueError(f"Invalid cursor: {str(e)}")
+        if not isinstance(position, dict) or "after" not in position or "page" not in position:
+            raise ValueError("Invalid cursor: missing position")
+        after, page = position["after"], position["page"]
+        if not isinstance(after, after_type) or (
+                isinstance(after, list) and (len(after) != 2 or not all(isinstance(part, str) for part in after))):
+            raise ValueError("Invalid cursor: position does not belong to this summary")
+        if not isinstance(page, int) or isinstance(page, bool):
+            raise ValueError("Invalid cursor: page must be an integer")
+        return position
+
+    def _iter_indexed_summaries(self, index: ComplianceReportIndex, after: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield index entries in (employee, file name) order, starting after a position.
+
+        Args:
+            index (ComplianceReportIndex): Index to walk.
+            after (Optional[List[str]]): [employee_number, file_name] of the last entry already returned.
+
+        Yields:
+            Dict[str, Any]: Index entries.
+        """
+        for emp_num in index.employees():
+            if after and emp_num < after[0]:
+                continue
+            for entry in index.all_reports(emp_num):
+                if after and [emp_num, entry["file_name"]] <= after:
+                    continue
+                yield entry
+
+    def generate_compliance_summary(self, emp_path: Path, employee_number: str, page: int = 1, page_size: int = 10,
+                                    cursor: Optional[str] = None) -> str:
         """
         Generate a compliance summary for a specific employee with pagination.
 
+        Only the report files on the requested page are read, each exactly once.
+
         Args:
             emp_path (Path): Path to the employee's cache folder.
             employee_number (str): Employee identifier.
             page (int): Page number for pagination (default: 1).
             page_size (int): Number of items per page (default: 10).
+            cursor (Optional[str]): Token from a previous response's `next_cursor`; takes precedence over `page`.
 
         Returns:
             str: JSON-formatted summary of compliance data.
@@ -124,39 +183,67 @@ class SummaryGenerator:
               "message": "Generated compliance summary for EN-016314",
               "report_summary": [...],
               "subsection_summary": [...],
-              "pagination": {...}
+              "pagination": {..., "next_cursor": "eyJhZnRlciI6..."}
             }
         """
-        reports = [self.file_handler.read_json(f) for f in self.file_handler.list_files(emp_path, "ComplianceReportAgent_*.json") if self.file_handler.read_json(f)]
-        report_summary, subsection_summary = self._extract_compliance_data(reports, employee_number)
-        total_items = len(report_summary)
+        page_size = max(1, page_size)
+        report_files = self.file_handler.list_files(emp_path, "ComplianceReportAgent_*.json")
+        total_items = len(report_files)
         total_pages = (total_items + page_size - 1) // page_size
-        current_page = max(1, min(page, total_pages))
-        start_idx = (current_page - 1) * page_size
-        end_idx = start_idx + page_size
+        if cursor:
+            try:
+                position = self._decode_cursor(cursor, str)
+            except ValueError as e:
+                return json.dumps({"employee_number": employee_number, "status": "error", "message": str(e)}, indent=2)
+            start_idx = bisect_right([f.name for f in report_files], position["after"])
+            current_page = position["page"]
+        else:
+            current_page = max(1, min(page, total_pages))
+            start_idx = (current_page - 1) * page_size
+
+        reports = []
+        next_idx = start_idx
+        for file in report_files[start_idx:]:
+            if len(reports) == page_size:
+                break
+            next_idx += 1
+            data = self.file_handler.read_json(file)
+            if data:
+                data.setdefault("file_name", file.name)
+                reports.append(data)
+        report_summary, subsection_summary = self._extract_compliance_data(reports, employee_number)
+        next_cursor = None
+        if next_idx < total_items:
+            next_cursor = self._encode_cursor({"after": report_files[next_idx - 1].name, "page": current_page + 1})
         result = {
             "employee_number": employee_number,
             "status": "success",
             "message": f"Generated compliance summary for {employee_number}",
-            "report_summary": report_summary[start_idx:end_idx],
-            "subsection_summary": [entry for entry in subsection_summary if any(report["reference_id"] == entry["reference_id"] for report in report_summary[start_idx:end_idx])],
+            "report_summary": report_summary,
+            "subsection_summary": subsection_summary,
             "pagination": {
                 "total_items": total_items,
                 "total_pages": total_pages,
                 "current_page": current_page,
-                "page_size": page_size
+                "page_size": page_size,
+                "next_cursor": next_cursor
             }
         }
         return json.dumps(result, indent=2)
 
-    def generate_all_compliance_summaries(self, cache_folder: Path, page: int = 1, page_size: int = 10) -> str:
+    def generate_all_compliance_summaries(self, cache_folder: Path, page: int = 1, page_size: int = 10,
+                                          cursor: Optional[str] = None) -> str:
         """
         Generate a compliance summary for all employees with pagination.
 
+        Entries are streamed from the compliance report index and the walk stops as soon as the
+        requested page is filled, so cost depends on the page size rather than the cache size.
+
         Args:
             cache_folder (Path): Root cache folder containing employee subdirectories.
             page (int): Page number for pagination (default: 1).
             page_size (int): Number of items per page (default: 10).
+            cursor (Optional[str]): Token from a previous response's `next_cursor`; takes precedence over `page`.
 
         Returns:
             str: JSON-formatted summary of compliance data across all employees.
@@ -167,37 +254,66 @@ class SummaryGenerator:
               "message": "Generated compliance summary for 10 employees (page 1 of 1)",
               "report_summary": [...],
               "subsection_summary": [...],
-              "pagination": {...}
+              "pagination": {..., "next_cursor": "eyJhZnRlciI6..."}
             }
         """
         if not cache_folder.exists():
             return json.dumps({"status": "warning", "message": f"Cache folder not found at {cache_folder}"}, indent=2)
-        all_reports = []
-        all_subsections = []
-        emp_dirs = self.file_handler.list_files(cache_folder, "*")
-        for emp_path in emp_dirs:
-            if emp_path.is_dir():
-                emp_num = emp_path.name
-                reports = [self.file_handler.read_json(f) for f in self.file_handler.list_files(emp_path, "ComplianceReportAgent_*.json") if self.file_handler.read_json(f)]
-                if reports:
-                    report_data, subsection_data = self._extract_compliance_data(reports, emp_num)
-                    all_reports.extend(report_data)
-                    all_subsections.extend(subsection_data)
-        total_items = len(all_reports)
+        index = self.compliance_handler.index
+        if index.cache_folder != Path(cache_folder):
+            index = ComplianceReportIndex(cache_folder)
+        page_size = max(1, page_size)
+        total_items = index.count()
         total_pages = (total_items + page_size - 1) // page_size
-        current_page = max(1, min(page, total_pages))
-        start_idx = (current_page - 1) * page_size
-        end_idx = start_idx + page_size
+        if cursor:
+            try:
+                position = self._decode_cursor(cursor, list)
+            except ValueError as e:
+                return json.dumps({"status": "error", "message": str(e)}, indent=2)
+            entries = self._iter_indexed_summaries(index, after=position["after"])
+            current_page = position["page"]
+        else:
+            current_page = max(1, min(page, total_pages))
+            entries = islice(self._iter_indexed_summaries(index), (current_page - 1) * page_size, None)
+
+        report_summary = []
+        subsection_summary = []
+        last_entry = None
+        has_more = False
+        for entry in entries:
+            if len(report_summary) == page_size:
+                has_more = True
+                break
+            last_entry = entry
+            report_fields = {
+                'employee_number': entry['claim_employee_number'],
+                'reference_id': entry['reference_id'],
+                'file_name': entry['file_name']
+            }
+            report_summary.append({
+                **report_fields,
+                'overall_compliance': entry['overall_compliance'],
+                'risk_level': entry['risk_level'] or 'N/A',
+                'alert_count': entry['alert_count']
+            })
+            subsection_summary.extend({**report_fields, **subsection} for subsection in entry['subsections'])
+        next_cursor = None
+        if has_more:
+            next_cursor = self._encode_cursor({
+                "after": [last_entry['employee_number'], last_entry['file_name']],
+                "page": current_page + 1
+            })
         result = {
             "status": "success",
-            "message": f"Generated compliance summary for {len(emp_dirs)} employees (page {current_page} of {total_pages})",
-            "report_summary": all_reports[start_idx:end_idx],
-            "subsection_summary": all_subsections[start_idx:end_idx],
+            "message": f"Generated compliance summary for {len(index.employees())} employees (page {current_page} of {total_pages})",
+            "report_summary": report_summary,
+            "subsection_summary": subsection_summary,
             "pagination": {
                 "total_items": total_items,
                 "total_pages": total_pages,
                 "current_page": current_page,
-                "page_size": page_size
+                "page_size": page_size,
+                "next_cursor": next_cursor
             }
         }
         return json.dumps(result, indent=2)
@@ -323,52 +439,38 @@ class SummaryGenerator:
             Top Alerts:
               - "Individual not found" (8 occurrences)
         """
-        latest_reports_json = self.compliance_handler.list_compliance_reports(employee_number=None, page=1, page_size=99999)
-        latest_reports = json.loads(latest_reports_json)
-        if latest_reports["status"] != "success":
+        index = self.compliance_handler.index
+        employees = index.employees()
+        if not employees:
             return "No latest compliance reports available for risk analysis"
         risk_categories = {"Low": [], "Medium": [], "High": [], "Unknown": []}
         alert_counts = defaultdict(int)
         total_employees = 0
-        file_count = 0
-        if "reports" in latest_reports and isinstance(latest_reports["reports"], dict):
-            for emp_num, reports_list in latest_reports["reports"].items():
-                total_employees += 1
-                if reports_list:
-                    report = reports_list[0]
-                    file_path = self.file_handler.base_path / emp_num / report["file_name"]
-                    try:
-                        data = self.file_handler.read_json(file_path)
-                        if data:
-                            file_count += 1
-                            final_eval = data.get("final_evaluation", {})
-                            risk_level = final_eval.get("risk_level", "Unknown")
-                            alert_count = len(final_eval.get("alerts", []))
-                            overall_compliance = final_eval.get("overall_compliance", False)
-                            severity = "Unknown"
-                            if alert_count > 0 and final_eval.get("alerts"):
-                                severities = [alert.get("severity", "Low") for alert in final_eval["alerts"]]
-                                severity_order = {"Low": 0, "Medium": 1, "High": 2}
-                                severity = max(severities, key=lambda s: severity_order.get(s, 0))
-                            if risk_level not in risk_categories:
-                                risk_level = "Unknown"
-                            if risk_level == "Unknown":
-                                if overall_compliance and alert_count == 0:
-                                    risk_level = "Low"
-                                elif alert_count > 5 or severity == "High":
-                                    risk_level = "High"
-                                elif alert_count > 0:
-                                    risk_level = "Medium"
-                                else:
-                                    risk_level = "Low"
-                            risk_categories[risk_level].append(
-                                f"  - {emp_num}: {alert_count} alert{'s' if alert_count != 1 else ''} (severity: {severity})"
-                            )
-                            for alert in final_eval.get("alerts", []):
-                                alert_desc = alert.get("description", "Unnamed alert")
-                                alert_counts[alert_desc] += 1
-                    except Exception as e:
-                        logger.warning(f"Skipping invalid JSON file {file_path}: {str(e)}")
+        for emp_num in employees:
+            latest_reports = index.latest_reports(emp_num)
+            if not latest_reports:
+                continue
+            total_employees += 1
+            entry = latest_reports[0]
+            risk_level = entry["risk_level"] or "Unknown"
+            alert_count = entry["alert_count"]
+            severity = entry["max_severity"] or "Unknown"
+            if risk_level not in risk_categories:
+                risk_level = "Unknown"
+            if risk_level == "Unknown":
+                if entry["overall_compliance"] and alert_count == 0:
+                    risk_level = "Low"
+                elif alert_count > 5 or severity == "High":
+                    risk_level = "High"
+                elif alert_count > 0:
+                    risk_level = "Medium"
+                else:
+                    risk_level = "Low"
+            risk_categories[risk_level].append(
+                f"  - {emp_num}: {alert_count} alert{'s' if alert_count != 1 else ''} (severity: {severity})"
+            )
+            for alert_desc in entry["alert_descriptions"]:
+                alert_counts[alert_desc] += 1
         lines = [f"Compliance Risk Dashboard ({total_employees} employees analyzed)"]
         for category, employees in risk_categories.items():
             count = len(employees)
@@ -22,14 +22,21 @@ as dataclasses with a to_dict() method.
 """
 
 import json
-import re
 import logging
-from typing import Dict, Any, List, Set, Optional, Tuple
+from typing import Dict, Any, List, Set, FrozenSet, Optional, Tuple
+from functools import lru_cache
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from enum import Enum
 import jellyfish
+from rapidfuzz.distance import Levenshtein
+from rapidfuzz.process import cdist
 from common_types import MatchThreshold, DataSource
-from services_secondary import perform_regulatory_action_review
+from services_secondary import perform_regulatory_action_reviews
+from logger_config import LazyJson
+from report_serializer import AlertEncoder, json_dumps_with_alerts
+from exam_patterns import VALID_EXAM_PATTERNS, get_passed_exams
 import importlib.resources
 import os
 
@@ -43,7 +50,7 @@ class AlertSeverity(Enum):
     HIGH = "HIGH"
     INFO = "INFO"
 
-@dataclass
+@dataclass(slots=True)
 class Alert:
     alert_type: str
     severity: AlertSeverity
@@ -65,14 +72,6 @@ class Alert:
         return result
 
 # Constants and Helpers
-VALID_EXAM_PATTERNS = [
-    'Series 86/87', 'Series 9/10', 'Series 7TO', 'Series 99', 'Series 57',
-    'Series 66', 'Series 65', 'Series 63', 'Series 82', 'Series 52', 'Series 53',
-    'Series 51', 'Series 31', 'Series 28', 'Series 27', 'Series 26', 'Series 24',
-    'Series 22', 'Series 50', 'Series 4', 'Series 3', 'Series 7', 'Series 6', 'SIE'
-]
-VALID_EXAM_PATTERNS.sort(key=len, reverse=True)
-
 # Load nicknames from nicknames.json in the same directory
 try:
     nickname_path = os.path.join(os.path.dirname(__file__), "nicknames.json")
@@ -101,24 +100,101 @@ except json.JSONDecodeError as e:
     nickname_dict = {}
     reverse_nickname_dict = {}
 
+def compile_nickname_index(nicknames: Dict[str, List[str]], reverse_nicknames: Dict[str, Set[str]]) -> Tuple[Dict[str, FrozenSet[str]], Dict[str, FrozenSet[int]]]:
+    """
+    Precompute the variant set of every known name.
+
+    A name's variants are itself, its nicknames (if it is a formal name) and its formal
+    names (if it is a nickname). Each name is also interned to an integer ID so that two
+    names can be compared with a single set-disjointness check on small integer sets.
+
+    Returns:
+        (variant names per name, variant IDs per name)
+    """
+    variants: Dict[str, Set[str]] = {}
+    for name in set(nicknames) | set(reverse_nicknames):
+        name_variants = {name}
+        name_variants.update(nicknames.get(name, ()))
+        name_variants.update(reverse_nicknames.get(name, ()))
+        variants[name] = name_variants
+    # Douglas/Doug is guaranteed regardless of nicknames.json contents
+    variants.setdefault("douglas", {"douglas"}).add("doug")
+    variants.setdefault("doug", {"doug"}).add("douglas")
+
+    name_ids: Dict[str, int] = {}
+    for name_variants in variants.values():
+        for variant in name_variants:
+            name_ids.setdefault(variant, len(name_ids))
+    variant_names = {name: frozenset(name_variants) for name, name_variants in variants.items()}
+    variant_ids = {name: frozenset(name_ids[v] for v in name_variants) for name, name_variants in variants.items()}
+    return variant_names, variant_ids
+
+nickname_variants, nickname_variant_ids = compile_nickname_index(nickname_dict, reverse_nickname_dict)
+
+NAME_SUFFIXES = ("SR", "JR", "II", "III", "IV", "V")
+
 def extract_suffix(name_part: str) -> Tuple[str, Optional[str]]:
     """Extract suffix from a name part if present."""
-    suffixes = ["SR", "JR", "II", "III", "IV", "V"]
     name_part = name_part.strip()
+    upper = name_part.upper()
     
     # Check for suffix at the end with space
-    for suffix in suffixes:
-        if name_part.upper().endswith(f" {suffix}"):
+    for suffix in NAME_SUFFIXES:
+        if upper.endswith(f" {suffix}"):
             return name_part[:-len(suffix)-1].strip(), suffix
     
     # Check for suffix at the end without space
-    for suffix in suffixes:
-        if name_part.upper().endswith(suffix) and len(name_part) > len(suffix):
+    for suffix in NAME_SUFFIXES:
+        if upper.endswith(suffix) and len(name_part) > len(suffix):
             return name_part[:-len(suffix)].strip(), suffix
             
     return name_part, None
 
-def parse_name(name: str) -> Dict[str, Optional[str]]:
+@lru_cache(maxsize=65536)
+def phonetic_key(part_lower: Optional[str]) -> str:
+    """NYSIIS code of a lower-cased name part, or "" if there is none (memoized)."""
+    if not part_lower:
+        return ""
+    try:
+        return jellyfish.nysiis(part_lower)
+    except Exception:
+        return ""
+
+class ParsedName:
+    """
+    Parsed name components as returned by parse_name_cached.
+
+    Instances are shared between all callers parsing the same string, so treat them as
+    read-only. Besides the original parts they carry the lower-cased parts and NYSIIS keys
+    used by the matchers, and support parts["first"] style access like the parse_name dict.
+    """
+    __slots__ = ("first", "middle", "last", "suffix",
+                 "first_lower", "middle_lower", "last_lower", "middle_key", "last_key")
+
+    def __init__(self, first: Optional[str] = None, middle: Optional[str] = None,
+                 last: Optional[str] = None, suffix: Optional[str] = None):
+        self.first = first
+        self.middle = middle
+        self.last = last
+        self.suffix = suffix
+        self.first_lower = first.lower() if first else None
+        self.middle_lower = middle.lower() if middle else None
+        self.last_lower = last.lower() if last else None
+        self.middle_key = phonetic_key(self.middle_lower)
+        self.last_key = phonetic_key(self.last_lower)
+
+    def __getitem__(self, key: str) -> Optional[str]:
+        if key not in ("first", "middle", "last", "suffix"):
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        return {"first": self.first, "middle": self.middle, "last": self.last, "suffix": self.suffix}
+
+    def __repr__(self) -> str:
+        return f"ParsedName({self.first!r}, {self.middle!r}, {self.last!r}, {self.suffix!r})"
+
+def _split_name(name: str) -> Dict[str, Optional[str]]:
     name = name.strip()
     parts = [part.strip() for part in name.split(",")] if "," in name else name.split()
     result = {"first": None, "middle": None, "last": None, "suffix": None}
@@ -158,7 +234,7 @@ def parse_name(name: str) -> Dict[str, Optional[str]]:
                 result["last"] = parts[-1]
                 if len(parts) > 2:
                     # Check if the second-to-last part is a suffix
-                    if len(parts) > 3 and parts[-2].upper() in ["SR", "JR", "II", "III", "IV", "V"]:
+                    if len(parts) > 3 and parts[-2].upper() in NAME_SUFFIXES:
                         result["middle"] = " ".join(parts[1:-2])
                         result["suffix"] = parts[-2]
                     else:
@@ -166,60 +242,35 @@ def parse_name(name: str) -> Dict[str, Optional[str]]:
     
     return result
 
-def get_passed_exams(exams: List[Dict[str, Any]]) -> Set[str]:
-    passed_exams = set()
-    for exam in exams:
-        exam_category = exam.get('examCategory', '')
-        for pattern in VALID_EXAM_PATTERNS:
-            if re.search(pattern, exam_category, re.IGNORECASE):
-                passed_exams.add(pattern)
-                break
-    return passed_exams
-
-def get_name_variants(name: str) -> Set[str]:
-    name_lower = name.strip().lower()
-    variants = {name_lower}
-    logger.debug(f"Generating variants for name: {name_lower}")
-    
-    # Check if the name is a formal name
-    if name_lower in nickname_dict:
-        # Convert list to set for proper update
-        nickname_set = set(nickname_dict[name_lower])
-        variants.update(nickname_set)
-        logger.debug(f"Found nicknames for {name_lower}: {nickname_set}")
-    
-    # Check if the name is a nickname
-    if name_lower in reverse_nickname_dict:
-        variants.update(reverse_nickname_dict[name_lower])
-        logger.debug(f"Found formal names for {name_lower}: {reverse_nickname_dict[name_lower]}")
-    
-    # Special case for Douglas/Doug if not already handled
-    if name_lower == "douglas" and "doug" not in variants:
-        variants.add("doug")
-        logger.debug(f"Added special case nickname 'doug' for 'douglas'")
-    elif name_lower == "doug" and "douglas" not in variants:
-        variants.add("douglas")
-        logger.debug(f"Added special case formal name 'douglas' for 'doug'")
-    
-    logger.debug(f"Final variants for {name_lower}: {variants}")
-    return variants
+@lru_cache(maxsize=65536)
+def parse_name_cached(name: str) -> ParsedName:
+    """Parse a name once per distinct string; repeated calls return the same ParsedName."""
+    return ParsedName(**_split_name(name))
 
-def are_nicknames(name1: str, name2: str) -> bool:
-    name1_lower = name1.strip().lower()
-    name2_lower = name2.strip().lower()
-    
-    # Special case for Douglas/Doug
-    if (name1_lower == "douglas" and name2_lower == "doug") or \
-       (name1_lower == "doug" and name2_lower == "douglas"):
-        logger.debug(f"Special case match for Douglas/Doug: {name1_lower} ~ {name2_lower}")
+def parse_name(name: str) -> Dict[str, Optional[str]]:
+    """Split a name into first, middle, last and suffix (returns a new dict on each call)."""
+    return parse_name_cached(name).to_dict()
+
+@lru_cache(maxsize=65536)
+def _name_variants(name_lower: str) -> FrozenSet[str]:
+    return nickname_variants.get(name_lower) or frozenset((name_lower,))
+
+def get_name_variants(name: str) -> FrozenSet[str]:
+    """Return the lower-cased name together with its nicknames and formal names (memoized)."""
+    return _name_variants(name.strip().lower())
+
+@lru_cache(maxsize=65536)
+def _nickname_match(name1_lower: str, name2_lower: str) -> bool:
+    if name1_lower == name2_lower:
         return True
-        
-    variants1 = get_name_variants(name1_lower)
-    variants2 = get_name_variants(name2_lower)
-    common_variants = variants1.intersection(variants2)
-    is_match = bool(common_variants)
-    logger.debug(f"Checking if {name1_lower} and {name2_lower} are nicknames: variants1={variants1}, variants2={variants2}, common={common_variants}, match={is_match}")
-    return is_match
+    ids1 = nickname_variant_ids.get(name1_lower)
+    ids2 = nickname_variant_ids.get(name2_lower)
+    # Names missing from the index only have themselves as a variant
+    return ids1 is not None and ids2 is not None and not ids1.isdisjoint(ids2)
+
+def are_nicknames(name1: str, name2: str) -> bool:
+    """Return True if the names are equal or share a nickname/formal-name variant."""
+    return _nickname_match(name1.strip().lower(), name2.strip().lower())
 
 def match_name_part(claim_part: Optional[str], fetched_part: Optional[str], name_type: str) -> float:
     if not claim_part and not fetched_part:
@@ -240,26 +291,10 @@ def match_name_part(claim_part: Optional[str], fetched_part: Optional[str], name
         fetched_first = fetched_part.split()[0]
         logger.debug(f"Extracted first name from fetched part: {fetched_first}")
         
-        # Get variants for both names
-        claim_variants = get_name_variants(claim_part)
-        fetched_variants = get_name_variants(fetched_first)
-        
-        logger.debug(f"Claim variants for {claim_part}: {claim_variants}")
-        logger.debug(f"Fetched variants for {fetched_first}: {fetched_variants}")
-        
         # Check for nickname match
-        common_variants = claim_variants.intersection(fetched_variants)
-        if common_variants:
-            logger.debug(f"Nickname match for first name: {claim_part} ~ {fetched_first}, common variants: {common_variants}")
+        if are_nicknames(claim_part, fetched_first):
+            logger.debug(f"Nickname match for first name: {claim_part} ~ {fetched_first}")
             return 1.0
-        else:
-            logger.debug(f"No common variants between {claim_part} and {fetched_first}")
-            
-            # Special case for Douglas/Doug
-            if (claim_part.lower() == "douglas" and fetched_first.lower() == "doug") or \
-               (claim_part.lower() == "doug" and fetched_first.lower() == "douglas"):
-                logger.debug(f"Special case match for Douglas/Doug: {claim_part} ~ {fetched_first}")
-                return 1.0
             
         # If no nickname match, try initial match
         if len(claim_part) == 1 and len(fetched_first) == 1 and claim_part[0] == fetched_first[0]:
@@ -280,12 +315,9 @@ def match_name_part(claim_part: Optional[str], fetched_part: Optional[str], name
         return similarity if similarity >= 0.8 else 0.0
         
     elif name_type == "middle":
-        try:
-            code1 = jellyfish.nysiis(claim_part)
-            code2 = jellyfish.nysiis(fetched_part)
-            logger.debug(f"Middle name NYSIIS: {code1} vs {code2}")
-        except Exception:
-            code1 = code2 = ""
+        code1 = phonetic_key(claim_part)
+        code2 = phonetic_key(fetched_part)
+        logger.debug(f"Middle name NYSIIS: {code1} vs {code2}")
         return 0.8 if code1 == code2 and code1 != "" else 0.0
         
     elif name_type == "full":
@@ -308,89 +340,150 @@ def match_name_part(claim_part: Optional[str], fetched_part: Optional[str], name
     # Default case - return 0.0 instead of None
     return 0.0
 
+def _first_name_score(first1: Optional[str], first2: Optional[str]) -> float:
+    """Score two lower-cased first names: exact/nickname 100, initial 90, substring 85."""
+    if not first1 or not first2:
+        return 0.0
+    if first1 == first2 or _nickname_match(first1, first2):
+        return 100.0
+    if (len(first1) == 1 and first2[0] == first1) or (len(first2) == 1 and first1[0] == first2):
+        return 90.0
+    if first1 in first2 or first2 in first1:
+        return 85.0
+    return 0.0
+
+def _last_name_shortcut(last1: Optional[str], last2: Optional[str]) -> Optional[float]:
+    """Score two lower-cased last names when no edit distance is needed, else return None."""
+    if not last1 or not last2:
+        return 0.0
+    if last1 == last2:
+        return 100.0
+    if last1 in last2 or last2 in last1:
+        return 90.0
+    return None
+
+def _last_name_distance_score(distance: int, len1: int, len2: int) -> float:
+    """Convert a last-name edit distance into a score; similarities below 0.8 score 0."""
+    max_len = max(len1, len2)
+    similarity = 1.0 - (distance / max_len) if max_len else 0.0
+    return similarity * 100.0 if similarity >= 0.8 else 0.0
+
+def score_name_pair(name1: str, name2: str) -> float:
+    """Weighted name score (60% last name, 40% first name) on a 0-100 scale."""
+    parsed1 = parse_name_cached(name1)
+    parsed2 = parse_name_cached(name2)
+    last_name_score = _last_name_shortcut(parsed1.last_lower, parsed2.last_lower)
+    if last_name_score is None:
+        distance = Levenshtein.distance(parsed1.last_lower, parsed2.last_lower)
+        last_name_score = _last_name_distance_score(distance, len(parsed1.last), len(parsed2.last))
+    return (last_name_score * 0.6) + (_first_name_score(parsed1.first_lower, parsed2.first_lower) * 0.4)
+
+def _last_name_upper_bound(expected: ParsedName, candidate: ParsedName) -> float:
+    """
+    Upper bound on the edit-distance last-name score of two different, non-nested last names.
+
+    The Levenshtein distance of two different strings is at least 1 and at least their length
+    difference, so the similarity cannot exceed 1 - max(1, |len1 - len2|) / max_len.
+    """
+    min_distance = max(1, abs(len(expected.last_lower) - len(candidate.last_lower)))
+    return _last_name_distance_score(min_distance, len(expected.last), len(candidate.last))
+
+def evaluate_names_batch(expected_name: str, candidates: List[str], min_score: Optional[float] = None) -> List[Optional[float]]:
+    """
+    Score many candidate names against one expected name.
+
+    Produces the same scores as evaluate_name, but parses the expected name once,
+    reuses cached parses of repeated candidates and computes all last-name edit
+    distances in a single vectorized call.
+
+    With min_score set, candidates that need an edit distance are first blocked:
+    the first-name score (exact, nickname group, initial, substring) is exact and the
+    last-name score is bounded by _last_name_upper_bound, so any candidate whose best
+    possible score is below min_score can never reach it and is returned as None
+    instead of being scored.
+
+    Args:
+        expected_name: The name being searched for.
+        candidates: Candidate names, e.g. respondents from disciplinary records.
+        min_score: Optional threshold (0-100) below which candidates may be pruned.
+
+    Returns:
+        Scores (0-100) in the same order as candidates; None for pruned candidates.
+    """
+    expected = parse_name_cached(expected_name)
+    scores: List[Optional[float]] = []
+    pending: List[Tuple[int, ParsedName]] = []
+    for i, candidate in enumerate(candidates):
+        parsed = parse_name_cached(candidate)
+        first_score = _first_name_score(expected.first_lower, parsed.first_lower)
+        last_score = _last_name_shortcut(expected.last_lower, parsed.last_lower)
+        if last_score is None:
+            if min_score is not None and \
+                    _last_name_upper_bound(expected, parsed) * 0.6 + first_score * 0.4 < min_score:
+                scores.append(None)
+                continue
+            pending.append((i, parsed))
+            last_score = 0.0
+        scores.append(last_score * 0.6 + first_score * 0.4)
+
+    if pending:
+        distances = cdist([expected.last_lower], [parsed.last_lower for _, parsed in pending], scorer=Levenshtein.distance)[0]
+        for (i, parsed), distance in zip(pending, distances):
+            scores[i] += _last_name_distance_score(int(distance), len(expected.last), len(parsed.last)) * 0.6
+    return scores
+
+# Name-scoring traces are collected only inside trace_name_scoring() or when
+# NAME_SCORING_TRACE is set; otherwise evaluate_name does no trace work at all.
+NAME_SCORING_TRACE = os.getenv("NAME_SCORING_TRACE", "").lower() in ("1", "true", "yes")
+_name_score_trace: ContextVar[Optional[List[Dict[str, Any]]]] = ContextVar("name_score_trace", default=None)
+
+@contextmanager
+def trace_name_scoring():
+    """
+    Collect structured name-scoring traces for the calls made inside the block.
+
+    Scoped to the current thread/task, so a worker can trace a single claim:
+
+        with trace_name_scoring() as traces:
+            evaluate_name(expected, fetched, others)
+        # traces -> [{"expected_name": ..., "candidate": ..., "expected_parts": ..., ...}]
+    """
+    traces: List[Dict[str, Any]] = []
+    token = _name_score_trace.set(traces)
+    try:
+        yield traces
+    finally:
+        _name_score_trace.reset(token)
+
+def _record_name_score(expected_name: str, candidate: str, score: float, source: Optional[str]) -> None:
+    """Append a trace entry to the active collector and/or the debug log."""
+    traces = _name_score_trace.get()
+    entry = {
+        "expected_name": expected_name,
+        "candidate": candidate,
+        "expected_parts": parse_name(expected_name),
+        "candidate_parts": parse_name(candidate),
+        "score": score,
+        "source": source
+    }
+    if traces is not None:
+        traces.append(entry)
+    if NAME_SCORING_TRACE:
+        logger.debug("Name score trace: %s", entry)
+
 def evaluate_name(expected_name: Any, fetched_name: Any, other_names: List[Any], score_threshold: float = 80.0, source: str = None) -> Tuple[Dict[str, Any], Optional[Alert]]:
-    print("\n\n==== IMPROVED NAME MATCHING IMPLEMENTATION ====")
-    print(f"evaluate_name called with: expected_name={expected_name}, fetched_name={fetched_name}")
-    
-    # Simple implementation that doesn't use nested functions
-    def calculate_name_score(name1: str, name2: str) -> float:
-        print(f"calculate_name_score called with: name1={name1}, name2={name2}")
-        
-        # Parse names into components
-        name1_parts = parse_name(name1)
-        name2_parts = parse_name(name2)
-        
-        print(f"Parsed name1: {name1_parts}")
-        print(f"Parsed name2: {name2_parts}")
-        
-        # Score first name match (40% weight)
-        first_name_score = 0.0
-        if name1_parts["first"] and name2_parts["first"]:
-            # Check for exact match
-            if name1_parts["first"].lower() == name2_parts["first"].lower():
-                first_name_score = 100.0
-            # Check for nickname match
-            elif are_nicknames(name1_parts["first"], name2_parts["first"]):
-                first_name_score = 100.0
-            # Check for initial match
-            elif (len(name1_parts["first"]) == 1 and
-                  name2_parts["first"] and
-                  name2_parts["first"][0].lower() == name1_parts["first"].lower()):
-                first_name_score = 90.0
-            elif (len(name2_parts["first"]) == 1 and
-                  name1_parts["first"] and
-                  name1_parts["first"][0].lower() == name2_parts["first"].lower()):
-                first_name_score = 90.0
-            # Partial string match
-            elif (name1_parts["first"].lower() in name2_parts["first"].lower() or
-                  name2_parts["first"].lower() in name1_parts["first"].lower()):
-                first_name_score = 85.0
-        
-        # Score last name match (60% weight)
-        last_name_score = 0.0
-        if name1_parts["last"] and name2_parts["last"]:
-            # Check for exact match
-            if name1_parts["last"].lower() == name2_parts["last"].lower():
-                last_name_score = 100.0
-            # Partial string match
-            elif (name1_parts["last"].lower() in name2_parts["last"].lower() or
-                  name2_parts["last"].lower() in name1_parts["last"].lower()):
-                last_name_score = 90.0
-            # Use Levenshtein distance for similar last names
-            else:
-                distance = jellyfish.levenshtein_distance(
-                    name1_parts["last"].lower(),
-                    name2_parts["last"].lower()
-                )
-                max_len = max(len(name1_parts["last"]), len(name2_parts["last"]))
-                similarity = 1.0 - (distance / max_len) if max_len else 0.0
-                last_name_score = similarity * 100.0 if similarity >= 0.8 else 0.0
-        
-        # Calculate weighted score (60% last name, 40% first name)
-        weighted_score = (last_name_score * 0.6) + (first_name_score * 0.4)
-        
-        print(f"First name score: {first_name_score}, Last name score: {last_name_score}, Weighted score: {weighted_score}")
-        
-        return weighted_score
-    
-    print("About to calculate scores")
+    tracing = _name_score_trace.get() is not None or (NAME_SCORING_TRACE and logger.isEnabledFor(logging.DEBUG))
+
     names_found = []
     name_scores = {}
     
-    # Score the main name
-    print(f"Scoring main name: {fetched_name}")
-    main_score = calculate_name_score(expected_name, fetched_name)
-    print(f"Main name score: {main_score}")
-    names_found.append(fetched_name)
-    name_scores[fetched_name] = main_score
-    
-    # Score alternative names
-    for alt in other_names:
-        print(f"Scoring alt name: {alt}")
-        alt_score = calculate_name_score(expected_name, alt)
-        print(f"Alt name score: {alt_score}")
-        names_found.append(alt)
-        name_scores[alt] = alt_score
+    # Score the main name and the alternative names
+    for candidate in [fetched_name] + list(other_names):
+        score = score_name_pair(expected_name, candidate)
+        if tracing:
+            _record_name_score(expected_name, candidate, score, source)
+        names_found.append(candidate)
+        name_scores[candidate] = score
     
     # Determine if there's a match
     exact_match_found = any(score >= score_threshold for score in name_scores.values())
@@ -414,41 +507,39 @@ def evaluate_name(expected_name: Any, fetched_name: Any, other_names: List[Any],
             alert_category=determine_alert_category("Name Mismatch")
         )
     
-    print("Returning from evaluate_name")
-    
     # Parse expected name into components
-    expected_name_parts = parse_name(expected_name)
+    expected_name_parts = parse_name_cached(expected_name)
     
     # Create claimed_name structure
     claimed_name = {
-        "first": expected_name_parts["first"] if expected_name_parts["first"] else None,
-        "middle": expected_name_parts["middle"] if expected_name_parts["middle"] else None,
-        "last": expected_name_parts["last"] if expected_name_parts["last"] else None
+        "first": expected_name_parts.first or None,
+        "middle": expected_name_parts.middle or None,
+        "last": expected_name_parts.last or None
     }
     
     # Create all_matches array
     all_matches = []
     for i, name in enumerate(names_found):
-        name_parts = parse_name(name)
+        name_parts = parse_name_cached(name)
         
         # Calculate individual component scores
-        first_score = 1.0 if name_parts["first"] and expected_name_parts["first"] and \
-                      (name_parts["first"].lower() == expected_name_parts["first"].lower() or \
-                       are_nicknames(name_parts["first"], expected_name_parts["first"])) else 0.0
+        first_score = 1.0 if name_parts.first_lower and expected_name_parts.first_lower and \
+                      (name_parts.first_lower == expected_name_parts.first_lower or \
+                       _nickname_match(name_parts.first_lower, expected_name_parts.first_lower)) else 0.0
                        
         middle_score = 0.5  # Default for middle names when one is present and one is not
-        if name_parts["middle"] and expected_name_parts["middle"]:
-            middle_score = 1.0 if name_parts["middle"].lower() == expected_name_parts["middle"].lower() else 0.0
+        if name_parts.middle_lower and expected_name_parts.middle_lower:
+            middle_score = 1.0 if name_parts.middle_lower == expected_name_parts.middle_lower else 0.0
             
-        last_score = 1.0 if name_parts["last"] and expected_name_parts["last"] and \
-                     name_parts["last"].lower() == expected_name_parts["last"].lower() else 0.0
+        last_score = 1.0 if name_parts.last_lower and expected_name_parts.last_lower and \
+                     name_parts.last_lower == expected_name_parts.last_lower else 0.0
         
         match_entry = {
             "name_source": "main_fetched_name" if i == 0 else f"other_names[{i-1}]",
             "fetched_name": {
-                "first": name_parts["first"] if name_parts["first"] else None,
-                "middle": name_parts["middle"] if name_parts["middle"] else None,
-                "last": name_parts["last"] if name_parts["last"] else None
+                "first": name_parts.first or None,
+                "middle": name_parts.middle or None,
+                "last": name_parts.last or None
             },
             "score": name_scores[name],
             "first_score": first_score,
@@ -1045,14 +1136,20 @@ def evaluate_regulatory(actions: List[Dict[str, Any]], name: str, due_diligence:
                 nfa_id_to_alert_index[nfa_id] = len(alerts) - 1
 
     if regulatory_found:
+        if not employee_number:
+            logger.warning(f"employee_number is None for NFA IDs {list(nfa_id_to_alert_index)}, using default 'UNKNOWN'")
+            employee_number = "UNKNOWN"  # TODO: Remove this once we have a way to get the employee number
+        logger.info(f"Performing secondary NFA search for NFA IDs {list(nfa_id_to_alert_index)} for {name}")
+        try:
+            secondary_results = perform_regulatory_action_reviews(nfa_id_to_alert_index, employee_number)
+        except Exception as e:
+            secondary_results = {nfa_id: e for nfa_id in nfa_id_to_alert_index}
         for nfa_id, alert_idx in nfa_id_to_alert_index.items():
             try:
-                logger.info(f"Performing secondary NFA search for NFA ID {nfa_id} for {name}")
-                if not employee_number:
-                    logger.warning(f"employee_number is None for NFA ID {nfa_id}, using default 'UNKNOWN'")
-                    employee_number = "UNKNOWN"  # TODO: Remove this once we have a way to get the employee number  
-                secondary_result = perform_regulatory_action_review(nfa_id, employee_number)
-                logger.debug(f"Secondary NFA search result for NFA ID {nfa_id}: {json_dumps_with_alerts(secondary_result, indent=2)}")
+                secondary_result = secondary_results.get(nfa_id)
+                if isinstance(secondary_result, Exception):
+                    raise secondary_result
+                logger.debug("Secondary NFA search result for NFA ID %s: %s", nfa_id, LazyJson(secondary_result, dumps=json_dumps_with_alerts, indent=2))
                 if secondary_result and isinstance(secondary_result, dict):
                     secondary_actions = secondary_result.get("actions", [])
                     if secondary_actions:
@@ -1184,17 +1281,6 @@ def determine_alert_category(alert_type: str) -> str:
     }
     return alert_type_to_category.get(alert_type, "status_evaluation")
 
-class AlertEncoder(json.JSONEncoder):
-    """Custom JSON encoder to handle Alert objects."""
-    def default(self, obj):
-        if isinstance(obj, Alert):
-            return obj.to_dict()
-        return super().default(obj)
-
-def json_dumps_with_alerts(obj: Any, **kwargs) -> str:
-    """Helper function to serialize objects that may contain Alert instances."""
-    return json.dumps(obj, cls=AlertEncoder, **kwargs)
-
 if __name__ == "__main__":
     logging.basicConfig(level=logging.DEBUG)
 
@@ -1,8 +1,10 @@
+import json
 import logging
 import logging.handlers
 import os
+from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, Set
+from typing import Any, Callable, Dict, Optional, Set, Union
 
 # Define LOGGER_GROUPS at module scope
 LOGGER_GROUPS = {
@@ -48,8 +50,20 @@ LOGGER_GROUPS = {
 # Global flag to track if logging has been initialized
 _LOGGING_INITIALIZED = False
 
-def setup_logging(debug: bool = False) -> Dict[str, logging.Logger]:
-    """Configure logging for all modules, ensuring idempotency."""
+# Default level when setup_logging() is called without an explicit debug flag
+LOG_LEVEL_ENV = "LOG_LEVEL"
+
+def _to_level(level: Union[int, str]) -> int:
+    """Convert a level name or number to a logging level, defaulting to INFO."""
+    if isinstance(level, int):
+        return level
+    return getattr(logging, str(level).upper(), logging.INFO)
+
+def setup_logging(debug: Optional[bool] = None) -> Dict[str, logging.Logger]:
+    """Configure logging for all modules, ensuring idempotency.
+
+    If debug is None the level is read from the LOG_LEVEL environment variable (default INFO).
+    """
     global _LOGGING_INITIALIZED
     if _LOGGING_INITIALIZED:
         return {key: logging.getLogger(name) for key, name in LOGGER_GROUPS['core'].items()}
@@ -58,8 +72,11 @@ def setup_logging(debug: bool = False) -> Dict[str, logging.Logger]:
     log_dir = "logs"
     os.makedirs(log_dir, exist_ok=True)
 
-    # Set level based on debug flag
-    base_level = logging.DEBUG if debug else logging.INFO
+    # Set level based on debug flag, falling back to the environment
+    if debug is None:
+        base_level = _to_level(os.getenv(LOG_LEVEL_ENV, "INFO"))
+    else:
+        base_level = logging.DEBUG if debug else logging.INFO
 
     # Get root logger and clear existing handlers
     root_logger = logging.getLogger()
@@ -102,6 +119,22 @@ def setup_logging(debug: bool = False) -> Dict[str, logging.Logger]:
     _LOGGING_INITIALIZED = True
     return loggers
 
+def set_log_level(level: Union[int, str]) -> int:
+    """Change the level of the root handlers and all grouped loggers at runtime.
+
+    Returns:
+        int: The numeric level applied.
+    """
+    numeric_level = _to_level(level)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(numeric_level)
+    for handler in root_logger.handlers:
+        handler.setLevel(numeric_level)
+    for group_loggers in LOGGER_GROUPS.values():
+        for logger_name in group_loggers.values():
+            logging.getLogger(logger_name).setLevel(numeric_level)
+    return numeric_level
+
 def reconfigure_logging(loggers: Dict[str, logging.Logger], enabled_groups: Set[str], group_levels: Dict[str, str]) -> None:
     """Reconfigure logging settings for specified logger groups."""
     groups = loggers.get('_groups', {})
@@ -122,4 +155,58 @@ def flush_logs():
     """Flush all log handlers to ensure logs are written to disk."""
     root_logger = logging.getLogger()
     for handler in root_logger.handlers:
-        handler.flush()
\ No newline at end of file
+        handler.flush()
+
+class _LazyText(ABC):
+    """Log argument rendered by str() only when a record is emitted, then cached."""
+    __slots__ = ("_text",)
+
+    def __init__(self):
+        self._text = None
+
+    @abstractmethod
+    def _render(self) -> str:
+        """Build the text for this argument."""
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = self._render()
+        return self._text
+
+class LazyJson(_LazyText):
+    """JSON log payload serialized only if the record is emitted.
+
+    Usage:
+        logger.debug("Normalized result: %s", LazyJson(result, indent=2))
+        logger.debug("Result: %s", LazyJson(result, dumps=json_dumps_with_alerts))
+    """
+    __slots__ = ("obj", "dumps", "kwargs")
+
+    def __init__(self, obj: Any, dumps: Callable[..., str] = json.dumps, **kwargs):
+        super().__init__()
+        self.obj = obj
+        self.dumps = dumps
+        self.kwargs = kwargs
+
+    def _render(self) -> str:
+        try:
+            return self.dumps(self.obj, **self.kwargs)
+        except (TypeError, ValueError):
+            return repr(self.obj)
+
+class LazyFormat(_LazyText):
+    """%-style message fragment formatted only if the record is emitted.
+
+    Usage:
+        claim_summary = LazyFormat("claim=%s", LazyJson(claim))
+        logger.info("Selected search for %s", claim_summary)
+    """
+    __slots__ = ("fmt", "args")
+
+    def __init__(self, fmt: str, *args: Any):
+        super().__init__()
+        self.fmt = fmt
+        self.args = args
+
+    def _render(self) -> str:
+        return self.fmt % self.args
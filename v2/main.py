@@ -11,10 +11,12 @@ import os
 import signal
 import sys
 import logging
-from typing import Dict, Set, Any
-from main_config import DEFAULT_WAIT_TIME, OUTPUT_FOLDER, load_config, save_config, INPUT_FOLDER, CHECKPOINT_FILE, get_storage_config
-from main_file_utils import setup_folders, load_checkpoint, save_checkpoint, get_csv_files, archive_file
+from typing import Dict, Set, Any, Optional
+from main_config import DEFAULT_WAIT_TIME, DEFAULT_BATCH_WORKERS, OUTPUT_FOLDER, load_config, save_config, INPUT_FOLDER, CHECKPOINT_FILE, get_storage_config
+from main_file_utils import setup_folders, load_checkpoint, load_checkpoint_state, save_checkpoint, get_csv_files, archive_file
 from main_csv_processing import CSVProcessor
+from main_batch_engine import BatchEngine
+from result_sink import create_result_sink
 from main_menu_helper import display_menu, handle_menu_choice
 from services import FinancialServicesFacade
 from logger_config import setup_logging, reconfigure_logging, flush_logs
@@ -27,10 +29,13 @@ storage_manager = None  # Global storage manager instance
 def signal_handler(sig, frame):
     """Handle system signals."""
     global storage_manager
+    if csv_processor.checkpoint_journal:
+        csv_processor.checkpoint_journal.commit()
     if csv_processor.current_csv and csv_processor.current_line > 0:
         logger.info(f"Signal received ({signal.Signals(sig).name}), saving checkpoint: {csv_processor.current_csv}, line {csv_processor.current_line}")
         if storage_manager:
-            save_checkpoint(csv_processor.current_csv, csv_processor.current_line, storage_manager)
+            save_checkpoint(csv_processor.current_csv, csv_processor.current_line, storage_manager,
+                            byte_offset=csv_processor.current_offset)
         else:
             logger.warning("Cannot save checkpoint: storage_manager is None")
     logger.info("Exiting due to signal")
@@ -84,8 +89,14 @@ def signal_handler(sig, frame):
 #     except Exception as e:
 #         logger.error(f"Error archiving file {file_path}: {str(e)}")
 
-def run_batch_processing(facade: FinancialServicesFacade, config: Dict[str, Any], wait_time: float, loggers: Dict[str, logging.Logger]):
-    """Run batch processing with the given configuration."""
+def run_batch_processing(facade: FinancialServicesFacade, config: Dict[str, Any], wait_time: float, loggers: Dict[str, logging.Logger],
+                         workers: Optional[int] = None):
+    """Run batch processing with the given configuration.
+
+    Rows are processed by `workers` concurrent workers (default: config "batch_workers"),
+    each with its own facade; the given facade is reused by the first worker. Results go to
+    the sink named by config "result_sink" (see result_sink.create_result_sink).
+    """
     global storage_manager, csv_processor
     
     # Initialize storage manager if not already done
@@ -102,28 +113,26 @@ def run_batch_processing(facade: FinancialServicesFacade, config: Dict[str, Any]
         return
     
     # Load checkpoint
-    last_csv, last_line = load_checkpoint(storage_manager)
+    checkpoint = load_checkpoint_state(storage_manager)
+    last_csv, last_line = checkpoint.get('csv_file', ''), checkpoint.get('line_number', 0)
+    last_offset = checkpoint.get('byte_offset')
     if last_csv and last_csv in csv_files:
         csv_files = csv_files[csv_files.index(last_csv):]
-        logger.info(f"Resuming from checkpoint: {last_csv}, line {last_line}")
+        logger.info(f"Resuming from checkpoint: {last_csv}, line {last_line}, byte offset {last_offset}")
     
-    # Set storage manager in CSV processor
+    # Set storage manager and result sink in CSV processor
     csv_processor.set_storage_manager(storage_manager)
+    result_sink = create_result_sink(storage_manager, config)
+    csv_processor.set_result_sink(result_sink)
     
-    # Process each CSV file
-    for csv_file in csv_files:
-        try:
-            csv_processor.process_csv(
-                csv_file,
-                start_line=last_line if csv_file == last_csv else 0,
-                facade=facade,
-                config=config,
-                wait_time=wait_time
-            )
-            archive_file(csv_file, storage_manager)
-        except Exception as e:
-            logger.error(f"Error processing file {csv_file}: {str(e)}")
-            continue
+    # Process and archive each CSV file
+    if workers is None:
+        workers = config.get("batch_workers", DEFAULT_BATCH_WORKERS)
+    engine = BatchEngine(csv_processor, storage_manager, config, workers=workers, wait_time=wait_time, facade=facade)
+    try:
+        return engine.run(csv_files, last_csv, last_line, last_offset)
+    finally:
+        result_sink.close()
 
 def main(test_mode=False):
     """Main application entry point.
@@ -133,7 +142,9 @@ def main(test_mode=False):
     """
     parser = argparse.ArgumentParser(description="Compliance CSV Processor")
     parser.add_argument('--diagnostic', action='store_true', help="Enable verbose debug logging")
-    parser.add_argument('--wait-time', type=float, default=DEFAULT_WAIT_TIME, help=f"Seconds to wait between records (default: {DEFAULT_WAIT_TIME})")
+    parser.add_argument('--wait-time', type=float, default=DEFAULT_WAIT_TIME, help=f"Seconds each upstream host rests after a record fetched from it live; cached records are not delayed (default: {DEFAULT_WAIT_TIME})")
+    parser.add_argument('--workers', type=int, default=DEFAULT_BATCH_WORKERS, help=f"Rows processed concurrently, each worker with its own browser (default: {DEFAULT_BATCH_WORKERS})")
+    parser.add_argument('--result-sink', choices=['per_record', 'jsonl'], default='per_record', help="Write one JSON file per result, or batched JSON Lines parts with a manifest (default: per_record)")
     parser.add_argument('--skip-disciplinary', action='store_true', help="Skip disciplinary review for all claims")
     parser.add_argument('--skip-arbitration', action='store_true', help="Skip arbitration review for all claims")
     parser.add_argument('--skip-regulatory', action='store_true', help="Skip regulatory review for all claims")
@@ -184,7 +195,9 @@ def main(test_mode=False):
             "enabled_logging_groups": ["core"],
             "logging_levels": {"core": "INFO"},
             "config_file": "config.json",
-            "default_wait_time": DEFAULT_WAIT_TIME
+            "default_wait_time": DEFAULT_WAIT_TIME,
+            "batch_workers": args.workers,
+            "result_sink": args.result_sink
         }
         if not (args.skip_disciplinary or args.skip_arbitration or args.skip_regulatory):
             loaded_config = load_config()
@@ -217,7 +230,9 @@ def main(test_mode=False):
         "enabled_logging_groups": list(enabled_groups),
         "logging_levels": dict(group_levels),
         "config_file": "config.json",
-        "default_wait_time": DEFAULT_WAIT_TIME
+        "default_wait_time": DEFAULT_WAIT_TIME,
+        "batch_workers": args.workers,
+        "result_sink": args.result_sink
     }
 
     # In test mode, we'll only run one iteration of the loop
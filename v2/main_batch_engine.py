@@ -0,0 +1,284 @@
+"""
+Parallel batch engine module.
+
+This module processes the rows of the input CSV files with a pool of worker threads.
+
+Each worker owns its own FinancialServicesFacade, and therefore its own WebDriver. Live
+upstream requests are spaced per host by marshaller.host_rate_limiter, configured from the
+"host_rate_limits" and "default_host_interval" settings, so adding workers does not exceed
+the per-host request rate. Rows finish out of order, so checkpoint progress
+is kept per file in a CheckpointJournal: an ordered commit watermark (CSVProcessor.current_line
+only moves past a row once every earlier row has finished) plus the rows finished beyond it,
+committed in batches. A restarted run skips every row the journal records as finished.
+The processor's result sink is flushed before every journal commit.
+
+Unless config "batch_dedup" is False, each file is planned first (main_batch_planner): rows
+that look up the same individual share their facade searches through a BatchLookupResults,
+so each unique lookup is fetched once per file.
+
+Rows are paced by their upstream use rather than a fixed sleep: a row that fetched live
+holds back the hosts it used for wait_time (see CSVProcessor.process_row), a row served
+from cache does not wait. Cache hits and live fetches are counted per run, and progress
+(throughput and cache hit ratio) is logged every "progress_every_rows" rows.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from main_batch_planner import BatchPlan, lookup_key, plan_rows
+from main_checkpoint import CheckpointJournal
+from main_config import (DEFAULT_BATCH_WORKERS, DEFAULT_CHECKPOINT_COMMIT_ROWS, DEFAULT_CHECKPOINT_COMMIT_SECONDS,
+                         DEFAULT_PROGRESS_EVERY_ROWS)
+from main_csv_processing import CSVProcessor
+from main_file_utils import archive_file
+from marshaller import FetchCounter, host_rate_limiter, track_fetches
+from services import BatchLookupResults, FinancialServicesFacade, batch_lookup_context
+from storage_manager import StorageManager
+
+logger = logging.getLogger('batch_engine')
+
+
+@dataclass
+class BatchSummary:
+    """Totals for one batch run."""
+    workers: int = 1
+    files: int = 0
+    rows: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    resumed: int = 0
+    unique_lookups: int = 0
+    reused_searches: int = 0
+    cache_hits: int = 0
+    live_fetches: int = 0
+    failed_files: List[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        requests = self.cache_hits + self.live_fetches
+        return self.cache_hits / requests if requests else 1.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "files": self.files,
+            "rows": self.rows,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "resumed": self.resumed,
+            "unique_lookups": self.unique_lookups,
+            "reused_searches": self.reused_searches,
+            "cache_hits": self.cache_hits,
+            "live_fetches": self.live_fetches,
+            "cache_hit_ratio": round(self.cache_hit_ratio, 3),
+            "failed_files": list(self.failed_files),
+            "elapsed_seconds": round(self.elapsed, 3),
+            "rows_per_second": round(self.rows_per_second, 3)
+        }
+
+
+class BatchEngine:
+    """Runs CSV files through a CSVProcessor with a pool of workers."""
+
+    def __init__(self, processor: CSVProcessor, storage_manager: StorageManager, config: Dict[str, Any],
+                 workers: int = DEFAULT_BATCH_WORKERS, wait_time: float = 0.0,
+                 facade: Optional[FinancialServicesFacade] = None,
+                 facade_factory: Optional[Callable[[], Any]] = None):
+        """
+        Initialize the batch engine.
+
+        Args:
+            processor: CSV processor whose process_row handles each row.
+            storage_manager: Storage manager for reading and archiving input files.
+            config: Batch configuration (skip flags, optional "host_rate_limits" in seconds per host,
+                "default_host_interval" for other hosts, "checkpoint_commit_rows", "checkpoint_commit_seconds", "batch_dedup" and
+                "progress_every_rows").
+            workers: Number of rows processed concurrently.
+            wait_time: Rest per upstream host after a record that fetched from it live.
+            facade: Caller-owned facade, reused by the first worker.
+            facade_factory: Creates a facade for each additional worker.
+        """
+        self.processor = processor
+        self.storage_manager = storage_manager
+        self.config = config
+        self.workers = max(1, int(workers))
+        self.wait_time = wait_time
+        self.facade_factory = facade_factory or (lambda: FinancialServicesFacade(headless=True, storage_manager=storage_manager))
+        self.facade = facade
+        self._shared_facades = []
+        self._created_facades = []
+        self._facades_lock = threading.Lock()
+        self._local = threading.local()
+        self.commit_rows = config.get("checkpoint_commit_rows", DEFAULT_CHECKPOINT_COMMIT_ROWS)
+        self.commit_seconds = config.get("checkpoint_commit_seconds", DEFAULT_CHECKPOINT_COMMIT_SECONDS)
+        self.dedup = config.get("batch_dedup", True)
+        self.progress_every = config.get("progress_every_rows", DEFAULT_PROGRESS_EVERY_ROWS)
+        self.fetches = FetchCounter()
+        self._started = time.time()
+
+        host_rate_limits = config.get("host_rate_limits")
+        if host_rate_limits or config.get("default_host_interval") is not None:
+            host_rate_limiter.configure(host_rate_limits or {}, config.get("default_host_interval"))
+
+    def _worker_facade(self) -> Any:
+        """Return the calling worker's facade, creating it on first use."""
+        facade = getattr(self._local, "facade", None)
+        if facade is None:
+            with self._facades_lock:
+                if self._shared_facades:
+                    facade = self._shared_facades.pop()
+                else:
+                    facade = self.facade_factory()
+                    self._created_facades.append(facade)
+            self._local.facade = facade
+        return facade
+
+    def _process_row(self, row: Dict[str, str], plan: Optional[BatchPlan] = None,
+                     lookups: Optional[BatchLookupResults] = None, key: Any = None) -> None:
+        if plan is None:
+            with track_fetches(self.fetches):
+                self.processor.process_row(row, self._worker_facade(), self.config, self.wait_time)
+            return
+        try:
+            with track_fetches(self.fetches), batch_lookup_context(lookups, key):
+                self.processor.process_row(row, self._worker_facade(), self.config, self.wait_time)
+        finally:
+            if plan.finish(key):
+                lookups.release(key)
+
+    def _collect(self, pending: Dict[Future, Tuple[int, int]], journal: CheckpointJournal, summary: BatchSummary) -> None:
+        """Wait for at least one row to finish and record it in the checkpoint journal."""
+        done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+        for future in done:
+            line_number, next_offset = pending.pop(future)
+            failed = False
+            try:
+                future.result()
+                summary.succeeded += 1
+            except Exception as e:
+                logger.error(f"Error processing row {line_number}: {str(e)}")
+                self.processor.skipped_records.add(str(line_number))
+                summary.failed += 1
+                failed = True
+            summary.rows += 1
+            if self.progress_every and summary.rows % self.progress_every == 0:
+                self._log_progress(summary)
+            self.processor.current_line = journal.record(line_number, next_offset, failed=failed)
+            self.processor.current_offset = journal.watermark.offset
+
+    def _log_progress(self, summary: BatchSummary) -> None:
+        elapsed = time.time() - self._started
+        rate = summary.rows / elapsed if elapsed > 0 else 0.0
+        logger.info(f"Progress: {summary.rows} rows ({summary.failed} failed) in {elapsed:.1f}s, {rate:.2f} rows/s, "
+                    f"cache hit ratio {self.fetches.cache_hit_ratio:.1%} "
+                    f"({self.fetches.cache_hits} cached, {self.fetches.live_fetches} live fetches)")
+
+    def process_file(self, csv_file: str, start_line: int, executor: ThreadPoolExecutor, summary: BatchSummary,
+                     byte_offset: Optional[int] = None) -> CheckpointJournal:
+        """
+        Process one CSV file, keeping at most two rows per worker in flight.
+
+        Rows recorded as finished in the file's checkpoint journal are skipped; without a
+        journal, processing starts at start_line (the legacy checkpoint position). With
+        dedup enabled the pending rows are planned first and share lookups per group.
+
+        Args:
+            csv_file: Path to the CSV file.
+            start_line: Line number to start processing from.
+            executor: Worker pool running the rows.
+            summary: Batch totals, updated in place.
+            byte_offset: Byte offset of start_line, if known from the checkpoint.
+
+        Returns:
+            CheckpointJournal: The file's journal, with all progress committed.
+        """
+        result_sink = self.processor.result_sink
+        journal = CheckpointJournal.load(self.storage_manager, csv_file,
+                                         commit_rows=self.commit_rows, commit_seconds=self.commit_seconds,
+                                         before_commit=result_sink.flush if result_sink is not None else None)
+        journal.start_at(start_line, byte_offset)
+        start_line, byte_offset = journal.watermark.line, journal.watermark.offset
+        self.processor.checkpoint_journal = journal
+        self.processor.current_csv = csv_file
+        self.processor.current_line = start_line
+        self.processor.current_offset = byte_offset
+        plan, lookups = None, None
+        if self.dedup:
+            pending_rows = ((line_number, row) for line_number, row, _ in self.processor.iter_rows(csv_file, start_line, byte_offset)
+                            if not journal.is_done(line_number))
+            plan, lookups = plan_rows(pending_rows, self.processor.extract_data), BatchLookupResults()
+            summary.unique_lookups += plan.unique_lookups
+        pending: Dict[Future, Tuple[int, int]] = {}
+        try:
+            for line_number, row, next_offset in self.processor.iter_rows(csv_file, start_line, byte_offset):
+                if journal.is_done(line_number):
+                    summary.resumed += 1
+                    continue
+                while len(pending) >= self.workers * 2:
+                    self._collect(pending, journal, summary)
+                key = lookup_key(self.processor.extract_data(row), line_number) if plan is not None else None
+                pending[executor.submit(self._process_row, row, plan, lookups, key)] = (line_number, next_offset)
+        finally:
+            while pending:
+                self._collect(pending, journal, summary)
+            journal.commit()
+            if lookups is not None:
+                summary.reused_searches += lookups.reused
+        return journal
+
+    def run(self, csv_files: List[str], last_csv: str = '', last_line: int = 0, last_offset: Optional[int] = None) -> BatchSummary:
+        """
+        Process and archive each CSV file, resuming last_csv at last_line (byte offset last_offset).
+
+        Returns:
+            BatchSummary: Totals for the run, also logged on completion.
+        """
+        summary = BatchSummary(workers=self.workers)
+        start_time = time.time()
+        self._started = start_time
+        self.fetches = FetchCounter()
+        self._local = threading.local()
+        self._shared_facades = [self.facade] if self.facade is not None else []
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="batch-worker") as executor:
+                for csv_file in csv_files:
+                    try:
+                        if csv_file == last_csv:
+                            journal = self.process_file(csv_file, last_line, executor, summary, last_offset)
+                        else:
+                            journal = self.process_file(csv_file, 0, executor, summary)
+                        archive_file(csv_file, self.storage_manager)
+                        journal.complete()
+                        summary.files += 1
+                    except Exception as e:
+                        logger.error(f"Error processing file {csv_file}: {str(e)}")
+                        summary.failed_files.append(csv_file)
+        finally:
+            self.cleanup()
+            summary.elapsed = time.time() - start_time
+            summary.cache_hits, summary.live_fetches = self.fetches.cache_hits, self.fetches.live_fetches
+        logger.info(f"Batch complete: {summary.files} files, {summary.rows} rows "
+                    f"({summary.succeeded} succeeded, {summary.failed} failed, {summary.resumed} already done, "
+                    f"{summary.unique_lookups} unique lookups, {summary.reused_searches} searches reused) in {summary.elapsed:.1f}s "
+                    f"with {summary.workers} workers, {summary.rows_per_second:.2f} rows/s, "
+                    f"cache hit ratio {summary.cache_hit_ratio:.1%} ({summary.live_fetches} live fetches)")
+        return summary
+
+    def cleanup(self) -> None:
+        """Close the facades (and WebDrivers) created for the additional workers."""
+        with self._facades_lock:
+            facades, self._created_facades = self._created_facades, []
+        for facade in facades:
+            try:
+                facade.cleanup()
+            except Exception as e:
+                logger.error(f"Failed to clean up worker facade: {str(e)}")
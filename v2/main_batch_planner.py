@@ -0,0 +1,86 @@
+"""
+Batch planner module.
+
+Input drops often repeat an individual across rows, with the same CRD or the same name at
+the same organization. Before a file is processed the planner scans its pending rows and
+groups them by lookup key. The batch engine runs each row inside
+services.batch_lookup_context, so the facade searches of a group are fetched once and
+fanned out to every row of the group, which is still evaluated and reported on its own.
+Once the last row of a group finishes, the group's shared results are released.
+"""
+
+import logging
+import re
+import threading
+from collections import Counter
+from typing import Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+logger = logging.getLogger('batch_planner')
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _normalize(value: Optional[str]) -> str:
+    return _WHITESPACE.sub(" ", str(value or "")).strip().lower()
+
+
+def lookup_key(claim: Dict[str, str], line_number: int) -> Hashable:
+    """
+    Key under which rows share lookups: the CRD, else the individual's name and organization.
+
+    Rows without either get a key of their own, so they never share.
+    """
+    crd_number = _normalize(claim.get("crd_number"))
+    if crd_number:
+        return ("crd", crd_number)
+    name = _normalize(claim.get("individual_name")) or _normalize(
+        f"{claim.get('first_name') or ''} {claim.get('last_name') or ''}")
+    organization = _normalize(claim.get("organization_crd")) or _normalize(claim.get("organization_name"))
+    if name and organization:
+        return ("name_org", name, organization)
+    return ("row", line_number)
+
+
+class BatchPlan:
+    """Pending rows per lookup key for one file."""
+
+    def __init__(self, counts: Optional[Dict[Hashable, int]] = None):
+        self.remaining = Counter(counts or {})
+        self.rows = sum(self.remaining.values())
+        self.unique_lookups = len(self.remaining)
+        self._lock = threading.Lock()
+
+    @property
+    def duplicate_rows(self) -> int:
+        """Rows whose lookups are served by an earlier row of the same group."""
+        return self.rows - self.unique_lookups
+
+    def finish(self, key: Hashable) -> bool:
+        """Record a finished row; True when it was the last pending row of its group."""
+        with self._lock:
+            self.remaining[key] -= 1
+            if self.remaining[key] <= 0:
+                del self.remaining[key]
+                return True
+            return False
+
+
+def plan_rows(rows: Iterable[Tuple[int, Dict[str, str]]],
+              extract: Callable[[Dict[str, str]], Dict[str, str]]) -> BatchPlan:
+    """
+    Group pending rows by lookup key.
+
+    Args:
+        rows: (line_number, row) pairs still to be processed.
+        extract: Maps a raw CSV row to claim fields (CSVProcessor.extract_data).
+
+    Returns:
+        BatchPlan: Pending row counts per lookup key.
+    """
+    counts: Counter = Counter()
+    for line_number, row in rows:
+        counts[lookup_key(extract(row), line_number)] += 1
+    plan = BatchPlan(counts)
+    logger.info(f"Planned {plan.rows} rows: {plan.unique_lookups} unique lookups, "
+                f"{plan.duplicate_rows} rows reuse another row's lookups")
+    return plan
@@ -0,0 +1,198 @@
+"""
+Checkpoint journal module.
+
+This module records per-row completion for a CSV file so that a restarted batch skips every
+row that already finished, including rows that finished out of order on parallel workers.
+
+Progress is kept as a commit watermark (every row before `line` is done) plus the sparse set
+of rows finished beyond it. The journal is written through the StorageManager, so it works on
+local disk and S3, and commits are batched: every `commit_rows` recorded rows or
+`commit_seconds` seconds, whichever comes first. Each commit rewrites one of two slot files
+(`checkpoints/<csv>.0.json` and `.1.json`) in turn with an increasing sequence number, so a
+torn write never loses the previous commit; loading takes the valid slot with the highest
+sequence.
+"""
+
+import json
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from main_config import DEFAULT_CHECKPOINT_COMMIT_ROWS, DEFAULT_CHECKPOINT_COMMIT_SECONDS
+from storage_manager import StorageManager
+
+logger = logging.getLogger('main_checkpoint')
+
+JOURNAL_FOLDER = "checkpoints"
+JOURNAL_SLOTS = 2
+
+
+class CommitWatermark:
+    """Tracks rows completed out of order; `line` is the first row not yet finished.
+
+    `offset` is the byte offset where `line` starts, when the rows' offsets are known.
+    `completed` maps rows finished beyond the watermark to the offset after them.
+    """
+
+    def __init__(self, start_line: int = 0, start_offset: Optional[int] = None):
+        self.line = start_line
+        self.offset = start_offset
+        self.completed: Dict[int, Optional[int]] = {}
+
+    def complete(self, line_number: int, next_offset: Optional[int] = None) -> int:
+        """Mark a row finished (next_offset: where the following row starts) and return the advanced watermark."""
+        self.completed[line_number] = next_offset
+        while self.line in self.completed:
+            self.offset = self.completed.pop(self.line)
+            self.line += 1
+        return self.line
+
+    def is_done(self, line_number: int) -> bool:
+        """Return True if the row has already finished."""
+        return line_number < self.line or line_number in self.completed
+
+
+def journal_path(csv_file: str, slot: int) -> str:
+    """Path of one journal slot for a CSV file, relative to the output storage."""
+    name = csv_file.replace('\\', '/').strip('/').replace('/', '_')
+    return f"{JOURNAL_FOLDER}/{name}.{slot}.json"
+
+
+class CheckpointJournal:
+    """Durable per-row completion journal for one CSV file."""
+
+    def __init__(self, storage_manager: StorageManager, csv_file: str,
+                 commit_rows: int = DEFAULT_CHECKPOINT_COMMIT_ROWS,
+                 commit_seconds: float = DEFAULT_CHECKPOINT_COMMIT_SECONDS,
+                 clock: Callable[[], float] = time.monotonic,
+                 before_commit: Optional[Callable[[], None]] = None):
+        """
+        Initialize an empty journal; use load() to resume a saved one.
+
+        Args:
+            storage_manager: Storage manager the journal is written through (output storage).
+            csv_file: The CSV file whose rows are tracked.
+            commit_rows: Commit after this many recorded rows.
+            commit_seconds: Commit when this many seconds passed since the last commit.
+            clock: Monotonic time source.
+            before_commit: Called before each commit (e.g. a result sink flush); if it raises,
+                the commit is skipped so no row is recorded before its result is durable.
+        """
+        self.storage_manager = storage_manager
+        self.csv_file = csv_file
+        self.commit_rows = max(1, int(commit_rows))
+        self.commit_seconds = commit_seconds
+        self.clock = clock
+        self.before_commit = before_commit
+        self.watermark = CommitWatermark()
+        self.failed: List[int] = []
+        self.sequence = 0
+        self._uncommitted = 0
+        self._last_commit = clock()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, storage_manager: StorageManager, csv_file: str, **kwargs) -> "CheckpointJournal":
+        """Return the journal for csv_file, restored from its latest valid commit if there is one."""
+        journal = cls(storage_manager, csv_file, **kwargs)
+        state = None
+        for slot in range(JOURNAL_SLOTS):
+            candidate = journal._read_slot(slot)
+            if candidate and (state is None or candidate["sequence"] > state["sequence"]):
+                state = candidate
+        if state:
+            journal.sequence = state["sequence"]
+            if not state.get("complete"):
+                journal.watermark = CommitWatermark(state.get("line_number", 0), state.get("byte_offset"))
+                journal.watermark.completed = {int(line): offset for line, offset in state.get("completed", {}).items()}
+                journal.failed = list(state.get("failed", []))
+                logger.info(f"Loaded checkpoint journal for {csv_file}: line {journal.watermark.line}, "
+                            f"{len(journal.watermark.completed)} rows done beyond it")
+        return journal
+
+    def _read_slot(self, slot: int) -> Optional[Dict[str, Any]]:
+        """Read one slot; missing, torn or foreign slots read as None."""
+        path = journal_path(self.csv_file, slot)
+        try:
+            if not self.storage_manager.file_exists(path, storage_type='output'):
+                return None
+            content = self.storage_manager.read_file(path, storage_type='output')
+            state = json.loads(content) if isinstance(content, (str, bytes)) else content
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable checkpoint journal {path}: {str(e)}")
+            return None
+        if not isinstance(state, dict) or state.get("csv_file") != self.csv_file or not isinstance(state.get("sequence"), int):
+            return None
+        return state
+
+    @property
+    def has_progress(self) -> bool:
+        """True if any row of the file has been recorded."""
+        return self.watermark.line > 0 or bool(self.watermark.completed)
+
+    def start_at(self, line_number: int, byte_offset: Optional[int] = None) -> None:
+        """Start an empty journal at a legacy checkpoint position."""
+        with self._lock:
+            if not self.has_progress:
+                self.watermark = CommitWatermark(line_number, byte_offset)
+
+    def is_done(self, line_number: int) -> bool:
+        """Return True if the row finished in this or an earlier run."""
+        with self._lock:
+            return self.watermark.is_done(line_number)
+
+    def record(self, line_number: int, next_offset: Optional[int] = None, failed: bool = False) -> int:
+        """
+        Record a finished row and commit if a batch is due.
+
+        Returns:
+            int: The commit watermark (first row not yet finished).
+        """
+        with self._lock:
+            self.watermark.complete(line_number, next_offset)
+            if failed:
+                self.failed.append(line_number)
+            self._uncommitted += 1
+            due = self._uncommitted >= self.commit_rows or self.clock() - self._last_commit >= self.commit_seconds
+            if due:
+                self._commit_locked()
+            return self.watermark.line
+
+    def commit(self) -> bool:
+        """Write any uncommitted progress now."""
+        with self._lock:
+            if not self._uncommitted:
+                return True
+            return self._commit_locked()
+
+    def complete(self) -> bool:
+        """Mark the file finished, so a later file with the same name starts from the top."""
+        with self._lock:
+            return self._commit_locked(complete=True)
+
+    def _commit_locked(self, complete: bool = False) -> bool:
+        state = {
+            "csv_file": self.csv_file,
+            "sequence": self.sequence + 1,
+            "line_number": self.watermark.line,
+            "byte_offset": self.watermark.offset,
+            "completed": {str(line): offset for line, offset in sorted(self.watermark.completed.items())},
+            "failed": self.failed,
+            "complete": complete,
+            "updated": datetime.now().isoformat()
+        }
+        path = journal_path(self.csv_file, state["sequence"] % JOURNAL_SLOTS)
+        try:
+            if self.before_commit is not None:
+                self.before_commit()
+            self.storage_manager.write_file(path, json.dumps(state), storage_type='output')
+        except Exception as e:
+            logger.error(f"Failed to commit checkpoint journal {path}: {str(e)}")
+            return False
+        self.sequence = state["sequence"]
+        self._uncommitted = 0
+        self._last_commit = self.clock()
+        logger.debug(f"Committed checkpoint journal {path}: line {self.watermark.line}")
+        return True
@@ -12,6 +12,12 @@ from typing import Dict, Any, Optional
 logger = logging.getLogger('main_config')
 
 DEFAULT_WAIT_TIME = 7.0
+DEFAULT_BATCH_WORKERS = 1  # rows processed concurrently, each worker with its own facade and browser
+DEFAULT_CHECKPOINT_COMMIT_ROWS = 25  # checkpoint journal commits after this many finished rows...
+DEFAULT_CHECKPOINT_COMMIT_SECONDS = 30.0  # ...or this many seconds, whichever comes first
+DEFAULT_PROGRESS_EVERY_ROWS = 100  # batch engine logs progress (throughput, cache hit ratio) after this many rows
+DEFAULT_SYNC_WORKERS = 8  # concurrent transfers when syncing the S3 drop and output prefixes
+DEFAULT_SYNC_COMMIT_EVERY = 50  # sync manifest commits after this many finished files
 
 DEFAULT_CONFIG = {
     "evaluate_name": True,
@@ -5,42 +5,95 @@ This module handles CSV file processing and data extraction.
 """
 
 import csv
-import json
 import logging
 import os
 import random
-import time
 from datetime import datetime
-from typing import Any, Dict, List, Tuple, Set
+from typing import Any, BinaryIO, Dict, Iterator, List, NamedTuple, Optional, Tuple, Set
 from collections import defaultdict
 from enum import Enum
+from functools import lru_cache
 from main_config import INPUT_FOLDER, OUTPUT_FOLDER, ARCHIVE_FOLDER, canonical_fields
 from main_file_utils import save_checkpoint
 from business import process_claim
 from services import FinancialServicesFacade
 from evaluation_report_builder import EvaluationReportBuilder
 from evaluation_report_director import EvaluationReportDirector
-from evaluation_processor import Alert
+from marshaller import host_rate_limiter, track_fetches
+from report_serializer import json_dumps_with_alerts
+from result_sink import PerRecordSink, ResultSink
 from storage_manager import StorageManager
+from storage_providers.instrumentation import correlation_context
 
 logger = logging.getLogger('csv_processor')
 
-class AlertEncoder(json.JSONEncoder):
-    """Custom JSON encoder to handle Alert objects."""
-    def default(self, obj):
-        if isinstance(obj, Alert):
-            return obj.to_dict()
-        return super().default(obj)
-
-def json_dumps_with_alerts(obj: Any, **kwargs) -> str:
-    """Helper function to serialize objects that may contain Alert instances."""
-    return json.dumps(obj, cls=AlertEncoder, **kwargs)
-
 class SkipScenario(Enum):
     NO_NAME = "Missing both first/last names and individual name"
     NO_EMPLOYEE_NUMBER = "Missing employee number"
     NO_ORG_IDENTIFIERS = "Missing all organization identifiers (crd_number, organization_crd, organization_name)"
 
+CSV_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Lower-cased header variant -> canonical field, first canonical wins (used by resolve_headers)
+CANONICAL_BY_VARIANT: Dict[str, str] = {}
+for _canonical, _variants in canonical_fields.items():
+    for _variant in _variants:
+        CANONICAL_BY_VARIANT.setdefault(_variant.lower().strip(), _canonical)
+
+# Every exact alias of a canonical field; other columns pass through extract_data as-is
+ALIAS_COLUMNS = {alias for aliases in canonical_fields.values() for alias in aliases}
+
+class HeaderMap(NamedTuple):
+    """Column mapping for one header layout."""
+    canonical_columns: Tuple[Tuple[str, Tuple[str, ...]], ...]  # canonical -> present aliases, in alias order
+    passthrough_columns: Tuple[str, ...]  # columns that are no canonical alias, kept as-is
+
+@lru_cache(maxsize=64)
+def compile_header_map(columns: Tuple[str, ...]) -> HeaderMap:
+    """Compile the canonical mapping for a row layout once; rows of a file share one layout."""
+    present = set(columns)
+    canonical_columns = tuple(
+        (canonical, tuple(alias for alias in aliases if alias in present))
+        for canonical, aliases in canonical_fields.items()
+        if any(alias in present for alias in aliases)
+    )
+    passthrough_columns = tuple(column for column in columns if column not in ALIAS_COLUMNS)
+    return HeaderMap(canonical_columns, passthrough_columns)
+
+class OffsetLines:
+    """
+    Text lines of a binary CSV stream, tracking the byte offset just past the last line read.
+
+    csv.reader pulls one line at a time and stops at the end of a record, so after each row
+    `offset` is where the next row starts, also for quoted fields spanning several lines.
+    """
+
+    def __init__(self, stream: BinaryIO, offset: int = 0, chunk_size: int = CSV_STREAM_CHUNK_SIZE):
+        self.offset = offset
+        self._lines = self._iter_lines(stream, chunk_size)
+
+    @staticmethod
+    def _iter_lines(stream: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+        remainder = b""
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            lines = (remainder + chunk).split(b"\n")
+            remainder = lines.pop()
+            for line in lines:
+                yield line + b"\n"
+        if remainder:
+            yield remainder
+
+    def __iter__(self) -> "OffsetLines":
+        return self
+
+    def __next__(self) -> str:
+        line = next(self._lines)
+        self.offset += len(line)
+        return line.decode('utf-8')
+
 class CSVProcessor:
     """Handles CSV file processing and data extraction."""
     
@@ -48,13 +101,21 @@ class CSVProcessor:
         """Initialize the CSV processor."""
         self.current_csv = None
         self.current_line = 0
+        self.current_offset = None
+        self.checkpoint_journal = None
         self.skipped_records: Set[str] = set()
         self.error_records = defaultdict(list)
         self.storage_manager = None
+        self.result_sink: Optional[ResultSink] = None
 
     def set_storage_manager(self, storage_manager: StorageManager):
         """Set the storage manager instance."""
         self.storage_manager = storage_manager
+        self.result_sink = PerRecordSink(storage_manager)
+
+    def set_result_sink(self, result_sink: ResultSink):
+        """Set where processed results are written (see result_sink.create_result_sink)."""
+        self.result_sink = result_sink
 
     def generate_reference_id(self, crd_number: str = None) -> str:
         if crd_number and crd_number.strip():
@@ -63,27 +124,23 @@ class CSVProcessor:
 
     def resolve_headers(self, fieldnames: List[str]) -> Dict[str, str]:
         resolved_headers = {}
-        logger.info(f"Raw fieldnames from CSV: {fieldnames}")
+        logger.debug("Raw fieldnames from CSV: %s", fieldnames)
         for header in fieldnames:
             if not header.strip():
                 logger.warning("Empty header name encountered")
                 continue
-            header_lower = header.lower().strip()
-            logger.info(f"Processing header: '{header}' (lowercase: '{header_lower}')")
-            for canonical, variants in canonical_fields.items():
-                variants_lower = [v.lower().strip() for v in variants]
-                logger.info(f"Checking against canonical '{canonical}' variants: {variants_lower}")
-                if header_lower in variants_lower:
-                    resolved_headers[header] = canonical
-                    logger.info(f"Mapped header '{header}' to '{canonical}'")
-                    break
+            canonical = CANONICAL_BY_VARIANT.get(header.lower().strip())
+            if canonical:
+                resolved_headers[header] = canonical
+                logger.debug("Mapped header '%s' to '%s'", header, canonical)
             else:
                 logger.warning(f"Unmapped CSV column: '{header}' will be included as-is")
                 resolved_headers[header] = header
-        logger.info(f"Resolved headers: {json_dumps_with_alerts(resolved_headers, indent=2)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Resolved headers: {json_dumps_with_alerts(resolved_headers, indent=2)}")
         unmapped_canonicals = set(canonical_fields.keys()) - set(resolved_headers.values())
         if unmapped_canonicals:
-            logger.info(f"Canonical fields not found in CSV headers: {unmapped_canonicals}")
+            logger.debug("Canonical fields not found in CSV headers: %s", unmapped_canonicals)
         return resolved_headers
 
     def validate_row(self, claim: Dict[str, str]) -> Tuple[bool, List[str]]:
@@ -103,7 +160,8 @@ class CSVProcessor:
             issues.append(SkipScenario.NO_ORG_IDENTIFIERS.value)
         return (len(issues) == 0, issues)
 
-    def process_csv(self, csv_file: str, start_line: int = 0, facade: Any = None, config: Dict[str, Any] = None, wait_time: float = 0.0):
+    def process_csv(self, csv_file: str, start_line: int = 0, facade: Any = None, config: Dict[str, Any] = None, wait_time: float = 0.0,
+                    byte_offset: Optional[int] = None):
         """
         Process a CSV file.
         
@@ -112,44 +170,69 @@ class CSVProcessor:
             start_line: Line number to start processing from.
             facade: Financial services facade instance.
             config: Configuration dictionary.
-            wait_time: Time to wait between records.
+            wait_time: Rest per upstream host after a record that fetched from it live (see process_row).
+            byte_offset: Byte offset of start_line, if known from the checkpoint.
         """
         if not self.storage_manager:
             raise ValueError("Storage manager not set")
         
         self.current_csv = csv_file
         self.current_line = start_line
+        self.current_offset = byte_offset
         
         try:
-            # Read CSV file
-            content = self.storage_manager.read_file(csv_file, storage_type='input')
-            
-            # Handle both string and bytes content
-            if isinstance(content, bytes):
-                content_str = content.decode('utf-8')
-            else:
-                content_str = content
-                
-            reader = csv.DictReader(content_str.splitlines())
-            
-            # Skip to start line
-            for _ in range(start_line):
-                next(reader, None)
-            
             # Process each row
-            for row in reader:
+            for line_number, row, next_offset in self.iter_rows(csv_file, start_line, byte_offset):
                 try:
                     self.process_row(row, facade, config, wait_time)
-                    self.current_line += 1
                 except Exception as e:
-                    logger.error(f"Error processing row {self.current_line}: {str(e)}")
-                    self.skipped_records.add(str(self.current_line))
-                    continue
+                    logger.error(f"Error processing row {line_number}: {str(e)}")
+                    self.skipped_records.add(str(line_number))
+                finally:
+                    self.current_line = line_number + 1
+                    self.current_offset = next_offset
                 
         except Exception as e:
             logger.error(f"Error processing CSV file {csv_file}: {str(e)}")
             raise
 
+    def iter_rows(self, csv_file: str, start_line: int = 0, byte_offset: Optional[int] = None) -> Iterator[Tuple[int, Dict[str, str], int]]:
+        """
+        Stream (line_number, row, next_offset) for the data rows of a CSV file.
+
+        The file is read incrementally through StorageManager.open_stream, so memory stays
+        flat however large the file is. Line numbers count data rows from 0, matching the
+        checkpoint line_number; next_offset is the byte offset just past the row. Given the
+        byte_offset of start_line, reading resumes there (a seek, or a ranged GET on S3)
+        instead of re-parsing the skipped rows; without it they are skipped by parsing.
+        """
+        if not self.storage_manager:
+            raise ValueError("Storage manager not set")
+
+        stream = self.storage_manager.open_stream(csv_file, storage_type='input')
+        try:
+            lines = OffsetLines(stream)
+            header = next(csv.reader(lines), None)
+            if header is None:
+                return
+            skip = start_line
+            if byte_offset is not None and byte_offset > lines.offset:
+                stream.close()
+                stream = self.storage_manager.open_stream(csv_file, storage_type='input', offset=byte_offset)
+                lines = OffsetLines(stream, byte_offset)
+                skip = 0
+            
+            reader = csv.DictReader(lines, fieldnames=header)
+            
+            # Skip to start line
+            for _ in range(skip):
+                next(reader, None)
+            
+            for line_number, row in enumerate(reader, start=start_line):
+                yield line_number, row, lines.offset
+        finally:
+            stream.close()
+
     def process_row(self, row: Dict[str, str], facade: Any, config: Dict[str, Any], wait_time: float):
         """
         Process a single row from the CSV file.
@@ -158,7 +241,8 @@ class CSVProcessor:
             row: Dictionary containing row data.
             facade: Financial services facade instance.
             config: Configuration dictionary.
-            wait_time: Time to wait between records.
+            wait_time: Rest each upstream host gets after a record that fetched from it live.
+                Records served entirely from cache are not delayed.
         """
         # Extract data from row
         data = self.extract_data(row)
@@ -171,131 +255,83 @@ class CSVProcessor:
         skip_arbitration = config.get('skip_arbitration', False)
         skip_regulatory = config.get('skip_regulatory', False)
         
-        result = process_claim(
-            data,
-            facade,
-            employee_number=data.get('employee_number'),
-            skip_disciplinary=skip_disciplinary,
-            skip_arbitration=skip_arbitration,
-            skip_regulatory=skip_regulatory
-        )
+        with track_fetches() as fetches, correlation_context(data.get('reference_id')):
+            result = process_claim(
+                data,
+                facade,
+                employee_number=data.get('employee_number'),
+                skip_disciplinary=skip_disciplinary,
+                skip_arbitration=skip_arbitration,
+                skip_regulatory=skip_regulatory
+            )
         
         # Save result
         self.save_result(result)
         
-        # Wait between records
+        # Pace by upstream use: the hosts this record fetched from live rest for wait_time
+        # before their next request, while cache hits move straight on to the next record
         if wait_time > 0:
-            time.sleep(wait_time)
+            for host in fetches.live_hosts:
+                host_rate_limiter.defer(host, wait_time)
 
     def extract_data(self, row: Dict[str, str]) -> Dict[str, Any]:
         """
         Extract data from a CSV row and map to canonical field names.
         
+        The column mapping is compiled once per header layout (see compile_header_map) and
+        applied to each row in a single pass.
+        
         Args:
             row: Dictionary containing row data.
             
         Returns:
             Dictionary containing extracted data with canonical field names.
         """
-        from main_config import canonical_fields
+        header_map = compile_header_map(tuple(row))
         
-        # Create a new dictionary for the extracted data
+        # Map fields to their canonical names: first non-empty column in alias order
         extracted = {}
-        
-        # Map fields to their canonical names
-        for canonical_name, aliases in canonical_fields.items():
-            # Check if any of the aliases exist in the row
-            for alias in aliases:
-                if alias in row and row[alias]:
-                    extracted[canonical_name] = row[alias]
+        for canonical_name, columns in header_map.canonical_columns:
+            for column in columns:
+                value = row[column]
+                if value:
+                    extracted[canonical_name] = value
                     break
         
         # Add any remaining fields that don't have canonical mappings
-        for key, value in row.items():
-            # Check if this key is already mapped to a canonical name
-            is_mapped = False
-            for aliases in canonical_fields.values():
-                if key in aliases:
-                    is_mapped = True
-                    break
-            
-            # If not mapped and has a value, add it to the extracted data
-            if not is_mapped and value:
-                extracted[key] = value
+        for column in header_map.passthrough_columns:
+            value = row[column]
+            if value:
+                extracted[column] = value
         
         # Special handling for reference_id if it's not already set
         if 'reference_id' not in extracted and 'referenceId' in row:
             extracted['reference_id'] = row['referenceId']
         
         # Special handling for crdNumber -> crd_number mapping
-        if 'crd_number' not in extracted and 'crdNumber' in row and row['crdNumber']:
+        if 'crd_number' not in extracted and row.get('crdNumber'):
             extracted['crd_number'] = row['crdNumber']
-            logger.debug(f"Mapped crdNumber '{row['crdNumber']}' to crd_number")
+            logger.debug("Mapped crdNumber '%s' to crd_number", row['crdNumber'])
         
         # Special handling for organizationCRD -> organization_crd mapping
-        if 'organization_crd' not in extracted and 'organizationCRD' in row and row['organizationCRD']:
+        if 'organization_crd' not in extracted and row.get('organizationCRD'):
             extracted['organization_crd'] = row['organizationCRD']
-            logger.debug(f"Mapped organizationCRD '{row['organizationCRD']}' to organization_crd")
-        
-        # Log the mapping for debugging
-        logger.debug(f"Mapped row fields: {row.keys()} to canonical fields: {extracted.keys()}")
+            logger.debug("Mapped organizationCRD '%s' to organization_crd", row['organizationCRD'])
         
         return extracted
 
     def save_result(self, result: Dict[str, Any]):
         """
-        Save processing result.
+        Save processing result through the result sink (one file per result by default).
         
         Args:
             result: Dictionary containing processing result.
         """
         if not self.storage_manager:
             raise ValueError("Storage manager not set")
-        
-        # Extract reference ID from the result or use a timestamp if not available
-        reference_id = None
-        
-        # Try to get reference_id from different possible locations in the result
-        if isinstance(result, dict):
-            # Try to get it directly from the result
-            reference_id = result.get('reference_id')
-            
-            # If not found, try to get it from the claim data if present
-            if not reference_id and 'claim' in result:
-                reference_id = result['claim'].get('reference_id')
-                
-            # If still not found, try to get it from search_evaluation if present
-            if not reference_id and 'search_evaluation' in result:
-                if isinstance(result['search_evaluation'], dict):
-                    reference_id = result['search_evaluation'].get('reference_id')
-        
-        # If reference_id is still not found, use a timestamp
-        if not reference_id:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = f"result_{timestamp}.json"
-        else:
-            # Clean the reference_id to make it a valid filename
-            reference_id = reference_id.replace('/', '_').replace('\\', '_').replace(':', '_')
-            output_file = f"{reference_id}.json"
-        
-        logger.info(f"Saving result to output file: {output_file}")
-        
-        # Get the output path from the storage manager
-        output_path = os.path.join(self.storage_manager.get_output_path(), output_file)
-        
-        # Save result to the output folder
-        try:
-            # Make sure the output directory exists
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            
-            # Write the file to the output directory
-            with open(output_path, 'w') as f:
-                f.write(json_dumps_with_alerts(result, indent=2))
-            
-            logger.debug(f"Successfully saved file: {output_path}")
-        except Exception as e:
-            logger.error(f"Error saving result to {output_path}: {str(e)}")
-            raise
+        if self.result_sink is None:
+            self.result_sink = PerRecordSink(self.storage_manager)
+        self.result_sink.write(result)
 
     def _write_records(self, records: defaultdict, output_file: str, record_type: str):
         date_str = datetime.now().strftime("%m-%d-%Y")
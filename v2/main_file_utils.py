@@ -27,36 +27,47 @@ def setup_folders(storage_manager: StorageManager):
         logger.error(f"Failed to create folders: {str(e)}")
         raise
 
-def save_checkpoint(csv_file: str, line_number: int, storage_manager: StorageManager):
-    """Save processing checkpoint using storage manager."""
+def save_checkpoint(csv_file: str, line_number: int, storage_manager: StorageManager, byte_offset: Optional[int] = None):
+    """Save processing checkpoint using storage manager.
+
+    byte_offset, when known, is where line_number starts in the file, so a resume can seek
+    there instead of re-parsing the rows before it.
+    """
     checkpoint = {
         'csv_file': csv_file,
         'line_number': line_number
     }
+    if byte_offset is not None:
+        checkpoint['byte_offset'] = byte_offset
     storage_manager.write_file('checkpoint.json', json.dumps(checkpoint), storage_type='output')
 
-def load_checkpoint(storage_manager: StorageManager) -> tuple:
-    """Load processing checkpoint using storage manager."""
+def load_checkpoint_state(storage_manager: StorageManager) -> Dict[str, Any]:
+    """Load the saved checkpoint as a dict (empty if there is none or it is unreadable)."""
     try:
         if storage_manager.file_exists('checkpoint.json', storage_type='output'):
             content = storage_manager.read_file('checkpoint.json', storage_type='output')
             if not content:
                 logger.warning("Checkpoint file is empty")
-                return '', 0
+                return {}
                 
             if isinstance(content, str):
                 try:
                     checkpoint = json.loads(content)
                 except json.JSONDecodeError:
                     logger.error("Invalid JSON in checkpoint file")
-                    return '', 0
+                    return {}
             else:
                 checkpoint = content
                 
-            return checkpoint.get('csv_file', ''), checkpoint.get('line_number', 0)
+            return checkpoint
     except Exception as e:
         logger.error(f"Error loading checkpoint: {str(e)}")
-    return '', 0
+    return {}
+
+def load_checkpoint(storage_manager: StorageManager) -> tuple:
+    """Load processing checkpoint using storage manager."""
+    checkpoint = load_checkpoint_state(storage_manager)
+    return checkpoint.get('csv_file', ''), checkpoint.get('line_number', 0)
 
 def get_csv_files(storage_manager: StorageManager) -> list:
     """Get list of CSV files from input folder using storage manager.
@@ -14,7 +14,7 @@ def display_menu(skip_disciplinary: bool, skip_arbitration: bool, skip_regulator
     print("7. Flush logs")
     print("8. Set trace mode (all groups on, DEBUG level)")
     print("9. Set production mode (minimal logging)")
-    print(f"10. Set wait time between records (currently: {wait_time} seconds)")
+    print(f"10. Set wait time after live fetches (currently: {wait_time} seconds)")
     print("11. Exit")
     return input("Enter your choice (1-11): ").strip()
 
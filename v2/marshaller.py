@@ -5,10 +5,13 @@ Marshaller module for handling agent operations and caching.
 import argparse
 import os
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, Callable, List, Union
+from typing import Optional, Dict, Any, Callable, Iterator, List, Set, Union
 import json
 import logging
+import threading
 import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import partial
 from pathlib import Path
 from selenium import webdriver
@@ -51,7 +54,7 @@ try:
         's3': storage_config.get('s3', {})
     }
     
-    storage_provider = StorageProviderFactory.create_provider(provider_config)
+    storage_provider = StorageProviderFactory.create_provider(provider_config, instrument=True)
     logger.info("Storage provider initialized successfully")
     
     # Get cache folder from config and ensure it exists
@@ -322,6 +325,106 @@ def log_request(employee_number: str, agent_name: str, service: str, status: str
         logger.error(f"Failed to log request for {employee_number}: {str(e)}", exc_info=True)
         # Don't raise the exception to avoid interrupting the main flow
 
+# Upstream host of each agent; when a batch run configures host_rate_limiter, live fetches
+# are spaced per host across all of its workers
+AGENT_HOSTS = {
+    "SEC_IAPD_Agent": "api.adviserinfo.sec.gov",
+    "FINRA_BrokerCheck_Agent": "api.brokercheck.finra.org",
+    "SEC_Arbitration_Agent": "www.sec.gov",
+    "SEC_Disciplinary_Agent": "www.sec.gov",
+    "FINRA_Disciplinary_Agent": "www.finra.org",
+    "FINRA_Arbitration_Agent": "www.finra.org",
+    "NFA_Basic_Agent": "www.nfa.futures.org"
+}
+DEFAULT_HOST_INTERVAL = 0.0  # minimum seconds between live requests to one host; off unless configured
+
+class HostRateLimiter:
+    """Thread-safe minimum spacing between requests to the same host."""
+
+    def __init__(self, default_interval: float = DEFAULT_HOST_INTERVAL, intervals: Optional[Dict[str, float]] = None):
+        self.default_interval = default_interval
+        self.intervals = dict(intervals or {})
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, intervals: Dict[str, float], default_interval: Optional[float] = None) -> None:
+        """Replace the per-host intervals (and optionally the default)."""
+        with self._lock:
+            self.intervals = dict(intervals)
+            if default_interval is not None:
+                self.default_interval = default_interval
+
+    def acquire(self, host: str) -> float:
+        """Reserve the next request slot for host and sleep until it; returns the seconds waited."""
+        with self._lock:
+            interval = self.intervals.get(host, self.default_interval)
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def defer(self, host: str, seconds: float) -> None:
+        """Hold the next request to host until at least seconds from now."""
+        with self._lock:
+            now = time.monotonic()
+            self._next_slot[host] = max(self._next_slot.get(host, now), now + seconds)
+
+host_rate_limiter = HostRateLimiter()
+
+class FetchCounter:
+    """Thread-safe count of cache hits and live fetches, rolled up into an optional parent counter."""
+
+    def __init__(self, parent: Optional["FetchCounter"] = None):
+        self.parent = parent
+        self.cache_hits = 0
+        self.live_fetches = 0
+        self.live_hosts: Set[str] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def requests(self) -> int:
+        return self.cache_hits + self.live_fetches
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        """Share of requests served from cache (1.0 when nothing was requested)."""
+        return self.cache_hits / self.requests if self.requests else 1.0
+
+    def record(self, live: bool, host: Optional[str] = None) -> None:
+        with self._lock:
+            if live:
+                self.live_fetches += 1
+                if host:
+                    self.live_hosts.add(host)
+            else:
+                self.cache_hits += 1
+        if self.parent is not None:
+            self.parent.record(live, host)
+
+_fetch_counter: ContextVar[Optional[FetchCounter]] = ContextVar("fetch_counter", default=None)
+
+@contextmanager
+def track_fetches(parent: Optional[FetchCounter] = None) -> Iterator[FetchCounter]:
+    """
+    Count the cache hits and live fetches made inside the block.
+
+    The counter rolls up into parent, or else into the enclosing track_fetches counter.
+    """
+    counter = FetchCounter(parent if parent is not None else _fetch_counter.get())
+    token = _fetch_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _fetch_counter.reset(token)
+
+def _record_fetch(live: bool, agent_name: str) -> None:
+    counter = _fetch_counter.get()
+    if counter is not None:
+        counter.record(live, AGENT_HOSTS.get(agent_name, agent_name) if live else None)
+
 def fetch_agent_data(agent_name: str, service: str, params: Dict[str, Any], driver: Optional[webdriver.Chrome] = None) -> tuple[Union[Optional[Dict], List[Dict]], Optional[float]]:
     """Fetch data from the specified agent service, ensuring a single-item list for single-result agents."""
     try:
@@ -337,9 +440,14 @@ def fetch_agent_data(agent_name: str, service: str, params: Dict[str, Any], driv
             if "organization_crd" not in params:
                 raise ValueError(f"Missing required 'organization_crd' for {agent_name}/{service}")
 
+        if agent_name in SELENIUM_AGENTS and driver is None:
+            raise ValueError(f"Agent {agent_name} requires a WebDriver instance")
+        host = AGENT_HOSTS.get(agent_name)
+        if host:
+            host_rate_limiter.acquire(host)
+            start_time = time.time()  # the fetch duration excludes the rate-limit wait
+
         if agent_name in SELENIUM_AGENTS:
-            if driver is None:
-                raise ValueError(f"Agent {agent_name} requires a WebDriver instance")
             result = agent_fn(**params, driver=driver, logger=logger)
         else:
             result = agent_fn(**params, logger=logger)
@@ -369,6 +477,37 @@ def fetch_agent_data(agent_name: str, service: str, params: Dict[str, Any], driv
         # Return empty result for single-result agents, empty list for multi-result agents
         return [empty_result] if agent_name in ["SEC_IAPD_Agent", "FINRA_BrokerCheck_Agent"] else [], None
 
+# Services whose results depend on a lookup parameter get one cache folder per value, so
+# e.g. several NFA IDs searched for the same employee do not overwrite each other
+CACHE_KEY_PARAMS = {
+    ("NFA_Basic_Agent", "search_nfa"): "nfa_id",
+}
+
+def request_cache_path(agent_name: str, service: str, employee_number: str, params: Dict[str, Any]) -> Path:
+    """Return the cache folder for a request, including the lookup key for keyed services."""
+    cache_path = build_cache_path(employee_number, agent_name, service)
+    key_param = CACHE_KEY_PARAMS.get((agent_name, service))
+    if key_param and params.get(key_param):
+        cache_path = cache_path / str(params[key_param])
+    return cache_path
+
+def read_cached_result(
+    agent_name: str, service: str, employee_number: str, params: Dict[str, Any]
+) -> Union[None, Dict, List[Dict]]:
+    """Return the fresh cached result for a request, or None on a miss (never fetches)."""
+    if not employee_number or employee_number.strip() == "":
+        return None
+    cache_path = request_cache_path(agent_name, service, employee_number, params)
+    if not (read_manifest(cache_path) and is_cache_valid(cache_path)):
+        return None
+    is_multiple = agent_name not in ["SEC_IAPD_Agent", "FINRA_BrokerCheck_Agent"] and service != "search_individual_by_firm"
+    cached_data = load_cached_data(cache_path, is_multiple)
+    if cached_data is not None:
+        logger.info(f"Cache hit for {agent_name}/{service}/{employee_number}")
+        log_request(employee_number, agent_name, service, "Cached", 0)
+        _record_fetch(False, agent_name)
+    return cached_data
+
 def check_cache_or_fetch(
     agent_name: str, service: str, employee_number: str, params: Dict[str, Any], driver: Optional[webdriver.Chrome] = None
 ) -> Union[Optional[Dict], List[Dict]]:
@@ -377,24 +516,20 @@ def check_cache_or_fetch(
         logger.error(f"Invalid employee_number: '{employee_number}' for agent {agent_name}/{service}")
         raise ValueError(f"employee_number must be a non-empty string, got '{employee_number}'")
     
-    cache_path = build_cache_path(employee_number, agent_name, service)
+    cache_path = request_cache_path(agent_name, service, employee_number, params)
     date = get_current_date()
     
     # Ensure cache directory exists
     storage_provider.create_directory(str(cache_path))
 
-    cached_date = read_manifest(cache_path)
-    is_multiple = agent_name not in ["SEC_IAPD_Agent", "FINRA_BrokerCheck_Agent"] and service != "search_individual_by_firm"
-    if cached_date and is_cache_valid(cache_path):
-        cached_data = load_cached_data(cache_path, is_multiple)
-        if cached_data is not None:
-            logger.info(f"Cache hit for {agent_name}/{service}/{employee_number}")
-            log_request(employee_number, agent_name, service, "Cached", 0)
-            return cached_data
+    cached_data = read_cached_result(agent_name, service, employee_number, params)
+    if cached_data is not None:
+        return cached_data
 
     logger.info(f"Cache miss or stale for {agent_name}/{service}/{employee_number}")
     results, fetch_duration = fetch_agent_data(agent_name, service, params, driver)
     log_request(employee_number, agent_name, service, "Fetched", fetch_duration)
+    _record_fetch(True, agent_name)
     
     file_name = build_file_name(agent_name, employee_number, service, date)
     if agent_name in ["SEC_IAPD_Agent", "FINRA_BrokerCheck_Agent"]:
@@ -11,7 +11,9 @@ a more comprehensive nickname handling with the full nicknames.json file.
 import logging
 from typing import Dict, Any, Optional, Set, Tuple, List
 from evaluation_processor import (
+    ParsedName,
     parse_name,
+    parse_name_cached,
     get_name_variants,
     are_nicknames,
     match_name_part,
@@ -22,7 +24,9 @@ logger = logging.getLogger('name_matcher')
 
 # Re-export the functions from evaluation_processor.py
 __all__ = [
+    'ParsedName',
     'parse_name',
+    'parse_name_cached',
     'get_name_variants',
     'are_nicknames',
     'match_name_part',
@@ -12,9 +12,12 @@ It handles:
 
 import json
 import logging
-from typing import Dict, Any, List, Optional
-from evaluation_processor import evaluate_name  # Only import evaluate_name
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Hashable, List, Optional, Tuple
+from evaluation_processor import evaluate_names_batch
 from common_types import MatchThreshold  # Import MatchThreshold from common_types
+from logger_config import LazyJson
 from datetime import datetime
 
 logger = logging.getLogger("normalizer")
@@ -23,6 +26,26 @@ class NormalizationError(Exception):
     """Exception raised for errors during normalization."""
     pass
 
+def score_respondent_names(searched_name: str, respondent_names: List[str],
+                           threshold: Optional[MatchThreshold] = None) -> Optional[Dict[str, Optional[float]]]:
+    """
+    Score all respondent names of a result set against the searched name in one batch.
+
+    :param searched_name: Name being searched for.
+    :param respondent_names: Respondent names extracted from the raw records.
+    :param threshold: If given, names that provably cannot reach it are pruned before fuzzy scoring.
+    :return: Mapping of respondent name to score (0-100), None for pruned names,
+             or None if scoring failed.
+    """
+    if not respondent_names:
+        return {}
+    min_score = threshold.value if threshold is not None else None
+    try:
+        return dict(zip(respondent_names, evaluate_names_batch(searched_name, respondent_names, min_score)))
+    except Exception as e:
+        logger.error(f"Failed to evaluate names against '{searched_name}': {str(e)}")
+        return None
+
 # Define valid data sources to ensure consistency
 VALID_DATA_SOURCES = {
     "FINRA_BrokerCheck",
@@ -34,6 +57,45 @@ VALID_DATA_SOURCES = {
     "NFA_Regulatory"
 }
 
+# Normalized individual records keyed by (data_source, basic fingerprint, detailed fingerprint)
+INDIVIDUAL_RECORD_CACHE_SIZE = 256
+_individual_record_cache: "OrderedDict[Tuple[str, Hashable, Hashable], Dict[str, Any]]" = OrderedDict()
+_individual_record_lock = threading.Lock()
+
+# 10-year cutoff for IAPD employment history
+EMPLOYMENT_HISTORY_CUTOFF = datetime(2015, 5, 12)  # ten years before the 2025-05-12 reference date
+
+def _payload_fingerprint(payload: Optional[Dict[str, Any]]) -> Hashable:
+    """
+    Cheap structural key of a raw payload: its keys, typed scalars and (length, hash) of each string.
+
+    The embedded content strings dominate a payload's size and Python caches a string's hash,
+    so fingerprinting a payload again walks its few nodes instead of re-serializing it.
+    """
+    if not payload:
+        return ()
+    return _fingerprint_value(payload)
+
+def _fingerprint_value(value: Any) -> Hashable:
+    if isinstance(value, str):
+        return (len(value), hash(value))
+    if isinstance(value, dict):
+        return ("{", tuple((key, _fingerprint_value(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return ("[", tuple(_fingerprint_value(item) for item in value))
+    if value is None or isinstance(value, (bool, int, float)):
+        return (type(value), value)
+    return _fingerprint_value(str(value))
+
+def _copy_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a cached record's top-level dict and lists so callers can extend them safely."""
+    return {key: list(value) if isinstance(value, list) else value for key, value in record.items()}
+
+def clear_individual_record_cache() -> None:
+    """Drop all cached normalized individual records."""
+    with _individual_record_lock:
+        _individual_record_cache.clear()
+
 def create_individual_record(
     data_source: str,
     basic_info: Optional[Dict[str, Any]],
@@ -60,8 +122,125 @@ def create_individual_record(
         }
     Note: 'fetched_name' and 'other_names' are designed to be passed to evaluate_name for matching
     against an expected name, producing names_found, name_scores, exact_match_found, and status.
+
+    Records are cached by payload fingerprint, so normalizing the same basic/detailed payloads again
+    (e.g. search_*_detailed after search_*_individual) skips parsing. Each call gets its own top-level
+    dict and lists; the nested disclosure/employment entries are shared and must not be mutated.
+    """
+    try:
+        key = (data_source, _payload_fingerprint(basic_info), _payload_fingerprint(detailed_info))
+    except (TypeError, ValueError, RecursionError) as e:
+        logger.debug(f"Payload for {data_source} cannot be fingerprinted, normalizing without cache: {e}")
+        return _build_individual_record(data_source, basic_info, detailed_info)
+
+    with _individual_record_lock:
+        cached = _individual_record_cache.get(key)
+        if cached is not None:
+            _individual_record_cache.move_to_end(key)
+    if cached is not None:
+        logger.debug(f"Reusing normalized individual record for {data_source}")
+        return _copy_record(cached)
+
+    record = _build_individual_record(data_source, basic_info, detailed_info)
+    with _individual_record_lock:
+        _individual_record_cache[key] = record
+        while len(_individual_record_cache) > INDIVIDUAL_RECORD_CACHE_SIZE:
+            _individual_record_cache.popitem(last=False)
+    return _copy_record(record)
+
+def _parse_embedded_json(content_str: Any, label: str) -> Dict[str, Any]:
+    """Parse a JSON document embedded as a string field (BrokerCheck 'content', IAPD 'iacontent')."""
+    try:
+        content_json = json.loads(content_str)
+        logger.debug("Parsed %s: %s", label, LazyJson(content_json, indent=2))
+        return content_json
+    except json.JSONDecodeError as e:
+        logger.warning(f"Failed to parse {label} JSON: {e}")
+        return {}
+
+def _normalize_employment(emp: Dict[str, Any], status: str, emp_type: str) -> Dict[str, Any]:
+    """Normalize an employment entry, with firm_id as string."""
+    firm_id = emp.get("firmId")
+    normalized = {
+        "firm_id": str(firm_id) if firm_id is not None else None,
+        "firm_name": emp.get("firmName"),
+        "registration_begin_date": emp.get("registrationBeginDate"),
+        "branch_offices": [
+            {
+                "street": office.get("street1"),
+                "city": office.get("city"),
+                "state": office.get("state"),
+                "zip_code": office.get("zipCode")
+            }
+            for office in emp.get("branchOfficeLocations", [])
+        ],
+        "status": status,
+        "type": emp_type
+    }
+    if status == "previous":
+        normalized["registration_end_date"] = emp.get("registrationEndDate")
+    logger.debug("Normalized employment: %s", LazyJson(normalized, indent=2))
+    return normalized
+
+def _extract_detail_fields(data_source: str, detail: Dict[str, Any], nested: bool) -> Dict[str, Any]:
+    """
+    Extract disclosures, arbitrations, exams and employments from a detailed payload in one pass.
+
+    :param detail: The flat detailed_info, or the parsed nested content/iacontent document.
+    :param nested: True for BrokerCheck nested content, which only carries disclosures and employments.
     """
-    logger.debug(f"Entering create_individual_record for {data_source} with basic_info={json.dumps(basic_info, indent=2) if basic_info else 'None'}")
+    fields: Dict[str, Any] = {"disclosures": detail.get("disclosures", [])}
+    employments = []
+    if data_source == "FINRA_BrokerCheck":
+        if not nested:
+            fields["arbitrations"] = detail.get("arbitrations", [])
+            fields["exams"] = (
+                detail.get("stateExamCategory", []) +
+                detail.get("principalExamCategory", []) +
+                detail.get("productExamCategory", [])
+            )
+        for emp in detail.get("currentEmployments", []):
+            employments.append(_normalize_employment(emp, "current", "registered_firm"))
+        for emp in detail.get("previousEmployments", []):
+            employments.append(_normalize_employment(emp, "previous", "registered_firm"))
+    else:
+        fields["arbitrations"] = detail.get("arbitrations", [])
+        fields["exams"] = (
+            detail.get("stateExamCategory", []) +
+            detail.get("principalExamCategory", []) +
+            detail.get("productExamCategory", [])
+        )
+        for emp in detail.get("currentIAEmployments", []):
+            employments.append(_normalize_employment(emp, "current", "registered_firm"))
+        for emp in detail.get("previousIAEmployments", []):
+            employments.append(_normalize_employment(emp, "previous", "registered_firm"))
+        for emp in detail.get("previousEmployments", []):
+            normalized_emp = _normalize_employment(emp, "previous", "employment_history")
+            end_date_str = emp.get("registrationEndDate")
+            if end_date_str:
+                try:
+                    end_date = datetime.strptime(end_date_str, "%m/%d/%Y")
+                    if end_date >= EMPLOYMENT_HISTORY_CUTOFF:
+                        employments.append(normalized_emp)
+                        logger.debug(f"Included previous employment ending {end_date_str} (within 10 years)")
+                    else:
+                        logger.debug(f"Excluded previous employment ending {end_date_str} (older than 10 years)")
+                except ValueError:
+                    logger.warning(f"Invalid registrationEndDate format: {end_date_str}")
+                    employments.append(normalized_emp)
+            else:
+                employments.append(normalized_emp)
+    fields["employments"] = employments
+    logger.debug(f"{'Nested' if nested else 'Flat'} structure employments: {len(employments)} entries")
+    return fields
+
+def _build_individual_record(
+    data_source: str,
+    basic_info: Optional[Dict[str, Any]],
+    detailed_info: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Normalize one basic/detailed payload pair; see create_individual_record."""
+    logger.debug("Entering create_individual_record for %s with basic_info=%s", data_source, LazyJson(basic_info, indent=2))
     
     # Validate data_source
     if data_source not in VALID_DATA_SOURCES:
@@ -91,7 +270,7 @@ def create_individual_record(
         return extracted_info
 
     individual = hits_list[0].get("_source", {})
-    logger.debug(f"Extracted individual data: {json.dumps(individual, indent=2)}")
+    logger.debug("Extracted individual data: %s", LazyJson(individual, indent=2))
 
     # Name fields
     first_name = individual.get('ind_firstname', '').upper()
@@ -112,185 +291,57 @@ def create_individual_record(
         logger.warning(f"No detailed_info provided for {data_source}. Skipping detailed fields.")
         return extracted_info
 
-    logger.debug(f"Processing detailed_info: {json.dumps(detailed_info, indent=2)}")
-
-    # Helper function to normalize employments with firm_id as string
-    def normalize_employment(emp: Dict[str, Any], status: str, emp_type: str) -> Dict[str, Any]:
-        firm_id = emp.get("firmId")
-        normalized = {
-            "firm_id": str(firm_id) if firm_id is not None else None,
-            "firm_name": emp.get("firmName"),
-            "registration_begin_date": emp.get("registrationBeginDate"),
-            "branch_offices": [
-                {
-                    "street": office.get("street1"),
-                    "city": office.get("city"),
-                    "state": office.get("state"),
-                    "zip_code": office.get("zipCode")
-                }
-                for office in emp.get("branchOfficeLocations", [])
-            ],
-            "status": status,
-            "type": emp_type
-        }
-        if status == "previous":
-            normalized["registration_end_date"] = emp.get("registrationEndDate")
-        logger.debug(f"Normalized employment: {json.dumps(normalized, indent=2)}")
-        return normalized
-
-    # 10-year cutoff for IAPD employment history
-    current_date = datetime(2025, 5, 12)  # Updated to match current date
-    ten_years_ago = current_date.replace(year=current_date.year - 10)
-    logger.debug(f"Using 10-year cutoff: {ten_years_ago}")
+    logger.debug("Processing detailed_info: %s", LazyJson(detailed_info, indent=2))
 
     # Source-specific parsing
     if data_source == "FINRA_BrokerCheck":
         # Handle flat structure
         if "disclosures" in detailed_info:
             logger.debug("Detected flat BrokerCheck structure in detailed_info")
-            extracted_info["disclosures"] = detailed_info.get("disclosures", [])
-            extracted_info["arbitrations"] = detailed_info.get("arbitrations", [])
-            extracted_info["exams"] = (
-                detailed_info.get("stateExamCategory", []) +
-                detailed_info.get("principalExamCategory", []) +
-                detailed_info.get("productExamCategory", [])
-            )
-            employments = []
-            for emp in detailed_info.get("currentEmployments", []):
-                employments.append(normalize_employment(emp, "current", "registered_firm"))
-            for emp in detailed_info.get("previousEmployments", []):
-                employments.append(normalize_employment(emp, "previous", "registered_firm"))
-            extracted_info["employments"] = employments
-            logger.debug(f"Flat structure employments: {len(employments)} entries")
+            extracted_info.update(_extract_detail_fields(data_source, detailed_info, nested=False))
 
         # Handle nested structure
         elif "hits" in detailed_info:
             logger.debug("Detected nested structure in BrokerCheck detailed_info")
             detailed_hits = detailed_info["hits"].get("hits", [])
             if detailed_hits:
-                content_str = detailed_hits[0]["_source"].get("content", "")
-                try:
-                    content_json = json.loads(content_str)
-                    logger.debug(f"Parsed nested content: {json.dumps(content_json, indent=2)}")
-                except json.JSONDecodeError as e:
-                    logger.warning(f"Failed to parse BrokerCheck 'content' JSON: {e}")
-                    content_json = {}
-                extracted_info["disclosures"] = content_json.get("disclosures", [])
-                employments = []
-                for emp in content_json.get("currentEmployments", []):
-                    employments.append(normalize_employment(emp, "current", "registered_firm"))
-                for emp in content_json.get("previousEmployments", []):
-                    employments.append(normalize_employment(emp, "previous", "registered_firm"))
-                extracted_info["employments"] = employments
-                logger.debug(f"Nested structure employments: {len(employments)} entries")
+                content_json = _parse_embedded_json(detailed_hits[0]["_source"].get("content", ""), "BrokerCheck 'content'")
+                extracted_info.update(_extract_detail_fields(data_source, content_json, nested=True))
             else:
                 logger.info("BrokerCheck detailed_info had no hits. No employments extracted.")
         else:
             logger.info("No valid BrokerCheck detailed_info provided, skipping employments.")
 
     elif data_source == "IAPD":
-        # Parse employments from basic_info iacontent (if nested)
-        iacontent_str = individual.get("iacontent", "{}")
-        try:
-            iacontent_data = json.loads(iacontent_str)
-            logger.debug(f"Parsed iacontent from basic_info: {json.dumps(iacontent_data, indent=2)}")
-        except json.JSONDecodeError as e:
-            logger.warning(f"IAPD basic_info iacontent parse error: {e}")
-            iacontent_data = {}
-
-        employments = []
-        for emp in iacontent_data.get("currentIAEmployments", []):
-            employments.append(normalize_employment(emp, "current", "registered_firm"))
-        logger.debug(f"Basic_info iacontent employments: {len(employments)} entries")
+        detailed_hits = detailed_info["hits"].get("hits", []) if "hits" in detailed_info else []
 
         # Handle flat structure
         if "disclosures" in detailed_info:
             logger.debug("Detected flat IAPD structure in detailed_info")
-            extracted_info["disclosures"] = detailed_info.get("disclosures", [])
-            extracted_info["arbitrations"] = detailed_info.get("arbitrations", [])
-            extracted_info["exams"] = (
-                detailed_info.get("stateExamCategory", []) +
-                detailed_info.get("principalExamCategory", []) +
-                detailed_info.get("productExamCategory", [])
-            )
-            employments = []
-            for emp in detailed_info.get("currentIAEmployments", []):
-                employments.append(normalize_employment(emp, "current", "registered_firm"))
-            for emp in detailed_info.get("previousIAEmployments", []):
-                employments.append(normalize_employment(emp, "previous", "registered_firm"))
-            for emp in detailed_info.get("previousEmployments", []):
-                normalized_emp = normalize_employment(emp, "previous", "employment_history")
-                end_date_str = emp.get("registrationEndDate")
-                if end_date_str:
-                    try:
-                        end_date = datetime.strptime(end_date_str, "%m/%d/%Y")
-                        if end_date >= ten_years_ago:
-                            employments.append(normalized_emp)
-                            logger.debug(f"Included previous employment ending {end_date_str} (within 10 years)")
-                        else:
-                            logger.debug(f"Excluded previous employment ending {end_date_str} (older than 10 years)")
-                    except ValueError:
-                        logger.warning(f"Invalid registrationEndDate format: {end_date_str}")
-                        employments.append(normalized_emp)
-                else:
-                    employments.append(normalized_emp)
-            extracted_info["employments"] = employments
-            logger.debug(f"Flat structure employments: {len(employments)} entries")
+            extracted_info.update(_extract_detail_fields(data_source, detailed_info, nested=False))
 
         # Handle nested structure
-        elif "hits" in detailed_info:
+        elif detailed_hits:
             logger.debug("Detected nested structure in IAPD detailed_info")
-            detailed_hits = detailed_info["hits"].get("hits", [])
-            if detailed_hits:
-                iapd_detailed_content_str = detailed_hits[0]["_source"].get("iacontent", "{}")
-                try:
-                    iapd_detailed_content_data = json.loads(iapd_detailed_content_str)
-                    logger.debug(f"Parsed nested iacontent: {json.dumps(iapd_detailed_content_data, indent=2)}")
-                except json.JSONDecodeError as e:
-                    logger.warning(f"IAPD detailed_info iacontent parse error: {e}")
-                    iapd_detailed_content_data = {}
-                extracted_info["exams"] = (
-                    iapd_detailed_content_data.get("stateExamCategory", []) +
-                    iapd_detailed_content_data.get("principalExamCategory", []) +
-                    iapd_detailed_content_data.get("productExamCategory", [])
-                )
-                extracted_info["disclosures"] = iapd_detailed_content_data.get("disclosures", [])
-                extracted_info["arbitrations"] = iapd_detailed_content_data.get("arbitrations", [])
-                employments = []
-                for emp in iapd_detailed_content_data.get("currentIAEmployments", []):
-                    employments.append(normalize_employment(emp, "current", "registered_firm"))
-                for emp in iapd_detailed_content_data.get("previousIAEmployments", []):
-                    employments.append(normalize_employment(emp, "previous", "registered_firm"))
-                for emp in iapd_detailed_content_data.get("previousEmployments", []):
-                    normalized_emp = normalize_employment(emp, "previous", "employment_history")
-                    end_date_str = emp.get("registrationEndDate")
-                    if end_date_str:
-                        try:
-                            end_date = datetime.strptime(end_date_str, "%m/%d/%Y")
-                            if end_date >= ten_years_ago:
-                                employments.append(normalized_emp)
-                                logger.debug(f"Included previous employment ending {end_date_str} (within 10 years)")
-                            else:
-                                logger.debug(f"Excluded previous employment ending {end_date_str} (older than 10 years)")
-                        except ValueError:
-                            logger.warning(f"Invalid registrationEndDate format: {end_date_str}")
-                            employments.append(normalized_emp)
-                    else:
-                        employments.append(normalized_emp)
-                extracted_info["employments"] = employments
-                logger.debug(f"Nested structure employments: {len(employments)} entries")
-            else:
-                logger.info("IAPD detailed_info had no hits. Using basic_info's iacontent.")
-                extracted_info["disclosures"] = iacontent_data.get("disclosures", [])
-                extracted_info["arbitrations"] = iacontent_data.get("arbitrations", [])
-                extracted_info["employments"] = employments
+            iapd_detailed_content_data = _parse_embedded_json(
+                detailed_hits[0]["_source"].get("iacontent", "{}"), "IAPD detailed_info iacontent"
+            )
+            extracted_info.update(_extract_detail_fields(data_source, iapd_detailed_content_data, nested=True))
+
+        # Fall back to the iacontent embedded in basic_info; only parsed when needed
         else:
+            if "hits" in detailed_info:
+                logger.info("IAPD detailed_info had no hits. Using basic_info's iacontent.")
+            iacontent_data = _parse_embedded_json(individual.get("iacontent", "{}"), "IAPD basic_info iacontent")
             extracted_info["disclosures"] = iacontent_data.get("disclosures", [])
             extracted_info["arbitrations"] = iacontent_data.get("arbitrations", [])
-            extracted_info["employments"] = employments
-            logger.debug(f"Defaulted to iacontent employments: {len(employments)} entries")
+            extracted_info["employments"] = [
+                _normalize_employment(emp, "current", "registered_firm")
+                for emp in iacontent_data.get("currentIAEmployments", [])
+            ]
+            logger.debug(f"Defaulted to iacontent employments: {len(extracted_info['employments'])} entries")
 
-    logger.debug(f"Normalized individual record from {data_source}: {json.dumps(extracted_info, indent=2)}")
+    logger.debug("Normalized individual record from %s: %s", data_source, LazyJson(extracted_info, indent=2))
     return extracted_info
 
 def create_disciplinary_record(
@@ -323,6 +374,7 @@ def create_disciplinary_record(
             "searched_name": searched_name,
             "records_found": 0,
             "records_filtered": 0,
+            "names_pruned": 0,
             "names_found": [],
             "name_scores": {},
             "exact_match_found": False,
@@ -330,7 +382,7 @@ def create_disciplinary_record(
         },
         "raw_data": [data] if data is not None and not isinstance(data, list) else data or []
     }
-    logger.debug(f"Raw data: {json.dumps(result['raw_data'], indent=2)}")
+    logger.debug("Raw data: %s", LazyJson(result['raw_data'], indent=2))
 
     if isinstance(data, dict) and "error" in data:
         logger.warning(f"Error in {data_source} data: {data['error']}")
@@ -365,13 +417,14 @@ def create_disciplinary_record(
     due_diligence["records_found"] = len(raw_results)
     logger.debug(f"Found {due_diligence['records_found']} records")
 
+    candidates = []
     for record in raw_results:
         if not isinstance(record, dict):
             logger.warning(f"Skipping malformed record in {data_source}: {record}")
             due_diligence["records_filtered"] += 1
             continue
 
-        logger.debug(f"Processing record: {json.dumps(record, indent=2)}")
+        logger.debug("Processing record: %s", LazyJson(record, indent=2))
         normalized_record = {}
         respondent_name = None
         if data_source == "FINRA_Disciplinary":
@@ -395,30 +448,33 @@ def create_disciplinary_record(
 
         logger.debug(f"Extracted respondent_name: '{respondent_name}'")
         if respondent_name:
-            try:
-                name_eval, _ = evaluate_name(searched_name, respondent_name, [], score_threshold=threshold.value)
-                dd = name_eval["due_diligence"]
-                logger.debug(f"Name evaluation result for '{respondent_name}': {json.dumps(dd, indent=2)}")
-                due_diligence["names_found"].append(respondent_name)
-                due_diligence["name_scores"][respondent_name] = dd["name_scores"][respondent_name]
-                if dd["exact_match_found"]:
-                    result["actions"].append(normalized_record)
-                    due_diligence["exact_match_found"] = True
-                    logger.debug(f"Matched disciplinary record {normalized_record['case_id']} with {respondent_name} (score: {dd['name_scores'][respondent_name]})")
-            except Exception as e:
-                logger.error(f"Failed to evaluate name '{respondent_name}' against '{searched_name}': {str(e)}")
-                due_diligence["names_found"].append(respondent_name)
-                due_diligence["name_scores"][respondent_name] = 0.0
-                due_diligence["status"] = f"Partial failure: Error processing '{respondent_name}'"
+            candidates.append((normalized_record, respondent_name))
         else:
             due_diligence["records_filtered"] += 1
             logger.debug(f"Skipped disciplinary record {normalized_record['case_id']} - no respondent name")
 
+    scores = score_respondent_names(searched_name, [name for _, name in candidates], threshold)
+    for normalized_record, respondent_name in candidates:
+        due_diligence["names_found"].append(respondent_name)
+        if scores is None:
+            due_diligence["name_scores"][respondent_name] = 0.0
+            due_diligence["status"] = f"Partial failure: Error processing '{respondent_name}'"
+            continue
+        score = scores[respondent_name]
+        if score is None:
+            due_diligence["names_pruned"] += 1
+            continue
+        due_diligence["name_scores"][respondent_name] = score
+        if score >= threshold.value:
+            result["actions"].append(normalized_record)
+            due_diligence["exact_match_found"] = True
+            logger.debug(f"Matched disciplinary record {normalized_record['case_id']} with {respondent_name} (score: {score})")
+
     due_diligence["records_filtered"] = due_diligence["records_found"] - len(result["actions"])
     if not due_diligence["status"].startswith("Partial failure"):
         due_diligence["status"] = "Exact matches found" if due_diligence["exact_match_found"] else f"Records found but no matches for '{searched_name}'"
 
-    logger.debug(f"Final due_diligence for {data_source}: {json.dumps(due_diligence, indent=2)}")
+    logger.debug("Final due_diligence for %s: %s", data_source, LazyJson(due_diligence, indent=2))
     return result
 
 def create_arbitration_record(
@@ -451,6 +507,7 @@ def create_arbitration_record(
             "searched_name": searched_name,
             "records_found": 0,
             "records_filtered": 0,
+            "names_pruned": 0,
             "names_found": [],
             "name_scores": {},
             "exact_match_found": False,
@@ -458,7 +515,7 @@ def create_arbitration_record(
         },
         "raw_data": [data] if data is not None and not isinstance(data, list) else data or []
     }
-    logger.debug(f"Raw data: {json.dumps(result['raw_data'], indent=2)}")
+    logger.debug("Raw data: %s", LazyJson(result['raw_data'], indent=2))
 
     if isinstance(data, dict) and "error" in data:
         logger.warning(f"Error in {data_source} data: {data['error']}")
@@ -494,13 +551,14 @@ def create_arbitration_record(
     due_diligence["records_found"] = len(raw_results)
     logger.debug(f"Found {due_diligence['records_found']} records")
 
+    candidates = []
     for record in raw_results:
         if not isinstance(record, dict):
             logger.warning(f"Skipping malformed record in {data_source}: {record}")
             due_diligence["records_filtered"] += 1
             continue
 
-        logger.debug(f"Processing record: {json.dumps(record, indent=2)}")
+        logger.debug("Processing record: %s", LazyJson(record, indent=2))
         normalized_record = {}
         respondent_names = []
 
@@ -539,35 +597,38 @@ def create_arbitration_record(
 
         logger.debug(f"Extracted respondent_names: {respondent_names}")
         if respondent_names:
-            matched = False
-            for respondent_name in respondent_names:
-                try:
-                    name_eval, _ = evaluate_name(searched_name, respondent_name, [], score_threshold=threshold.value)
-                    dd = name_eval["due_diligence"]
-                    logger.debug(f"Name evaluation result for '{respondent_name}': {json.dumps(dd, indent=2)}")
-                    due_diligence["names_found"].append(respondent_name)
-                    due_diligence["name_scores"][respondent_name] = dd["name_scores"][respondent_name]
-                    if dd["exact_match_found"]:
-                        normalized_record["matched_name"] = respondent_name
-                        result["actions"].append(normalized_record)
-                        due_diligence["exact_match_found"] = True
-                        matched = True
-                        logger.debug(f"Matched arbitration record {normalized_record['case_id']} with {respondent_name} (score: {dd['name_scores'][respondent_name]})")
-                        break
-                except Exception as e:
-                    logger.error(f"Failed to evaluate name '{respondent_name}' against '{searched_name}': {str(e)}")
-                    due_diligence["names_found"].append(respondent_name)
-                    due_diligence["name_scores"][respondent_name] = 0.0
-                    due_diligence["status"] = f"Partial failure: Error processing '{respondent_name}'"
-            if not matched:
-                due_diligence["records_filtered"] += 1
-                logger.debug(f"Record {normalized_record['case_id']} not matched")
+            candidates.append((normalized_record, respondent_names))
         else:
             due_diligence["records_filtered"] += 1
             logger.debug(f"No respondents found in {normalized_record['case_id']}, skipping match")
 
+    scores = score_respondent_names(searched_name, [name for _, names in candidates for name in names], threshold)
+    for normalized_record, respondent_names in candidates:
+        matched = False
+        for respondent_name in respondent_names:
+            due_diligence["names_found"].append(respondent_name)
+            if scores is None:
+                due_diligence["name_scores"][respondent_name] = 0.0
+                due_diligence["status"] = f"Partial failure: Error processing '{respondent_name}'"
+                continue
+            score = scores[respondent_name]
+            if score is None:
+                due_diligence["names_pruned"] += 1
+                continue
+            due_diligence["name_scores"][respondent_name] = score
+            if score >= threshold.value:
+                normalized_record["matched_name"] = respondent_name
+                result["actions"].append(normalized_record)
+                due_diligence["exact_match_found"] = True
+                matched = True
+                logger.debug(f"Matched arbitration record {normalized_record['case_id']} with {respondent_name} (score: {score})")
+                break
+        if not matched:
+            due_diligence["records_filtered"] += 1
+            logger.debug(f"Record {normalized_record['case_id']} not matched")
+
     due_diligence["status"] = "Exact matches found" if due_diligence["exact_match_found"] else f"Records found but no matches for '{searched_name}'"
-    logger.debug(f"Final due_diligence for {data_source}: {json.dumps(due_diligence, indent=2)}")
+    logger.debug("Final due_diligence for %s: %s", data_source, LazyJson(due_diligence, indent=2))
     return result
 
 def create_regulatory_record(
@@ -600,6 +661,7 @@ def create_regulatory_record(
             "searched_name": searched_name,
             "records_found": 0,
             "records_filtered": 0,
+            "names_pruned": 0,
             "names_found": [],
             "name_scores": {},
             "exact_match_found": False,
@@ -640,13 +702,14 @@ def create_regulatory_record(
     due_diligence["records_found"] = len(raw_results)
     logger.debug(f"Found {due_diligence['records_found']} records")
 
+    candidates = []
     for record in raw_results:
         if not isinstance(record, dict):
             logger.warning(f"Skipping malformed record in {data_source}: {record}")
             due_diligence["records_filtered"] += 1
             continue
 
-        logger.debug(f"Processing record: {json.dumps(record, indent=2)}")
+        logger.debug("Processing record: %s", LazyJson(record, indent=2))
         reg_types_str = record.get("Current Registration Types", "-")
         registration_types = [rtype.strip() for rtype in reg_types_str.split(",")] if reg_types_str and reg_types_str != "-" else []
 
@@ -664,32 +727,33 @@ def create_regulatory_record(
         logger.debug(f"Extracted respondent_name: '{respondent_name}'")
 
         if respondent_name:
-            try:
-                name_eval, _ = evaluate_name(searched_name, respondent_name, [], score_threshold=threshold.value)
-                dd = name_eval["due_diligence"]
-                logger.debug(f"Name evaluation result for '{respondent_name}': {json.dumps(dd, indent=2)}")
-                normalized_name = dd["names_found"][0]
-                score = dd["name_scores"].get(normalized_name, 0.0)
-                due_diligence["names_found"].append(respondent_name)
-                due_diligence["name_scores"][respondent_name] = score
-                if dd["exact_match_found"]:
-                    result["actions"].append(normalized_record)
-                    due_diligence["exact_match_found"] = True
-                    logger.debug(f"Matched regulatory record {normalized_record['nfa_id']} with {respondent_name} (score: {score})")
-            except Exception as e:
-                logger.error(f"Failed to evaluate name '{respondent_name}' against '{searched_name}': {str(e)}")
-                due_diligence["names_found"].append(respondent_name)
-                due_diligence["name_scores"][respondent_name] = 0.0
-                due_diligence["status"] = f"Partial failure: Error processing '{respondent_name}'"
+            candidates.append((normalized_record, respondent_name))
         else:
             due_diligence["records_filtered"] += 1
             logger.debug(f"Skipped regulatory record {normalized_record['nfa_id']} - no respondent name")
 
+    scores = score_respondent_names(searched_name, [name for _, name in candidates], threshold)
+    for normalized_record, respondent_name in candidates:
+        due_diligence["names_found"].append(respondent_name)
+        if scores is None:
+            due_diligence["name_scores"][respondent_name] = 0.0
+            due_diligence["status"] = f"Partial failure: Error processing '{respondent_name}'"
+            continue
+        score = scores[respondent_name]
+        if score is None:
+            due_diligence["names_pruned"] += 1
+            continue
+        due_diligence["name_scores"][respondent_name] = score
+        if score >= threshold.value:
+            result["actions"].append(normalized_record)
+            due_diligence["exact_match_found"] = True
+            logger.debug(f"Matched regulatory record {normalized_record['nfa_id']} with {respondent_name} (score: {score})")
+
     due_diligence["records_filtered"] = due_diligence["records_found"] - len(result["actions"])
     if not due_diligence["status"].startswith("Partial failure"):
         due_diligence["status"] = "Exact matches found" if due_diligence["exact_match_found"] else f"Records found but no matches for '{searched_name}'"
 
-    logger.debug(f"Final due_diligence for {data_source}: {json.dumps(due_diligence, indent=2)}")
+    logger.debug("Final due_diligence for %s: %s", data_source, LazyJson(due_diligence, indent=2))
     return result
 
 if __name__ == "__main__":
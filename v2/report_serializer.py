@@ -0,0 +1,80 @@
+"""
+report_serializer.py
+
+Shared JSON serialization for claim results and compliance reports.
+
+Reports may still hold Alert objects (or other objects exposing to_dict()) and enums.
+orjson serializes the tree in a single native pass and calls report_default() only for
+those objects, so callers no longer need a convert_to_serializable() walk before dumping.
+AlertEncoder and json_dumps_with_alerts() keep the interface the modules used to define
+locally; keyword arguments orjson cannot honour (sort_keys, ensure_ascii, separators,
+indent other than 2, ...) fall back to the standard json encoder.
+"""
+
+import json
+from enum import Enum
+from typing import Any, Dict, Optional
+
+import orjson
+
+# Options applied to every dump; dataclasses go through report_default so Alert.to_dict() decides their shape
+_BASE_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def report_default(obj: Any) -> Any:
+    """Convert objects orjson/json cannot serialize natively (Alerts, enums, sets, plain objects)."""
+    to_dict = getattr(obj, "to_dict", None)
+    if callable(to_dict):
+        return to_dict()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if hasattr(obj, "__slots__"):
+        return {slot: getattr(obj, slot) for slot in obj.__slots__ if hasattr(obj, slot)}
+    if hasattr(obj, "__dict__"):
+        return dict(obj.__dict__)
+    return str(obj)
+
+
+class AlertEncoder(json.JSONEncoder):
+    """JSON encoder that handles Alert objects (stdlib fallback for json_dumps_with_alerts)."""
+    def default(self, obj):
+        return report_default(obj)
+
+
+def dumps_bytes(obj: Any, indent: Optional[int] = None) -> bytes:
+    """
+    Serialize a report or result to UTF-8 JSON bytes.
+
+    Args:
+        obj: Object to serialize; may contain Alert objects and enums.
+        indent: None for compact output, or 2 for pretty-printed output.
+
+    Returns:
+        bytes: The encoded JSON document.
+    """
+    options = _BASE_OPTIONS | (orjson.OPT_INDENT_2 if indent else 0)
+    try:
+        return orjson.dumps(obj, default=report_default, option=options)
+    except orjson.JSONEncodeError:
+        # e.g. integers beyond 64 bits, which the stdlib encoder still accepts
+        return json.dumps(obj, cls=AlertEncoder, indent=indent, ensure_ascii=False).encode("utf-8")
+
+
+def json_dumps_with_alerts(obj: Any, **kwargs) -> str:
+    """Helper function to serialize objects that may contain Alert instances."""
+    indent = kwargs.pop("indent", None)
+    if kwargs or indent not in (None, 2):
+        return json.dumps(obj, cls=AlertEncoder, indent=indent, **kwargs)
+    return dumps_bytes(obj, indent=indent).decode("utf-8")
+
+
+def loads(data: Any) -> Any:
+    """Parse JSON from bytes or str."""
+    return orjson.loads(data)
+
+
+def to_serializable(obj: Any) -> Dict[str, Any]:
+    """Return a plain JSON-compatible copy of obj (Alerts and enums converted)."""
+    return orjson.loads(dumps_bytes(obj))
@@ -0,0 +1,234 @@
+"""
+result_sink.py
+
+Pluggable destinations for batch results. Every sink writes through the StorageManager
+(output storage), so results land in the local output folder or the S3 output prefix alike.
+
+- PerRecordSink: one pretty-printed JSON file per reference_id, the historical layout.
+- JsonlPartSink: buffers compact JSON lines and writes numbered part files
+  (results/<run_id>/part-00000.jsonl) of at most rows_per_part rows or part_bytes bytes,
+  uploading up to max_concurrent_uploads parts at a time. A manifest.json next to the
+  parts lists each part's record count, size, SHA-256 and reference_ids; it is rewritten
+  on every flush, so partial runs are discoverable too.
+
+flush() makes everything written so far durable; the batch engine calls it before each
+checkpoint journal commit, so a row is never recorded as finished while its result is
+still buffered. create_result_sink() picks a sink from the "result_sink" config.
+"""
+
+import hashlib
+import logging
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from report_serializer import dumps_bytes
+from storage_manager import StorageManager
+
+logger = logging.getLogger('result_sink')
+
+RESULTS_FOLDER = "results"
+DEFAULT_ROWS_PER_PART = 1000
+DEFAULT_PART_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_CONCURRENT_UPLOADS = 4
+
+
+def result_reference_id(result: Any) -> Optional[str]:
+    """Return the reference_id of a claim result, looking in the claim and search evaluation too."""
+    if not isinstance(result, dict):
+        return None
+    reference_id = result.get('reference_id')
+    if not reference_id and isinstance(result.get('claim'), dict):
+        reference_id = result['claim'].get('reference_id')
+    if not reference_id and isinstance(result.get('search_evaluation'), dict):
+        reference_id = result['search_evaluation'].get('reference_id')
+    return reference_id or None
+
+
+class ResultSink(ABC):
+    """Destination for processed claim results."""
+
+    @abstractmethod
+    def write(self, result: Dict[str, Any]) -> None:
+        """Accept one result; safe to call from several worker threads."""
+
+    def flush(self) -> None:
+        """Make every result written so far durable."""
+
+    def close(self) -> Optional[Dict[str, Any]]:
+        """Flush and release resources; returns the manifest, if the sink writes one."""
+        self.flush()
+        return None
+
+    def __enter__(self) -> "ResultSink":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class PerRecordSink(ResultSink):
+    """One pretty-printed <reference_id>.json file per result."""
+
+    def __init__(self, storage_manager: StorageManager):
+        self.storage_manager = storage_manager
+
+    def write(self, result: Dict[str, Any]) -> None:
+        reference_id = result_reference_id(result)
+        if not reference_id:
+            # Without a reference_id fall back to a timestamped name
+            output_file = f"result_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        else:
+            # Clean the reference_id to make it a valid filename
+            reference_id = str(reference_id).replace('/', '_').replace('\\', '_').replace(':', '_')
+            output_file = f"{reference_id}.json"
+        logger.info(f"Saving result to output file: {output_file}")
+        self.storage_manager.write_file(output_file, dumps_bytes(result, indent=2), storage_type='output')
+
+
+class JsonlPartSink(ResultSink):
+    """Batched JSON Lines part files plus a manifest, uploaded with bounded concurrency."""
+
+    def __init__(self, storage_manager: StorageManager, run_id: Optional[str] = None,
+                 rows_per_part: int = DEFAULT_ROWS_PER_PART, part_bytes: int = DEFAULT_PART_BYTES,
+                 max_concurrent_uploads: int = DEFAULT_MAX_CONCURRENT_UPLOADS):
+        """
+        Initialize the sink.
+
+        Args:
+            storage_manager: Storage manager the parts are written through (output storage).
+            run_id: Folder name under results/ (default: the current timestamp).
+            rows_per_part: Start a new part after this many results.
+            part_bytes: Start a new part once the buffered lines reach this size.
+            max_concurrent_uploads: Parts written at the same time; writers wait beyond it.
+        """
+        self.storage_manager = storage_manager
+        self.run_id = run_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.prefix = f"{RESULTS_FOLDER}/{self.run_id}"
+        self.rows_per_part = max(1, int(rows_per_part))
+        self.part_bytes = part_bytes
+        self._lines: List[bytes] = []
+        self._line_bytes = 0
+        self._reference_ids: List[Optional[str]] = []
+        self._next_part = 0
+        self._parts: Dict[int, Dict[str, Any]] = {}
+        self._uploads: List[Tuple[int, Future, bytes, List[Optional[str]]]] = []
+        self._failed: Dict[int, Tuple[bytes, List[Optional[str]]]] = {}
+        self.manifest: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max(1, int(max_concurrent_uploads)))
+        self._executor = ThreadPoolExecutor(max_workers=max(1, int(max_concurrent_uploads)),
+                                            thread_name_prefix="result-upload")
+
+    def write(self, result: Dict[str, Any]) -> None:
+        line = dumps_bytes(result) + b"\n"
+        with self._lock:
+            self._lines.append(line)
+            self._line_bytes += len(line)
+            self._reference_ids.append(result_reference_id(result))
+            if len(self._lines) >= self.rows_per_part or self._line_bytes >= self.part_bytes:
+                self._submit_part_locked()
+
+    def _submit_part_locked(self) -> None:
+        """Hand the buffered lines to an upload slot, waiting while all slots are busy."""
+        if not self._lines:
+            return
+        index = self._next_part
+        self._next_part += 1
+        data = b"".join(self._lines)
+        reference_ids = self._reference_ids
+        self._lines, self._line_bytes, self._reference_ids = [], 0, []
+        self._submit_upload_locked(index, data, reference_ids)
+
+    def _submit_upload_locked(self, index: int, data: bytes, reference_ids: List[Optional[str]]) -> None:
+        self._slots.acquire()
+        future = self._executor.submit(self._upload_part, index, data, reference_ids)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._uploads.append((index, future, data, reference_ids))
+
+    def _upload_part(self, index: int, data: bytes, reference_ids: List[Optional[str]]) -> Dict[str, Any]:
+        path = f"{self.prefix}/part-{index:05d}.jsonl"
+        self.storage_manager.write_file(path, data, storage_type='output')
+        entry = {
+            "path": path,
+            "records": len(reference_ids),
+            "bytes": len(data),
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "reference_ids": reference_ids
+        }
+        logger.debug(f"Wrote result part {path} ({entry['records']} records, {entry['bytes']} bytes)")
+        return entry
+
+    def flush(self) -> None:
+        """
+        Write the buffered results as a part, wait for all uploads and refresh the manifest.
+
+        Parts that failed are kept and retried on every flush, which raises OSError until
+        all of them are written, so no checkpoint commit covers a lost result.
+        """
+        with self._lock:
+            failed, self._failed = self._failed, {}
+            for index, (data, reference_ids) in sorted(failed.items()):
+                self._submit_upload_locked(index, data, reference_ids)
+            self._submit_part_locked()
+            uploads, self._uploads = self._uploads, []
+            errors = []
+            for index, future, data, reference_ids in uploads:
+                try:
+                    self._parts[index] = future.result()
+                except Exception as e:
+                    self._failed[index] = (data, reference_ids)
+                    errors.append(str(e))
+            self.manifest = self._write_manifest_locked()
+        if errors:
+            raise OSError(f"Failed to write {len(errors)} result part(s): {'; '.join(errors)}")
+
+    def _manifest_locked(self) -> Dict[str, Any]:
+        parts = [self._parts[index] for index in sorted(self._parts)]
+        manifest = {
+            "run_id": self.run_id,
+            "format": "jsonl",
+            "updated": datetime.now().isoformat(),
+            "records": sum(part["records"] for part in parts),
+            "bytes": sum(part["bytes"] for part in parts),
+            "parts": parts
+        }
+        return manifest
+
+    def _write_manifest_locked(self) -> Dict[str, Any]:
+        manifest = self._manifest_locked()
+        if manifest["parts"]:
+            self.storage_manager.write_file(f"{self.prefix}/manifest.json", dumps_bytes(manifest, indent=2),
+                                            storage_type='output')
+        return manifest
+
+    def close(self) -> Dict[str, Any]:
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown(wait=True)
+        manifest = self.manifest
+        logger.info(f"Wrote {manifest['records']} results in {len(manifest['parts'])} parts to {self.prefix}")
+        return manifest
+
+
+def create_result_sink(storage_manager: StorageManager, config: Dict[str, Any]) -> ResultSink:
+    """
+    Build the result sink named by config "result_sink" ("per_record", the default, or "jsonl").
+
+    JSONL options come from "result_rows_per_part", "result_part_bytes" and
+    "result_max_concurrent_uploads".
+    """
+    kind = config.get("result_sink", "per_record")
+    if kind == "jsonl":
+        return JsonlPartSink(
+            storage_manager,
+            rows_per_part=config.get("result_rows_per_part", DEFAULT_ROWS_PER_PART),
+            part_bytes=config.get("result_part_bytes", DEFAULT_PART_BYTES),
+            max_concurrent_uploads=config.get("result_max_concurrent_uploads", DEFAULT_MAX_CONCURRENT_UPLOADS)
+        )
+    if kind != "per_record":
+        raise ValueError(f"Unknown result_sink '{kind}' (expected 'per_record' or 'jsonl')")
+    return PerRecordSink(storage_manager)
@@ -8,9 +8,14 @@ It abstracts away the complexity of interacting with multiple underlying service
 provides a unified interface for business logic to retrieve and store normalized data.
 """
 
+import copy
 import json
 import os
-from typing import Dict, Any, List, Optional
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, Callable, Hashable, List, Optional, Set, Tuple
 import argparse
 import logging
 
@@ -36,25 +41,123 @@ from normalizer import (
     create_regulatory_record,
 )
 from agents.compliance_report_agent import save_compliance_report
-from logger_config import setup_logging, reconfigure_logging
-from evaluation_processor import Alert
+from logger_config import setup_logging, reconfigure_logging, LazyJson
+from report_serializer import AlertEncoder, json_dumps_with_alerts
 
 # Set up logging using logger_config
-loggers = setup_logging(debug=True)  # Enable debug mode for detailed logs
+loggers = setup_logging()  # Level from LOG_LEVEL (default INFO)
 logger = loggers["services"]
 
 RUN_HEADLESS = True
 
-class AlertEncoder(json.JSONEncoder):
-    """Custom JSON encoder to handle Alert objects."""
-    def default(self, obj):
-        if isinstance(obj, Alert):
-            return obj.to_dict()
-        return super().default(obj)
-
-def json_dumps_with_alerts(obj: Any, **kwargs) -> str:
-    """Helper function to serialize objects that may contain Alert instances."""
-    return json.dumps(obj, cls=AlertEncoder, **kwargs)
+# Search results memoized for the claim currently being processed, keyed by (search, *identifiers)
+_request_results: ContextVar[Optional[Dict[Tuple[str, ...], Any]]] = ContextVar("request_results", default=None)
+
+@contextmanager
+def claim_request_context():
+    """
+    Memoize facade search results for the lifetime of one claim.
+
+    Inside the block every (source, CRD) pair is fetched and normalized once, however many
+    strategies or fallbacks ask for it. Scoped to the current thread/task, and a nested block
+    shares the outer one's results:
+
+        with claim_request_context():
+            facade.search_finra_brokercheck_individual("12345")
+            facade.search_finra_brokercheck_detailed("12345")  # served from the first call
+    """
+    if _request_results.get() is not None:
+        yield
+        return
+    token = _request_results.set({})
+    try:
+        yield
+    finally:
+        _request_results.reset(token)
+
+class BatchLookupResults:
+    """
+    Search results shared by the rows of a batch run that look up the same individual.
+
+    Each row runs inside batch_lookup_context(results, lookup_key). A search key is fetched
+    once however many rows, or concurrent workers, ask for it: later callers wait for the
+    first fetch and get a deep copy, so every row builds its report from its own data exactly
+    as before. A result is kept until release() has been called for every lookup key whose
+    rows used it.
+    """
+
+    def __init__(self):
+        self._results: Dict[Tuple[str, ...], Any] = {}
+        self._pending: Dict[Tuple[str, ...], threading.Event] = {}
+        self._users: Dict[Tuple[str, ...], Set[Hashable]] = defaultdict(set)
+        self._keys_by_lookup: Dict[Hashable, Set[Tuple[str, ...]]] = defaultdict(set)
+        self._lock = threading.Lock()
+        self.fetches = 0
+        self.reused = 0
+
+    def fetch(self, lookup_key: Hashable, key: Tuple[str, ...], fetch: Callable[[], Any]) -> Any:
+        """Return the result for key, calling fetch only if no row fetched it yet."""
+        while True:
+            with self._lock:
+                self._users[key].add(lookup_key)
+                self._keys_by_lookup[lookup_key].add(key)
+                found = key in self._results
+                if found:
+                    self.reused += 1
+                    stored = self._results[key]
+                    break
+                pending = self._pending.get(key)
+                if pending is None:
+                    self._pending[key] = threading.Event()
+                    break
+            # Another worker is fetching this key; use its result (or fetch if it failed)
+            pending.wait()
+        if found:
+            logger.debug("Reusing %s result for %s from an earlier row of the batch", key[0], key[1:])
+            return copy.deepcopy(stored)
+        try:
+            result = fetch()
+            with self._lock:
+                self.fetches += 1
+                if self._users.get(key):
+                    self._results[key] = copy.deepcopy(result)
+            return result
+        finally:
+            with self._lock:
+                self._pending.pop(key).set()
+
+    def release(self, lookup_key: Hashable) -> None:
+        """Drop the results no remaining lookup key needs, once the rows of lookup_key are done."""
+        with self._lock:
+            for key in self._keys_by_lookup.pop(lookup_key, ()):
+                users = self._users.get(key)
+                if users is None:
+                    continue
+                users.discard(lookup_key)
+                if not users:
+                    del self._users[key]
+                    self._results.pop(key, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._results)
+
+# Batch-wide results and the current row's lookup key, set per worker thread by the batch engine
+_batch_lookup: ContextVar[Optional[Tuple[BatchLookupResults, Hashable]]] = ContextVar("batch_lookup", default=None)
+
+@contextmanager
+def batch_lookup_context(results: BatchLookupResults, lookup_key: Hashable):
+    """
+    Share facade search results with the other rows of a batch while processing one row.
+
+        with batch_lookup_context(results, ("crd", "12345")):
+            process_claim(claim, facade)  # searches another row already ran are not fetched again
+    """
+    token = _batch_lookup.set((results, lookup_key))
+    try:
+        yield
+    finally:
+        _batch_lookup.reset(token)
 
 class FinancialServicesFacade:
     def __init__(self, headless: bool = True, storage_manager=None):
@@ -117,6 +220,23 @@ class FinancialServicesFacade:
             self.logger.error(f"Error loading organizations cache: {e}", exc_info=True)
             return None
 
+    @staticmethod
+    def _memoized(key: Tuple[str, ...], fetch: Callable[[], Any]) -> Any:
+        """Return the result for key from the active claim context, then the batch, calling fetch on a miss."""
+        results = _request_results.get()
+        if results is not None and key in results:
+            logger.debug("Reusing %s result for %s from the claim context", key[0], key[1:])
+            return results[key]
+        batch = _batch_lookup.get()
+        if batch is not None:
+            shared, lookup_key = batch
+            result = shared.fetch(lookup_key, key, fetch)
+        else:
+            result = fetch()
+        if results is not None:
+            results[key] = result
+        return result
+
     @staticmethod
     def _normalize_organization_name(name: str) -> str:
         """Normalize organization name for comparison."""
@@ -126,11 +246,15 @@ class FinancialServicesFacade:
     def _normalize_individual_record(data_source: str, basic_info: Optional[Dict[str, Any]], detailed_info: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Normalize individual record using the normalizer module."""
         result = create_individual_record(data_source, basic_info, detailed_info)
-        logger.debug(f"Normalized individual record from {data_source}: {json.dumps(result, indent=2)}")
+        logger.debug("Normalized individual record from %s: %s", data_source, LazyJson(result, indent=2))
         return result
 
     def get_organization_crd(self, organization_name: str) -> Optional[str]:
         """Retrieve organization CRD from cache."""
+        return self._memoized(("organization_crd", organization_name), lambda: self._lookup_organization_crd(organization_name))
+
+    def _lookup_organization_crd(self, organization_name: str) -> Optional[str]:
+        """Look up an organization CRD in the organizations cache file."""
         orgs_data = self._load_organizations_cache()
         if not orgs_data:
             logger.error("Failed to load organizations cache.")
@@ -155,6 +279,10 @@ class FinancialServicesFacade:
         if not crd_number or not crd_number.isdigit():
             logger.error(f"Invalid CRD number: {crd_number}")
             return self._normalize_individual_record("IAPD", None, None)
+        return self._memoized(("IAPD", crd_number), lambda: self._fetch_sec_iapd_individual(crd_number, employee_number))
+
+    def _fetch_sec_iapd_individual(self, crd_number: str, employee_number: Optional[str]) -> Dict[str, Any]:
+        """Fetch and normalize SEC IAPD basic and detailed info for a valid CRD number."""
         basic_result = fetch_agent_sec_iapd_search(employee_number, {"crd_number": crd_number})
         detailed_result = fetch_agent_sec_iapd_detailed(employee_number, {"crd_number": crd_number}) if basic_result else None
         if basic_result:
@@ -170,12 +298,17 @@ class FinancialServicesFacade:
 
     def search_sec_iapd_correlated(self, individual_name: str, organization_crd_number: str, employee_number: Optional[str] = None) -> Dict[str, Any]:
         """Search SEC IAPD for an individual correlated with an organization."""
+        return self._memoized(("IAPD_correlated", individual_name, organization_crd_number),
+                              lambda: self._fetch_sec_iapd_correlated(individual_name, organization_crd_number, employee_number))
+
+    def _fetch_sec_iapd_correlated(self, individual_name: str, organization_crd_number: str, employee_number: Optional[str]) -> Dict[str, Any]:
+        """Fetch and normalize a correlated search for a name at an organization."""
         logger.info(f"Fetching SEC IAPD correlated info for {individual_name} at organization {organization_crd_number}, Employee: {employee_number}")
         result = fetch_agent_sec_iapd_correlated(employee_number, {
             "individual_name": individual_name,
             "organization_crd_number": organization_crd_number
         })
-        logger.debug(f"Raw result from fetch_agent_sec_iapd_correlated: {json.dumps(result, indent=2) if result else 'None'}")
+        logger.debug("Raw result from fetch_agent_sec_iapd_correlated: %s", LazyJson(result, indent=2))
         if result:
             logger.info(f"Successfully fetched SEC IAPD correlated data for {individual_name} at organization {organization_crd_number}")
         else:
@@ -184,12 +317,17 @@ class FinancialServicesFacade:
 
     def search_finra_correlated(self, individual_name: str, organization_crd_number: str, employee_number: Optional[str] = None) -> Dict[str, Any]:
         """Search FINRA BrokerCheck for an individual correlated with an organization."""
+        return self._memoized(("FINRA_correlated", individual_name, organization_crd_number),
+                              lambda: self._fetch_finra_correlated(individual_name, organization_crd_number, employee_number))
+
+    def _fetch_finra_correlated(self, individual_name: str, organization_crd_number: str, employee_number: Optional[str]) -> Dict[str, Any]:
+        """Fetch and normalize a correlated search for a name at an organization."""
         logger.info(f"Fetching FINRA correlated info for {individual_name} at organization {organization_crd_number}, Employee: {employee_number}")
         result = fetch_agent_finra_bc_search_by_firm(employee_number, {
             "individual_name": individual_name,
             "organization_crd": organization_crd_number
         })
-        logger.debug(f"Raw result from fetch_agent_finra_bc_search_by_firm: {json.dumps(result, indent=2) if result else 'None'}")
+        logger.debug("Raw result from fetch_agent_finra_bc_search_by_firm: %s", LazyJson(result, indent=2))
         if result:
             logger.info(f"Successfully fetched FINRA correlated data for {individual_name} at organization {organization_crd_number}")
         else:
@@ -202,6 +340,10 @@ class FinancialServicesFacade:
         if not crd_number or not crd_number.isdigit():
             logger.error(f"Invalid CRD number: {crd_number}")
             return self._normalize_individual_record("FINRA_BrokerCheck", None, None)
+        return self._memoized(("FINRA_BrokerCheck", crd_number), lambda: self._fetch_finra_brokercheck_individual(crd_number, employee_number))
+
+    def _fetch_finra_brokercheck_individual(self, crd_number: str, employee_number: Optional[str]) -> Dict[str, Any]:
+        """Fetch and normalize FINRA BrokerCheck basic and detailed info for a valid CRD number."""
         basic_result = fetch_agent_finra_bc_search(employee_number, {"crd_number": crd_number})
         detailed_result = fetch_agent_finra_bc_detailed(employee_number, {"crd_number": crd_number}) if basic_result else None
         if basic_result:
@@ -217,13 +359,17 @@ class FinancialServicesFacade:
 
     def search_sec_arbitration(self, first_name: str, last_name: str, employee_number: Optional[str] = None) -> Dict[str, Any]:
         """Search SEC arbitration records by name."""
+        return self._memoized(("SEC_Arbitration", first_name, last_name), lambda: self._fetch_sec_arbitration(first_name, last_name, employee_number))
+
+    def _fetch_sec_arbitration(self, first_name: str, last_name: str, employee_number: Optional[str]) -> Dict[str, Any]:
+        """Fetch and normalize SEC Arbitration records for a name."""
         self._ensure_driver()
         logger.info(f"Fetching SEC Arbitration data for {first_name} {last_name}, Employee: {employee_number}")
         params = {"first_name": first_name, "last_name": last_name}
         searched_name = f"{first_name} {last_name}"
         result = fetch_agent_sec_arb_search(employee_number, params, self.driver)
         normalized = create_arbitration_record("SEC_Arbitration", result, searched_name)
-        logger.debug(f"SEC Arbitration normalized result: {json.dumps(normalized, indent=2)}")
+        logger.debug("SEC Arbitration normalized result: %s", LazyJson(normalized, indent=2))
         if result:
             logger.info(f"Successfully fetched SEC Arbitration data for {searched_name}")
         else:
@@ -232,14 +378,18 @@ class FinancialServicesFacade:
 
     def search_finra_disciplinary(self, first_name: str, last_name: str, employee_number: Optional[str] = None) -> Dict[str, Any]:
         """Search FINRA disciplinary records by name."""
+        return self._memoized(("FINRA_Disciplinary", first_name, last_name), lambda: self._fetch_finra_disciplinary(first_name, last_name, employee_number))
+
+    def _fetch_finra_disciplinary(self, first_name: str, last_name: str, employee_number: Optional[str]) -> Dict[str, Any]:
+        """Fetch and normalize FINRA Disciplinary records for a name."""
         self._ensure_driver()
         logger.info(f"Fetching FINRA Disciplinary data for {first_name} {last_name}, Employee: {employee_number}")
         params = {"first_name": first_name, "last_name": last_name}
         searched_name = f"{first_name} {last_name}"
         result = fetch_agent_finra_disc_search(employee_number, params, self.driver)
         normalized = create_disciplinary_record("FINRA_Disciplinary", result, searched_name)
-        logger.debug(f"FINRA Disciplinary raw result: {json.dumps(result, indent=2) if result else 'None'}")
-        logger.debug(f"FINRA Disciplinary normalized result: {json.dumps(normalized, indent=2)}")
+        logger.debug("FINRA Disciplinary raw result: %s", LazyJson(result, indent=2))
+        logger.debug("FINRA Disciplinary normalized result: %s", LazyJson(normalized, indent=2))
         if result:
             logger.info(f"Successfully fetched FINRA Disciplinary data for {searched_name}")
         else:
@@ -248,6 +398,10 @@ class FinancialServicesFacade:
 
     def search_nfa_regulatory(self, first_name: str, last_name: str, employee_number: Optional[str] = None) -> Dict[str, Any]:
         """Search NFA regulatory records by name."""
+        return self._memoized(("NFA_Regulatory", first_name, last_name), lambda: self._fetch_nfa_regulatory(first_name, last_name, employee_number))
+
+    def _fetch_nfa_regulatory(self, first_name: str, last_name: str, employee_number: Optional[str]) -> Dict[str, Any]:
+        """Fetch and normalize NFA Regulatory records for a name."""
         self._ensure_driver()
         logger.info(f"Fetching NFA regulatory data for {first_name} {last_name}, Employee: {employee_number}")
         params = {"first_name": first_name, "last_name": last_name}
@@ -255,8 +409,8 @@ class FinancialServicesFacade:
         result = fetch_agent_nfa_search(employee_number, params, self.driver)
         result_dict = result[0] if isinstance(result, list) and result else result
         normalized = create_regulatory_record("NFA_Regulatory", result_dict, searched_name)
-        logger.debug(f"NFA regulatory raw result: {json.dumps(result, indent=2) if result else 'None'}")
-        logger.debug(f"NFA regulatory normalized result: {json.dumps(normalized, indent=2)}")
+        logger.debug("NFA regulatory raw result: %s", LazyJson(result, indent=2))
+        logger.debug("NFA regulatory normalized result: %s", LazyJson(normalized, indent=2))
         if result:
             logger.info(f"Successfully fetched NFA regulatory data for {searched_name}")
         else:
@@ -265,13 +419,17 @@ class FinancialServicesFacade:
 
     def search_finra_arbitration(self, first_name: str, last_name: str, employee_number: Optional[str] = None) -> Dict[str, Any]:
         """Search FINRA arbitration records by name."""
+        return self._memoized(("FINRA_Arbitration", first_name, last_name), lambda: self._fetch_finra_arbitration(first_name, last_name, employee_number))
+
+    def _fetch_finra_arbitration(self, first_name: str, last_name: str, employee_number: Optional[str]) -> Dict[str, Any]:
+        """Fetch and normalize FINRA Arbitration records for a name."""
         self._ensure_driver()
         logger.info(f"Fetching FINRA Arbitration data for {first_name} {last_name}, Employee: {employee_number}")
         params = {"first_name": first_name, "last_name": last_name}
         searched_name = f"{first_name} {last_name}"
         result = fetch_agent_finra_arb_search(employee_number, params, self.driver)
         normalized = create_arbitration_record("FINRA_Arbitration", result, searched_name)
-        logger.debug(f"FINRA Arbitration normalized result: {json.dumps(normalized, indent=2)}")
+        logger.debug("FINRA Arbitration normalized result: %s", LazyJson(normalized, indent=2))
         if result:
             logger.info(f"Successfully fetched FINRA Arbitration data for {searched_name}")
         else:
@@ -280,14 +438,18 @@ class FinancialServicesFacade:
 
     def search_sec_disciplinary(self, first_name: str, last_name: str, employee_number: Optional[str] = None) -> Dict[str, Any]:
         """Search SEC disciplinary records by name."""
+        return self._memoized(("SEC_Disciplinary", first_name, last_name), lambda: self._fetch_sec_disciplinary(first_name, last_name, employee_number))
+
+    def _fetch_sec_disciplinary(self, first_name: str, last_name: str, employee_number: Optional[str]) -> Dict[str, Any]:
+        """Fetch and normalize SEC Disciplinary records for a name."""
         self._ensure_driver()
         logger.info(f"Fetching SEC Disciplinary data for {first_name} {last_name}, Employee: {employee_number}")
         params = {"first_name": first_name, "last_name": last_name}
         searched_name = f"{first_name} {last_name}"
         result = fetch_agent_sec_disc_search(employee_number, params, self.driver)
         normalized = create_disciplinary_record("SEC_Disciplinary", result, searched_name)
-        logger.debug(f"SEC Disciplinary raw result: {json.dumps(result, indent=2) if result else 'None'}")
-        logger.debug(f"SEC Disciplinary normalized result: {json.dumps(normalized, indent=2)}")
+        logger.debug("SEC Disciplinary raw result: %s", LazyJson(result, indent=2))
+        logger.debug("SEC Disciplinary normalized result: %s", LazyJson(normalized, indent=2))
         if result:
             logger.info(f"Successfully fetched SEC Disciplinary data for {searched_name}")
         else:
@@ -299,7 +461,7 @@ class FinancialServicesFacade:
         logger.info(f"Saving compliance report for employee_number={employee_number}")
         success = save_compliance_report(report, employee_number)
         if success:
-            logger.debug(f"Compliance report saved: {json_dumps_with_alerts(report, indent=2)}")
+            logger.debug("Compliance report saved: %s", LazyJson(report, dumps=json_dumps_with_alerts, indent=2))
         else:
             logger.error("Failed to save compliance report")
         return success
@@ -356,7 +518,7 @@ class FinancialServicesFacade:
 
         result["search_evaluation"]["source"] = sources
         result["search_evaluation"]["compliance_explanation"] = "; ".join(compliance_explanations) or "Search completed successfully"
-        logger.debug(f"Evaluation result: {json.dumps(result, indent=2)}")
+        logger.debug("Evaluation result: %s", LazyJson(result, indent=2))
         return result
 
     def perform_disciplinary_review(self, first_name: str, last_name: str, employee_number: Optional[str] = None) -> Dict[str, Any]:
@@ -373,6 +535,7 @@ class FinancialServicesFacade:
                     "source": "SEC_Disciplinary",
                     "records_found": 0,
                     "records_filtered": 0,
+                    "names_pruned": 0,
                     "names_found": [],
                     "name_scores": {},
                     "exact_match_found": False,
@@ -382,6 +545,7 @@ class FinancialServicesFacade:
                     "source": "FINRA_Disciplinary",
                     "records_found": 0,
                     "records_filtered": 0,
+                    "names_pruned": 0,
                     "names_found": [],
                     "name_scores": {},
                     "exact_match_found": False,
@@ -392,11 +556,12 @@ class FinancialServicesFacade:
 
         sec_result = self.search_sec_disciplinary(first_name, last_name, employee_number)
         if sec_result:
-            logger.debug(f"SEC Disciplinary result received: {json.dumps(sec_result, indent=2)}")
+            logger.debug("SEC Disciplinary result received: %s", LazyJson(sec_result, indent=2))
             sec_dd = sec_result.get("due_diligence", {})
             sec_actions = sec_result.get("actions", [])
             combined_review["due_diligence"]["sec_disciplinary"]["records_found"] = sec_dd.get("records_found", 0)
             combined_review["due_diligence"]["sec_disciplinary"]["records_filtered"] = sec_dd.get("records_filtered", 0)
+            combined_review["due_diligence"]["sec_disciplinary"]["names_pruned"] = sec_dd.get("names_pruned", 0)
             combined_review["due_diligence"]["sec_disciplinary"]["names_found"] = sec_dd.get("names_found", [])
             combined_review["due_diligence"]["sec_disciplinary"]["name_scores"] = sec_dd.get("name_scores", {})
             combined_review["due_diligence"]["sec_disciplinary"]["exact_match_found"] = sec_dd.get("exact_match_found", False)
@@ -407,11 +572,12 @@ class FinancialServicesFacade:
 
         finra_result = self.search_finra_disciplinary(first_name, last_name, employee_number)
         if finra_result:
-            logger.debug(f"FINRA Disciplinary result received: {json.dumps(finra_result, indent=2)}")
+            logger.debug("FINRA Disciplinary result received: %s", LazyJson(finra_result, indent=2))
             finra_dd = finra_result.get("due_diligence", {})
             finra_actions = finra_result.get("actions", [])
             combined_review["due_diligence"]["finra_disciplinary"]["records_found"] = finra_dd.get("records_found", 0)
             combined_review["due_diligence"]["finra_disciplinary"]["records_filtered"] = finra_dd.get("records_filtered", 0)
+            combined_review["due_diligence"]["finra_disciplinary"]["names_pruned"] = finra_dd.get("names_pruned", 0)
             combined_review["due_diligence"]["finra_disciplinary"]["names_found"] = finra_dd.get("names_found", [])
             combined_review["due_diligence"]["finra_disciplinary"]["name_scores"] = finra_dd.get("name_scores", {})
             combined_review["due_diligence"]["finra_disciplinary"]["exact_match_found"] = finra_dd.get("exact_match_found", False)
@@ -420,7 +586,7 @@ class FinancialServicesFacade:
                 combined_review["actions"].extend(finra_actions)
                 logger.debug(f"Added {len(finra_actions)} FINRA disciplinary actions")
 
-        logger.debug(f"Combined disciplinary review result: {json.dumps(combined_review, indent=2)}")
+        logger.debug("Combined disciplinary review result: %s", LazyJson(combined_review, indent=2))
         if combined_review["actions"]:
             logger.info(f"Combined disciplinary review completed for {combined_review['primary_name']} with {len(combined_review['actions'])} matching actions")
         else:
@@ -441,6 +607,7 @@ class FinancialServicesFacade:
                     "source": "SEC_Arbitration",
                     "records_found": 0,
                     "records_filtered": 0,
+                    "names_pruned": 0,
                     "names_found": [],
                     "name_scores": {},
                     "exact_match_found": False,
@@ -450,6 +617,7 @@ class FinancialServicesFacade:
                     "source": "FINRA_Arbitration",
                     "records_found": 0,
                     "records_filtered": 0,
+                    "names_pruned": 0,
                     "names_found": [],
                     "name_scores": {},
                     "exact_match_found": False,
@@ -460,11 +628,12 @@ class FinancialServicesFacade:
 
         sec_result = self.search_sec_arbitration(first_name, last_name, employee_number)
         if sec_result:
-            logger.debug(f"SEC Arbitration result received: {json.dumps(sec_result, indent=2)}")
+            logger.debug("SEC Arbitration result received: %s", LazyJson(sec_result, indent=2))
             sec_dd = sec_result.get("due_diligence", {})
             sec_actions = sec_result.get("actions", [])
             combined_review["due_diligence"]["sec_arbitration"]["records_found"] = sec_dd.get("records_found", 0)
             combined_review["due_diligence"]["sec_arbitration"]["records_filtered"] = sec_dd.get("records_filtered", 0)
+            combined_review["due_diligence"]["sec_arbitration"]["names_pruned"] = sec_dd.get("names_pruned", 0)
             combined_review["due_diligence"]["sec_arbitration"]["names_found"] = sec_dd.get("names_found", [])
             combined_review["due_diligence"]["sec_arbitration"]["name_scores"] = sec_dd.get("name_scores", {})
             combined_review["due_diligence"]["sec_arbitration"]["exact_match_found"] = sec_dd.get("exact_match_found", False)
@@ -475,11 +644,12 @@ class FinancialServicesFacade:
 
         finra_result = self.search_finra_arbitration(first_name, last_name, employee_number)
         if finra_result:
-            logger.debug(f"FINRA Arbitration result received: {json.dumps(finra_result, indent=2)}")
+            logger.debug("FINRA Arbitration result received: %s", LazyJson(finra_result, indent=2))
             finra_dd = finra_result.get("due_diligence", {})
             finra_actions = finra_result.get("actions", [])
             combined_review["due_diligence"]["finra_arbitration"]["records_found"] = finra_dd.get("records_found", 0)
             combined_review["due_diligence"]["finra_arbitration"]["records_filtered"] = finra_dd.get("records_filtered", 0)
+            combined_review["due_diligence"]["finra_arbitration"]["names_pruned"] = finra_dd.get("names_pruned", 0)
             combined_review["due_diligence"]["finra_arbitration"]["names_found"] = finra_dd.get("names_found", [])
             combined_review["due_diligence"]["finra_arbitration"]["name_scores"] = finra_dd.get("name_scores", {})
             combined_review["due_diligence"]["finra_arbitration"]["exact_match_found"] = finra_dd.get("exact_match_found", False)
@@ -488,7 +658,7 @@ class FinancialServicesFacade:
                 combined_review["actions"].extend(finra_actions)
                 logger.debug(f"Added {len(finra_actions)} FINRA arbitration actions")
 
-        logger.debug(f"Combined arbitration review result: {json.dumps(combined_review, indent=2)}")
+        logger.debug("Combined arbitration review result: %s", LazyJson(combined_review, indent=2))
         if combined_review["actions"]:
             logger.info(f"Combined arbitration review completed for {combined_review['primary_name']} with {len(combined_review['actions'])} matching actions")
         else:
@@ -509,6 +679,7 @@ class FinancialServicesFacade:
                     "source": "NFA_Regulatory",
                     "records_found": 0,
                     "records_filtered": 0,
+                    "names_pruned": 0,
                     "names_found": [],
                     "name_scores": {},
                     "exact_match_found": False,
@@ -519,11 +690,12 @@ class FinancialServicesFacade:
 
         nfa_result = self.search_nfa_regulatory(first_name, last_name, employee_number)
         if nfa_result:
-            logger.debug(f"NFA Regulatory result received: {json.dumps(nfa_result, indent=2)}")
+            logger.debug("NFA Regulatory result received: %s", LazyJson(nfa_result, indent=2))
             nfa_dd = nfa_result.get("due_diligence", {})
             nfa_actions = nfa_result.get("actions", [])
             combined_review["due_diligence"]["nfa_regulatory_actions"]["records_found"] = nfa_dd.get("records_found", 0)
             combined_review["due_diligence"]["nfa_regulatory_actions"]["records_filtered"] = nfa_dd.get("records_filtered", 0)
+            combined_review["due_diligence"]["nfa_regulatory_actions"]["names_pruned"] = nfa_dd.get("names_pruned", 0)
             combined_review["due_diligence"]["nfa_regulatory_actions"]["names_found"] = nfa_dd.get("names_found", [])
             combined_review["due_diligence"]["nfa_regulatory_actions"]["name_scores"] = nfa_dd.get("name_scores", {})
             combined_review["due_diligence"]["nfa_regulatory_actions"]["exact_match_found"] = nfa_dd.get("exact_match_found", False)
@@ -532,7 +704,7 @@ class FinancialServicesFacade:
                 combined_review["actions"].extend(nfa_actions)
                 logger.debug(f"Added {len(nfa_actions)} NFA regulatory actions")
 
-        logger.debug(f"Combined regulatory review result: {json.dumps(combined_review, indent=2)}")
+        logger.debug("Combined regulatory review result: %s", LazyJson(combined_review, indent=2))
         if combined_review["actions"]:
             logger.info(f"Combined regulatory review completed for {combined_review['primary_name']} with {len(combined_review['actions'])} matching actions")
         else:
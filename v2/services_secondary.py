@@ -3,50 +3,32 @@ services_secondary.py
 
 This module contains secondary service functions extracted from services.py,
 specifically for performing regulatory action reviews, fully independent of FinancialServicesFacade.
+
+Reviews are batched: perform_regulatory_action_reviews() takes every NFA ID from a claim,
+answers cached IDs without starting a browser and scrapes the rest through one WebDriver
+(or a small pool of them when max_browsers > 1).
 """
 
 import json
 import logging
-from typing import Optional, Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Optional, Dict, Any, Iterable, List
 
-from logger_config import setup_logging
-from marshaller import fetch_agent_nfa_id_search, create_driver
+from logger_config import setup_logging, LazyJson
+from marshaller import fetch_agent_nfa_id_search, create_driver, read_cached_result
 
-loggers = setup_logging(debug=True)
+loggers = setup_logging()
 logger = loggers["services"]
 
 RUN_HEADLESS = True
+NFA_AGENT = "NFA_Basic_Agent"
+NFA_ID_SERVICE = "search_nfa"
+DEFAULT_MAX_BROWSERS = 1
 
-def perform_regulatory_action_review(nfa_id: str, employee_number: Optional[str] = None) -> Dict[str, Any]:
-    """
-    Performs a consolidated regulatory action review for a specific NFA ID using NFA data.
-    Manages its own WebDriver instance independently.
-    
-    :param nfa_id: The NFA ID to search for.
-    :param employee_number: Optional employee identifier.
-    :return: A dictionary containing combined regulatory actions and due diligence metadata.
-    """
-    call_id = id(object())  # Unique ID for tracing
-    logger.debug(f"[{call_id}] Starting regulatory action review for NFA ID {nfa_id}, Employee: {employee_number}")
-
-    if not nfa_id:
-        logger.error(f"[{call_id}] NFA ID is required")
-        return {
-            "primary_id": nfa_id,
-            "actions": [],
-            "due_diligence": {
-                "searched_id": nfa_id,
-                "nfa_regulatory_actions": {
-                    "records_found": 0,
-                    "records_filtered": 0,
-                    "exact_match_found": False,
-                    "status": "No records fetched due to invalid NFA ID"
-                }
-            },
-            "raw_data": [{"result": "No Results Found"}]
-        }
-
-    combined_review = {
+def _invalid_id_review(nfa_id: str) -> Dict[str, Any]:
+    """Review returned when no NFA ID was given."""
+    return {
         "primary_id": nfa_id,
         "actions": [],
         "due_diligence": {
@@ -55,101 +37,97 @@ def perform_regulatory_action_review(nfa_id: str, employee_number: Optional[str]
                 "records_found": 0,
                 "records_filtered": 0,
                 "exact_match_found": False,
-                "status": "No records fetched"
+                "status": "No records fetched due to invalid NFA ID"
             }
         },
-        "raw_data": []
+        "raw_data": [{"result": "No Results Found"}]
     }
 
-    driver = None
-    try:
-        logger.debug(f"[{call_id}] Creating new WebDriver for secondary NFA search")
-        driver = create_driver(RUN_HEADLESS)
-        logger.info(f"[{call_id}] Fetching NFA regulatory data by ID {nfa_id}, Employee: {employee_number}")
-        params = {"nfa_id": nfa_id}
-        result = fetch_agent_nfa_id_search(employee_number, params, driver)
-        if result:
-            logger.debug(f"[{call_id}] NFA regulatory by ID raw result: {json.dumps(result, indent=2)}")
-            result_dict = result[0] if isinstance(result, list) and result else result
-            data_source = "NFA_Regulatory_Actions"
-            base_url = "https://www.nfa.futures.org/BasicNet/"
-
-            normalized_result = {
-                "actions": [],
-                "due_diligence": {
-                    "searched_id": nfa_id,
-                    "records_found": 0,
-                    "records_filtered": 0,
-                    "status": "No records found"
-                }
+def _failed_nfa_result(nfa_id: str, error: Exception) -> Dict[str, Any]:
+    """NFA result recorded when the search itself failed."""
+    return {
+        "actions": [],
+        "due_diligence": {
+            "searched_id": nfa_id,
+            "records_found": 0,
+            "records_filtered": 0,
+            "exact_match_found": False,
+            "status": f"Search failed: {str(error)}"
+        },
+        "raw_data": [{"result": "Search Failed"}]
+    }
+
+def _normalize_nfa_result(nfa_id: str, result: Any, call_id: int) -> Dict[str, Any]:
+    """Normalize a raw NFA-by-ID search result into actions and due diligence."""
+    if result:
+        logger.debug("[%s] NFA regulatory by ID raw result: %s", call_id, LazyJson(result, indent=2))
+        result_dict = result[0] if isinstance(result, list) and result else result
+        data_source = "NFA_Regulatory_Actions"
+        base_url = "https://www.nfa.futures.org/BasicNet/"
+
+        normalized_result = {
+            "actions": [],
+            "due_diligence": {
+                "searched_id": nfa_id,
+                "records_found": 0,
+                "records_filtered": 0,
+                "status": "No records found"
             }
+        }
 
-            if isinstance(result_dict, dict) and "error" in result_dict:
-                logger.warning(f"[{call_id}] Error in {data_source} data: {result_dict['error']}")
+        if isinstance(result_dict, dict) and "error" in result_dict:
+            logger.warning(f"[{call_id}] Error in {data_source} data: {result_dict['error']}")
+            nfa_result = normalized_result
+        else:
+            raw_results = result_dict.get("result") if isinstance(result_dict, dict) else None
+            if not raw_results or raw_results == "No Results Found":
+                logger.info(f"[{call_id}] No results found in {data_source} for NFA ID {nfa_id}")
                 nfa_result = normalized_result
             else:
-                raw_results = result_dict.get("result") if isinstance(result_dict, dict) else None
-                if not raw_results or raw_results == "No Results Found":
-                    logger.info(f"[{call_id}] No results found in {data_source} for NFA ID {nfa_id}")
-                    nfa_result = normalized_result
+                if isinstance(raw_results, dict) and "regulatory_actions" in raw_results:
+                    actions = raw_results["regulatory_actions"]
                 else:
-                    if isinstance(raw_results, dict) and "regulatory_actions" in raw_results:
-                        actions = raw_results["regulatory_actions"]
-                    else:
-                        actions = []
-
-                    due_diligence = normalized_result["due_diligence"]
-                    due_diligence["records_found"] = len(actions)
-                    if actions:
-                        for row in actions:
-                            required_fields = ["Effective Date", "Contributor", "Action Type", "Case Outcome", "Case #"]
-                            missing_fields = [field for field in required_fields if not row.get(field)]
-                            if missing_fields:
-                                logger.warning(f"[{call_id}] Skipping action with missing fields {missing_fields}: {row}")
-                                due_diligence["records_filtered"] += 1
-                                continue
-
-                            effective_date = row.get("Effective Date", "")
-                            contributor = row.get("Contributor", "")
-                            action_type = row.get("Action Type", [])
-                            case_outcome = row.get("Case Outcome", [])
-                            case_num = row.get("Case #", "")
-                            relative_link = row.get("Case Link", "")
-                            full_link = f"{base_url}{relative_link}" if relative_link else ""
-
-                            normalized_action = {
-                                "data_source": data_source,
-                                "effective_date": effective_date,
-                                "contributor": contributor,
-                                "action_type": action_type,
-                                "case_outcome": case_outcome,
-                                "case_number": case_num,
-                                "case_link": full_link,
-                                "nfa_id": raw_results.get("nfa_id", nfa_id)
-                            }
-                            normalized_result["actions"].append(normalized_action)
-                            logger.debug(f"[{call_id}] Normalized action for NFA ID {nfa_id}: {normalized_action}")
-
-                        appended_count = len(normalized_result["actions"])
-                        due_diligence["records_filtered"] = due_diligence["records_found"] - appended_count
-                        due_diligence["status"] = "Actions appended" if appended_count > 0 else "No records found"
-                        logger.debug(f"[{call_id}] Final due_diligence for {data_source}: {json.dumps(due_diligence, indent=2)}")
-                    nfa_result = normalized_result
-        else:
-            logger.warning(f"[{call_id}] No data found for NFA ID {nfa_id} in NFA regulatory search")
-            nfa_result = {
-                "actions": [],
-                "due_diligence": {
-                    "searched_id": nfa_id,
-                    "records_found": 0,
-                    "records_filtered": 0,
-                    "exact_match_found": False,
-                    "status": "No records found"
-                },
-                "raw_data": [{"result": "No Results Found"}]
-            }
-    except Exception as e:
-        logger.error(f"[{call_id}] Error during NFA search: {str(e)}")
+                    actions = []
+
+                due_diligence = normalized_result["due_diligence"]
+                due_diligence["records_found"] = len(actions)
+                if actions:
+                    for row in actions:
+                        required_fields = ["Effective Date", "Contributor", "Action Type", "Case Outcome", "Case #"]
+                        missing_fields = [field for field in required_fields if not row.get(field)]
+                        if missing_fields:
+                            logger.warning(f"[{call_id}] Skipping action with missing fields {missing_fields}: {row}")
+                            due_diligence["records_filtered"] += 1
+                            continue
+
+                        effective_date = row.get("Effective Date", "")
+                        contributor = row.get("Contributor", "")
+                        action_type = row.get("Action Type", [])
+                        case_outcome = row.get("Case Outcome", [])
+                        case_num = row.get("Case #", "")
+                        relative_link = row.get("Case Link", "")
+                        full_link = f"{base_url}{relative_link}" if relative_link else ""
+
+                        normalized_action = {
+                            "data_source": data_source,
+                            "effective_date": effective_date,
+                            "contributor": contributor,
+                            "action_type": action_type,
+                            "case_outcome": case_outcome,
+                            "case_number": case_num,
+                            "case_link": full_link,
+                            "nfa_id": raw_results.get("nfa_id", nfa_id)
+                        }
+                        normalized_result["actions"].append(normalized_action)
+                        logger.debug(f"[{call_id}] Normalized action for NFA ID {nfa_id}: {normalized_action}")
+
+                    appended_count = len(normalized_result["actions"])
+                    due_diligence["records_filtered"] = due_diligence["records_found"] - appended_count
+                    due_diligence["status"] = "Actions appended" if appended_count > 0 else "No records found"
+                    logger.debug("[%s] Final due_diligence for %s: %s", call_id, data_source, LazyJson(due_diligence, indent=2))
+                nfa_result = normalized_result
+    else:
+        logger.warning(f"[{call_id}] No data found for NFA ID {nfa_id} in NFA regulatory search")
         nfa_result = {
             "actions": [],
             "due_diligence": {
@@ -157,21 +135,32 @@ def perform_regulatory_action_review(nfa_id: str, employee_number: Optional[str]
                 "records_found": 0,
                 "records_filtered": 0,
                 "exact_match_found": False,
-                "status": f"Search failed: {str(e)}"
+                "status": "No records found"
             },
-            "raw_data": [{"result": "Search Failed"}]
+            "raw_data": [{"result": "No Results Found"}]
         }
-    finally:
-        if driver:
-            try:
-                driver.quit()
-                logger.info(f"[{call_id}] WebDriver closed for secondary NFA search")
-            except Exception as e:
-                logger.warning(f"[{call_id}] Failed to close WebDriver: {str(e)}")
+    return nfa_result
+
+def _build_review(nfa_id: str, nfa_result: Dict[str, Any], call_id: int) -> Dict[str, Any]:
+    """Combine a normalized NFA result into the review returned to callers."""
+    combined_review = {
+        "primary_id": nfa_id,
+        "actions": [],
+        "due_diligence": {
+            "searched_id": nfa_id,
+            "nfa_regulatory_actions": {
+                "records_found": 0,
+                "records_filtered": 0,
+                "exact_match_found": False,
+                "status": "No records fetched"
+            }
+        },
+        "raw_data": []
+    }
 
     combined_review["raw_data"] = nfa_result if nfa_result else [{"result": "No Results Found"}]
     if nfa_result and isinstance(nfa_result, dict) and "due_diligence" in nfa_result:
-        logger.debug(f"[{call_id}] NFA Regulatory Action result received: {json.dumps(nfa_result, indent=2)}")
+        logger.debug("[%s] NFA Regulatory Action result received: %s", call_id, LazyJson(nfa_result, indent=2))
         nfa_dd = nfa_result.get("due_diligence", {})
         nfa_actions = nfa_result.get("actions", [])
         combined_review["due_diligence"]["nfa_regulatory_actions"]["records_found"] = nfa_dd.get("records_found", 0)
@@ -184,13 +173,100 @@ def perform_regulatory_action_review(nfa_id: str, employee_number: Optional[str]
     else:
         logger.warning(f"[{call_id}] Malformed NFA result: {nfa_result}")
 
-    logger.debug(f"[{call_id}] Combined regulatory action review result: {json.dumps(combined_review, indent=2)}")
+    logger.debug("[%s] Combined regulatory action review result: %s", call_id, LazyJson(combined_review, indent=2))
     if combined_review["actions"]:
         logger.info(f"[{call_id}] Combined regulatory action review completed for NFA ID {nfa_id} with {len(combined_review['actions'])} actions")
     else:
         logger.info(f"[{call_id}] No regulatory actions found for NFA ID {nfa_id}; due diligence: NFA found {combined_review['due_diligence']['nfa_regulatory_actions']['records_found']}")
     return combined_review
 
+def _scrape_nfa_ids(nfa_ids: List[str], employee_number: Optional[str]) -> Dict[str, Dict[str, Any]]:
+    """Review several NFA IDs through a single WebDriver session."""
+    call_id = id(object())  # Unique ID for tracing
+    reviews = {}
+    driver = None
+    try:
+        logger.debug(f"[{call_id}] Creating WebDriver for secondary NFA search of {len(nfa_ids)} IDs")
+        driver = create_driver(RUN_HEADLESS)
+        for nfa_id in nfa_ids:
+            try:
+                logger.info(f"[{call_id}] Fetching NFA regulatory data by ID {nfa_id}, Employee: {employee_number}")
+                result = fetch_agent_nfa_id_search(employee_number, {"nfa_id": nfa_id}, driver)
+                nfa_result = _normalize_nfa_result(nfa_id, result, call_id)
+            except Exception as e:
+                logger.error(f"[{call_id}] Error during NFA search for NFA ID {nfa_id}: {str(e)}")
+                nfa_result = _failed_nfa_result(nfa_id, e)
+            reviews[nfa_id] = _build_review(nfa_id, nfa_result, call_id)
+    except Exception as e:
+        logger.error(f"[{call_id}] Error during NFA search: {str(e)}")
+        for nfa_id in nfa_ids:
+            if nfa_id not in reviews:
+                reviews[nfa_id] = _build_review(nfa_id, _failed_nfa_result(nfa_id, e), call_id)
+    finally:
+        if driver:
+            try:
+                driver.quit()
+                logger.info(f"[{call_id}] WebDriver closed for secondary NFA search")
+            except Exception as e:
+                logger.warning(f"[{call_id}] Failed to close WebDriver: {str(e)}")
+    return reviews
+
+def perform_regulatory_action_reviews(nfa_ids: Iterable[str], employee_number: Optional[str] = None,
+                                      max_browsers: int = DEFAULT_MAX_BROWSERS) -> Dict[str, Dict[str, Any]]:
+    """
+    Performs regulatory action reviews for all NFA IDs of a claim in one batch.
+
+    Duplicate IDs are reviewed once. IDs with a fresh cache entry are answered from the cache
+    without starting a browser; the remaining IDs are scraped through one WebDriver, or split
+    across up to max_browsers WebDrivers running in parallel.
+
+    :param nfa_ids: NFA IDs to review.
+    :param employee_number: Optional employee identifier (cache owner).
+    :param max_browsers: Maximum number of concurrent WebDriver sessions.
+    :return: Mapping of NFA ID to its review, in first-seen order.
+    """
+    unique_ids = list(dict.fromkeys(nfa_ids))
+    reviews: Dict[str, Dict[str, Any]] = {}
+    pending = []
+    for nfa_id in unique_ids:
+        if not nfa_id:
+            logger.error("NFA ID is required")
+            reviews[nfa_id] = _invalid_id_review(nfa_id)
+            continue
+        cached = read_cached_result(NFA_AGENT, NFA_ID_SERVICE, employee_number, {"nfa_id": nfa_id})
+        if cached is not None:
+            call_id = id(object())
+            reviews[nfa_id] = _build_review(nfa_id, _normalize_nfa_result(nfa_id, cached, call_id), call_id)
+        else:
+            pending.append(nfa_id)
+
+    if pending:
+        workers = max(1, min(max_browsers, len(pending)))
+        logger.info(f"Scraping {len(pending)} of {len(unique_ids)} NFA IDs with {workers} browser(s), Employee: {employee_number}")
+        if workers == 1:
+            reviews.update(_scrape_nfa_ids(pending, employee_number))
+        else:
+            chunks = [pending[i::workers] for i in range(workers)]
+            # Each scrape runs in a copy of the caller's context, so its fetches count towards the caller's row
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(copy_context().run, _scrape_nfa_ids, chunk, employee_number) for chunk in chunks]
+                for future in futures:
+                    reviews.update(future.result())
+
+    return {nfa_id: reviews[nfa_id] for nfa_id in unique_ids}
+
+def perform_regulatory_action_review(nfa_id: str, employee_number: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Performs a consolidated regulatory action review for a specific NFA ID using NFA data.
+    Manages its own WebDriver instance independently; prefer perform_regulatory_action_reviews
+    when a claim has several NFA IDs.
+    
+    :param nfa_id: The NFA ID to search for.
+    :param employee_number: Optional employee identifier.
+    :return: A dictionary containing combined regulatory actions and due diligence metadata.
+    """
+    return perform_regulatory_action_reviews([nfa_id], employee_number)[nfa_id]
+
 if __name__ == "__main__":
     logging.basicConfig(level=logging.DEBUG)
     while True:
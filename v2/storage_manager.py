@@ -13,6 +13,7 @@ from unittest.mock import Mock
 from storage_providers.local_provider import LocalStorageProvider
 from storage_providers.s3_provider import S3StorageProvider
 from storage_providers.base_provider import BaseStorageProvider
+from storage_providers.async_base_provider import AsyncBaseStorageProvider
 from utils.logger import logger
 from storage_providers.factory import StorageProviderFactory
 
@@ -34,11 +35,12 @@ class StorageManager:
             raise TypeError("Configuration cannot be None")
 
         self.config = config
+        self._async_manager = None
         logger.debug(f"Initializing storage manager with config: {config}")
         
         try:
             # Create storage provider using factory
-            self.provider = StorageProviderFactory.create_provider(config)
+            self.provider = StorageProviderFactory.create_provider(config, instrument=True)
             logger.info(f"Initialized storage manager in {config.get('mode', 'local')} mode")
             
         except Exception as e:
@@ -48,6 +50,25 @@ class StorageManager:
     def get_provider(self) -> BaseStorageProvider:
         """Get the configured storage provider instance."""
         return self.provider
+
+    @property
+    def aio(self) -> 'AsyncStorageManager':
+        """Async facade over the same storage, for callers running on an event loop.
+
+        The async provider is created on first access and shares the path
+        configuration of the synchronous provider.
+        """
+        if self._async_manager is None:
+            async_provider = StorageProviderFactory.create_async_provider(
+                self.config, instrument=True, provider=self.provider
+            )
+            self._async_manager = AsyncStorageManager(async_provider)
+        return self._async_manager
+
+    async def aclose(self) -> None:
+        """Close the async facade if it was opened."""
+        if self._async_manager is not None:
+            await self._async_manager.close()
     
     def read_file(self, path: str, storage_type: str = None) -> bytes:
         """Read a file from storage.
@@ -75,6 +96,29 @@ class StorageManager:
             logger.error(f"Error reading file {path}: {str(e)}")
             raise OSError(f"Error reading file {path}: {str(e)}")
     
+    def open_stream(self, path: str, storage_type: str = None, offset: int = 0) -> BinaryIO:
+        """Open a file for streamed binary reading, starting at a byte offset.
+        
+        Args:
+            path: Path to file
+            storage_type: Type of storage (input, output, archive, cache)
+            offset: Byte offset to start reading from
+            
+        Returns:
+            Binary file-like object; the caller closes it
+        """
+        try:
+            return self.provider.open_stream(path, storage_type, offset)
+        except FileNotFoundError as e:
+            logger.error(f"Error opening file {path}: {str(e)}")
+            raise FileNotFoundError(f"File not found: {path}")
+        except PermissionError as e:
+            logger.error(f"Error opening file {path}: {str(e)}")
+            raise PermissionError(f"Permission denied: {path}")
+        except Exception as e:
+            logger.error(f"Error opening file {path}: {str(e)}")
+            raise OSError(f"Error opening file {path}: {str(e)}")
+    
     def write_file(self, path: str, content: Union[str, bytes], storage_type: str = None) -> bool:
         """Write content to a file.
         
@@ -131,6 +175,26 @@ class StorageManager:
             logger.error(f"Error listing files in {path}: {str(e)}")
             raise OSError(f"Error listing files in {path}: {str(e)}")
     
+    def list_objects(self, path: str = "", pattern: Optional[str] = None, storage_type: str = None) -> List[Dict[str, Any]]:
+        """List files in a directory with their size, ETag and modification time.
+        
+        Args:
+            path: Directory path to list
+            pattern: Optional pattern to filter files
+            storage_type: Type of storage (input, output, archive, cache)
+            
+        Returns:
+            List of {"path", "size", "etag", "modified"} dicts
+        """
+        try:
+            return self.provider.list_objects(path, pattern, storage_type)
+        except (FileNotFoundError, PermissionError) as e:
+            logger.error(f"Error listing objects in {path}: {str(e)}")
+            raise
+        except Exception as e:
+            logger.error(f"Error listing objects in {path}: {str(e)}")
+            raise OSError(f"Error listing objects in {path}: {str(e)}")
+    
     def delete_file(self, path: str, storage_type: str = None) -> bool:
         """Delete a file.
         
@@ -316,4 +380,192 @@ class StorageManager:
                 json.dump({"storage": self.config}, f, indent=4)
         except Exception as e:
             logger.error(f"Error saving config to {config_path}: {str(e)}")
-            raise OSError(f"Error saving config: {str(e)}")
\ No newline at end of file
+            raise OSError(f"Error saving config: {str(e)}")
+
+class AsyncStorageManager:
+    """Async counterpart of StorageManager, with the same error semantics."""
+
+    def __init__(self, provider: AsyncBaseStorageProvider):
+        """Initialize with an async storage provider.
+
+        Args:
+            provider: Async provider created by StorageProviderFactory.create_async_provider
+        """
+        self.provider = provider
+
+    def get_provider(self) -> AsyncBaseStorageProvider:
+        """Get the configured async storage provider instance."""
+        return self.provider
+
+    async def read_file(self, path: str, storage_type: str = None) -> Any:
+        """Read a file from storage.
+
+        Args:
+            path: Path to file
+            storage_type: Type of storage (input, output, archive, cache)
+
+        Returns:
+            File contents
+        """
+        try:
+            return await self.provider.read_file(path, storage_type)
+        except FileNotFoundError as e:
+            logger.error(f"Error reading file {path}: {str(e)}")
+            raise FileNotFoundError(f"File not found: {path}")
+        except PermissionError as e:
+            logger.error(f"Error reading file {path}: {str(e)}")
+            raise PermissionError(f"Permission denied: {path}")
+        except Exception as e:
+            logger.error(f"Error reading file {path}: {str(e)}")
+            raise OSError(f"Error reading file {path}: {str(e)}")
+
+    async def write_file(self, path: str, content: Union[str, bytes], storage_type: str = None) -> bool:
+        """Write content to a file.
+
+        Args:
+            path: Path to file
+            content: Content to write
+            storage_type: Type of storage (input, output, archive, cache)
+
+        Returns:
+            True if successful
+        """
+        try:
+            result = await self.provider.write_file(path, content, storage_type)
+        except Exception as e:
+            logger.error(f"Error writing file {path}: {str(e)}")
+            raise OSError(f"Error writing file {path}: {str(e)}")
+        if not result:
+            raise OSError(f"Failed to write file {path}")
+        return result
+
+    async def list_files(self, path: str = "", pattern: Optional[str] = None, storage_type: str = None) -> List[str]:
+        """List files in a directory.
+
+        Args:
+            path: Directory path to list
+            pattern: Optional pattern to filter files
+            storage_type: Type of storage (input, output, archive, cache)
+
+        Returns:
+            List of file paths
+        """
+        try:
+            return await self.provider.list_files(path, pattern, storage_type)
+        except OSError as e:
+            logger.error(f"Error listing files in {path}: {str(e)}")
+            raise
+        except Exception as e:
+            logger.error(f"Error listing files in {path}: {str(e)}")
+            raise OSError(f"Error listing files in {path}: {str(e)}")
+
+    async def delete_file(self, path: str, storage_type: str = None) -> bool:
+        """Delete a file.
+
+        Args:
+            path: Path to file
+            storage_type: Type of storage (input, output, archive, cache)
+
+        Returns:
+            True if successful
+        """
+        try:
+            result = await self.provider.delete_file(path)
+        except Exception as e:
+            logger.error(f"Error deleting file {path}: {str(e)}")
+            raise OSError(f"Error deleting file {path}: {str(e)}")
+        if not result:
+            raise FileNotFoundError(f"File not found: {path}")
+        return result
+
+    async def move_file(self, source: str, dest: str, source_type: str = None, dest_type: str = None) -> bool:
+        """Move a file from source to destination.
+
+        Args:
+            source: Source path
+            dest: Destination path
+            source_type: Type of source storage (input, output, archive, cache)
+            dest_type: Type of destination storage (input, output, archive, cache)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            return await self.provider.move_file(source, dest, source_type, dest_type)
+        except Exception as e:
+            logger.error(f"Error moving file from {source} to {dest}: {str(e)}")
+            raise OSError(f"Error moving file from {source} to {dest}: {str(e)}")
+
+    async def file_exists(self, path: str, storage_type: str = None) -> bool:
+        """Check if a file exists.
+
+        Args:
+            path: Path to file
+            storage_type: Type of storage (input, output, archive, cache)
+
+        Returns:
+            True if file exists, False otherwise
+        """
+        try:
+            return await self.provider.file_exists(path, storage_type)
+        except Exception as e:
+            logger.error(f"Error checking file existence {path}: {str(e)}")
+            raise OSError(f"Error checking file existence {path}: {str(e)}")
+
+    async def create_directory(self, path: str, storage_type: str = None) -> bool:
+        """Create a directory.
+
+        Args:
+            path: Path to create
+            storage_type: Type of storage (input, output, archive, cache)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            return await self.provider.create_directory(path, storage_type)
+        except Exception as e:
+            logger.error(f"Error creating directory {path}: {str(e)}")
+            raise OSError(f"Error creating directory {path}: {str(e)}")
+
+    async def get_file_size(self, path: str, storage_type: str = None) -> int:
+        """Get the size of a file in bytes.
+
+        Args:
+            path: Path to file
+            storage_type: Type of storage (input, output, archive, cache)
+
+        Returns:
+            File size in bytes
+        """
+        try:
+            return await self.provider.get_file_size(path, storage_type)
+        except OSError as e:
+            logger.error(f"Error getting file size {path}: {str(e)}")
+            raise
+        except Exception as e:
+            logger.error(f"Error getting file size {path}: {str(e)}")
+            raise OSError(f"Error getting file size {path}: {str(e)}")
+
+    async def get_file_modified_time(self, path: str, storage_type: str = None) -> float:
+        """Get the last modified time of a file.
+
+        Args:
+            path: Path to file
+            storage_type: Type of storage (input, output, archive, cache)
+
+        Returns:
+            Last modified time as Unix timestamp
+        """
+        try:
+            return await self.provider.get_file_modified_time(path, storage_type)
+        except OSError as e:
+            logger.error(f"Error getting file modified time {path}: {str(e)}")
+            raise
+        except Exception as e:
+            logger.error(f"Error getting file modified time {path}: {str(e)}")
+            raise OSError(f"Error getting file modified time {path}: {str(e)}")
+
+    async def close(self):
+        """Release connections held by the async provider."""
+        await self.provider.close()
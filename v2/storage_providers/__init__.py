@@ -2,17 +2,39 @@
 Storage providers package.
 
 This package provides a unified interface for file storage operations,
-supporting both local filesystem and AWS S3 storage.
+supporting both local filesystem and AWS S3 storage, with synchronous and
+async (event-loop friendly) providers.
 """
 
 from .base_provider import BaseStorageProvider
 from .local_provider import LocalStorageProvider
 from .s3_provider import S3StorageProvider
+from .async_base_provider import AsyncBaseStorageProvider
 from .factory import StorageProviderFactory
+from .instrumentation import InstrumentedStorageProvider, correlation_context, get_correlation_id
+
+# The async providers need aiofiles / aiobotocore, so they are only imported when first used
+_ASYNC_PROVIDERS = {
+    'AsyncLocalStorageProvider': 'async_local_provider',
+    'AsyncS3StorageProvider': 'async_s3_provider',
+}
+
+
+def __getattr__(name):
+    if name in _ASYNC_PROVIDERS:
+        from importlib import import_module
+        return getattr(import_module(f".{_ASYNC_PROVIDERS[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'BaseStorageProvider',
     'LocalStorageProvider',
     'S3StorageProvider',
-    'StorageProviderFactory'
+    'AsyncBaseStorageProvider',
+    'AsyncLocalStorageProvider',
+    'AsyncS3StorageProvider',
+    'StorageProviderFactory',
+    'InstrumentedStorageProvider',
+    'correlation_context',
+    'get_correlation_id'
 ] 
\ No newline at end of file
@@ -0,0 +1,147 @@
+"""
+Async base storage provider interface.
+
+This module defines the abstract base class for async storage providers, the
+awaitable counterpart of BaseStorageProvider for code running on an event loop
+(e.g. FastAPI handlers). Implementations share path configuration with a
+synchronous provider so both address the same files.
+"""
+
+import json
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+def decode_content(file_path: str, content: Union[str, bytes]) -> Any:
+    """Decode raw file content the same way the synchronous providers do.
+
+    Args:
+        file_path: Path of the file, used to decide whether to parse JSON
+        content: Raw file content
+
+    Returns:
+        Parsed JSON for .json files, text otherwise, or "" for empty files
+    """
+    if isinstance(content, bytes):
+        content = content.decode('utf-8')
+    if not content.strip():
+        logger.debug(f"File {file_path} is empty")
+        return ""
+    if file_path.lower().endswith('.json'):
+        try:
+            return json.loads(content)
+        except json.JSONDecodeError:
+            logger.warning(f"Failed to parse {file_path} as JSON, returning as text")
+            return content
+    return content
+
+def encode_content(content: Any) -> bytes:
+    """Encode content for writing the same way the synchronous providers do."""
+    if isinstance(content, (dict, list)):
+        content = json.dumps(content, indent=2)
+    if isinstance(content, bytes):
+        return content
+    return str(content).encode('utf-8')
+
+class AsyncBaseStorageProvider(ABC):
+    """Interface for async storage operations."""
+
+    def __init__(self):
+        """Initialize the async storage provider."""
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @abstractmethod
+    async def read_file(self, file_path: str, storage_type: str = None) -> Optional[Any]:
+        """Read content from a file.
+
+        Args:
+            file_path: Path to the file to read
+            storage_type: Type of storage (input, output, archive, cache)
+
+        Returns:
+            File contents
+        """
+        pass
+
+    @abstractmethod
+    async def write_file(self, path: str, content: Union[str, bytes], storage_type: str = None) -> bool:
+        """Write content to a file.
+
+        Args:
+            path: The path where the file should be written.
+            content: The content to write (string, bytes, dict or list).
+            storage_type: Type of storage (input, output, archive, cache)
+
+        Returns:
+            True if the write was successful, False otherwise.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_file(self, file_path: str) -> bool:
+        """Delete a file."""
+        pass
+
+    @abstractmethod
+    async def list_files(self, directory: str = "", pattern: Optional[str] = None, storage_type: str = None) -> List[str]:
+        """List files in directory.
+
+        Args:
+            directory: Directory to list files from
+            pattern: Optional glob pattern to filter files
+            storage_type: Type of storage (input, output, archive, cache)
+
+        Returns:
+            List of file paths relative to the storage type directory
+        """
+        pass
+
+    async def move_file(self, source: str, dest: str, source_type: str = None, dest_type: str = None) -> bool:
+        """Move a file from source to destination.
+
+        Args:
+            source: Source path
+            dest: Destination path
+            source_type: Type of source storage (input, output, archive, cache)
+            dest_type: Type of destination storage (input, output, archive, cache)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if await self.write_file(dest, await self.read_file(source, source_type), dest_type):
+            return await self.delete_file(source)
+        return False
+
+    @abstractmethod
+    async def file_exists(self, path: str, storage_type: str = None) -> bool:
+        """Check if a file exists."""
+        pass
+
+    @abstractmethod
+    async def create_directory(self, path: str, storage_type: str = None) -> bool:
+        """Create a directory."""
+        pass
+
+    @abstractmethod
+    async def get_file_size(self, path: str, storage_type: str = None) -> int:
+        """Get the size of a file in bytes.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        pass
+
+    @abstractmethod
+    async def get_file_modified_time(self, path: str, storage_type: str = None) -> float:
+        """Get the last modified time of a file as a Unix timestamp.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        pass
+
+    async def close(self):
+        """Release any connections held by the provider."""
+        pass
@@ -0,0 +1,119 @@
+"""
+Async local filesystem storage provider implementation.
+"""
+import asyncio
+import logging
+from pathlib import Path
+from typing import Any, List, Optional, Union
+
+import aiofiles
+import aiofiles.os
+
+from storage_providers.async_base_provider import AsyncBaseStorageProvider, decode_content, encode_content
+from storage_providers.local_provider import LocalStorageProvider
+
+logger = logging.getLogger(__name__)
+
+class AsyncLocalStorageProvider(AsyncBaseStorageProvider):
+    """Async storage provider that uses the local filesystem through aiofiles.
+
+    Path configuration is taken from an initialized LocalStorageProvider, so
+    sync and async callers resolve the same paths.
+    """
+
+    def __init__(self, provider: LocalStorageProvider):
+        """Initialize from an initialized synchronous local provider.
+
+        Args:
+            provider: LocalStorageProvider holding the path configuration
+        """
+        super().__init__()
+        provider._ensure_initialized()
+        self.provider = provider
+
+    def _resolve_path(self, path: str, storage_type: str = None) -> Path:
+        """Resolve a path the same way LocalStorageProvider does."""
+        if not storage_type:
+            return self.provider._get_full_path(path)
+        base_dirs = {
+            'input': self.provider.input_path,
+            'output': self.provider.output_path,
+            'archive': self.provider.archive_path,
+            'cache': self.provider.cache_path
+        }
+        return base_dirs.get(storage_type, self.provider.base_path) / path
+
+    async def read_file(self, file_path: str, storage_type: str = None) -> Optional[Any]:
+        """Read content from a file."""
+        full_path = self._resolve_path(file_path, storage_type)
+        if not await aiofiles.os.path.exists(full_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+        try:
+            async with aiofiles.open(full_path, 'r') as f:
+                content = await f.read()
+        except Exception as e:
+            logger.error(f"Error reading file {file_path}: {str(e)}")
+            raise
+        return decode_content(file_path, content)
+
+    async def write_file(self, path: str, content: Union[str, bytes], storage_type: str = None) -> bool:
+        """Write content to a file."""
+        full_path = self._resolve_path(path, storage_type)
+        try:
+            await aiofiles.os.makedirs(full_path.parent, exist_ok=True)
+            async with aiofiles.open(full_path, 'wb') as f:
+                await f.write(encode_content(content))
+            logger.debug(f"Successfully wrote file: {full_path}")
+            return True
+        except Exception as e:
+            logger.error(f"Error writing file {path}: {str(e)}")
+            return False
+
+    async def delete_file(self, file_path: str) -> bool:
+        """Delete a file."""
+        full_path = self._resolve_path(file_path)
+        try:
+            if not await aiofiles.os.path.exists(full_path):
+                return False
+            await aiofiles.os.remove(full_path)
+            logger.debug(f"Successfully deleted file: {full_path}")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting file {file_path}: {str(e)}")
+            return False
+
+    async def list_files(self, directory: str = "", pattern: Optional[str] = None, storage_type: str = None) -> List[str]:
+        """List files in directory."""
+        # Glob walks the directory tree, so run it off the event loop
+        return await asyncio.to_thread(self.provider.list_files, directory, pattern, storage_type)
+
+    async def move_file(self, source: str, dest: str, source_type: str = None, dest_type: str = None) -> bool:
+        """Move a file from source to destination."""
+        return await asyncio.to_thread(self.provider.move_file, source, dest, source_type, dest_type)
+
+    async def file_exists(self, path: str, storage_type: str = None) -> bool:
+        """Check if a file exists."""
+        try:
+            return await aiofiles.os.path.exists(self._resolve_path(path, storage_type))
+        except Exception as e:
+            logger.error(f"Error checking if file exists {path}: {str(e)}")
+            return False
+
+    async def create_directory(self, path: str, storage_type: str = None) -> bool:
+        """Create a directory."""
+        try:
+            await aiofiles.os.makedirs(self._resolve_path(path, storage_type), exist_ok=True)
+            return True
+        except Exception as e:
+            logger.error(f"Error creating directory {path}: {str(e)}")
+            return False
+
+    async def get_file_size(self, path: str, storage_type: str = None) -> int:
+        """Get file size in bytes."""
+        stat_result = await aiofiles.os.stat(self._resolve_path(path, storage_type))
+        return stat_result.st_size
+
+    async def get_file_modified_time(self, path: str, storage_type: str = None) -> float:
+        """Get file last modified time as Unix timestamp."""
+        stat_result = await aiofiles.os.stat(self._resolve_path(path, storage_type))
+        return stat_result.st_mtime
@@ -0,0 +1,209 @@
+"""
+Async AWS S3 storage provider implementation.
+
+This module implements the AsyncBaseStorageProvider interface on top of
+aiobotocore, reusing the bucket and prefix layout of S3StorageProvider.
+"""
+
+import asyncio
+import fnmatch
+import logging
+from contextlib import AsyncExitStack
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from aiobotocore.session import get_session
+from botocore.exceptions import ClientError
+
+from storage_providers.async_base_provider import AsyncBaseStorageProvider, decode_content, encode_content
+from storage_providers.s3_provider import S3StorageProvider
+
+logger = logging.getLogger(__name__)
+
+RECOGNIZED_PREFIXES = ['input/', 'output/', 'archive/', 'cache/']
+
+class AsyncS3StorageProvider(AsyncBaseStorageProvider):
+    """Async storage provider that uses AWS S3 through aiobotocore.
+
+    A single client is opened on first use and kept until close() is awaited.
+    """
+
+    def __init__(self, provider: S3StorageProvider, config: Optional[Dict[str, Any]] = None):
+        """Initialize from an initialized synchronous S3 provider.
+
+        Args:
+            provider: S3StorageProvider holding the bucket and prefix configuration
+            config: S3 settings with optional aws_access_key_id, aws_secret_access_key and aws_region
+        """
+        super().__init__()
+        if not provider.bucket_name:
+            raise RuntimeError("S3StorageProvider not initialized - call initialize() first")
+        self.provider = provider
+        config = config or {}
+        self._client_kwargs = {
+            'aws_access_key_id': config.get('aws_access_key_id'),
+            'aws_secret_access_key': config.get('aws_secret_access_key'),
+            'region_name': config.get('aws_region')
+        }
+        self._client_kwargs = {k: v for k, v in self._client_kwargs.items() if v is not None}
+        self._client = None
+        self._exit_stack: Optional[AsyncExitStack] = None
+        self._client_lock = asyncio.Lock()
+
+    async def _get_client(self):
+        """Return the shared S3 client, creating it on first use."""
+        if self._client is None:
+            async with self._client_lock:
+                if self._client is None:
+                    self._exit_stack = AsyncExitStack()
+                    self._client = await self._exit_stack.enter_async_context(
+                        get_session().create_client('s3', **self._client_kwargs)
+                    )
+        return self._client
+
+    async def close(self):
+        """Close the shared S3 client."""
+        if self._exit_stack is not None:
+            await self._exit_stack.aclose()
+        self._client = None
+        self._exit_stack = None
+
+    def _get_prefix(self, storage_type: str) -> str:
+        """Get the key prefix for a storage type."""
+        return {
+            'input': self.provider.input_prefix,
+            'output': self.provider.output_prefix,
+            'archive': self.provider.archive_prefix,
+            'cache': self.provider.cache_prefix
+        }.get(storage_type, self.provider.base_prefix)
+
+    def _resolve_key(self, path: str, storage_type: str = None, for_writing: bool = False) -> Tuple[str, str]:
+        """Resolve bucket and key the same way S3StorageProvider does."""
+        if storage_type:
+            return self.provider.bucket_name, f"{self._get_prefix(storage_type)}{self.provider._normalize_path(path)}"
+        if for_writing and not any(path.startswith(prefix) for prefix in RECOGNIZED_PREFIXES):
+            path = 'output/' + path
+        return self.provider._get_bucket_and_key(path, for_writing=for_writing)
+
+    async def read_file(self, file_path: str, storage_type: str = None) -> Optional[Any]:
+        """Read content from S3."""
+        bucket, key = self._resolve_key(file_path, storage_type)
+        client = await self._get_client()
+        try:
+            response = await client.get_object(Bucket=bucket, Key=key)
+            async with response['Body'] as stream:
+                content = await stream.read()
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'NoSuchKey':
+                raise FileNotFoundError(f"File not found in S3: {file_path}")
+            logger.error(f"Error reading from S3 {file_path}: {str(e)}")
+            raise
+        return decode_content(file_path, content)
+
+    async def write_file(self, path: str, content: Union[str, bytes], storage_type: str = None) -> bool:
+        """Write content to a file in S3."""
+        try:
+            bucket, key = self._resolve_key(path, storage_type, for_writing=True)
+            client = await self._get_client()
+            await client.put_object(Bucket=bucket, Key=key, Body=encode_content(content))
+            logger.debug(f"Successfully wrote file to S3: {bucket}/{key}")
+            return True
+        except Exception as e:
+            logger.error(f"Error writing file {path}: {str(e)}")
+            return False
+
+    async def delete_file(self, file_path: str) -> bool:
+        """Delete file from S3."""
+        try:
+            bucket, key = self.provider._get_bucket_and_key(file_path, for_writing=True)
+            client = await self._get_client()
+            await client.delete_object(Bucket=bucket, Key=key)
+            logger.debug(f"Successfully deleted from S3: {bucket}/{key}")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting from S3 {file_path}: {str(e)}")
+            return False
+
+    async def list_files(self, directory: str = "", pattern: Optional[str] = None, storage_type: str = None) -> List[str]:
+        """List files in S3 directory."""
+        base_prefix = self._get_prefix(storage_type)
+        directory = self.provider._normalize_path(directory)
+        prefix = f"{base_prefix}{directory}" if directory else base_prefix
+        if prefix and not prefix.endswith('/'):
+            prefix += '/'
+
+        files = []
+        try:
+            client = await self._get_client()
+            paginator = client.get_paginator('list_objects_v2')
+            async for page in paginator.paginate(Bucket=self.provider.bucket_name, Prefix=prefix):
+                for obj in page.get('Contents', []):
+                    if obj['Key'].endswith('/'):
+                        continue
+                    rel_path = obj['Key'][len(base_prefix):] if obj['Key'].startswith(base_prefix) else obj['Key']
+                    if pattern and not fnmatch.fnmatch(rel_path, pattern):
+                        continue
+                    files.append(rel_path)
+        except Exception as e:
+            logger.error(f"Error listing files in S3 {directory}: {str(e)}")
+            return []
+        return files
+
+    async def move_file(self, source: str, dest: str, source_type: str = None, dest_type: str = None) -> bool:
+        """Move a file within S3 using a server-side copy."""
+        try:
+            if not source_type and not any(source.startswith(prefix) for prefix in RECOGNIZED_PREFIXES):
+                source = 'input/' + source
+            source_bucket, source_key = self._resolve_key(source, source_type)
+            dest_bucket, dest_key = self._resolve_key(dest, dest_type, for_writing=True)
+            client = await self._get_client()
+            await client.copy_object(
+                Bucket=dest_bucket,
+                Key=dest_key,
+                CopySource={'Bucket': source_bucket, 'Key': source_key}
+            )
+            await client.delete_object(Bucket=source_bucket, Key=source_key)
+            return True
+        except Exception as e:
+            logger.error(f"Error moving file from {source} to {dest}: {str(e)}")
+            return False
+
+    async def _head_object(self, path: str, storage_type: str = None) -> Dict[str, Any]:
+        """Return object metadata, raising FileNotFoundError for missing keys."""
+        bucket, key = self._resolve_key(path, storage_type)
+        client = await self._get_client()
+        try:
+            return await client.head_object(Bucket=bucket, Key=key)
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('404', 'NoSuchKey'):
+                raise FileNotFoundError(f"File not found in S3: {path}")
+            raise
+
+    async def file_exists(self, path: str, storage_type: str = None) -> bool:
+        """Check if file exists in S3."""
+        try:
+            await self._head_object(path, storage_type)
+            return True
+        except FileNotFoundError:
+            return False
+
+    async def create_directory(self, path: str, storage_type: str = None) -> bool:
+        """Create a directory marker in S3."""
+        try:
+            bucket, key = self._resolve_key(path, storage_type, for_writing=True) if storage_type \
+                else self.provider._get_bucket_and_key(path, for_writing=True)
+            if not key.endswith('/'):
+                key += '/'
+            client = await self._get_client()
+            await client.put_object(Bucket=bucket, Key=key, Body=b'')
+            return True
+        except Exception as e:
+            logger.error(f"Error creating directory in S3 {path}: {str(e)}")
+            return False
+
+    async def get_file_size(self, path: str, storage_type: str = None) -> int:
+        """Get file size from S3."""
+        return (await self._head_object(path, storage_type))['ContentLength']
+
+    async def get_file_modified_time(self, path: str, storage_type: str = None) -> float:
+        """Get file last modified time from S3."""
+        return (await self._head_object(path, storage_type))['LastModified'].timestamp()
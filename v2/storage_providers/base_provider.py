@@ -5,6 +5,7 @@ This module defines the abstract base class for storage providers,
 which provides a common interface for both local and S3 storage operations.
 """
 
+import io
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Union, BinaryIO
 import logging
@@ -41,6 +42,27 @@ class BaseStorageProvider(ABC):
         """
         pass
     
+    def open_stream(self, path: str, storage_type: str = None, offset: int = 0) -> BinaryIO:
+        """Open a file for sequential binary reading, starting at a byte offset.
+        
+        Providers that can stream (local files, ranged S3 GETs) override this; the
+        default reads the whole file through read_file.
+        
+        Args:
+            path: Path to the file to read
+            storage_type: Type of storage (input, output, archive, cache)
+            offset: Byte offset to start reading from
+            
+        Returns:
+            Binary file-like object; the caller closes it
+        """
+        content = self.read_file(path, storage_type)
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        elif not isinstance(content, bytes):
+            raise TypeError(f"Cannot stream parsed content of {path}")
+        return io.BytesIO(content[offset:])
+    
     @abstractmethod
     def delete_file(self, file_path: str) -> bool:
         """Delete a file."""
@@ -60,6 +82,31 @@ class BaseStorageProvider(ABC):
         """
         pass
     
+    def list_objects(self, directory: str = "", pattern: Optional[str] = None, storage_type: str = None) -> List[Dict[str, Any]]:
+        """List files in directory with their size, ETag and modification time.
+        
+        Providers that get this metadata from the listing itself (S3) override this; the
+        default stats each file listed by list_files.
+        
+        Args:
+            directory: Directory to list files from
+            pattern: Optional glob pattern to filter files
+            storage_type: Type of storage (input, output, archive, cache)
+            
+        Returns:
+            List of {"path", "size", "etag", "modified"} dicts; path is relative to the storage
+            type directory and etag is None where the storage has none
+        """
+        return [
+            {
+                "path": path,
+                "size": self.get_file_size(path, storage_type),
+                "etag": None,
+                "modified": self.get_file_modified_time(path, storage_type)
+            }
+            for path in self.list_files(directory, pattern, storage_type)
+        ]
+    
     def move_file(self, source: str, dest: str, source_type: str = None, dest_type: str = None) -> bool:
         """Move a file from source to destination.
         
@@ -13,6 +13,8 @@ from typing import Dict, Any, Optional
 from storage_providers.base_provider import BaseStorageProvider
 from storage_providers.local_provider import LocalStorageProvider
 from storage_providers.s3_provider import S3StorageProvider
+from storage_providers.async_base_provider import AsyncBaseStorageProvider
+from storage_providers.instrumentation import InstrumentedStorageProvider, instrument_provider
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +22,7 @@ class StorageProviderFactory:
     """Factory class for creating storage provider instances."""
     
     @staticmethod
-    def create_provider(config: Dict[str, Any]) -> BaseStorageProvider:
+    def create_provider(config: Dict[str, Any], instrument: bool = False) -> BaseStorageProvider:
         """
         Create and return appropriate storage provider based on configuration.
 
@@ -29,6 +31,7 @@ class StorageProviderFactory:
                 - mode: Provider type ('local' or 's3')
                 - local: Local storage settings with input_folder, output_folder, etc.
                 - s3: S3 storage settings with bucket and prefix information
+            instrument (bool): Wrap the provider so every call records Prometheus metrics
 
         Returns:
             BaseStorageProvider: Configured storage provider instance
@@ -44,12 +47,53 @@ class StorageProviderFactory:
         logger.debug(f"Full config: {json.dumps(config, indent=2)}")
 
         if provider_type == 'local':
-            return StorageProviderFactory._create_local_provider(config)
+            provider = StorageProviderFactory._create_local_provider(config)
         elif provider_type == 's3':
-            return StorageProviderFactory._create_s3_provider(config)
+            provider = StorageProviderFactory._create_s3_provider(config)
         else:
             raise ValueError(f"Invalid storage provider type: {provider_type}")
+
+        return instrument_provider(provider, provider_type) if instrument else provider
     
+    @staticmethod
+    def create_async_provider(config: Dict[str, Any], instrument: bool = False,
+                              provider: Optional[BaseStorageProvider] = None) -> AsyncBaseStorageProvider:
+        """
+        Create the async counterpart of the storage provider described by configuration.
+
+        Args:
+            config (Dict[str, Any]): Storage configuration dictionary, as for create_provider
+            instrument (bool): Wrap the provider so every call records Prometheus metrics
+            provider (Optional[BaseStorageProvider]): Already-initialized sync provider whose
+                path configuration should be shared; created from config if omitted
+
+        Returns:
+            AsyncBaseStorageProvider: Async provider addressing the same files as the sync one
+
+        Raises:
+            ValueError: If provider type is invalid or required config missing
+        """
+        # Imported here so sync-only users do not need aiofiles / aiobotocore installed
+        from storage_providers.async_local_provider import AsyncLocalStorageProvider
+        from storage_providers.async_s3_provider import AsyncS3StorageProvider
+
+        if provider is None:
+            provider = StorageProviderFactory.create_provider(config)
+        if isinstance(provider, InstrumentedStorageProvider):
+            provider = provider.provider
+
+        if isinstance(provider, LocalStorageProvider):
+            async_provider = AsyncLocalStorageProvider(provider)
+            provider_type = 'local'
+        elif isinstance(provider, S3StorageProvider):
+            async_provider = AsyncS3StorageProvider(provider, config.get('s3', {}))
+            provider_type = 's3'
+        else:
+            raise ValueError(f"No async storage provider for {type(provider).__name__}")
+
+        logger.info(f"Created async {provider_type} storage provider")
+        return instrument_provider(async_provider, provider_type) if instrument else async_provider
+
     @staticmethod
     def _create_local_provider(config: Dict[str, Any]) -> LocalStorageProvider:
         """Create and configure a local storage provider."""
@@ -0,0 +1,306 @@
+"""
+Storage instrumentation layer.
+
+This module wraps any BaseStorageProvider or AsyncBaseStorageProvider with
+Prometheus metrics so that storage latency can be separated from scraper
+latency. Every call records its duration per operation, storage type and
+provider, counts successes and failures, and counts bytes moved. Calls are tagged with the active request or
+claim correlation ID (as a histogram exemplar and in debug logs) without
+turning the ID into a high-cardinality label.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Union, BinaryIO
+
+from prometheus_client import Counter, Histogram
+
+from storage_providers.base_provider import BaseStorageProvider
+from storage_providers.async_base_provider import AsyncBaseStorageProvider
+
+logger = logging.getLogger(__name__)
+
+STORAGE_TYPES = ('input', 'output', 'archive', 'cache')
+
+STORAGE_OPERATION_TIME = Histogram(
+    'storage_operation_seconds',
+    'Time spent in storage provider operations',
+    ['operation', 'storage_type', 'provider']
+)
+STORAGE_OPERATION_COUNTER = Counter(
+    'storage_operation_total',
+    'Total number of storage provider operations',
+    ['operation', 'storage_type', 'provider', 'status']
+)
+STORAGE_BYTES_COUNTER = Counter(
+    'storage_bytes_total',
+    'Total number of bytes moved through storage providers',
+    ['direction', 'storage_type', 'provider']
+)
+
+# Correlation ID of the request or claim currently being served
+_correlation_id: ContextVar[Optional[str]] = ContextVar('storage_correlation_id', default=None)
+
+def get_correlation_id() -> Optional[str]:
+    """Return the correlation ID bound to the current context, if any."""
+    return _correlation_id.get()
+
+@contextmanager
+def correlation_context(correlation_id: Optional[str]) -> Iterator[None]:
+    """Bind a request or claim correlation ID to storage calls made in this block.
+
+    Args:
+        correlation_id: Reference ID of the claim or ID of the request. ``None``
+            keeps whatever ID is already bound.
+    """
+    if not correlation_id:
+        yield
+        return
+    token = _correlation_id.set(str(correlation_id))
+    try:
+        yield
+    finally:
+        _correlation_id.reset(token)
+
+def _payload_size(content: Any) -> Optional[int]:
+    """Return the size in bytes of raw file content, or None if it is not raw."""
+    if isinstance(content, bytes):
+        return len(content)
+    if isinstance(content, str):
+        return len(content.encode('utf-8'))
+    return None
+
+def _resolve_storage_type(path: str, storage_type: Optional[str]) -> str:
+    """Label value for the storage type, inferred from the path prefix when not given."""
+    if storage_type:
+        return storage_type
+    head = str(path).replace('\\', '/').lstrip('/').split('/', 1)[0]
+    return head if head in STORAGE_TYPES else 'base'
+
+def _record_operation(provider_name: str, operation: str, path: str, storage_type: Optional[str], status: str,
+                      elapsed: float, moved: Optional[int], direction: str):
+    """Record one storage call in the metrics, tagged with the current correlation ID."""
+    label_type = _resolve_storage_type(path, storage_type)
+    correlation_id = _correlation_id.get()
+    exemplar = {'correlation_id': correlation_id} if correlation_id else None
+    STORAGE_OPERATION_TIME.labels(
+        operation=operation,
+        storage_type=label_type,
+        provider=provider_name
+    ).observe(elapsed, exemplar)
+    STORAGE_OPERATION_COUNTER.labels(
+        operation=operation,
+        storage_type=label_type,
+        provider=provider_name,
+        status=status
+    ).inc()
+    if moved and status == 'success':
+        STORAGE_BYTES_COUNTER.labels(
+            direction=direction,
+            storage_type=label_type,
+            provider=provider_name
+        ).inc(moved)
+    logger.debug(f"storage {operation} {provider_name}/{label_type} path={path} "
+                 f"status={status} duration={elapsed:.4f}s correlation_id={correlation_id}")
+
+class InstrumentedStorageProvider(BaseStorageProvider):
+    """Storage provider that records metrics around a wrapped provider.
+
+    Attributes not defined here (``base_path``, ``bucket_name``, ...) are
+    looked up on the wrapped provider, so the wrapper can be used wherever
+    the underlying provider was used before.
+    """
+
+    def __init__(self, provider: BaseStorageProvider, provider_name: Optional[str] = None):
+        """Wrap a storage provider.
+
+        Args:
+            provider: The provider to instrument
+            provider_name: Value of the ``provider`` metric label (default: 'local', 's3', ...)
+        """
+        super().__init__()
+        self.provider = provider
+        self.provider_name = provider_name or type(provider).__name__.replace('StorageProvider', '').lower()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called when normal lookup fails; guard against recursion before __init__ ran
+        if name == 'provider':
+            raise AttributeError(name)
+        return getattr(self.provider, name)
+
+    def _call(self, operation: str, path: str, storage_type: Optional[str], func: Callable, *args,
+              bytes_in: Optional[int] = None, count_result_bytes: bool = False) -> Any:
+        """Invoke a provider method, recording duration, outcome and bytes moved."""
+        status = 'success'
+        result = None
+        start_time = time.perf_counter()
+        try:
+            result = func(*args)
+            if result is False and operation != 'exists':
+                status = 'failure'
+            return result
+        except Exception:
+            status = 'error'
+            raise
+        finally:
+            _record_operation(self.provider_name, operation, path, storage_type, status,
+                              time.perf_counter() - start_time,
+                              _payload_size(result) if count_result_bytes else bytes_in,
+                              'read' if count_result_bytes else 'write')
+
+    def initialize(self, config: Dict[str, Any]):
+        """Initialize the wrapped provider."""
+        return self.provider.initialize(config)
+
+    def save_file(self, file_path: str, content: Any) -> bool:
+        """Save content to a file."""
+        return self._call('write', file_path, None, self.provider.save_file, file_path, content,
+                          bytes_in=_payload_size(content))
+
+    def read_file(self, file_path: str, storage_type: str = None) -> Optional[Any]:
+        """Read content from a file."""
+        return self._call('read', file_path, storage_type, self.provider.read_file, file_path, storage_type,
+                          count_result_bytes=True)
+
+    def open_stream(self, path: str, storage_type: str = None, offset: int = 0) -> BinaryIO:
+        """Open a file for streamed reading from a byte offset."""
+        return self._call('open', path, storage_type, self.provider.open_stream, path, storage_type, offset)
+
+    def delete_file(self, file_path: str) -> bool:
+        """Delete a file."""
+        return self._call('delete', file_path, None, self.provider.delete_file, file_path)
+
+    def list_files(self, directory: str = "", pattern: Optional[str] = None, storage_type: str = None) -> List[str]:
+        """List files in directory."""
+        return self._call('list', directory, storage_type, self.provider.list_files, directory, pattern, storage_type)
+
+    def list_objects(self, directory: str = "", pattern: Optional[str] = None, storage_type: str = None) -> List[Dict[str, Any]]:
+        """List files with size and ETag."""
+        return self._call('list', directory, storage_type, self.provider.list_objects, directory, pattern, storage_type)
+
+    def move_file(self, source: str, dest: str, source_type: str = None, dest_type: str = None) -> bool:
+        """Move a file from source to destination."""
+        return self._call('move', source, source_type, self.provider.move_file, source, dest, source_type, dest_type)
+
+    def write_file(self, path: str, content: Union[str, bytes, BinaryIO], storage_type: str = None) -> bool:
+        """Write content to a file."""
+        return self._call('write', path, storage_type, self.provider.write_file, path, content, storage_type,
+                          bytes_in=_payload_size(content))
+
+    def file_exists(self, path: str, storage_type: str = None) -> bool:
+        """Check if a file exists."""
+        return self._call('exists', path, storage_type, self.provider.file_exists, path, storage_type)
+
+    def create_directory(self, path: str, storage_type: str = None) -> bool:
+        """Create a directory."""
+        return self._call('mkdir', path, storage_type, self.provider.create_directory, path, storage_type)
+
+    def get_file_size(self, path: str, storage_type: str = None) -> int:
+        """Get the size of a file in bytes."""
+        return self._call('stat', path, storage_type, self.provider.get_file_size, path, storage_type)
+
+    def get_file_modified_time(self, path: str, storage_type: str = None) -> float:
+        """Get the last modified time of a file."""
+        return self._call('stat', path, storage_type, self.provider.get_file_modified_time, path, storage_type)
+
+class AsyncInstrumentedStorageProvider(AsyncBaseStorageProvider):
+    """Async storage provider that records the same metrics around a wrapped async provider."""
+
+    def __init__(self, provider: AsyncBaseStorageProvider, provider_name: Optional[str] = None):
+        """Wrap an async storage provider.
+
+        Args:
+            provider: The async provider to instrument
+            provider_name: Value of the ``provider`` metric label (default: 'local', 's3', ...)
+        """
+        super().__init__()
+        self.provider = provider
+        self.provider_name = provider_name or type(provider).__name__.replace('Async', '').replace('StorageProvider', '').lower()
+
+    def __getattr__(self, name: str) -> Any:
+        if name == 'provider':
+            raise AttributeError(name)
+        return getattr(self.provider, name)
+
+    async def _call(self, operation: str, path: str, storage_type: Optional[str], coro: Awaitable,
+                    bytes_in: Optional[int] = None, count_result_bytes: bool = False) -> Any:
+        """Await a provider coroutine, recording duration, outcome and bytes moved."""
+        status = 'success'
+        result = None
+        start_time = time.perf_counter()
+        try:
+            result = await coro
+            if result is False and operation != 'exists':
+                status = 'failure'
+            return result
+        except Exception:
+            status = 'error'
+            raise
+        finally:
+            _record_operation(self.provider_name, operation, path, storage_type, status,
+                              time.perf_counter() - start_time,
+                              _payload_size(result) if count_result_bytes else bytes_in,
+                              'read' if count_result_bytes else 'write')
+
+    async def read_file(self, file_path: str, storage_type: str = None) -> Optional[Any]:
+        """Read content from a file."""
+        return await self._call('read', file_path, storage_type, self.provider.read_file(file_path, storage_type),
+                                count_result_bytes=True)
+
+    async def write_file(self, path: str, content: Union[str, bytes], storage_type: str = None) -> bool:
+        """Write content to a file."""
+        return await self._call('write', path, storage_type, self.provider.write_file(path, content, storage_type),
+                                bytes_in=_payload_size(content))
+
+    async def delete_file(self, file_path: str) -> bool:
+        """Delete a file."""
+        return await self._call('delete', file_path, None, self.provider.delete_file(file_path))
+
+    async def list_files(self, directory: str = "", pattern: Optional[str] = None, storage_type: str = None) -> List[str]:
+        """List files in directory."""
+        return await self._call('list', directory, storage_type, self.provider.list_files(directory, pattern, storage_type))
+
+    async def move_file(self, source: str, dest: str, source_type: str = None, dest_type: str = None) -> bool:
+        """Move a file from source to destination."""
+        return await self._call('move', source, source_type, self.provider.move_file(source, dest, source_type, dest_type))
+
+    async def file_exists(self, path: str, storage_type: str = None) -> bool:
+        """Check if a file exists."""
+        return await self._call('exists', path, storage_type, self.provider.file_exists(path, storage_type))
+
+    async def create_directory(self, path: str, storage_type: str = None) -> bool:
+        """Create a directory."""
+        return await self._call('mkdir', path, storage_type, self.provider.create_directory(path, storage_type))
+
+    async def get_file_size(self, path: str, storage_type: str = None) -> int:
+        """Get the size of a file in bytes."""
+        return await self._call('stat', path, storage_type, self.provider.get_file_size(path, storage_type))
+
+    async def get_file_modified_time(self, path: str, storage_type: str = None) -> float:
+        """Get the last modified time of a file."""
+        return await self._call('stat', path, storage_type, self.provider.get_file_modified_time(path, storage_type))
+
+    async def close(self):
+        """Close the wrapped provider."""
+        await self.provider.close()
+
+def instrument_provider(provider: Union[BaseStorageProvider, AsyncBaseStorageProvider],
+                        provider_name: Optional[str] = None) -> Union[BaseStorageProvider, AsyncBaseStorageProvider]:
+    """Wrap a sync or async provider with metrics, leaving already-instrumented or foreign objects untouched.
+
+    Args:
+        provider: Provider returned by StorageProviderFactory
+        provider_name: Optional value for the ``provider`` metric label
+
+    Returns:
+        The instrumented provider
+    """
+    if isinstance(provider, (InstrumentedStorageProvider, AsyncInstrumentedStorageProvider)):
+        return provider
+    if isinstance(provider, AsyncBaseStorageProvider):
+        return AsyncInstrumentedStorageProvider(provider, provider_name)
+    if isinstance(provider, BaseStorageProvider):
+        return InstrumentedStorageProvider(provider, provider_name)
+    return provider
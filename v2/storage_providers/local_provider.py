@@ -7,7 +7,7 @@ import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, List, Union, BinaryIO
 from storage_providers.base_provider import BaseStorageProvider
 
 logger = logging.getLogger(__name__)
@@ -92,27 +92,30 @@ class LocalStorageProvider(BaseStorageProvider):
             logger.error(f"Error saving file {file_path}: {str(e)}")
             return False
             
+    def _resolve_read_path(self, file_path: str, storage_type: str = None) -> Path:
+        """Full path of a file to read, relative to the storage type directory if given."""
+        # Determine the base directory based on storage type
+        if storage_type == 'input':
+            base_dir = self.input_path
+        elif storage_type == 'output':
+            base_dir = self.output_path
+        elif storage_type == 'archive':
+            base_dir = self.archive_path
+        elif storage_type == 'cache':
+            base_dir = self.cache_path
+        else:
+            base_dir = self.base_path
+            
+        # Get the full path for the file
+        if storage_type:
+            return base_dir / file_path
+        return self._get_full_path(file_path)
+
     def read_file(self, file_path: str, storage_type: str = None) -> Optional[Any]:
         """Read content from a file."""
         self._ensure_initialized()
         try:
-            # Determine the base directory based on storage type
-            if storage_type == 'input':
-                base_dir = self.input_path
-            elif storage_type == 'output':
-                base_dir = self.output_path
-            elif storage_type == 'archive':
-                base_dir = self.archive_path
-            elif storage_type == 'cache':
-                base_dir = self.cache_path
-            else:
-                base_dir = self.base_path
-                
-            # Get the full path for the file
-            if storage_type:
-                full_path = base_dir / file_path
-            else:
-                full_path = self._get_full_path(file_path)
+            full_path = self._resolve_read_path(file_path, storage_type)
                 
             if not full_path.exists():
                 raise FileNotFoundError(f"File not found: {file_path}")
@@ -138,6 +141,17 @@ class LocalStorageProvider(BaseStorageProvider):
             logger.error(f"Error reading file {file_path}: {str(e)}")
             raise
             
+    def open_stream(self, path: str, storage_type: str = None, offset: int = 0) -> BinaryIO:
+        """Open a local file for binary reading, positioned at offset."""
+        self._ensure_initialized()
+        full_path = self._resolve_read_path(path, storage_type)
+        if not full_path.exists():
+            raise FileNotFoundError(f"File not found: {path}")
+        stream = open(full_path, 'rb')
+        if offset:
+            stream.seek(offset)
+        return stream
+            
     def delete_file(self, file_path: str) -> bool:
         """Delete a file."""
         self._ensure_initialized()
@@ -200,6 +214,17 @@ class LocalStorageProvider(BaseStorageProvider):
             logger.error(f"Error listing files in {directory}: {str(e)}")
             return []
     
+    def list_objects(self, directory: str = "", pattern: Optional[str] = None, storage_type: str = None) -> List[Dict[str, Any]]:
+        """List files in directory with size and modification time (local files have no ETag)."""
+        objects = []
+        for path in self.list_files(directory, pattern, storage_type):
+            try:
+                stat = self._resolve_read_path(path, storage_type).stat()
+            except FileNotFoundError:
+                continue
+            objects.append({"path": path, "size": stat.st_size, "etag": None, "modified": stat.st_mtime})
+        return objects
+    
     def _normalize_path(self, path: str) -> str:
         """Normalize a path by converting backslashes to forward slashes and making it relative.
 
@@ -5,8 +5,10 @@ This module implements the StorageProvider interface for AWS S3 operations.
 """
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 from typing import List, Optional, Union, BinaryIO, Dict, Tuple, Any
+import io
 import logging
 import fnmatch
 import os
@@ -15,6 +17,10 @@ from storage_providers.base_provider import BaseStorageProvider
 from datetime import datetime
 from pathlib import Path
 
+# Bodies at least this large are written as concurrent multipart uploads
+DEFAULT_MULTIPART_THRESHOLD = 16 * 1024 * 1024
+DEFAULT_MULTIPART_CONCURRENCY = 4
+
 logger = logging.getLogger(__name__)
 
 class S3StorageProvider(BaseStorageProvider):
@@ -30,6 +36,8 @@ class S3StorageProvider(BaseStorageProvider):
         self.archive_prefix: Optional[str] = None
         self.cache_prefix: Optional[str] = None
         self.s3_client = None
+        self.transfer_config = TransferConfig(multipart_threshold=DEFAULT_MULTIPART_THRESHOLD,
+                                              max_concurrency=DEFAULT_MULTIPART_CONCURRENCY)
         
     def initialize(self, config: Dict[str, Any]):
         """Initialize with configuration dictionary.
@@ -47,6 +55,8 @@ class S3StorageProvider(BaseStorageProvider):
                 - output_prefix: Prefix for output files (default: base_prefix/output)
                 - archive_prefix: Prefix for archived files (default: base_prefix/archive)
                 - cache_prefix: Prefix for cached files (default: base_prefix/cache)
+                - multipart_threshold: Write bodies of at least this many bytes as multipart uploads
+                - multipart_concurrency: Parts of one multipart upload sent concurrently
         """
         if not isinstance(config, dict):
             raise ValueError("Configuration must be a dictionary")
@@ -80,6 +90,10 @@ class S3StorageProvider(BaseStorageProvider):
         self.output_prefix = self._normalize_prefix(config.get('output_prefix', f"{self.base_prefix}output/"))
         self.archive_prefix = self._normalize_prefix(config.get('archive_prefix', f"{self.base_prefix}archive/"))
         self.cache_prefix = self._normalize_prefix(config.get('cache_prefix', f"{self.base_prefix}cache/"))
+        self.transfer_config = TransferConfig(
+            multipart_threshold=int(config.get('multipart_threshold', DEFAULT_MULTIPART_THRESHOLD)),
+            max_concurrency=int(config.get('multipart_concurrency', DEFAULT_MULTIPART_CONCURRENCY))
+        )
         
         # Verify bucket exists and is accessible
         try:
@@ -195,6 +209,29 @@ class S3StorageProvider(BaseStorageProvider):
             logger.error(f"Error saving to S3 {file_path}: {str(e)}")
             return False
             
+    def _resolve_read_location(self, file_path: str, storage_type: str = None) -> Tuple[str, str]:
+        """Bucket and key of an object to read, under the storage type prefix if given."""
+        if storage_type:
+            # Determine the base prefix based on storage type
+            if storage_type == 'input':
+                prefix = self.input_prefix
+            elif storage_type == 'output':
+                prefix = self.output_prefix
+            elif storage_type == 'archive':
+                prefix = self.archive_prefix
+            elif storage_type == 'cache':
+                prefix = self.cache_prefix
+            else:
+                prefix = self.base_prefix
+            
+            # Normalize the file path and join with the prefix
+            normalized_path = self._normalize_path(file_path)
+            key = f"{prefix}{normalized_path}"
+            bucket = self.bucket_name
+        else:
+            bucket, key = self._get_bucket_and_key(file_path, for_writing=False)
+        return bucket, key
+
     def read_file(self, file_path: str, storage_type: str = None) -> Optional[Any]:
         """Read content from S3.
         
@@ -206,25 +243,7 @@ class S3StorageProvider(BaseStorageProvider):
             File contents
         """
         try:
-            if storage_type:
-                # Determine the base prefix based on storage type
-                if storage_type == 'input':
-                    prefix = self.input_prefix
-                elif storage_type == 'output':
-                    prefix = self.output_prefix
-                elif storage_type == 'archive':
-                    prefix = self.archive_prefix
-                elif storage_type == 'cache':
-                    prefix = self.cache_prefix
-                else:
-                    prefix = self.base_prefix
-                
-                # Normalize the file path and join with the prefix
-                normalized_path = self._normalize_path(file_path)
-                key = f"{prefix}{normalized_path}"
-                bucket = self.bucket_name
-            else:
-                bucket, key = self._get_bucket_and_key(file_path, for_writing=False)
+            bucket, key = self._resolve_read_location(file_path, storage_type)
             
             response = self.s3_client.get_object(
                 Bucket=bucket,
@@ -254,6 +273,25 @@ class S3StorageProvider(BaseStorageProvider):
             logger.error(f"Error reading from S3 {file_path}: {str(e)}")
             raise
             
+    def open_stream(self, path: str, storage_type: str = None, offset: int = 0) -> BinaryIO:
+        """Open an S3 object as a streamed body; a non-zero offset issues a ranged GET."""
+        bucket, key = self._resolve_read_location(path, storage_type)
+        params = {'Bucket': bucket, 'Key': key}
+        if offset:
+            params['Range'] = f"bytes={offset}-"
+        try:
+            response = self.s3_client.get_object(**params)
+        except ClientError as e:
+            code = e.response['Error']['Code']
+            if code == 'NoSuchKey':
+                raise FileNotFoundError(f"File not found in S3: {path}")
+            if code == 'InvalidRange':
+                # Offset at (or past) the end of the object: nothing left to read
+                return io.BytesIO(b"")
+            logger.error(f"Error opening S3 stream {path}: {str(e)}")
+            raise
+        return response['Body']
+            
     def delete_file(self, file_path: str) -> bool:
         """Delete file from S3."""
         try:
@@ -346,6 +384,55 @@ class S3StorageProvider(BaseStorageProvider):
             logger.error(f"Error listing files in S3 {directory}: {str(e)}")
             return []
             
+    def list_objects(self, directory: str = "", pattern: Optional[str] = None, storage_type: str = None) -> List[Dict[str, Any]]:
+        """List files in an S3 directory with the size, ETag and modification time from the listing.
+
+        Every page of list_objects_v2 is read, so prefixes with more than 1000 keys are
+        listed completely. Unlike list_files, errors are raised rather than read as an
+        empty listing.
+
+        Args:
+            directory: Directory to list files from
+            pattern: Optional glob pattern to filter files
+            storage_type: Type of storage (input, output, archive, cache)
+
+        Returns:
+            List of {"path", "size", "etag", "modified"} dicts, path relative to the storage type directory
+        """
+        if storage_type == 'input':
+            base_prefix = self.input_prefix
+        elif storage_type == 'output':
+            base_prefix = self.output_prefix
+        elif storage_type == 'archive':
+            base_prefix = self.archive_prefix
+        elif storage_type == 'cache':
+            base_prefix = self.cache_prefix
+        else:
+            base_prefix = self.base_prefix
+        directory = self._normalize_path(directory)
+        prefix = f"{base_prefix}{directory}" if directory else base_prefix
+        if prefix and not prefix.endswith('/'):
+            prefix += '/'
+
+        objects = []
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+            for obj in page.get('Contents', []):
+                if obj['Key'].endswith('/'):
+                    continue
+                rel_path = obj['Key'][len(base_prefix):] if obj['Key'].startswith(base_prefix) else obj['Key']
+                if pattern and not fnmatch.fnmatch(rel_path, pattern):
+                    continue
+                modified = obj.get('LastModified')
+                objects.append({
+                    "path": rel_path,
+                    "size": obj.get('Size', 0),
+                    "etag": obj.get('ETag', '').strip('"') or None,
+                    "modified": modified.timestamp() if modified else None
+                })
+        logger.debug(f"Listed {len(objects)} objects matching {pattern or '*'} in {prefix}")
+        return objects
+
     def file_exists(self, path: str, storage_type: str = None) -> bool:
         """Check if file exists in S3.
         
@@ -557,11 +644,15 @@ class S3StorageProvider(BaseStorageProvider):
 
                 bucket, key = self._get_bucket_and_key(path, for_writing=True)
             
-            self.s3_client.put_object(
-                Bucket=bucket,
-                Key=key,
-                Body=content
-            )
+            if len(content) >= self.transfer_config.multipart_threshold:
+                # Large bodies (e.g. batched result parts) go up in concurrent parts
+                self.s3_client.upload_fileobj(io.BytesIO(content), bucket, key, Config=self.transfer_config)
+            else:
+                self.s3_client.put_object(
+                    Bucket=bucket,
+                    Key=key,
+                    Body=content
+                )
             logger.debug(f"Successfully wrote file to S3: {bucket}/{key}")
             return True
         except Exception as e:
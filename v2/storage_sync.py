@@ -0,0 +1,301 @@
+"""
+storage_sync.py
+
+Concurrent, resumable file sync between two storages, built on StorageManager. It replaces
+the serial loops of aws-pull-to-drop.py (S3 drop prefix -> local input folder) and
+aws-push-to-output.py (local output folder -> S3 output prefix).
+
+- Each side is listed once with StorageManager.list_objects, which reads every page of an
+  S3 listing.
+- A file is skipped when the destination already holds it: same size and the same ETag,
+  the same size and the source version recorded in the sync manifest, or the same size and
+  a content MD5 matching the other side's single-part ETag.
+- Transfers run on a pool of `workers` threads.
+- The manifest (cache/sync/<name>.json by default) records the version of every synced
+  file and is committed every `commit_every` files, so an interrupted sync resumes without
+  transferring finished files again.
+- With archive_source, each synced source file is then moved to archive/<MM-DD-YYYY>/.
+"""
+
+import fnmatch
+import hashlib
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from main_checkpoint import JOURNAL_FOLDER
+from main_config import DEFAULT_SYNC_COMMIT_EVERY, DEFAULT_SYNC_WORKERS
+from report_serializer import dumps_bytes
+from result_sink import RESULTS_FOLDER
+from storage_manager import StorageManager
+
+logger = logging.getLogger('storage_sync')
+
+SYNC_FOLDER = "sync"
+
+
+def object_fingerprint(obj: Dict[str, Any]) -> str:
+    """Version of a listed file: its ETag, or size and modification time where there is none."""
+    if obj.get("etag"):
+        return f"etag:{obj['etag']}"
+    return f"stat:{obj.get('size')}:{int(obj.get('modified') or 0)}"
+
+
+def is_md5_etag(etag: Optional[str]) -> bool:
+    """True for single-part S3 ETags, which are the MD5 of the content."""
+    return bool(etag) and len(etag) == 32 and '-' not in etag
+
+
+@dataclass
+class SyncSummary:
+    """Totals for one sync run."""
+    listed: int = 0
+    transferred: int = 0
+    skipped: int = 0
+    archived: int = 0
+    failed: int = 0
+    bytes_transferred: int = 0
+    failed_files: List[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "listed": self.listed,
+            "transferred": self.transferred,
+            "skipped": self.skipped,
+            "archived": self.archived,
+            "failed": self.failed,
+            "bytes_transferred": self.bytes_transferred,
+            "failed_files": list(self.failed_files),
+            "elapsed_seconds": round(self.elapsed, 3)
+        }
+
+    def add(self, other: "SyncSummary") -> None:
+        """Add the totals of another sync run."""
+        self.listed += other.listed
+        self.transferred += other.transferred
+        self.skipped += other.skipped
+        self.archived += other.archived
+        self.failed += other.failed
+        self.bytes_transferred += other.bytes_transferred
+        self.failed_files.extend(other.failed_files)
+        self.elapsed += other.elapsed
+
+
+class StorageSync:
+    """Copies new or changed files from one storage to another with a pool of workers."""
+
+    def __init__(self, source: StorageManager, destination: StorageManager, name: str,
+                 source_type: str = 'input', destination_type: str = 'input',
+                 directory: str = "", pattern: Optional[str] = None, exclude: Iterable[str] = (),
+                 workers: int = DEFAULT_SYNC_WORKERS, archive_source: bool = False,
+                 manifest_storage: Optional[StorageManager] = None,
+                 commit_every: int = DEFAULT_SYNC_COMMIT_EVERY):
+        """
+        Initialize the sync.
+
+        Args:
+            source: Storage the files are copied from.
+            destination: Storage the files are copied to, under the same relative paths.
+            name: Sync name; the manifest is sync/<name>.json in the manifest storage's cache.
+            source_type: Storage type listed on the source (input, output, archive, cache).
+            destination_type: Storage type written on the destination.
+            directory: Directory to sync, relative to the storage type.
+            pattern: Optional glob pattern the files must match.
+            exclude: Glob patterns of files left alone.
+            workers: Number of concurrent transfers.
+            archive_source: Move each synced source file to archive/<MM-DD-YYYY>/ afterwards.
+            manifest_storage: Storage holding the manifest (default: destination).
+            commit_every: Commit the manifest after this many finished files.
+        """
+        self.source = source
+        self.destination = destination
+        self.name = name
+        self.source_type = source_type
+        self.destination_type = destination_type
+        self.directory = directory
+        self.pattern = pattern
+        self.exclude = list(exclude)
+        self.workers = max(1, int(workers))
+        self.archive_source = archive_source
+        self.manifest_storage = manifest_storage or destination
+        self.manifest_path = f"{SYNC_FOLDER}/{name}.json"
+        self.commit_every = max(1, int(commit_every))
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._uncommitted = 0
+        self._lock = threading.Lock()
+
+    def load_manifest(self) -> None:
+        """Load the versions synced by earlier runs; an unreadable manifest starts empty."""
+        self.entries = {}
+        try:
+            if not self.manifest_storage.file_exists(self.manifest_path, storage_type='cache'):
+                return
+            content = self.manifest_storage.read_file(self.manifest_path, storage_type='cache')
+            state = json.loads(content) if isinstance(content, (str, bytes)) else content
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable sync manifest {self.manifest_path}: {str(e)}")
+            return
+        if isinstance(state, dict) and isinstance(state.get("files"), dict):
+            self.entries = state["files"]
+            logger.info(f"Loaded sync manifest {self.manifest_path} with {len(self.entries)} files")
+
+    def commit_manifest(self) -> bool:
+        """Write the manifest now."""
+        with self._lock:
+            state = {"name": self.name, "updated": datetime.now().isoformat(), "files": dict(self.entries)}
+            self._uncommitted = 0
+        try:
+            self.manifest_storage.write_file(self.manifest_path, dumps_bytes(state, indent=2), storage_type='cache')
+            return True
+        except Exception as e:
+            logger.error(f"Failed to commit sync manifest {self.manifest_path}: {str(e)}")
+            return False
+
+    def _selected(self, path: str) -> bool:
+        return not any(fnmatch.fnmatch(path, pattern) for pattern in self.exclude)
+
+    def plan(self) -> Tuple[List[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]], List[Dict[str, Any]]]:
+        """
+        List both sides and split the source files into transfers and skips.
+
+        Returns:
+            Tuple: (source file, destination file or None) pairs to transfer, and the source
+            files the destination already holds.
+        """
+        sources = [obj for obj in self.source.list_objects(self.directory, self.pattern, self.source_type)
+                   if self._selected(obj["path"])]
+        existing = {obj["path"]: obj for obj in self.destination.list_objects(self.directory, self.pattern,
+                                                                              self.destination_type)}
+        transfers, skips = [], []
+        for obj in sources:
+            current = existing.get(obj["path"])
+            if self._is_current(obj, current):
+                skips.append(obj)
+            else:
+                transfers.append((obj, current))
+        return transfers, skips
+
+    def _is_current(self, obj: Dict[str, Any], current: Optional[Dict[str, Any]]) -> bool:
+        """True if the destination copy is known to match the source without reading either."""
+        if current is None or current.get("size") != obj.get("size"):
+            return False
+        if obj.get("etag") and current.get("etag"):
+            return obj["etag"] == current["etag"]
+        entry = self.entries.get(obj["path"])
+        return bool(entry) and entry.get("fingerprint") == object_fingerprint(obj)
+
+    def _read(self, manager: StorageManager, path: str, storage_type: str) -> bytes:
+        """Read a file's exact bytes (read_file would parse .json files)."""
+        stream = manager.open_stream(path, storage_type=storage_type)
+        try:
+            return stream.read()
+        finally:
+            stream.close()
+
+    def _transfer(self, obj: Dict[str, Any], current: Optional[Dict[str, Any]]) -> int:
+        """
+        Copy one file unless a content check shows the destination already holds it.
+
+        Returns:
+            int: Bytes written (0 when the copy was skipped).
+        """
+        path = obj["path"]
+        content = self._read(self.source, path, self.source_type)
+        if current is not None and current.get("size") == len(content):
+            if is_md5_etag(current.get("etag")) and hashlib.md5(content).hexdigest() == current["etag"]:
+                return 0
+            if is_md5_etag(obj.get("etag")) and current.get("etag") is None:
+                if hashlib.md5(self._read(self.destination, path, self.destination_type)).hexdigest() == obj["etag"]:
+                    return 0
+        self.destination.write_file(path, content, storage_type=self.destination_type)
+        return len(content)
+
+    def _archive(self, path: str) -> None:
+        archive_path = f"{datetime.now().strftime('%m-%d-%Y')}/{path}"
+        if not self.source.move_file(path, archive_path, self.source_type, 'archive'):
+            raise OSError(f"Failed to archive {path}")
+
+    def _finish(self, obj: Dict[str, Any], current: Optional[Dict[str, Any]], transfer: bool) -> int:
+        """Sync (or only confirm) one file, record it and archive the source if requested."""
+        written = self._transfer(obj, current) if transfer else 0
+        with self._lock:
+            self.entries[obj["path"]] = {
+                "size": obj.get("size"),
+                "etag": obj.get("etag"),
+                "fingerprint": object_fingerprint(obj),
+                "synced": datetime.now().isoformat()
+            }
+            self._uncommitted += 1
+            due = self._uncommitted >= self.commit_every
+        if due:
+            self.commit_manifest()
+        if self.archive_source:
+            self._archive(obj["path"])
+        return written
+
+    def run(self) -> SyncSummary:
+        """Sync every selected file and commit the manifest."""
+        summary = SyncSummary()
+        start_time = time.time()
+        self.load_manifest()
+        transfers, skips = self.plan()
+        summary.listed = len(transfers) + len(skips)
+        logger.info(f"Sync {self.name}: {len(transfers)} files to transfer, {len(skips)} already current")
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=f"sync-{self.name}") as executor:
+                futures = {executor.submit(self._finish, obj, current, True): obj for obj, current in transfers}
+                futures.update({executor.submit(self._finish, obj, None, False): obj for obj in skips})
+                for future in as_completed(futures):
+                    obj = futures[future]
+                    try:
+                        written = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to sync {obj['path']}: {str(e)}")
+                        summary.failed += 1
+                        summary.failed_files.append(obj["path"])
+                        continue
+                    if written:
+                        summary.transferred += 1
+                        summary.bytes_transferred += written
+                    else:
+                        summary.skipped += 1
+                    if self.archive_source:
+                        summary.archived += 1
+        finally:
+            self.commit_manifest()
+            summary.elapsed = time.time() - start_time
+        logger.info(f"Sync {self.name} complete: {summary.transferred} transferred ({summary.bytes_transferred} bytes), "
+                    f"{summary.skipped} skipped, {summary.failed} failed in {summary.elapsed:.1f}s")
+        return summary
+
+
+def pull_drop(s3_storage: StorageManager, local_storage: StorageManager,
+              workers: int = DEFAULT_SYNC_WORKERS) -> SyncSummary:
+    """Download the CSV files of the S3 drop prefix to the local input folder and archive them in S3."""
+    return StorageSync(s3_storage, local_storage, "pull-drop", source_type='input', destination_type='input',
+                       pattern="*.csv", workers=workers, archive_source=True,
+                       manifest_storage=local_storage).run()
+
+
+def push_output(local_storage: StorageManager, s3_storage: StorageManager,
+                workers: int = DEFAULT_SYNC_WORKERS) -> SyncSummary:
+    """
+    Upload the local result files to the S3 output prefix and archive them locally.
+
+    Covers both result layouts: the per-record <ref>.json files at the top of the output
+    folder and the JSON Lines parts and manifests under results/<run_id>/. The checkpoint
+    file and journals (checkpoints/) stay in place.
+    """
+    summary = SyncSummary()
+    for name, directory, pattern in (("push-output", "", "*.json"), ("push-output-results", RESULTS_FOLDER, "**/*")):
+        summary.add(StorageSync(local_storage, s3_storage, name, source_type='output', destination_type='output',
+                                directory=directory, pattern=pattern,
+                                exclude=["checkpoint.json", f"{JOURNAL_FOLDER}/*"], workers=workers,
+                                archive_source=True, manifest_storage=local_storage).run())
+    return summary
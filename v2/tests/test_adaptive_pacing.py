@@ -0,0 +1,86 @@
+"""
+Tests for pacing batch rows by their live upstream fetches.
+"""
+
+import io
+import time
+from unittest.mock import MagicMock, patch
+
+import business
+import main_batch_engine
+import marshaller
+from main_batch_engine import BatchEngine
+from main_csv_processing import CSVProcessor
+from marshaller import FetchCounter, HostRateLimiter, check_cache_or_fetch, track_fetches
+
+
+def test_defer_holds_only_the_given_host():
+    """Test that deferring a host delays its next request and leaves other hosts alone."""
+    limiter = HostRateLimiter(default_interval=0.0)
+    limiter.defer("www.finra.org", 0.05)
+    assert limiter.acquire("www.sec.gov") == 0
+    assert limiter.acquire("www.finra.org") > 0.03
+
+
+def test_cache_hits_and_live_fetches_roll_up():
+    """Test that cached and fetched requests are counted in the row and its parent counter."""
+    totals = FetchCounter()
+    cached = {"SEC_Arbitration_Agent": [{"case": 1}]}
+    with patch.object(marshaller, "storage_provider"), \
+         patch.object(marshaller, "log_request"), \
+         patch.object(marshaller, "read_manifest", side_effect=lambda path: {"timestamp": "now"}), \
+         patch.object(marshaller, "is_cache_valid", return_value=True), \
+         patch.object(marshaller, "load_cached_data",
+                      side_effect=lambda path, is_multiple: cached.get(path.parts[-2])), \
+         patch.object(marshaller, "fetch_agent_data", return_value=([{"hits": {"total": 0, "hits": []}}], 0.1)), \
+         patch.object(marshaller, "save_cached_data"), \
+         patch.object(marshaller, "write_manifest"):
+        with track_fetches(totals) as row:
+            check_cache_or_fetch("SEC_Arbitration_Agent", "search_individual", "EMP001", {})
+            check_cache_or_fetch("FINRA_BrokerCheck_Agent", "search_individual", "EMP001", {})
+
+    assert (row.cache_hits, row.live_fetches, row.live_hosts) == (1, 1, {"api.brokercheck.finra.org"})
+    assert (totals.cache_hits, totals.live_fetches, totals.cache_hit_ratio) == (1, 1, 0.5)
+
+
+def test_cached_rows_are_not_delayed():
+    """Test that a fully cached row does not wait, and a live row defers the hosts it used."""
+    processor = CSVProcessor()
+
+    def process_claim(data, facade, employee_number=None, **kwargs):
+        marshaller._record_fetch(data["employee_number"] == "EMP2", "SEC_IAPD_Agent")
+        return {"reference_id": data["employee_number"]}
+
+    with patch.object(business, "process_claim", side_effect=process_claim), \
+         patch.object(processor, "save_result"), \
+         patch("main_csv_processing.host_rate_limiter") as limiter:
+        started = time.monotonic()
+        processor.process_row({"employeeNumber": "EMP1"}, MagicMock(), {}, wait_time=5.0)
+        limiter.defer.assert_not_called()
+        processor.process_row({"employeeNumber": "EMP2"}, MagicMock(), {}, wait_time=5.0)
+
+    assert time.monotonic() - started < 1.0
+    limiter.defer.assert_called_once_with("api.adviserinfo.sec.gov", 5.0)
+
+
+def test_engine_reports_cache_hit_ratio():
+    """Test that the batch summary counts cache hits and live fetches across workers."""
+    content = ("employee_number,first_name\n" + "\n".join(f"EMP{i},Name{i}" for i in range(8))).encode()
+    storage_manager = MagicMock()
+    storage_manager.open_stream.side_effect = lambda path, storage_type=None, offset=0: io.BytesIO(content[offset:])
+    processor = CSVProcessor()
+    processor.set_storage_manager(storage_manager)
+
+    def process_row(row, facade, config, wait_time):
+        marshaller._record_fetch(False, "FINRA_Disciplinary_Agent")
+        if row["employee_number"] in ("EMP0", "EMP5"):
+            marshaller._record_fetch(True, "FINRA_Disciplinary_Agent")
+
+    engine = BatchEngine(processor, storage_manager, {"progress_every_rows": 3}, workers=2,
+                         facade=MagicMock(), facade_factory=MagicMock)
+    with patch.object(processor, "process_row", side_effect=process_row), \
+         patch.object(main_batch_engine, "archive_file"):
+        summary = engine.run(["a.csv"])
+
+    assert (summary.rows, summary.cache_hits, summary.live_fetches) == (8, 8, 2)
+    assert summary.to_dict()["cache_hit_ratio"] == 0.8
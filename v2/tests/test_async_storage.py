@@ -0,0 +1,102 @@
+"""
+Tests for the async storage providers and the StorageManager async facade.
+"""
+
+import asyncio
+import os
+import pytest
+import subprocess
+import sys
+import tempfile
+from storage_providers.factory import StorageProviderFactory
+from storage_providers.local_provider import LocalStorageProvider
+from storage_providers.async_local_provider import AsyncLocalStorageProvider
+from storage_providers.instrumentation import AsyncInstrumentedStorageProvider
+from storage_manager import AsyncStorageManager
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for testing."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        yield tmp_dir
+
+@pytest.fixture
+def sync_provider(temp_dir):
+    """Create an initialized LocalStorageProvider rooted in a temporary directory."""
+    provider = LocalStorageProvider()
+    provider.initialize({
+        'base_path': temp_dir,
+        'cache_path': os.path.join(temp_dir, 'cache')
+    })
+    return provider
+
+@pytest.fixture
+def async_provider(sync_provider):
+    """Create an AsyncLocalStorageProvider sharing the sync provider's paths."""
+    return AsyncLocalStorageProvider(sync_provider)
+
+def test_write_and_read_roundtrip(async_provider, sync_provider):
+    """Test that async writes are visible to sync reads and vice versa."""
+    async def scenario():
+        assert await async_provider.write_file('EMP001/report.json', {'a': 1}, storage_type='cache')
+        assert sync_provider.read_file('EMP001/report.json', storage_type='cache') == {'a': 1}
+        sync_provider.write_file('EMP001/notes.txt', 'hello', storage_type='cache')
+        assert await async_provider.read_file('EMP001/notes.txt', storage_type='cache') == 'hello'
+    asyncio.run(scenario())
+
+def test_metadata_and_listing(async_provider):
+    """Test exists, size, modified time and listing."""
+    async def scenario():
+        await async_provider.write_file('EMP002/a.json', b'{}', storage_type='cache')
+        await async_provider.write_file('EMP002/b.txt', b'12345', storage_type='cache')
+        assert await async_provider.file_exists('EMP002/a.json', storage_type='cache')
+        assert not await async_provider.file_exists('EMP002/missing.json', storage_type='cache')
+        assert await async_provider.get_file_size('EMP002/b.txt', storage_type='cache') == 5
+        assert await async_provider.get_file_modified_time('EMP002/b.txt', storage_type='cache') > 0
+        files = await async_provider.list_files('EMP002', '*.json', storage_type='cache')
+        assert files == [os.path.join('EMP002', 'a.json')]
+    asyncio.run(scenario())
+
+def test_read_missing_file_raises(async_provider):
+    """Test that reading a missing file raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(async_provider.read_file('nope.json', storage_type='cache'))
+
+def test_delete_and_move(async_provider):
+    """Test deleting and moving files."""
+    async def scenario():
+        await async_provider.write_file('cache/x.txt', 'x')
+        assert await async_provider.move_file('cache/x.txt', 'cache/y.txt')
+        assert not await async_provider.file_exists('cache/x.txt')
+        assert await async_provider.delete_file('cache/y.txt')
+        assert not await async_provider.delete_file('cache/y.txt')
+    asyncio.run(scenario())
+
+def test_factory_reuses_sync_provider(sync_provider):
+    """Test that the factory builds an instrumented async counterpart of a sync provider."""
+    async_provider = StorageProviderFactory.create_async_provider({}, instrument=True, provider=sync_provider)
+    assert isinstance(async_provider, AsyncInstrumentedStorageProvider)
+    assert async_provider.provider.provider is sync_provider
+
+def test_async_storage_manager_errors(async_provider):
+    """Test that the async facade raises like StorageManager."""
+    manager = AsyncStorageManager(async_provider)
+    async def scenario():
+        assert await manager.write_file('cache/z.txt', 'z')
+        assert await manager.read_file('cache/z.txt') == 'z'
+        with pytest.raises(FileNotFoundError):
+            await manager.read_file('cache/missing.txt')
+        with pytest.raises(FileNotFoundError):
+            await manager.delete_file('cache/missing.txt')
+    asyncio.run(scenario())
+
+def test_sync_imports_do_not_load_async_dependencies():
+    """Test that importing the storage package and StorageManager leaves aiofiles and aiobotocore unloaded."""
+    code = ("import sys, storage_providers, storage_manager; "
+            "print(sorted(m for m in ('aiofiles', 'aiobotocore') if m in sys.modules))")
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).stdout
+    assert output.strip() == "[]"
+
+    import storage_providers
+    assert storage_providers.AsyncLocalStorageProvider is AsyncLocalStorageProvider
@@ -0,0 +1,87 @@
+"""
+Tests for the parallel batch engine.
+"""
+
+import io
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import main_batch_engine
+from main_batch_engine import BatchEngine
+from main_checkpoint import CommitWatermark
+from main_csv_processing import CSVProcessor
+from marshaller import HostRateLimiter
+
+
+def _processor(rows):
+    content = ("employee_number,first_name\n" + "\n".join(f"EMP{i},Name{i}" for i in range(rows))).encode()
+    storage_manager = MagicMock()
+    storage_manager.open_stream.side_effect = lambda path, storage_type=None, offset=0: io.BytesIO(content[offset:])
+    processor = CSVProcessor()
+    processor.set_storage_manager(storage_manager)
+    return processor, storage_manager
+
+
+def test_commit_watermark_waits_for_earlier_rows():
+    """Test that the watermark only advances over a contiguous prefix of finished rows."""
+    watermark = CommitWatermark(start_line=5, start_offset=50)
+    assert watermark.complete(7, 80) == 5
+    assert watermark.complete(5, 60) == 6
+    assert watermark.offset == 60
+    assert watermark.complete(6, 70) == 8
+    assert watermark.offset == 80
+
+
+def test_workers_use_own_facades_and_finish_every_row():
+    """Test that rows run concurrently on per-worker facades, and failures are counted."""
+    processor, storage_manager = _processor(12)
+    seen = []
+    lock = threading.Lock()
+
+    def process_row(row, facade, config, wait_time):
+        time.sleep(0.01)
+        with lock:
+            seen.append((row["employee_number"], threading.get_ident(), facade))
+        if row["employee_number"] == "EMP3":
+            raise RuntimeError("boom")
+
+    shared = MagicMock(name="shared")
+    created = []
+
+    def factory():
+        created.append(MagicMock(name=f"worker{len(created)}"))
+        return created[-1]
+
+    engine = BatchEngine(processor, storage_manager, {}, workers=3, facade=shared, facade_factory=factory)
+    with patch.object(processor, "process_row", side_effect=process_row), \
+         patch.object(main_batch_engine, "archive_file") as archive:
+        summary = engine.run(["a.csv", "b.csv"], last_csv="b.csv", last_line=10)
+
+    assert (summary.files, summary.rows, summary.succeeded, summary.failed) == (2, 14, 13, 1)
+    assert sorted(call.args[0] for call in archive.call_args_list) == ["a.csv", "b.csv"]
+    assert processor.current_line == 12
+    assert "3" in processor.skipped_records
+    facade_by_thread = {}
+    for _, thread_id, facade in seen:
+        assert facade_by_thread.setdefault(thread_id, facade) is facade
+    assert len(set(map(id, facade_by_thread.values()))) == len(facade_by_thread) <= 3
+    assert all(facade.cleanup.called for facade in created)
+    shared.cleanup.assert_not_called()
+
+
+def test_host_rate_limiter_spaces_requests_per_host():
+    """Test that requests to one host are spaced while other hosts are not delayed."""
+    limiter = HostRateLimiter(default_interval=0.0, intervals={"api.brokercheck.finra.org": 0.05})
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.acquire("api.brokercheck.finra.org")
+    assert time.monotonic() - start >= 0.1
+    assert limiter.acquire("www.sec.gov") == 0
+
+
+def test_host_rate_limiter_is_off_by_default():
+    """Test that live fetches outside a configured batch run are not throttled."""
+    limiter = HostRateLimiter()
+    for _ in range(3):
+        assert limiter.acquire("www.sec.gov") == 0
@@ -0,0 +1,105 @@
+"""
+Tests for claim-level lookup deduplication across a batch run.
+"""
+
+import io
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import main_batch_engine
+from main_batch_engine import BatchEngine
+from main_batch_planner import lookup_key, plan_rows
+from main_csv_processing import CSVProcessor
+from services import BatchLookupResults, FinancialServicesFacade, batch_lookup_context, claim_request_context
+
+
+def test_lookup_key_prefers_crd_then_name_and_org():
+    """Test that rows are grouped by CRD, else by normalized name plus organization."""
+    assert lookup_key({"crd_number": " 123 ", "first_name": "A"}, 0) == ("crd", "123")
+    assert lookup_key({"first_name": "Jane", "last_name": "Doe", "organization_name": "ACME  Corp"}, 1) == \
+        lookup_key({"individual_name": "jane doe", "organization_name": "acme corp"}, 2)
+    assert lookup_key({"first_name": "Jane", "last_name": "Doe"}, 3) == ("row", 3)
+
+
+def test_plan_counts_rows_per_lookup():
+    """Test that the plan reports unique lookups and releases a group after its last row."""
+    rows = [(0, {"crd_number": "1"}), (1, {"crd_number": "2"}), (2, {"crd_number": "1"})]
+    plan = plan_rows(rows, lambda row: row)
+    assert (plan.rows, plan.unique_lookups, plan.duplicate_rows) == (3, 2, 1)
+    assert plan.finish(("crd", "1")) is False
+    assert plan.finish(("crd", "1")) is True
+
+
+def test_concurrent_rows_fetch_once_and_get_copies():
+    """Test that concurrent rows share one fetch and each get their own copy of the result."""
+    lookups = BatchLookupResults()
+    calls = []
+    results = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"actions": [{"id": 1}]}
+
+    def row():
+        with batch_lookup_context(lookups, ("crd", "1")), claim_request_context():
+            results.append(FinancialServicesFacade._memoized(("FINRA_Disciplinary", "Jane", "Doe"), fetch))
+
+    threads = [threading.Thread(target=row) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1 and lookups.fetches == 1 and lookups.reused == 3
+    assert all(result == {"actions": [{"id": 1}]} for result in results)
+    assert len(set(map(id, results))) == 4
+    lookups.release(("crd", "1"))
+    assert len(lookups) == 0
+
+
+def test_results_kept_while_another_group_needs_them():
+    """Test that releasing one group keeps results another pending group also used."""
+    lookups = BatchLookupResults()
+    with batch_lookup_context(lookups, "a"):
+        FinancialServicesFacade._memoized(("SEC_Arbitration", "Jane", "Doe"), lambda: {"n": 1})
+    with batch_lookup_context(lookups, "b"):
+        FinancialServicesFacade._memoized(("SEC_Arbitration", "Jane", "Doe"), lambda: {"n": 2})
+    lookups.release("a")
+    assert len(lookups) == 1
+    lookups.release("b")
+    assert len(lookups) == 0
+
+
+def test_engine_fetches_each_unique_crd_once():
+    """Test that repeated individuals in a drop are fetched once and every row still gets a report."""
+    crds = ["111", "222", "111", "111", "222"]
+    content = ("employee_number,crd_number\n" + "\n".join(f"EMP{i},{crd}" for i, crd in enumerate(crds))).encode()
+    storage_manager = MagicMock()
+    storage_manager.open_stream.side_effect = lambda path, storage_type=None, offset=0: io.BytesIO(content[offset:])
+    processor = CSVProcessor()
+    processor.set_storage_manager(storage_manager)
+    facade = FinancialServicesFacade(storage_manager=storage_manager)
+    reports = {}
+    lock = threading.Lock()
+
+    def process_row(row, facade, config, wait_time):
+        with claim_request_context():
+            record = facade.search_finra_brokercheck_individual(row["crd_number"], row["employee_number"])
+        with lock:
+            reports[row["employee_number"]] = record
+
+    engine = BatchEngine(processor, storage_manager, {}, workers=3, facade=facade, facade_factory=lambda: facade)
+    with patch.object(processor, "process_row", side_effect=process_row), \
+         patch.object(main_batch_engine, "archive_file"), \
+         patch("services.fetch_agent_finra_bc_search", side_effect=lambda emp, params: {"crd": params["crd_number"]}) as search, \
+         patch("services.fetch_agent_finra_bc_detailed", return_value=None), \
+         patch.object(FinancialServicesFacade, "_normalize_individual_record",
+                      side_effect=lambda source, basic, detailed=None: {"source": source, "basic": basic}):
+        summary = engine.run(["drop.csv"])
+
+    assert sorted(call.args[1]["crd_number"] for call in search.call_args_list) == ["111", "222"]
+    assert (summary.rows, summary.unique_lookups, summary.reused_searches) == (5, 2, 3)
+    assert reports["EMP3"] == {"source": "FINRA_BrokerCheck", "basic": {"crd": "111"}}
+    assert len(reports) == 5
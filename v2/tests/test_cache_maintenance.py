@@ -0,0 +1,95 @@
+"""
+Tests for the parallel cache maintenance engine.
+"""
+
+import json
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from cache_manager.cache_operations import CacheManager
+from cache_manager.maintenance import CacheMaintenanceEngine, S3_DELETE_BATCH_SIZE
+
+
+@pytest.fixture
+def cache_folder():
+    """Create a cache with one stale and one fresh agent file per employee plus a compliance report."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        folder = Path(tmp_dir)
+        old = time.time() - 200 * 86400
+        for emp in ("EMP001", "EMP002"):
+            agent = folder / emp / "SEC_IAPD_Agent"
+            agent.mkdir(parents=True)
+            stale = agent / "stale.json"
+            stale.write_text("{}")
+            os.utime(stale, (old, old))
+            (agent / "fresh.json").write_text("{}")
+            report = folder / emp / "ComplianceReportAgent_REF-1_v1_20250308.json"
+            report.write_text("{}")
+            os.utime(report, (old, old))
+        yield folder
+
+
+def test_cleanup_stale_dry_run_and_delete(cache_folder):
+    """Test that dry runs only count and real runs delete stale agent files."""
+    manager = CacheManager(cache_folder)
+    dry = json.loads(manager.cleanup_stale_cache(dry_run=True))
+    assert dry["matched_files"] == 2
+    assert dry["deleted_files"] == 0
+    assert (cache_folder / "EMP001" / "SEC_IAPD_Agent" / "stale.json").exists()
+
+    result = json.loads(manager.cleanup_stale_cache())
+    assert result["status"] == "success"
+    assert result["deleted_files"] == 2
+    assert result["progress"]["scanned_files"] == 4
+    assert not (cache_folder / "EMP001" / "SEC_IAPD_Agent" / "stale.json").exists()
+    assert (cache_folder / "EMP001" / "SEC_IAPD_Agent" / "fresh.json").exists()
+    assert (cache_folder / "EMP001" / "ComplianceReportAgent_REF-1_v1_20250308.json").exists()
+
+
+def test_clear_all_in_background(cache_folder):
+    """Test that a background clear-all job reports a summary when finished."""
+    manager = CacheManager(cache_folder)
+    job_id = json.loads(manager.start_maintenance("clear_all"))["job_id"]
+    job = manager.maintenance.get_job(job_id)
+    for _ in range(100):
+        if job.status in ("completed", "failed"):
+            break
+        time.sleep(0.05)
+    status = json.loads(manager.get_maintenance_status(job_id))
+    assert status["status"] == "completed"
+    assert status["cleared_agents"] == 2
+    assert status["deleted_files"] == 4
+    assert not (cache_folder / "EMP001" / "SEC_IAPD_Agent").exists()
+    assert (cache_folder / "EMP002" / "ComplianceReportAgent_REF-1_v1_20250308.json").exists()
+
+
+def test_unknown_operation_and_job(cache_folder):
+    """Test error reporting for bad operations and job ids."""
+    manager = CacheManager(cache_folder)
+    assert json.loads(manager.start_maintenance("purge"))["status"] == "error"
+    assert json.loads(manager.get_maintenance_status("missing"))["status"] == "warning"
+
+
+def test_s3_cleanup_batches_deletes():
+    """Test that stale S3 objects are deleted with batched DeleteObjects calls."""
+    old = datetime.now(timezone.utc) - timedelta(days=200)
+    contents = [{"Key": f"milton/cache/EMP{i:04d}/SEC_IAPD_Agent/a.json", "LastModified": old, "Size": 10}
+                for i in range(S3_DELETE_BATCH_SIZE + 5)]
+    contents.append({"Key": "milton/cache/EMP0001/ComplianceReportAgent_REF-1_v1_20250308.json", "LastModified": old, "Size": 10})
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.return_value = [{"Contents": contents}]
+    client.delete_objects.return_value = {}
+
+    engine = CacheMaintenanceEngine(Path("unused"), s3_client=client, bucket_name="bucket", cache_prefix="milton/cache/")
+    job = engine.run("cleanup_stale")
+    assert job.status == "completed"
+    assert job.deleted_files == S3_DELETE_BATCH_SIZE + 5
+    assert client.delete_objects.call_count == 2
+    deleted_keys = [obj["Key"] for call in client.delete_objects.call_args_list for obj in call.kwargs["Delete"]["Objects"]]
+    assert not any("ComplianceReportAgent" in key for key in deleted_keys)
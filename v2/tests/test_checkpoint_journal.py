@@ -0,0 +1,106 @@
+"""
+Tests for the per-row checkpoint journal.
+"""
+
+import io
+import json
+from unittest.mock import patch
+
+import main_batch_engine
+from main_batch_engine import BatchEngine
+from main_checkpoint import CheckpointJournal, journal_path
+from main_csv_processing import CSVProcessor
+
+
+class MemoryStorage:
+    """Storage manager stand-in keeping files in a dict."""
+
+    def __init__(self, files=None):
+        self.files = dict(files or {})
+        self.writes = []
+
+    def file_exists(self, path, storage_type=None):
+        return (storage_type, path) in self.files
+
+    def read_file(self, path, storage_type=None):
+        return self.files[(storage_type, path)]
+
+    def write_file(self, path, content, storage_type=None):
+        self.files[(storage_type, path)] = content
+        self.writes.append(path)
+        return True
+
+    def open_stream(self, path, storage_type=None, offset=0):
+        return io.BytesIO(self.files[(storage_type, path)][offset:])
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_commits_are_batched_by_rows_and_time():
+    """Test that the journal writes every N rows or T seconds, alternating slots."""
+    storage, clock = MemoryStorage(), FakeClock()
+    journal = CheckpointJournal(storage, "drop.csv", commit_rows=3, commit_seconds=10, clock=clock)
+    journal.record(1, 20)
+    journal.record(0, 10)
+    assert storage.writes == []
+    journal.record(2, 30)
+    assert storage.writes == [journal_path("drop.csv", 1)]
+    clock.now = 11
+    journal.record(4, 50)
+    assert storage.writes == [journal_path("drop.csv", 1), journal_path("drop.csv", 0)]
+
+
+def test_resume_skips_rows_finished_out_of_order():
+    """Test that a reloaded journal knows the watermark and the rows done beyond it."""
+    storage = MemoryStorage()
+    journal = CheckpointJournal(storage, "drop.csv", commit_rows=1)
+    for line in (0, 1, 3, 5):
+        journal.record(line, line * 10 + 10, failed=(line == 5))
+
+    restored = CheckpointJournal.load(storage, "drop.csv")
+    assert (restored.watermark.line, restored.watermark.offset) == (2, 20)
+    assert [line for line in range(7) if not restored.is_done(line)] == [2, 4, 6]
+    assert restored.failed == [5]
+
+
+def test_torn_slot_falls_back_and_complete_resets():
+    """Test that an unreadable newest slot falls back to the other, and a completed file starts over."""
+    storage = MemoryStorage()
+    journal = CheckpointJournal(storage, "drop.csv", commit_rows=1)
+    journal.record(0, 10)
+    journal.record(1, 20)
+    storage.files[("output", journal_path("drop.csv", journal.sequence % 2))] = '{"csv_file": "drop.csv", "seq'
+    assert CheckpointJournal.load(storage, "drop.csv").watermark.line == 1
+
+    journal.complete()
+    restored = CheckpointJournal.load(storage, "drop.csv")
+    assert not restored.has_progress
+    assert restored.sequence == journal.sequence
+
+
+def test_engine_resumes_from_journal():
+    """Test that a restarted batch only processes the rows the journal lacks."""
+    content = ("employee_number\n" + "\n".join(f"EMP{i}" for i in range(6))).encode()
+    storage = MemoryStorage({("input", "drop.csv"): content})
+    journal = CheckpointJournal(storage, "drop.csv", commit_rows=1)
+    for line in (0, 1, 4):
+        journal.record(line)
+
+    processor = CSVProcessor()
+    processor.set_storage_manager(storage)
+    processed = []
+    engine = BatchEngine(processor, storage, {}, workers=2, facade_factory=lambda: None)
+    with patch.object(processor, "process_row", side_effect=lambda row, *args: processed.append(row["employee_number"])), \
+         patch.object(main_batch_engine, "archive_file"):
+        summary = engine.run(["drop.csv"], last_csv="drop.csv", last_line=1)
+
+    assert sorted(processed) == ["EMP2", "EMP3", "EMP5"]
+    assert (summary.rows, summary.resumed) == (3, 1)
+    final = json.loads(storage.files[("output", journal_path("drop.csv", engine.processor.checkpoint_journal.sequence % 2))])
+    assert final["complete"] and final["line_number"] == 6
@@ -0,0 +1,78 @@
+"""
+Tests for the per-claim request context that memoizes facade search results.
+"""
+
+from unittest.mock import patch
+
+import business
+from services import FinancialServicesFacade, claim_request_context
+
+BC_BASIC = {"hits": {"total": 1, "hits": [{"_source": {"content": "{}"}}]}}
+
+
+def _patch_fetchers():
+    """Patch the BrokerCheck and IAPD fetchers and normalizer, returning the started mocks."""
+    patches = {
+        "bc_search": patch("services.fetch_agent_finra_bc_search", return_value=BC_BASIC),
+        "bc_detailed": patch("services.fetch_agent_finra_bc_detailed", return_value={}),
+        "iapd_search": patch("services.fetch_agent_sec_iapd_search", return_value=None),
+        "iapd_detailed": patch("services.fetch_agent_sec_iapd_detailed", return_value=None),
+        "normalize": patch("services.create_individual_record",
+                           side_effect=lambda source, basic, detailed=None:
+                               {"fetched_name": "Jane Doe", "crd_number": "12345"} if basic else {"fetched_name": ""}),
+    }
+    return patches
+
+
+def test_searches_memoized_within_context():
+    """Test that each (source, CRD) pair is fetched and normalized once per claim."""
+    facade = FinancialServicesFacade()
+    patches = _patch_fetchers()
+    mocks = {name: p.start() for name, p in patches.items()}
+    try:
+        with claim_request_context():
+            first = facade.search_finra_brokercheck_individual("12345", "EMP001")
+            assert facade.search_finra_brokercheck_detailed("12345", "EMP001") is first
+            facade.search_sec_iapd_individual("12345", "EMP001")
+            facade.search_sec_iapd_detailed("12345", "EMP001")
+            facade.search_finra_brokercheck_individual("67890", "EMP001")
+        assert mocks["bc_search"].call_count == 2
+        assert mocks["bc_detailed"].call_count == 2
+        assert mocks["iapd_search"].call_count == 1
+        assert mocks["normalize"].call_count == 3
+
+        # Outside a claim context every call fetches again
+        facade.search_finra_brokercheck_individual("12345", "EMP001")
+        assert mocks["bc_search"].call_count == 3
+    finally:
+        for p in patches.values():
+            p.stop()
+
+
+def test_nested_context_shares_results():
+    """Test that a nested context reuses the outer claim's results."""
+    facade = FinancialServicesFacade()
+    with patch.object(facade, "_lookup_organization_crd", return_value="282563") as lookup:
+        with claim_request_context():
+            assert facade.get_organization_crd("Acme") == "282563"
+            with claim_request_context():
+                assert facade.get_organization_crd("Acme") == "282563"
+        assert lookup.call_count == 1
+
+
+def test_search_with_crd_only_fetches_each_source_once():
+    """Test that search_with_crd_only no longer re-runs the individual searches."""
+    facade = FinancialServicesFacade()
+    patches = _patch_fetchers()
+    mocks = {name: p.start() for name, p in patches.items()}
+    try:
+        claim = {"crd_number": "12345", "employee_number": "EMP001"}
+        result = business.search_with_crd_only(claim, facade, "EMP001")
+        assert result["source"] == "FINRA_BrokerCheck"
+        assert result["detailed_result"] is result["basic_result"]
+        assert mocks["bc_search"].call_count == 1
+        assert mocks["bc_detailed"].call_count == 1
+        assert mocks["iapd_search"].call_count == 1
+    finally:
+        for p in patches.values():
+            p.stop()
@@ -149,8 +149,8 @@ class TestComplianceReportAgent(unittest.TestCase):
         # Verify the result
         self.assertTrue(result)
         
-        # Verify write_file was called with correct data
-        write_call = self.mock_storage.write_file.call_args
+        # Verify write_file was called with correct data (the digest sidecar is written after the report)
+        write_call = self.mock_storage.write_file.call_args_list[0]
         self.assertIsNotNone(write_call)
         file_path = write_call[0][0]
         self.assertTrue(file_path.startswith("cache/EMP001/ComplianceReportAgent_TEST-001_v1_"))
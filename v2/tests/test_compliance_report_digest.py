@@ -0,0 +1,116 @@
+"""
+Tests for the report digest fast path in save_compliance_report.
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from agents.compliance_report_agent import digest_path, has_significant_changes, report_fingerprint, save_compliance_report
+
+
+class DictStorage:
+    """In-memory storage provider with the calls save_compliance_report uses."""
+
+    def __init__(self):
+        self.files = {}
+        self.list_files = Mock(side_effect=self._list_files)
+        self.read_file = Mock(side_effect=self._read_file)
+
+    def create_directory(self, path):
+        return True
+
+    def write_file(self, path, content):
+        self.files[path] = content
+        return True
+
+    def file_exists(self, path):
+        return path in self.files
+
+    def _read_file(self, path):
+        if path not in self.files:
+            raise FileNotFoundError(path)
+        return self.files[path]
+
+    def _list_files(self, directory, pattern):
+        prefix, suffix = pattern.split("*")
+        return [path.rsplit("/", 1)[1] for path in self.files
+                if path.startswith(f"{directory}/{prefix}") and path.endswith(suffix)]
+
+    def reports(self):
+        return sorted(path for path in self.files if "/ComplianceReportAgent_" in path)
+
+
+def _report(compliant=True, alerts=0):
+    return {
+        "reference_id": "TEST-001",
+        "claim": {"employee_number": "EMP001"},
+        "final_evaluation": {"overall_compliance": compliant, "alerts": [{"alert_type": "A"}] * alerts},
+        "license_evaluation": {"compliance": compliant},
+    }
+
+
+@pytest.fixture
+def storage():
+    storage = DictStorage()
+    with patch("agents.compliance_report_agent._storage_provider", storage), \
+         patch("agents.compliance_report_agent.update_report_index"):
+        yield storage
+
+
+def test_unchanged_resave_skips_listing_and_report_read(storage):
+    """Test that an unchanged re-run is answered by the digest alone."""
+    assert save_compliance_report(_report())
+    assert len(storage.reports()) == 1
+    storage.list_files.reset_mock()
+    storage.read_file.reset_mock()
+
+    assert save_compliance_report(_report())
+    storage.list_files.assert_not_called()
+    storage.read_file.assert_called_once_with(digest_path("cache/EMP001", "TEST-001"))
+    assert len(storage.reports()) == 1
+
+
+def test_changed_report_gets_next_version_from_digest(storage):
+    """Test that a change is versioned from the digest, and a stale digest falls back to listing."""
+    assert save_compliance_report(_report())
+    storage.list_files.reset_mock()
+    assert save_compliance_report(_report(alerts=1))
+    storage.list_files.assert_not_called()
+    assert [path.split("_")[2] for path in storage.reports()] == ["v1", "v2"]
+
+    # Digest lost or written by an older run: the listing path still decides and refreshes it
+    del storage.files[digest_path("cache/EMP001", "TEST-001")]
+    assert save_compliance_report(_report(alerts=1))
+    assert storage.list_files.call_count == 1
+    assert len(storage.reports()) == 2
+    assert json.loads(storage.files[digest_path("cache/EMP001", "TEST-001")])["latest_version"] == 2
+
+
+def test_first_save_does_not_read_missing_digest(storage):
+    """Test that a reference_id without a digest is not read, so no read error is logged or counted."""
+    assert save_compliance_report(_report())
+    assert digest_path("cache/EMP001", "TEST-001") not in [call.args[0] for call in storage.read_file.call_args_list]
+
+
+def test_missing_latest_report_is_recreated(storage):
+    """Test that a matching digest does not hide a report file that no longer exists."""
+    assert save_compliance_report(_report())
+    (report_path,) = storage.reports()
+    del storage.files[report_path]
+
+    assert save_compliance_report(_report())
+    assert storage.list_files.call_count == 2
+    assert storage.reports() == [report_path]
+
+
+@pytest.mark.parametrize("old,new", [
+    (_report(), _report()),
+    (_report(), _report(compliant=False)),
+    (_report(), _report(alerts=2)),
+    ({"reference_id": "TEST-001"}, _report()),
+])
+def test_fingerprint_agrees_with_significant_changes(old, new):
+    """Test that fingerprints differ exactly when has_significant_changes reports a change."""
+    assert (report_fingerprint(old) != report_fingerprint(new)) == has_significant_changes(new, old)
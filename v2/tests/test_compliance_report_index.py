@@ -0,0 +1,137 @@
+"""
+Tests for the compliance report index and the cache_manager queries it backs.
+"""
+
+import json
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import cache_manager.report_index as report_index
+from cache_manager.compliance_handler import ComplianceHandler
+from cache_manager.file_handler import FileHandler
+from cache_manager.report_index import ComplianceReportIndex, build_index_entry, index_compliance_report
+from cache_manager.summary_generator import SummaryGenerator
+
+
+def make_report(reference_id, employee_number, compliant=True, alerts=None, risk_level=None):
+    """Build a minimal compliance report."""
+    final_evaluation = {"overall_compliance": compliant, "alerts": alerts or []}
+    if risk_level:
+        final_evaluation["risk_level"] = risk_level
+    return {
+        "reference_id": reference_id,
+        "claim": {"employee_number": employee_number},
+        "final_evaluation": final_evaluation,
+        "name_evaluation": {"compliance": compliant, "compliance_explanation": "checked"}
+    }
+
+
+def write_report(cache_folder, employee_number, file_name, report):
+    """Write a report file the way save_compliance_report lays them out."""
+    emp_path = cache_folder / employee_number
+    emp_path.mkdir(parents=True, exist_ok=True)
+    (emp_path / file_name).write_text(json.dumps(report))
+
+
+@pytest.fixture
+def cache_folder():
+    """Create a temporary cache folder with reports saved before the index existed."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        folder = Path(tmp_dir)
+        write_report(folder, "EMP001", "ComplianceReportAgent_REF-1_v1_20250301.json", make_report("REF-1", "EMP001"))
+        write_report(folder, "EMP001", "ComplianceReportAgent_REF-1_v1_20250308.json",
+                     make_report("REF-1", "EMP001", compliant=False,
+                                 alerts=[{"description": "Individual not found", "severity": "High"}]))
+        yield folder
+
+
+def test_build_index_entry():
+    """Test that entries capture the summary fields and parse the file name."""
+    report = make_report("EN-53", "EMP001", compliant=False,
+                         alerts=[{"description": "a", "severity": "Low"}, {"description": "b", "severity": "Medium"}])
+    entry = build_index_entry(report, "EMP001", "ComplianceReportAgent_EN-53_v2_20250308.json")
+    assert entry["reference_id"] == "EN-53"
+    assert entry["version"] == 2
+    assert entry["date"] == "20250308"
+    assert entry["alert_count"] == 2
+    assert entry["max_severity"] == "Medium"
+    assert len(entry["subsections"]) == 9
+    assert build_index_entry(report, "EMP001", "notes.json") is None
+
+
+def test_index_rebuilds_and_appends(cache_folder):
+    """Test that the first write rebuilds the index and later writes are appended."""
+    write_report(cache_folder, "EMP002", "ComplianceReportAgent_REF-2_v1_20250309.json", make_report("REF-2", "EMP002"))
+    assert index_compliance_report(cache_folder, "EMP002", "ComplianceReportAgent_REF-2_v1_20250309.json",
+                                   make_report("REF-2", "EMP002"))
+
+    index = ComplianceReportIndex(cache_folder)
+    assert index.employees() == ["EMP001", "EMP002"]
+    assert index.latest_report("EMP001")["file_name"] == "ComplianceReportAgent_REF-1_v1_20250308.json"
+
+    report = make_report("REF-3", "EMP002", risk_level="Medium")
+    write_report(cache_folder, "EMP002", "ComplianceReportAgent_REF-3_v1_20250310.json", report)
+    index_compliance_report(cache_folder, "EMP002", "ComplianceReportAgent_REF-3_v1_20250310.json", report)
+    assert [e["reference_id"] for e in index.latest_reports("EMP002")] == ["REF-2", "REF-3"]
+
+
+def test_report_saved_during_first_rebuild_is_kept(cache_folder, monkeypatch):
+    """Test that a writer racing the first-time rebuild is appended after it, not replaced by it."""
+    scanning = threading.Event()
+    build_entry = report_index.build_index_entry
+
+    def slow_build(report, employee_number, file_name, last_modified=None):
+        if last_modified is not None and threading.current_thread().name == "writer-a":
+            scanning.set()
+            time.sleep(0.1)
+        return build_entry(report, employee_number, file_name, last_modified)
+
+    monkeypatch.setattr(report_index, "build_index_entry", slow_build)
+    name_a, name_b = "ComplianceReportAgent_REF-A_v1_20250309.json", "ComplianceReportAgent_REF-B_v1_20250309.json"
+    write_report(cache_folder, "EMP00A", name_a, make_report("REF-A", "EMP00A"))
+    writer_a = threading.Thread(name="writer-a", target=index_compliance_report,
+                                args=(cache_folder, "EMP00A", name_a, make_report("REF-A", "EMP00A")))
+    writer_a.start()
+    assert scanning.wait(5)
+    write_report(cache_folder, "EMP00Z", name_b, make_report("REF-B", "EMP00Z"))
+    assert index_compliance_report(cache_folder, "EMP00Z", name_b, make_report("REF-B", "EMP00Z"))
+    writer_a.join()
+
+    index = ComplianceReportIndex(cache_folder)
+    assert {"EMP00A", "EMP00Z"} <= set(index.employees())
+
+
+def test_compliance_handler_uses_index(cache_folder):
+    """Test latest/by-ref/list queries against the index."""
+    handler = ComplianceHandler(cache_folder)
+    latest = json.loads(handler.get_latest_compliance_report("EMP001"))
+    assert latest["status"] == "success"
+    assert latest["report"]["final_evaluation"]["overall_compliance"] is False
+
+    by_ref = json.loads(handler.get_compliance_report_by_ref("EMP001", "REF-1"))
+    assert by_ref["message"].endswith("ComplianceReportAgent_REF-1_v1_20250308.json")
+
+    listing = json.loads(handler.list_compliance_reports())
+    assert [r["file_name"] for r in listing["reports"]["EMP001"]] == ["ComplianceReportAgent_REF-1_v1_20250308.json"]
+    assert json.loads(handler.list_compliance_reports("EMP001"))["pagination"]["total_items"] == 2
+
+
+def test_summaries_and_dashboard_skip_report_bodies(cache_folder, monkeypatch):
+    """Test that cross-employee summaries are answered without reading report files."""
+    handler = ComplianceHandler(cache_folder)
+    handler.index.rebuild()
+    generator = SummaryGenerator(FileHandler(cache_folder), handler)
+    monkeypatch.setattr(FileHandler, "read_json", lambda self, path: pytest.fail(f"read {path}"))
+
+    summary = json.loads(generator.generate_all_compliance_summaries(cache_folder))
+    assert summary["pagination"]["total_items"] == 2
+    assert {entry["subsection"] for entry in summary["subsection_summary"]} >= {"name_evaluation"}
+
+    dashboard = generator.generate_risk_dashboard()
+    assert "High Risk: 1 employees (100%)" in dashboard
+    assert "EMP001: 1 alert (severity: High)" in dashboard
+    assert '"Individual not found" (1 occurrence)' in dashboard
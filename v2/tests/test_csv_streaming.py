@@ -0,0 +1,104 @@
+"""
+Tests for streaming CSV rows with byte-offset resume.
+"""
+
+import csv
+import io
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from main_csv_processing import CSVProcessor, OffsetLines
+from main_file_utils import load_checkpoint, load_checkpoint_state, save_checkpoint
+from storage_providers.local_provider import LocalStorageProvider
+from storage_providers.s3_provider import S3StorageProvider
+
+CONTENT = (
+    'employee_number,first_name,notes\r\n'
+    'EMP0,Ann,plain\r\n'
+    '\r\n'
+    'EMP1,Bob,"two\r\nlines"\r\n'
+    'EMP2,Cy,"quoted, comma"\r\n'
+    'EMP3,Dé,last'
+).encode('utf-8')
+
+
+def _processor(opened=None):
+    storage_manager = MagicMock()
+
+    def open_stream(path, storage_type=None, offset=0):
+        if opened is not None:
+            opened.append(offset)
+        return io.BytesIO(CONTENT[offset:])
+
+    storage_manager.open_stream.side_effect = open_stream
+    processor = CSVProcessor()
+    processor.set_storage_manager(storage_manager)
+    return processor
+
+
+def test_rows_match_whole_file_parse():
+    """Test that streamed rows equal the old decode/splitlines parse, with offsets at row ends."""
+    rows = list(_processor().iter_rows("drop.csv"))
+    expected = list(csv.DictReader(CONTENT.decode('utf-8').splitlines()))
+    assert [row for _, row, _ in rows] == expected[:1] + [{**expected[1], "notes": "two\r\nlines"}] + expected[2:]
+    assert [line for line, _, _ in rows] == [0, 1, 2, 3]
+    assert rows[-1][2] == len(CONTENT)
+    assert CONTENT[rows[0][2]:].startswith(b'\r\nEMP1')
+
+
+def test_resume_from_byte_offset_skips_reparsing():
+    """Test that resuming with a byte offset seeks past the done rows and keeps line numbers."""
+    offsets = [offset for _, _, offset in _processor().iter_rows("drop.csv")]
+    opened = []
+    resumed = list(_processor(opened).iter_rows("drop.csv", start_line=2, byte_offset=offsets[1]))
+    assert opened == [0, offsets[1]]
+    assert [(line, row["employee_number"]) for line, row, _ in resumed] == [(2, "EMP2"), (3, "EMP3")]
+    # Without an offset the skipped rows are parsed again
+    assert [line for line, _, _ in _processor().iter_rows("drop.csv", start_line=2)] == [2, 3]
+
+
+def test_offset_lines_handles_small_chunks():
+    """Test line splitting when chunks cut through lines and multi-byte characters."""
+    lines = OffsetLines(io.BytesIO(CONTENT), chunk_size=3)
+    assert "".join(lines).encode('utf-8') == CONTENT
+    assert lines.offset == len(CONTENT)
+
+
+def test_checkpoint_keeps_byte_offset():
+    """Test that the checkpoint round-trips the byte offset next to the line number."""
+    storage_manager = MagicMock()
+    save_checkpoint("drop.csv", 3, storage_manager, byte_offset=120)
+    written = storage_manager.write_file.call_args[0][1]
+    storage_manager.file_exists.return_value = True
+    storage_manager.read_file.return_value = written
+    assert load_checkpoint_state(storage_manager) == {"csv_file": "drop.csv", "line_number": 3, "byte_offset": 120}
+    assert load_checkpoint(storage_manager) == ("drop.csv", 3)
+
+
+def test_local_provider_open_stream_seeks(tmp_path):
+    """Test that the local provider opens input files positioned at the offset."""
+    provider = LocalStorageProvider()
+    provider.initialize({'base_path': str(tmp_path)})
+    (tmp_path / 'input' / 'drop.csv').write_bytes(CONTENT)
+    with provider.open_stream('drop.csv', storage_type='input', offset=10) as stream:
+        assert stream.read() == CONTENT[10:]
+    with pytest.raises(FileNotFoundError):
+        provider.open_stream('missing.csv', storage_type='input')
+
+
+def test_s3_provider_open_stream_uses_ranged_get():
+    """Test that the S3 provider streams the body and asks for a byte range when resuming."""
+    provider = S3StorageProvider()
+    provider.bucket_name = 'bucket'
+    provider.base_prefix = ''
+    provider.input_prefix = 'input/'
+    provider.s3_client = Mock()
+    body = io.BytesIO(CONTENT[10:])
+    provider.s3_client.get_object.return_value = {'Body': body}
+    assert provider.open_stream('drop.csv', storage_type='input', offset=10) is body
+    provider.s3_client.get_object.assert_called_once_with(Bucket='bucket', Key='input/drop.csv', Range='bytes=10-')
+
+    provider.s3_client.get_object.side_effect = ClientError({'Error': {'Code': 'InvalidRange'}}, 'GetObject')
+    assert provider.open_stream('drop.csv', storage_type='input', offset=len(CONTENT)).read() == b''
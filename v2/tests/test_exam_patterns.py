@@ -0,0 +1,44 @@
+"""
+Tests for the compiled exam-pattern matcher.
+"""
+
+import pytest
+
+from exam_patterns import (
+    EXAM_TAXONOMY,
+    VALID_EXAM_PATTERNS,
+    _classify_exam_loop,
+    classify_exam,
+    get_passed_exams,
+    is_valid_exam_category,
+)
+
+
+@pytest.mark.parametrize("category", EXAM_TAXONOMY + [
+    "series 65", "SERIES 7TO", "Series 7 and Series 66", "Series 63 / SIE", "Series 86/87 (Part 1)"
+])
+def test_classify_matches_per_pattern_search(category):
+    """Test that the compiled matcher agrees with trying each pattern in turn."""
+    assert classify_exam(category) == _classify_exam_loop(category)
+
+
+def test_longest_pattern_wins():
+    """Test pattern priority independent of position in the category."""
+    assert classify_exam("Series 7TO") == "Series 7TO"
+    assert classify_exam("Series 7 and Series 66") == "Series 66"
+    assert classify_exam("Series 79TO") == "Series 7"
+    assert classify_exam("F04") is None
+
+
+def test_get_passed_exams():
+    """Test accumulation of passed exams, skipping unknown and missing categories."""
+    exams = [
+        {"examCategory": "Series 7"},
+        {"examCategory": "Series 63"},
+        {"examCategory": "F04"},
+        {"examCategory": None},
+        {},
+    ]
+    assert get_passed_exams(exams) == {"Series 7", "Series 63"}
+    assert all(is_valid_exam_category(pattern) for pattern in VALID_EXAM_PATTERNS)
+    assert not is_valid_exam_category("")
@@ -0,0 +1,61 @@
+"""
+Tests for the precompiled CSV header mapping.
+"""
+
+import logging
+import random
+
+from main_config import canonical_fields
+from main_csv_processing import CSVProcessor, compile_header_map
+
+
+def _reference_extract(row):
+    """The per-row alias scan extract_data used before the header map."""
+    extracted = {}
+    for canonical_name, aliases in canonical_fields.items():
+        for alias in aliases:
+            if alias in row and row[alias]:
+                extracted[canonical_name] = row[alias]
+                break
+    for key, value in row.items():
+        if not any(key in aliases for aliases in canonical_fields.values()) and value:
+            extracted[key] = value
+    if 'reference_id' not in extracted and 'referenceId' in row:
+        extracted['reference_id'] = row['referenceId']
+    if 'crd_number' not in extracted and 'crdNumber' in row and row['crdNumber']:
+        extracted['crd_number'] = row['crdNumber']
+    if 'organization_crd' not in extracted and 'organizationCRD' in row and row['organizationCRD']:
+        extracted['organization_crd'] = row['organizationCRD']
+    return extracted
+
+
+def test_extract_data_matches_alias_scan():
+    """Test that the compiled mapping extracts exactly what the alias scan did."""
+    rng = random.Random(7)
+    columns = [alias for aliases in canonical_fields.values() for alias in aliases]
+    columns += ['crdNumber', 'custom_note', 'Employee Num']
+    processor = CSVProcessor()
+    for _ in range(200):
+        header = rng.sample(columns, rng.randint(1, 25))
+        row = {column: rng.choice(['', 'x', 'y', '123']) for column in header}
+        assert processor.extract_data(row) == _reference_extract(row)
+
+
+def test_header_map_compiled_once_per_layout():
+    """Test that rows with the same columns share one compiled map."""
+    compile_header_map.cache_clear()
+    processor = CSVProcessor()
+    processor.extract_data({'firstName': 'Ann', 'CRD': '1', 'note': 'a'})
+    processor.extract_data({'firstName': 'Bob', 'CRD': '', 'note': ''})
+    assert compile_header_map.cache_info().misses == 1
+    header_map = compile_header_map(('firstName', 'CRD', 'note'))
+    assert header_map.canonical_columns == (('crd_number', ('CRD',)), ('first_name', ('firstName',)))
+    assert header_map.passthrough_columns == ('note',)
+
+
+def test_resolve_headers_logs_details_at_debug(caplog):
+    """Test that per-header mapping details stay out of INFO logs."""
+    with caplog.at_level(logging.INFO, logger='csv_processor'):
+        resolved = CSVProcessor().resolve_headers(['First Name', 'CRD Number', 'unknown_field'])
+    assert resolved == {'First Name': 'first_name', 'CRD Number': 'crd_number', 'unknown_field': 'unknown_field'}
+    assert [record.levelno for record in caplog.records] == [logging.WARNING]
@@ -0,0 +1,92 @@
+"""
+Tests for the normalized individual record cache in normalizer.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+import normalizer
+from normalizer import clear_individual_record_cache, create_individual_record
+
+
+IAPD_CONTENT = {
+    "disclosures": [{"disclosureType": "Regulatory"}],
+    "arbitrations": [],
+    "stateExamCategory": [{"examCategory": "Series 63"}],
+    "currentIAEmployments": [{"firmId": 1, "firmName": "Acme Advisors", "branchOfficeLocations": []}],
+    "previousEmployments": [
+        {"firmId": 2, "firmName": "Old Firm", "registrationEndDate": "01/01/2001"},
+        {"firmId": 3, "firmName": "Recent Firm", "registrationEndDate": "01/01/2020"},
+    ],
+}
+
+BASIC_INFO = {"hits": {"hits": [{"_source": {
+    "ind_firstname": "Mark", "ind_lastname": "Miller", "ind_source_id": 12345,
+    "ind_bc_scope": "Active", "ind_ia_scope": "Active", "iacontent": "{}"
+}}]}}
+
+DETAILED_INFO = {"hits": {"hits": [{"_source": {"iacontent": json.dumps(IAPD_CONTENT)}}]}}
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_individual_record_cache()
+    yield
+    clear_individual_record_cache()
+
+
+def test_nested_iapd_payload_is_parsed_once():
+    """Test that repeated normalization of the same payload reuses the parsed record."""
+    basic_copy, detailed_copy = json.loads(json.dumps(BASIC_INFO)), json.loads(json.dumps(DETAILED_INFO))
+    with patch.object(normalizer.json, "loads", wraps=json.loads) as loads:
+        first = create_individual_record("IAPD", BASIC_INFO, DETAILED_INFO)
+        second = create_individual_record("IAPD", basic_copy, detailed_copy)
+    assert loads.call_count == 1
+    assert first == second
+    assert first["fetched_name"] == "MARK MILLER"
+    assert first["crd_number"] == "12345"
+    assert [emp["firm_name"] for emp in first["employments"]] == ["Acme Advisors", "Recent Firm"]
+    assert first["exams"] == [{"examCategory": "Series 63"}]
+
+
+def test_cached_records_do_not_share_top_level_containers():
+    """Test that callers can extend a returned record without affecting later hits."""
+    first = create_individual_record("IAPD", BASIC_INFO, DETAILED_INFO)
+    first["disclosures"].append({"disclosureType": "Injected"})
+    first["fetched_name"] = "CHANGED"
+    second = create_individual_record("IAPD", BASIC_INFO, DETAILED_INFO)
+    assert second["disclosures"] == IAPD_CONTENT["disclosures"]
+    assert second["fetched_name"] == "MARK MILLER"
+
+
+def test_cache_key_includes_source_and_payloads():
+    """Test that different sources or payloads are normalized separately."""
+    iapd = create_individual_record("IAPD", BASIC_INFO, DETAILED_INFO)
+    basic_only = create_individual_record("IAPD", BASIC_INFO)
+    brokercheck = create_individual_record("FINRA_BrokerCheck", BASIC_INFO, DETAILED_INFO)
+    assert iapd["employments"] and not basic_only["employments"]
+    assert brokercheck["source"] == "FINRA_BrokerCheck"
+
+
+def test_cache_is_bounded():
+    """Test that the least recently used records are evicted."""
+    with patch.object(normalizer, "INDIVIDUAL_RECORD_CACHE_SIZE", 2):
+        for crd in (1, 2, 3):
+            basic = {"hits": {"hits": [{"_source": {"ind_firstname": "A", "ind_source_id": crd}}]}}
+            create_individual_record("IAPD", basic)
+    assert len(normalizer._individual_record_cache) == 2
+
+
+def test_fingerprint_does_not_serialize_payload():
+    """Test that cache keys are built without serializing the payload, yet tell payloads apart."""
+    with patch.object(normalizer.json, "dumps", wraps=json.dumps) as dumps:
+        create_individual_record("IAPD", BASIC_INFO, DETAILED_INFO)
+        create_individual_record("IAPD", BASIC_INFO, DETAILED_INFO)
+    dumps.assert_not_called()
+
+    fingerprint = normalizer._payload_fingerprint
+    assert fingerprint(DETAILED_INFO) == fingerprint(json.loads(json.dumps(DETAILED_INFO)))
+    assert fingerprint({"id": 1}) != fingerprint({"id": True})
+    assert fingerprint({"content": "{\"a\": 1}"}) != fingerprint({"content": "{\"a\": 2}"})
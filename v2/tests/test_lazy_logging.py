@@ -0,0 +1,68 @@
+"""
+Tests for the lazy log payloads and runtime level control in logger_config.
+"""
+
+import logging
+
+from logger_config import LazyFormat, LazyJson, set_log_level
+
+
+class CountingDumps:
+    """json.dumps stand-in that counts how often it is called."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, obj, **kwargs):
+        self.calls += 1
+        return f"dumped:{obj}"
+
+
+def test_payload_not_serialized_when_level_disabled(caplog):
+    """Test that a suppressed debug record never serializes its payload."""
+    dumps = CountingDumps()
+    logger = logging.getLogger("test_lazy_logging.disabled")
+    with caplog.at_level(logging.INFO, logger="test_lazy_logging.disabled"):
+        logger.debug("Result: %s", LazyJson({"a": 1}, dumps=dumps))
+    assert dumps.calls == 0
+    assert caplog.records == []
+
+
+def test_payload_serialized_once_when_emitted(caplog):
+    """Test that an emitted payload is serialized once and reused across records."""
+    dumps = CountingDumps()
+    summary = LazyFormat("claim=%s, employee_number=%s", LazyJson({"a": 1}, dumps=dumps), "EMP001")
+    logger = logging.getLogger("test_lazy_logging.enabled")
+    with caplog.at_level(logging.DEBUG, logger="test_lazy_logging.enabled"):
+        logger.info("Selected search for %s", summary)
+        logger.info("Done for %s", summary)
+    assert [r.getMessage() for r in caplog.records] == [
+        "Selected search for claim=dumped:{'a': 1}, employee_number=EMP001",
+        "Done for claim=dumped:{'a': 1}, employee_number=EMP001",
+    ]
+    assert dumps.calls == 1
+
+
+def test_lazy_json_defaults_and_fallback():
+    """Test json.dumps formatting and the repr fallback for unserializable objects."""
+    assert str(LazyJson({"a": [1, 2]}, indent=2)) == '{\n  "a": [\n    1,\n    2\n  ]\n}'
+    assert str(LazyJson(None)) == "null"
+    unserializable = {"x": object()}
+    assert str(LazyJson(unserializable)) == repr(unserializable)
+
+
+def test_set_log_level_updates_grouped_loggers():
+    """Test that set_log_level changes the root and grouped logger levels."""
+    names = ["", "services", "evaluation_processor"]
+    saved = {name: logging.getLogger(name).level for name in names}
+    saved_handlers = [(h, h.level) for h in logging.getLogger().handlers]
+    try:
+        assert set_log_level("warning") == logging.WARNING
+        for name in names:
+            assert logging.getLogger(name).level == logging.WARNING
+    finally:
+        set_log_level(saved[""])
+        for name, level in saved.items():
+            logging.getLogger(name).setLevel(level)
+        for handler, level in saved_handlers:
+            handler.setLevel(level)
@@ -1,4 +1,5 @@
 import unittest
+import io
 import os
 import json
 import csv
@@ -102,7 +103,7 @@ class TestComplianceProcessor(unittest.TestCase):
     def test_process_csv(self, mock_save, mock_process_row):
         # Create a mock storage manager
         mock_storage_manager = MagicMock()
-        mock_storage_manager.read_file.return_value = b"first_name,crd_number\nJohn,12345"
+        mock_storage_manager.open_stream.return_value = io.BytesIO(b"first_name,crd_number\nJohn,12345")
         
         # Create a CSV processor and set the storage manager
         csv_processor = CSVProcessor()
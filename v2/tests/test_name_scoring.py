@@ -0,0 +1,118 @@
+"""
+Tests for batch name scoring and its use in the normalizer.
+"""
+
+import pytest
+
+from common_types import MatchThreshold
+from evaluation_processor import evaluate_name, evaluate_names_batch, score_name_pair, trace_name_scoring
+from normalizer import create_arbitration_record, create_disciplinary_record, create_regulatory_record
+
+
+CANDIDATES = [
+    "Mark Miller",
+    "MILLER, MARK",
+    "Marc Millar",
+    "M Miller",
+    "Mark Mill",
+    "Mark J Miller Jr",
+    "Acme Securities LLC",
+    "Miller",
+]
+
+
+@pytest.mark.parametrize("expected", ["Mark Miller", "Miller, Mark A", "Doug Smith"])
+def test_batch_matches_evaluate_name(expected, capsys):
+    """Test that batch scores equal the per-pair scores reported by evaluate_name."""
+    single = [evaluate_name(expected, candidate, [])[0]["all_matches"][0]["score"] for candidate in CANDIDATES]
+    assert evaluate_names_batch(expected, CANDIDATES) == single
+    assert [score_name_pair(expected, candidate) for candidate in CANDIDATES] == single
+
+
+def test_batch_empty():
+    """Test that an empty candidate list returns no scores."""
+    assert evaluate_names_batch("Mark Miller", []) == []
+
+
+def test_disciplinary_record_scores_respondents():
+    """Test that disciplinary normalization keeps records whose respondent matches."""
+    data = [
+        {"Case ID": "1", "Firms/Individuals": "Mark Miller"},
+        {"Case ID": "2", "Firms/Individuals": "Acme Securities LLC"},
+        {"Case ID": "3"},
+    ]
+    result = create_disciplinary_record("FINRA_Disciplinary", data, "Mark Miller", MatchThreshold.STRICT)
+    due_diligence = result["due_diligence"]
+    assert [action["case_id"] for action in result["actions"]] == ["1"]
+    assert due_diligence["names_found"] == ["Mark Miller", "Acme Securities LLC"]
+    assert due_diligence["name_scores"] == {"Mark Miller": 100.0}
+    assert due_diligence["names_pruned"] == 1
+    assert due_diligence["records_filtered"] == 2
+    assert due_diligence["status"] == "Exact matches found"
+
+
+def test_arbitration_record_stops_at_first_match():
+    """Test that arbitration normalization records the matching respondent."""
+    data = [{"Case Summary": {"Case Number": "9", "Respondent(s):": "Acme Corp, Mark Miller, Mark Millar"}}]
+    result = create_arbitration_record("FINRA_Arbitration", data, "Mark Miller", MatchThreshold.STRICT)
+    assert result["actions"][0]["matched_name"] == "Mark Miller"
+    assert result["due_diligence"]["names_found"] == ["Acme Corp", "Mark Miller"]
+
+
+def test_regulatory_record_matches_respondent():
+    """Test that an NFA record whose name matches the searched individual becomes an action."""
+    data = [{"result": [
+        {"NFA ID": "0001", "Name": "MILLER, MARK", "Regulatory Actions": "Yes", "Current Registration Types": "AP, Swap AP"},
+        {"NFA ID": "0002", "Name": "Bob Smith", "Regulatory Actions": "Yes"},
+        {"NFA ID": "0003", "Name": ""},
+    ]}]
+    result = create_regulatory_record("NFA_Regulatory", data, "Mark Miller", MatchThreshold.STRICT)
+    due_diligence = result["due_diligence"]
+    assert [action["nfa_id"] for action in result["actions"]] == ["0001"]
+    assert result["actions"][0]["details"]["registration_types"] == ["AP", "Swap AP"]
+    assert due_diligence["name_scores"]["MILLER, MARK"] == 100.0
+    assert "Bob Smith" in due_diligence["names_found"]
+    assert due_diligence["records_filtered"] == 2
+    assert due_diligence["status"] == "Exact matches found"
+
+
+def test_evaluate_name_is_silent_without_tracing(capsys):
+    """Test that evaluate_name writes nothing to stdout."""
+    evaluation, alert = evaluate_name("Mark Miller", "Mark Miller", ["Marc Millar"])
+    assert evaluation["compliance"] is True
+    assert alert is None
+    assert capsys.readouterr().out == ""
+
+
+def test_trace_name_scoring_collects_entries():
+    """Test that traces are recorded only inside trace_name_scoring()."""
+    with trace_name_scoring() as traces:
+        evaluate_name("Mark Miller", "Mark Miller", ["Acme Corp"], source="BrokerCheck")
+    assert [(t["candidate"], t["score"]) for t in traces] == [("Mark Miller", 100.0), ("Acme Corp", 0.0)]
+    assert traces[0]["expected_parts"]["last"] == "Miller"
+    assert traces[1]["source"] == "BrokerCheck"
+
+    evaluate_name("Mark Miller", "Mark Miller", [])
+    assert len(traces) == 2
+
+
+@pytest.mark.parametrize("threshold", list(MatchThreshold))
+def test_blocking_never_prunes_a_passing_candidate(threshold):
+    """Test that pruning only drops names scoring below the threshold and keeps other scores intact."""
+    names = CANDIDATES + ["Marcus Miler", "Mark Muller", "Mike Hiller", "Bob Smith", "Robert Smyth", "Rob Smithers"]
+    for expected in names:
+        if not expected:
+            continue
+        full = evaluate_names_batch(expected, names)
+        blocked = evaluate_names_batch(expected, names, threshold.value)
+        for name, score, pruned_score in zip(names, full, blocked):
+            if pruned_score is None:
+                assert score < threshold.value, (expected, name)
+            else:
+                assert pruned_score == score
+
+
+def test_blocking_prunes_unrelated_first_names():
+    """Test that a differing last name with an unrelated first name is pruned."""
+    assert evaluate_names_batch("Mark Miller", ["Bob Hiller", "Mark Hiller"], MatchThreshold.LENIENT.value) == \
+        [None, evaluate_names_batch("Mark Miller", ["Mark Hiller"])[0]]
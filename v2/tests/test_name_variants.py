@@ -0,0 +1,36 @@
+"""
+Tests for the precompiled nickname index used by name matching.
+"""
+
+from evaluation_processor import (
+    are_nicknames,
+    compile_nickname_index,
+    get_name_variants,
+    match_name_part
+)
+
+
+def test_compile_nickname_index():
+    """Test that variants include nicknames, formal names and the name itself."""
+    nicknames = {"robert": ["bob", "rob"], "roberta": ["bobbie"]}
+    reverse = {"bob": {"robert"}, "rob": {"robert"}, "bobbie": {"roberta"}}
+    variant_names, variant_ids = compile_nickname_index(nicknames, reverse)
+    assert variant_names["bob"] == frozenset({"bob", "robert"})
+    assert variant_names["robert"] == frozenset({"robert", "bob", "rob"})
+    assert variant_ids["bob"] & variant_ids["rob"]
+    assert variant_ids["bob"].isdisjoint(variant_ids["bobbie"])
+    assert "doug" in variant_names["douglas"]
+
+
+def test_get_name_variants_is_memoized():
+    """Test that repeated lookups return the same cached set."""
+    assert get_name_variants(" Douglas ") is get_name_variants("douglas")
+    assert get_name_variants("Zyxwvut") == frozenset({"zyxwvut"})
+
+
+def test_are_nicknames():
+    """Test nickname checks for known, unknown and identical names."""
+    assert are_nicknames("Douglas", "Doug")
+    assert are_nicknames("Zyxwvut", "zyxwvut ")
+    assert not are_nicknames("Zyxwvut", "Douglas")
+    assert match_name_part("doug", "Douglas A", "first") == 1.0
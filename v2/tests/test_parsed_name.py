@@ -0,0 +1,46 @@
+"""
+Tests for the memoized ParsedName parser in evaluation_processor.
+"""
+
+import jellyfish
+
+from evaluation_processor import ParsedName, extract_suffix, parse_name, parse_name_cached
+
+
+def test_parse_name_cached_returns_shared_instance():
+    """Test that the same string yields the same ParsedName object."""
+    first = parse_name_cached("Mark J Miller Jr")
+    assert parse_name_cached("Mark J Miller Jr") is first
+    assert isinstance(first, ParsedName)
+
+
+def test_parsed_name_precomputes_lowered_parts_and_keys():
+    """Test the lower-cased parts and NYSIIS keys carried by ParsedName."""
+    parsed = parse_name_cached("MARK JAMES MILLER")
+    assert (parsed.first, parsed.middle, parsed.last, parsed.suffix) == ("MARK", "JAMES", "MILLER", None)
+    assert (parsed.first_lower, parsed.middle_lower, parsed.last_lower) == ("mark", "james", "miller")
+    assert parsed.last_key == jellyfish.nysiis("miller")
+    assert parsed.middle_key == jellyfish.nysiis("james")
+    assert parsed["last"] == "MILLER"
+
+
+def test_parse_name_returns_independent_dicts():
+    """Test that parse_name keeps returning a fresh dict per call."""
+    parts = parse_name("Mark Miller")
+    assert parts == {"first": "Mark", "middle": None, "last": "Miller", "suffix": None}
+    parts["first"] = "changed"
+    assert parse_name("Mark Miller")["first"] == "Mark"
+
+
+def test_single_and_empty_names():
+    """Test names with no last name."""
+    assert parse_name_cached("Miller").last_lower is None
+    empty = parse_name_cached("")
+    assert empty.first is None and empty.last_key == ""
+
+
+def test_extract_suffix():
+    """Test suffix extraction with and without a separating space."""
+    assert extract_suffix("Miller III") == ("Miller", "III")
+    assert extract_suffix("Millerjr") == ("Miller", "JR")
+    assert extract_suffix("Miller") == ("Miller", None)
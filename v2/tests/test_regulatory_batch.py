@@ -0,0 +1,78 @@
+"""
+Tests for batched secondary NFA regulatory reviews.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import evaluation_processor
+import services_secondary
+from marshaller import build_cache_path, request_cache_path
+
+
+def _nfa_result(nfa_id):
+    """Raw NFA-by-ID result with one complete regulatory action."""
+    return [{"result": {"nfa_id": nfa_id, "regulatory_actions": [{
+        "Effective Date": "01/02/2020",
+        "Contributor": "NFA",
+        "Action Type": ["Fine"],
+        "Case Outcome": ["Fined"],
+        "Case #": f"CASE-{nfa_id}",
+    }]}}]
+
+
+def test_duplicates_and_cached_ids_share_one_browser():
+    """Test that each NFA ID is reviewed once and only uncached IDs are scraped, with one driver."""
+    cached = {"0002": _nfa_result("0002")}
+    with patch.object(services_secondary, "create_driver", return_value=MagicMock()) as create_driver, \
+         patch.object(services_secondary, "read_cached_result",
+                      side_effect=lambda agent, service, emp, params: cached.get(params["nfa_id"])), \
+         patch.object(services_secondary, "fetch_agent_nfa_id_search",
+                      side_effect=lambda emp, params, driver: _nfa_result(params["nfa_id"])) as fetch:
+        reviews = services_secondary.perform_regulatory_action_reviews(["0001", "0002", "0001", "0003"], "EMP001")
+
+    assert list(reviews) == ["0001", "0002", "0003"]
+    assert create_driver.call_count == 1
+    assert sorted(call.args[1]["nfa_id"] for call in fetch.call_args_list) == ["0001", "0003"]
+    assert reviews["0002"]["actions"][0]["case_number"] == "CASE-0002"
+    assert reviews["0003"]["due_diligence"]["nfa_regulatory_actions"]["status"] == "Actions appended"
+
+
+def test_all_cached_skips_browser_and_pool_splits_work():
+    """Test that no driver starts when everything is cached, and max_browsers bounds the pool."""
+    with patch.object(services_secondary, "create_driver") as create_driver, \
+         patch.object(services_secondary, "read_cached_result", return_value=_nfa_result("0001")):
+        review = services_secondary.perform_regulatory_action_review("0001", "EMP001")
+    assert create_driver.call_count == 0
+    assert len(review["actions"]) == 1
+
+    with patch.object(services_secondary, "create_driver", side_effect=lambda headless: MagicMock()) as create_driver, \
+         patch.object(services_secondary, "read_cached_result", return_value=None), \
+         patch.object(services_secondary, "fetch_agent_nfa_id_search", side_effect=RuntimeError("boom")):
+        reviews = services_secondary.perform_regulatory_action_reviews(["1", "2", "3"], "EMP001", max_browsers=2)
+    assert create_driver.call_count == 2
+    assert all(r["due_diligence"]["nfa_regulatory_actions"]["status"] == "Search failed: boom" for r in reviews.values())
+
+
+def test_evaluate_regulatory_batches_secondary_lookups():
+    """Test that evaluate_regulatory issues one batched lookup for all NFA IDs."""
+    actions = [
+        {"nfa_id": "0001", "details": {"action_type": "Regulatory"}},
+        {"nfa_id": "0002", "details": {"action_type": "Regulatory"}},
+    ]
+    batch = {
+        "0001": {"actions": [{"case_number": "C1", "effective_date": "2020", "case_outcome": ["Fined"]}]},
+        "0002": {"actions": []},
+    }
+    with patch.object(evaluation_processor, "perform_regulatory_action_reviews", return_value=batch) as reviews:
+        result = evaluation_processor.evaluate_regulatory(actions, "Jane Doe", employee_number="EMP001")
+    reviews.assert_called_once()
+    assert list(reviews.call_args.args[0]) == ["0001", "0002"]
+    assert "Case C1 on 2020: Fined" in result[0]["alerts"][0]["description"]
+
+
+def test_nfa_id_requests_get_their_own_cache_folder():
+    """Test that NFA-by-ID lookups are cached per NFA ID."""
+    base = build_cache_path("EMP001", "NFA_Basic_Agent", "search_nfa")
+    assert request_cache_path("NFA_Basic_Agent", "search_nfa", "EMP001", {"nfa_id": "0001"}) == base / "0001"
+    assert request_cache_path("NFA_Basic_Agent", "search_individual", "EMP001", {"nfa_id": "0001"}) == \
+        build_cache_path("EMP001", "NFA_Basic_Agent", "search_individual")
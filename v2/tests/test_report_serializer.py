@@ -0,0 +1,64 @@
+"""
+Tests for the shared report serializer.
+"""
+
+import json
+
+import pytest
+
+from evaluation_processor import Alert, AlertSeverity
+from report_serializer import AlertEncoder, dumps_bytes, json_dumps_with_alerts, to_serializable
+
+
+def _report():
+    """Report fragment holding Alert objects next to plain data."""
+    alert = Alert(
+        alert_type="Regulatory Disclosure",
+        severity=AlertSeverity.HIGH,
+        metadata={"record": {"nfa_id": "0001"}, "scores": [90.5, 10]},
+        description="Regulatory action found.",
+        alert_category="REGULATORY",
+        source="NFA"
+    )
+    return {
+        "reference_id": "EN-1",
+        "final_evaluation": {"overall_compliance": False, "alerts": [alert]},
+        "name_evaluation": {"name_scores": {"Jane Doe": 100.0}, "alerts": [alert.to_dict()]},
+        "exams": {"Series 7"},
+    }
+
+
+def _reference_dumps(obj, **kwargs):
+    """The stdlib encoder the modules used before (Alerts via to_dict, sets as lists)."""
+    class Encoder(json.JSONEncoder):
+        def default(self, o):
+            if isinstance(o, Alert):
+                return o.to_dict()
+            if isinstance(o, set):
+                return sorted(o)
+            return super().default(o)
+    return json.dumps(obj, cls=Encoder, **kwargs)
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_matches_stdlib_encoding(indent):
+    """Test that orjson output parses to the same document as the stdlib encoder."""
+    report = _report()
+    assert json.loads(dumps_bytes(report, indent=indent)) == json.loads(_reference_dumps(report, indent=indent))
+    if indent == 2:
+        assert json_dumps_with_alerts(report, indent=2) == _reference_dumps(report, indent=2)
+
+
+def test_alert_is_slotted():
+    """Test that Alert no longer carries a per-instance __dict__."""
+    alert = _report()["final_evaluation"]["alerts"][0]
+    assert not hasattr(alert, "__dict__")
+    assert to_serializable(alert) == alert.to_dict()
+
+
+def test_stdlib_fallback_for_unsupported_options():
+    """Test that options orjson cannot honour go through AlertEncoder."""
+    report = _report()
+    expected = json.dumps(report, cls=AlertEncoder, sort_keys=True)
+    assert json_dumps_with_alerts(report, sort_keys=True) == expected
+    assert json.loads(dumps_bytes({"big": 2 ** 70})) == {"big": 2 ** 70}
@@ -0,0 +1,162 @@
+"""
+Tests for the batch result sinks.
+"""
+
+import json
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from boto3.s3.transfer import TransferConfig
+
+from main_checkpoint import CheckpointJournal, journal_path
+from main_csv_processing import CSVProcessor
+from result_sink import JsonlPartSink, PerRecordSink, create_result_sink
+from storage_providers.s3_provider import S3StorageProvider
+
+
+class MemoryStorage:
+    """Storage manager stand-in keeping files in a dict; can slow down or fail writes."""
+
+    def __init__(self, delay=0.0, fail_paths=()):
+        self.files = {}
+        self.delay = delay
+        self.fail_paths = set(fail_paths)
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def write_file(self, path, content, storage_type=None):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            if path in self.fail_paths:
+                raise OSError(f"Error writing file {path}")
+            with self._lock:
+                self.files[(storage_type, path)] = content
+            return True
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def file_exists(self, path, storage_type=None):
+        return (storage_type, path) in self.files
+
+
+def _result(reference_id):
+    return {"reference_id": reference_id, "final_evaluation": {"overall_compliance": True}}
+
+
+def test_per_record_sink_keeps_file_layout():
+    """Test that the default sink writes one pretty-printed file per reference_id via the storage manager."""
+    storage = MemoryStorage()
+    processor = CSVProcessor()
+    processor.set_storage_manager(storage)
+    processor.save_result({"claim": {"reference_id": "EN/1:2"}, "value": 1})
+
+    content = storage.files[("output", "EN_1_2.json")]
+    assert json.loads(content) == {"claim": {"reference_id": "EN/1:2"}, "value": 1}
+    assert b"\n  " in content
+
+
+def test_jsonl_parts_and_manifest():
+    """Test that results are split into JSON Lines parts listed in the manifest."""
+    storage = MemoryStorage()
+    sink = JsonlPartSink(storage, run_id="run1", rows_per_part=2)
+    for index in range(5):
+        sink.write(_result(f"EN-{index}"))
+    manifest = sink.close()
+
+    assert [part["path"] for part in manifest["parts"]] == [
+        "results/run1/part-00000.jsonl", "results/run1/part-00001.jsonl", "results/run1/part-00002.jsonl"
+    ]
+    assert manifest["records"] == 5
+    assert manifest["parts"][2]["reference_ids"] == ["EN-4"]
+    lines = storage.files[("output", "results/run1/part-00001.jsonl")].splitlines()
+    assert [json.loads(line)["reference_id"] for line in lines] == ["EN-2", "EN-3"]
+    assert json.loads(storage.files[("output", "results/run1/manifest.json")]) == manifest
+
+
+def test_jsonl_uploads_are_bounded():
+    """Test that no more than max_concurrent_uploads parts are written at once."""
+    storage = MemoryStorage(delay=0.02)
+    sink = JsonlPartSink(storage, run_id="run1", rows_per_part=1, max_concurrent_uploads=2)
+    for index in range(8):
+        sink.write(_result(f"EN-{index}"))
+    assert sink.close()["records"] == 8
+    assert storage.peak <= 2
+
+
+def test_jsonl_failed_part_raises_on_flush():
+    """Test that a part that could not be written surfaces as OSError."""
+    storage = MemoryStorage(fail_paths={"results/run1/part-00000.jsonl"})
+    sink = JsonlPartSink(storage, run_id="run1")
+    sink.write(_result("EN-1"))
+    with pytest.raises(OSError):
+        sink.close()
+
+
+def test_journal_commit_waits_for_sink_flush():
+    """Test that rows are only committed once their buffered results are written."""
+    storage = MemoryStorage(fail_paths={"results/run1/part-00000.jsonl"})
+    sink = JsonlPartSink(storage, run_id="run1", rows_per_part=100)
+    journal = CheckpointJournal(storage, "drop.csv", commit_rows=1, before_commit=sink.flush)
+    sink.write(_result("EN-1"))
+    journal.record(0, 10)
+    assert not storage.file_exists(journal_path("drop.csv", 1), storage_type='output')
+
+    storage.fail_paths.clear()
+    sink.write(_result("EN-2"))
+    journal.record(1, 20)
+    assert storage.file_exists(journal_path("drop.csv", 1), storage_type='output')
+    assert storage.files[("output", "results/run1/part-00001.jsonl")].count(b"\n") == 1
+
+
+def test_failed_part_blocks_commits_until_written():
+    """Test that a lost part keeps failing later flushes, so no commit covers its rows, and is retried."""
+    storage = MemoryStorage(fail_paths={"results/run1/part-00000.jsonl"})
+    sink = JsonlPartSink(storage, run_id="run1", rows_per_part=2)
+    journal = CheckpointJournal(storage, "drop.csv", commit_rows=2, before_commit=sink.flush)
+    for line_number in range(4):
+        sink.write(_result(f"EN-{line_number}"))
+        journal.record(line_number, (line_number + 1) * 10)
+    assert not any(storage.file_exists(journal_path("drop.csv", slot), storage_type='output') for slot in (0, 1))
+    assert ("output", "results/run1/part-00001.jsonl") in storage.files
+
+    storage.fail_paths.clear()
+    assert journal.commit()
+    lines = storage.files[("output", "results/run1/part-00000.jsonl")].splitlines()
+    assert [json.loads(line)["reference_id"] for line in lines] == ["EN-0", "EN-1"]
+    assert sink.close()["records"] == 4
+
+
+def test_create_result_sink():
+    """Test that the sink is chosen from the configuration."""
+    storage = MemoryStorage()
+    assert isinstance(create_result_sink(storage, {}), PerRecordSink)
+    sink = create_result_sink(storage, {"result_sink": "jsonl", "result_rows_per_part": 10})
+    assert isinstance(sink, JsonlPartSink) and sink.rows_per_part == 10
+    sink.close()
+    with pytest.raises(ValueError):
+        create_result_sink(storage, {"result_sink": "parquet"})
+
+
+def test_s3_large_bodies_use_multipart_upload():
+    """Test that the S3 provider switches to a multipart upload above the threshold."""
+    provider = S3StorageProvider()
+    provider.bucket_name = 'bucket'
+    provider.output_prefix = 'output/'
+    provider.s3_client = Mock()
+    provider.transfer_config = TransferConfig(multipart_threshold=8, max_concurrency=2)
+
+    assert provider.write_file('small.json', b'{}', storage_type='output')
+    provider.s3_client.put_object.assert_called_once_with(Bucket='bucket', Key='output/small.json', Body=b'{}')
+
+    assert provider.write_file('part.jsonl', b'x' * 16, storage_type='output')
+    args, kwargs = provider.s3_client.upload_fileobj.call_args
+    assert args[0].read() == b'x' * 16
+    assert args[1:] == ('bucket', 'output/part.jsonl')
+    assert kwargs['Config'] is provider.transfer_config
@@ -0,0 +1,83 @@
+"""
+Tests for the storage instrumentation layer.
+"""
+
+import os
+import pytest
+import tempfile
+from prometheus_client import REGISTRY
+from storage_providers.local_provider import LocalStorageProvider
+from storage_providers.instrumentation import (
+    InstrumentedStorageProvider,
+    correlation_context,
+    get_correlation_id,
+    instrument_provider
+)
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for testing."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        yield tmp_dir
+
+@pytest.fixture
+def provider(temp_dir):
+    """Create an instrumented LocalStorageProvider rooted in a temporary directory."""
+    local_provider = LocalStorageProvider()
+    local_provider.initialize({
+        'base_path': temp_dir,
+        'cache_path': os.path.join(temp_dir, 'cache')
+    })
+    return instrument_provider(local_provider, 'local')
+
+def _sample(name, **labels):
+    """Read a metric sample from the default registry, treating a missing sample as zero."""
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+def test_instrument_provider_wraps_once(provider):
+    """Test that wrapping is idempotent and attributes pass through."""
+    assert isinstance(provider, InstrumentedStorageProvider)
+    assert instrument_provider(provider) is provider
+    assert provider.cache_path == provider.provider.cache_path
+
+def test_operations_record_latency_and_bytes(provider):
+    """Test that reads and writes record counts, durations and bytes per storage type."""
+    labels = {'storage_type': 'cache', 'provider': 'local'}
+    writes_before = _sample('storage_operation_seconds_count', operation='write', **labels)
+    bytes_before = _sample('storage_bytes_total', direction='write', **labels)
+    read_bytes_before = _sample('storage_bytes_total', direction='read', **labels)
+
+    assert provider.write_file('EMP001/notes.txt', 'hello', storage_type='cache')
+    assert provider.read_file('EMP001/notes.txt', storage_type='cache') == 'hello'
+
+    assert _sample('storage_operation_seconds_count', operation='write', **labels) == writes_before + 1
+    assert _sample('storage_bytes_total', direction='write', **labels) == bytes_before + 5
+    assert _sample('storage_bytes_total', direction='read', **labels) == read_bytes_before + 5
+
+def test_storage_type_inferred_from_path(provider):
+    """Test that the storage type label falls back to the path prefix."""
+    before = _sample('storage_operation_total', operation='mkdir', storage_type='cache',
+                     provider='local', status='success')
+    provider.create_directory('cache/EMP002')
+    assert _sample('storage_operation_total', operation='mkdir', storage_type='cache',
+                   provider='local', status='success') == before + 1
+
+def test_errors_are_counted_and_reraised(provider):
+    """Test that provider exceptions propagate and are counted as errors."""
+    before = _sample('storage_operation_total', operation='read', storage_type='cache',
+                     provider='local', status='error')
+    with pytest.raises(FileNotFoundError):
+        provider.read_file('missing.json', storage_type='cache')
+    assert _sample('storage_operation_total', operation='read', storage_type='cache',
+                   provider='local', status='error') == before + 1
+
+def test_correlation_context_nesting():
+    """Test that correlation IDs are scoped and restored."""
+    assert get_correlation_id() is None
+    with correlation_context('REQ-1'):
+        assert get_correlation_id() == 'REQ-1'
+        with correlation_context('CLAIM-9'):
+            assert get_correlation_id() == 'CLAIM-9'
+        with correlation_context(None):
+            assert get_correlation_id() == 'REQ-1'
+    assert get_correlation_id() is None
@@ -0,0 +1,181 @@
+"""
+Tests for the concurrent, resumable storage sync.
+"""
+
+import fnmatch
+import hashlib
+import io
+import threading
+import time
+from datetime import datetime
+from unittest.mock import Mock
+
+from storage_manager import StorageManager
+from storage_providers.s3_provider import S3StorageProvider
+from storage_sync import StorageSync, object_fingerprint, push_output
+
+
+class MemoryStorage:
+    """Storage manager stand-in keeping files in a dict; `etags` makes it behave like S3."""
+
+    def __init__(self, files=None, etags=False, delay=0.0, fail_paths=()):
+        self.files = dict(files or {})
+        self.etags = etags
+        self.delay = delay
+        self.fail_paths = set(fail_paths)
+        self.writes = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def list_objects(self, path="", pattern=None, storage_type=None):
+        return [
+            {
+                "path": name,
+                "size": len(content),
+                "etag": hashlib.md5(content).hexdigest() if self.etags else None,
+                "modified": 1000.0
+            }
+            for (kind, name), content in sorted(self.files.items())
+            if kind == storage_type and name.startswith(path) and (pattern is None or fnmatch.fnmatch(name, pattern))
+        ]
+
+    def open_stream(self, path, storage_type=None, offset=0):
+        return io.BytesIO(self.files[(storage_type, path)][offset:])
+
+    def write_file(self, path, content, storage_type=None):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            if path in self.fail_paths:
+                raise OSError(f"Error writing file {path}")
+            with self._lock:
+                self.files[(storage_type, path)] = content
+                self.writes.append(path)
+            return True
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def file_exists(self, path, storage_type=None):
+        return (storage_type, path) in self.files
+
+    def read_file(self, path, storage_type=None):
+        return self.files[(storage_type, path)]
+
+    def move_file(self, source, dest, source_type=None, dest_type=None):
+        with self._lock:
+            self.files[(dest_type, dest)] = self.files.pop((source_type, source))
+        return True
+
+
+def _csv_writes(storage):
+    return [path for path in storage.writes if path.endswith(".csv")]
+
+
+def _drop(count):
+    return {("input", f"claims_{index}.csv"): f"row,{index}\n".encode() for index in range(count)}
+
+
+def test_pull_transfers_concurrently_and_archives():
+    """Test that every file is copied with bounded concurrency and the source is archived."""
+    s3 = MemoryStorage(_drop(6), etags=True)
+    local = MemoryStorage(delay=0.02)
+    summary = StorageSync(s3, local, "pull-drop", pattern="*.csv", workers=3, archive_source=True,
+                          manifest_storage=local).run()
+
+    assert summary.transferred == 6 and summary.archived == 6 and summary.failed == 0
+    assert 1 < local.peak <= 3
+    assert local.files[("input", "claims_2.csv")] == b"row,2\n"
+    today = datetime.now().strftime('%m-%d-%Y')
+    assert ("archive", f"{today}/claims_2.csv") in s3.files
+    assert not any(kind == "input" for kind, _ in s3.files)
+
+
+def test_unchanged_files_are_skipped_on_rerun():
+    """Test that a second sync skips files recorded in the manifest, and re-copies changed ones."""
+    s3 = MemoryStorage(_drop(3), etags=True)
+    local = MemoryStorage()
+    StorageSync(s3, local, "pull-drop", pattern="*.csv").run()
+    assert len(_csv_writes(local)) == 3
+
+    s3.files[("input", "claims_1.csv")] = b"row,X\n"
+    summary = StorageSync(s3, local, "pull-drop", pattern="*.csv").run()
+    assert _csv_writes(local)[3:] == ["claims_1.csv"]
+    assert summary.transferred == 1 and summary.skipped == 2
+
+
+def test_matching_content_is_not_uploaded():
+    """Test that a destination copy whose ETag is the source MD5 is not uploaded again."""
+    local = MemoryStorage({("output", "EN-1.json"): b'{"a": 1}', ("output", "checkpoint.json"): b'{}'})
+    s3 = MemoryStorage({("output", "EN-1.json"): b'{"a": 1}'}, etags=True)
+    summary = StorageSync(local, s3, "push-output", source_type='output', destination_type='output',
+                          pattern="*.json", exclude=["checkpoint.json"], manifest_storage=local).run()
+
+    assert s3.writes == [] and local.writes == ["sync/push-output.json"]
+    assert summary.listed == 1 and summary.skipped == 1
+
+
+def test_interrupted_sync_resumes_from_manifest():
+    """Test that files synced before a failure are recorded and not transferred again."""
+    s3 = MemoryStorage(_drop(4), etags=True)
+    local = MemoryStorage(fail_paths={"claims_3.csv"})
+    sync = StorageSync(s3, local, "pull-drop", pattern="*.csv", commit_every=1)
+    summary = sync.run()
+    assert summary.failed_files == ["claims_3.csv"]
+    assert set(sync.entries) == {"claims_0.csv", "claims_1.csv", "claims_2.csv"}
+    reloaded = StorageSync(s3, local, "pull-drop")
+    reloaded.load_manifest()
+    assert reloaded.entries["claims_0.csv"]["fingerprint"] == object_fingerprint(
+        {"etag": hashlib.md5(b"row,0\n").hexdigest()})
+
+    local.fail_paths.clear()
+    local.writes.clear()
+    summary = StorageSync(s3, local, "pull-drop", pattern="*.csv").run()
+    assert _csv_writes(local) == ["claims_3.csv"]
+
+
+def test_s3_list_objects_reads_every_page():
+    """Test that the S3 listing follows pagination and keeps size and ETag."""
+    provider = S3StorageProvider()
+    provider.bucket_name = 'bucket'
+    provider.base_prefix = ''
+    provider.input_prefix = 'input/'
+    provider.s3_client = Mock()
+    provider.s3_client.get_paginator.return_value.paginate.return_value = [
+        {'Contents': [{'Key': 'input/', 'Size': 0}, {'Key': 'input/a.csv', 'Size': 3, 'ETag': '"abc"',
+                                                     'LastModified': datetime(2024, 1, 1)}]},
+        {'Contents': [{'Key': 'input/b.csv', 'Size': 5, 'ETag': '"def"'}, {'Key': 'input/c.txt', 'Size': 1}]},
+    ]
+
+    objects = provider.list_objects(pattern='*.csv', storage_type='input')
+    assert [(obj["path"], obj["size"], obj["etag"]) for obj in objects] == [("a.csv", 3, "abc"), ("b.csv", 5, "def")]
+    provider.s3_client.get_paginator.return_value.paginate.assert_called_once_with(Bucket='bucket', Prefix='input/')
+
+
+def test_push_output_includes_jsonl_results_but_not_journals(tmp_path):
+    """Test that the push uploads per-record files and results/ parts, leaving checkpoints behind."""
+    local = StorageManager({"storage": {"mode": "local", "local": {
+        folder: str(tmp_path / folder) for folder in ("input_folder", "output_folder", "archive_folder", "cache_folder")
+    }}})
+    files = {
+        "EN-1.json": b'{"a": 1}',
+        "checkpoint.json": b'{}',
+        "checkpoints/drop.csv.0.json": b'{"sequence": 1}',
+        "results/run1/part-00000.jsonl": b'{"reference_id": "EN-2"}\n',
+        "results/run1/manifest.json": b'{"parts": []}',
+    }
+    for path, content in files.items():
+        local.write_file(path, content, storage_type='output')
+    s3 = MemoryStorage(etags=True)
+
+    summary = push_output(local, s3, workers=2)
+
+    assert sorted(name for kind, name in s3.files) == [
+        "EN-1.json", "results/run1/manifest.json", "results/run1/part-00000.jsonl"
+    ]
+    assert summary.transferred == 3 and summary.failed == 0
+    assert local.file_exists("checkpoints/drop.csv.0.json", storage_type='output')
+    assert not local.file_exists("results/run1/part-00000.jsonl", storage_type='output')
@@ -0,0 +1,95 @@
+"""
+Tests for streaming, cursor-paginated compliance summaries.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from cache_manager.compliance_handler import ComplianceHandler
+from cache_manager.file_handler import FileHandler
+from cache_manager.summary_generator import SummaryGenerator
+
+
+@pytest.fixture
+def cache_folder():
+    """Create a cache folder with three employees holding two reports each."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        folder = Path(tmp_dir)
+        for emp in ("EMP001", "EMP002", "EMP003"):
+            emp_path = folder / emp
+            emp_path.mkdir()
+            for ref in ("REF-1", "REF-2"):
+                report = {
+                    "reference_id": ref,
+                    "claim": {"employee_number": emp},
+                    "final_evaluation": {"overall_compliance": ref == "REF-1", "alerts": []}
+                }
+                (emp_path / f"ComplianceReportAgent_{ref}_v1_20250308.json").write_text(json.dumps(report))
+        yield folder
+
+
+@pytest.fixture
+def generator(cache_folder):
+    """Create a SummaryGenerator over the cache folder."""
+    file_handler = FileHandler(cache_folder)
+    return SummaryGenerator(file_handler, ComplianceHandler(cache_folder))
+
+
+def test_employee_summary_reads_each_page_file_once(generator, cache_folder, monkeypatch):
+    """Test that only the page's report files are read, once each."""
+    reads = []
+    original = FileHandler.read_json
+    monkeypatch.setattr(FileHandler, "read_json", lambda self, path: reads.append(path.name) or original(self, path))
+
+    result = json.loads(generator.generate_compliance_summary(cache_folder / "EMP001", "EMP001", page=2, page_size=1))
+    assert reads == ["ComplianceReportAgent_REF-2_v1_20250308.json"]
+    assert [r["file_name"] for r in result["report_summary"]] == reads
+    assert [s["reference_id"] for s in result["subsection_summary"]] == ["REF-2"] * 9
+    assert result["pagination"]["next_cursor"] is None
+
+
+def test_employee_summary_cursor(generator, cache_folder):
+    """Test that following next_cursor walks the employee's reports."""
+    first = json.loads(generator.generate_compliance_summary(cache_folder / "EMP001", "EMP001", page_size=1))
+    second = json.loads(generator.generate_compliance_summary(
+        cache_folder / "EMP001", "EMP001", page_size=1, cursor=first["pagination"]["next_cursor"]))
+    assert first["report_summary"][0]["reference_id"] == "REF-1"
+    assert second["report_summary"][0]["reference_id"] == "REF-2"
+    assert second["pagination"]["current_page"] == 2
+
+
+def test_all_summaries_cursor_matches_pages(generator, cache_folder):
+    """Test that cursor pagination returns the same pages as page numbers."""
+    by_page = [
+        json.loads(generator.generate_all_compliance_summaries(cache_folder, page=p, page_size=4))["report_summary"]
+        for p in (1, 2)
+    ]
+    first = json.loads(generator.generate_all_compliance_summaries(cache_folder, page_size=4))
+    second = json.loads(generator.generate_all_compliance_summaries(
+        cache_folder, page_size=4, cursor=first["pagination"]["next_cursor"]))
+    assert [first["report_summary"], second["report_summary"]] == by_page
+    assert len(by_page[1]) == 2
+    assert second["pagination"]["next_cursor"] is None
+    assert first["pagination"]["total_items"] == 6
+
+
+def test_invalid_cursor(generator, cache_folder):
+    """Test that malformed cursors are reported as errors."""
+    result = json.loads(generator.generate_all_compliance_summaries(cache_folder, cursor="not-a-cursor"))
+    assert result["status"] == "error"
+
+
+def test_cursor_from_another_endpoint(generator, cache_folder):
+    """Test that a cursor issued by one summary endpoint is rejected by the other."""
+    all_cursor = json.loads(generator.generate_all_compliance_summaries(cache_folder, page_size=1))["pagination"]["next_cursor"]
+    emp_cursor = json.loads(generator.generate_compliance_summary(
+        cache_folder / "EMP001", "EMP001", page_size=1))["pagination"]["next_cursor"]
+    assert json.loads(generator.generate_compliance_summary(
+        cache_folder / "EMP001", "EMP001", cursor=all_cursor))["status"] == "error"
+    assert json.loads(generator.generate_all_compliance_summaries(cache_folder, cursor=emp_cursor))["status"] == "error"
+    bad_page = generator._encode_cursor({"after": "ComplianceReportAgent_REF-1_v1_20250308.json", "page": "2"})
+    assert json.loads(generator.generate_compliance_summary(
+        cache_folder / "EMP001", "EMP001", cursor=bad_page))["status"] == "error"